@@ -0,0 +1,410 @@
+"""Headless batch conversion entry point (``markitdowngui-batch``).
+
+Runs the same conversion core and Markdown save transactions as the desktop
+app without importing Qt, so it can run on machines without a display.
+"""
+
+from __future__ import annotations
+
+import argparse
+from dataclasses import asdict, dataclass
+import glob
+import json
+import logging
+from pathlib import Path
+import sys
+import time
+from typing import Sequence, TextIO
+
+from markitdowngui.core.conversion import (
+    DEFAULT_OCR_PAGE_WORKERS,
+    DEFAULT_OCR_RENDER_MAX_MEGAPIXELS,
+    OCR_PROVIDER_AZURE_TESSERACT,
+    OCR_PROVIDER_GLMOCR,
+    OCR_PROVIDER_HTTP,
+    OCR_RENDER_COLOR_RGB,
+    OCR_RENDER_COLORS,
+    ConversionOptions,
+    ConversionOutcome,
+    run_conversion_batch,
+)
+from markitdowngui.core.conversion_cache import ConversionCache
+from markitdowngui.core.input_sources import (
+    is_web_url,
+    source_output_dir,
+    source_output_stem,
+)
+from markitdowngui.core.markdown_assets import (
+    AssetTransferStats,
+    MarkdownSaveInput,
+    cleanup_temp_asset_root,
+    create_temp_asset_root,
+    prepare_combined_markdown_stream_for_save_transaction,
+    prepare_markdown_for_separate_save_transaction,
+)
+from markitdowngui.core.ocr_page_cache import default_ocr_page_cache_dir
+from markitdowngui.core.separate_save import save_prepared_markdown
+
+
+EXIT_OK = 0
+EXIT_CONVERSION_FAILED = 1
+GLOB_CHARACTERS = frozenset("*?[")
+
+
+@dataclass
+class BatchItemReport:
+    source: str
+    status: str = "pending"
+    backend: str = ""
+    output: str = ""
+    error: str = ""
+    seconds: float = 0.0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="markitdowngui-batch",
+        description="Convert files to Markdown without starting the desktop app.",
+    )
+    parser.add_argument(
+        "inputs",
+        nargs="*",
+        help="Files, directories, glob patterns (quote them) or web URLs.",
+    )
+    parser.add_argument(
+        "-m",
+        "--manifest",
+        action="append",
+        default=[],
+        help="Text file listing one input per line; '-' reads stdin. Repeatable.",
+    )
+    parser.add_argument(
+        "-o",
+        "--output-dir",
+        help="Write Markdown here instead of next to each source file.",
+    )
+    parser.add_argument(
+        "--combined",
+        metavar="PATH",
+        help="Write all successful results into one Markdown file.",
+    )
+    parser.add_argument(
+        "--ext",
+        default=".md",
+        help="Output file extension for separate outputs (default: .md).",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of files converted at once (default: 1).",
+    )
+    parser.add_argument(
+        "--process-pool",
+        action="store_true",
+        help="Convert in separate processes to use several CPU cores.",
+    )
+    parser.add_argument("--ocr", action="store_true", help="Enable OCR for scans and images.")
+    parser.add_argument(
+        "--ocr-provider",
+        choices=(OCR_PROVIDER_AZURE_TESSERACT, OCR_PROVIDER_GLMOCR, OCR_PROVIDER_HTTP),
+        default=OCR_PROVIDER_AZURE_TESSERACT,
+    )
+    parser.add_argument("--ocr-languages", default="", help="Tesseract languages, e.g. eng+deu.")
+    parser.add_argument(
+        "--ocr-page-workers",
+        type=int,
+        default=DEFAULT_OCR_PAGE_WORKERS,
+        help="Number of PDF pages OCR'd in parallel.",
+    )
+    parser.add_argument(
+        "--ocr-render-max-megapixels",
+        type=int,
+        default=DEFAULT_OCR_RENDER_MAX_MEGAPIXELS,
+        help="Largest bitmap, in megapixels, a PDF page is rendered to for OCR.",
+    )
+    parser.add_argument(
+        "--ocr-render-color",
+        choices=OCR_RENDER_COLORS,
+        default=OCR_RENDER_COLOR_RGB,
+        help="Render PDF pages for OCR in colour, grayscale or black and white.",
+    )
+    parser.add_argument(
+        "--hybrid-pdf-ocr",
+        action="store_true",
+        help="OCR only the scanned pages of mixed PDFs.",
+    )
+    parser.add_argument("--fast-pdf", action="store_true", help="Use the fast PDF parser first.")
+    parser.add_argument("--preserve-pdf-images", action="store_true")
+    parser.add_argument("--preserve-docx-images", action="store_true")
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Reuse cached results for unchanged files (~/.markitdown/cache).",
+    )
+    parser.add_argument(
+        "--no-tesseract-engine-reuse",
+        action="store_true",
+        help="Run Tesseract as a new process per page instead of reusing loaded engines.",
+    )
+    parser.add_argument(
+        "--no-ocr-page-cache",
+        action="store_true",
+        help="Do not reuse or store OCR text per PDF page.",
+    )
+    parser.add_argument(
+        "--summary",
+        metavar="PATH",
+        help="Write the JSON summary to PATH instead of stdout.",
+    )
+    parser.add_argument(
+        "-q",
+        "--quiet",
+        action="store_true",
+        help="Do not print progress to stderr.",
+    )
+    return parser
+
+
+def expand_inputs(
+    inputs: Sequence[str],
+    manifests: Sequence[str] = (),
+    *,
+    stdin: TextIO | None = None,
+) -> list[str]:
+    """Resolve inputs, manifests, directories and globs to a de-duplicated list."""
+    entries = list(inputs)
+    for manifest in manifests:
+        if manifest == "-":
+            lines = (stdin or sys.stdin).read().splitlines()
+        else:
+            lines = Path(manifest).read_text(encoding="utf-8").splitlines()
+        entries.extend(
+            line.strip()
+            for line in lines
+            if line.strip() and not line.lstrip().startswith("#")
+        )
+
+    files: list[str] = []
+    seen: set[str] = set()
+
+    def add(candidate: str) -> None:
+        if candidate not in seen:
+            seen.add(candidate)
+            files.append(candidate)
+
+    for entry in entries:
+        if is_web_url(entry):
+            add(entry.strip())
+            continue
+        if GLOB_CHARACTERS.intersection(entry):
+            for match in sorted(glob.glob(entry, recursive=True)):
+                if Path(match).is_file():
+                    add(str(Path(match).resolve()))
+            continue
+        path = Path(entry).expanduser()
+        if path.is_dir():
+            for child in sorted(path.rglob("*")):
+                if child.is_file() and not child.name.startswith("."):
+                    add(str(child.resolve()))
+            continue
+        add(str(path.resolve()))
+    return files
+
+
+def build_options(args: argparse.Namespace, artifacts_dir: str) -> ConversionOptions:
+    return ConversionOptions(
+        ocr_enabled=args.ocr,
+        fast_pdf_conversion=args.fast_pdf,
+        hybrid_pdf_ocr=args.hybrid_pdf_ocr,
+        preserve_pdf_images=args.preserve_pdf_images,
+        preserve_docx_images=args.preserve_docx_images,
+        ocr_provider=args.ocr_provider,
+        ocr_languages=args.ocr_languages,
+        ocr_page_workers=args.ocr_page_workers,
+        ocr_render_max_megapixels=args.ocr_render_max_megapixels,
+        ocr_render_color=args.ocr_render_color,
+        reuse_tesseract_engines=not args.no_tesseract_engine_reuse,
+        pdf_artifacts_dir=artifacts_dir,
+        docx_artifacts_dir=artifacts_dir,
+        ocr_page_cache_dir=(
+            "" if args.no_ocr_page_cache else str(default_ocr_page_cache_dir())
+        ),
+    )
+
+
+def run_batch(args: argparse.Namespace, files: list[str], *, stderr: TextIO) -> dict:
+    """Convert ``files``, save outputs and return the JSON-serialisable summary."""
+    reports = {file_path: BatchItemReport(source=file_path) for file_path in files}
+    started_at: dict[str, float] = {}
+    outcomes: dict[str, ConversionOutcome] = {}
+    asset_transfer = AssetTransferStats()
+    batch_started_at = time.perf_counter()
+    completed = 0
+
+    def on_started(file_path: str) -> None:
+        started_at[file_path] = time.perf_counter()
+
+    def on_finished(file_path: str, outcome: ConversionOutcome, failed: bool) -> None:
+        nonlocal completed
+        completed += 1
+        report = reports[file_path]
+        report.seconds = round(time.perf_counter() - started_at.get(file_path, 0.0), 3)
+        if failed:
+            report.status = "failed"
+            report.error = outcome.markdown
+        else:
+            report.status = "converted"
+            report.backend = outcome.backend
+            if args.combined:
+                outcomes[file_path] = outcome
+            else:
+                _save_separate_output(args, file_path, outcome, report, asset_transfer)
+        if not args.quiet:
+            print(
+                f"[{completed}/{len(files)}] {report.status}: {file_path}"
+                + (f" ({report.error})" if report.error else ""),
+                file=stderr,
+                flush=True,
+            )
+
+    artifacts_dir = create_temp_asset_root()
+    try:
+        run_conversion_batch(
+            files,
+            build_options(args, str(artifacts_dir)),
+            max_workers=max(1, args.jobs),
+            on_started=on_started,
+            on_finished=on_finished,
+            use_process_pool=args.process_pool,
+            conversion_cache=ConversionCache() if args.cache else None,
+        )
+        if args.combined:
+            _save_combined_output(args, files, outcomes, reports, asset_transfer)
+    finally:
+        cleanup_temp_asset_root(artifacts_dir)
+
+    items = [reports[file_path] for file_path in files]
+    return {
+        "total": len(items),
+        "succeeded": sum(1 for item in items if item.status == "saved"),
+        "failed": sum(1 for item in items if item.status != "saved"),
+        "elapsed_seconds": round(time.perf_counter() - batch_started_at, 3),
+        "combined_output": str(Path(args.combined).resolve()) if args.combined else "",
+        "assets": {
+            "reflinked": asset_transfer.reflinked,
+            "hardlinked": asset_transfer.hardlinked,
+            "copied": asset_transfer.copied,
+            "bytes_avoided": asset_transfer.bytes_avoided,
+            "copied_bytes": asset_transfer.copied_bytes,
+            "seconds": round(asset_transfer.seconds, 3),
+        },
+        "items": [asdict(item) for item in items],
+    }
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    import multiprocessing
+
+    # Frozen builds re-enter main() in process-pool conversion workers.
+    multiprocessing.freeze_support()
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    logging.basicConfig(
+        level=logging.WARNING,
+        format="%(levelname)s: %(message)s",
+        stream=sys.stderr,
+    )
+
+    try:
+        files = expand_inputs(args.inputs, args.manifest)
+    except OSError as exc:
+        parser.error(f"could not read manifest: {exc}")
+    if not files:
+        parser.error("no input files matched")
+
+    summary = run_batch(args, files, stderr=sys.stderr)
+    encoded = json.dumps(summary, indent=2, ensure_ascii=False)
+    if args.summary:
+        Path(args.summary).write_text(encoded + "\n", encoding="utf-8")
+    else:
+        print(encoded)
+    return EXIT_CONVERSION_FAILED if summary["failed"] else EXIT_OK
+
+
+def _save_separate_output(
+    args: argparse.Namespace,
+    file_path: str,
+    outcome: ConversionOutcome,
+    report: BatchItemReport,
+    asset_transfer: AssetTransferStats,
+) -> None:
+    output_dir = args.output_dir or source_output_dir(file_path) or "."
+    output_path = _unique_output_path(Path(output_dir), file_path, args.ext)
+    try:
+        prepared = prepare_markdown_for_separate_save_transaction(
+            outcome.markdown,
+            outcome.assets,
+            output_path,
+        )
+        save_prepared_markdown(output_path, prepared)
+    except Exception as exc:
+        report.status = "failed"
+        report.error = f"Save failed: {exc}"
+        return
+    asset_transfer.add(prepared.asset_transfer)
+    report.status = "saved"
+    report.output = str(output_path)
+
+
+def _save_combined_output(
+    args: argparse.Namespace,
+    files: Sequence[str],
+    outcomes: dict[str, ConversionOutcome],
+    reports: dict[str, BatchItemReport],
+    asset_transfer: AssetTransferStats,
+) -> None:
+    converted = [file_path for file_path in files if file_path in outcomes]
+    if not converted:
+        return
+    output_path = Path(args.combined)
+    documents = [
+        MarkdownSaveInput(
+            source=file_path,
+            markdown=outcomes[file_path].markdown,
+            assets=outcomes[file_path].assets,
+        )
+        for file_path in converted
+    ]
+    try:
+        prepared, chunks = prepare_combined_markdown_stream_for_save_transaction(
+            documents,
+            output_path,
+            source_heading_template="## {source}",
+        )
+        save_prepared_markdown(output_path, prepared, chunks)
+    except Exception as exc:
+        for file_path in converted:
+            reports[file_path].status = "failed"
+            reports[file_path].error = f"Save failed: {exc}"
+        return
+    asset_transfer.add(prepared.asset_transfer)
+    for file_path in converted:
+        reports[file_path].status = "saved"
+        reports[file_path].output = str(output_path.resolve())
+
+
+def _unique_output_path(output_dir: Path, source: str, extension: str) -> Path:
+    output_dir.mkdir(parents=True, exist_ok=True)
+    suffix = extension if extension.startswith(".") else f".{extension}"
+    path = output_dir / f"{source_output_stem(source)}{suffix}"
+    counter = 1
+    while path.exists():
+        path = output_dir / f"{source_output_stem(source)}_{counter}{suffix}"
+        counter += 1
+    return path
+
+
+if __name__ == "__main__":
+    sys.exit(main())
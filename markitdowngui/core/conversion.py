@@ -1,22 +1,54 @@
 from __future__ import annotations
 
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
+from collections import deque
+from contextlib import closing
 from dataclasses import dataclass, field
-from itertools import islice
+from functools import lru_cache
+from itertools import count, islice
 import base64
+import json
 import logging
 import mimetypes
 import os
+import queue
 import shutil
 import tempfile
+import threading
+import time
 from io import BytesIO
 from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Sequence
 from urllib.parse import quote
 
-import requests
+from markitdowngui.core.http_sessions import (
+    DEFAULT_HTTP_MAX_RETRIES,
+    DEFAULT_HTTP_POOL_SIZE,
+    MAX_HTTP_POOL_SIZE,
+    MAX_HTTP_RETRIES,
+    MultipartFileUpload,
+    get_http_session,
+)
+from markitdowngui.core.input_sources import is_web_url
+from markitdowngui.core.ocr_page_cache import OcrPageCache
+from markitdowngui.core.tesseract_engine import (
+    recognize_with_tesseract_engine,
+    tessdata_dir_for,
+    tesserocr_available,
+)
+
+if TYPE_CHECKING:
+    from concurrent.futures import ProcessPoolExecutor
 
-from PySide6.QtCore import QThread, Signal
+    import requests
 
-from markitdowngui.core.input_sources import is_web_url
+    from markitdowngui.core.conversion_cache import ConversionCache
 
 IMAGE_EXTENSIONS = {".bmp", ".gif", ".jpeg", ".jpg", ".png", ".tiff", ".webp"}
 DOCINTEL_IMAGE_EXTENSIONS = {".bmp", ".jpeg", ".jpg", ".png", ".tiff"}
@@ -35,7 +67,34 @@ DOCX_IMAGE_EXTENSIONS_BY_CONTENT_TYPE = {
     "image/x-wmf": ".wmf",
 }
 PDF_RENDER_SCALE = 3.0
+# Scans are rendered near their own resolution, but not below this scale
+# (150 DPI), where small print gets too blurry for OCR.
+MIN_PDF_RENDER_SCALE = 150 / 72
+# An image covering at least this share of a page is treated as its scan.
+PDF_SCAN_IMAGE_MIN_COVERAGE = 0.5
+DEFAULT_OCR_PAGE_WORKERS = max(1, min(4, os.cpu_count() or 1))
+DEFAULT_OCR_RENDER_MAX_MEGAPIXELS = 16
+MAX_OCR_RENDER_MAX_MEGAPIXELS = 100
+OCR_RENDER_COLOR_RGB = "rgb"
+OCR_RENDER_COLOR_GRAYSCALE = "grayscale"
+OCR_RENDER_COLOR_BINARY = "binary"
+OCR_RENDER_COLORS = (
+    OCR_RENDER_COLOR_RGB,
+    OCR_RENDER_COLOR_GRAYSCALE,
+    OCR_RENDER_COLOR_BINARY,
+)
 LOCAL_OCR_TIMEOUT_SECONDS = 60
+MAX_OCR_PAGE_WORKERS = 16
+MAX_OCR_RENDER_AHEAD = 16
+MAX_GLMOCR_OLLAMA_CONCURRENCY = 8
+# Pages with fewer non-whitespace characters than this are treated as scans.
+HYBRID_PDF_MIN_PAGE_CHARS = 32
+LOCAL_PDF_OCR_DEPENDENCY_MESSAGE = "Local PDF OCR requires pypdfium2 to be installed."
+GLMOCR_OLLAMA_PDF_DEPENDENCY_MESSAGE = (
+    "GLM-OCR Ollama PDF conversion requires pypdfium2 to be installed."
+)
+HYBRID_PDF_DEPENDENCY_MESSAGE = "Hybrid PDF OCR requires pypdfium2 to be installed."
+DEFAULT_OCR_RENDER_AHEAD = 2
 DEFUDDLE_REQUEST_TIMEOUT_SECONDS = 30
 DEFUDDLE_API_BASE_URL = "https://defuddle.md/"
 AZURE_OCR_API_KEY_ENV_VAR = "AZURE_OCR_API_KEY"
@@ -50,6 +109,7 @@ BACKEND_DOCX_IMAGES = "docx-images"
 BACKEND_PDF_IMAGES = "pdf-images"
 BACKEND_PDF_INSPECTOR = "pdf-inspector"
 BACKEND_ANYDOC = "anydoc"
+BACKEND_PDF_HYBRID = "pdf-hybrid"
 ANYDOC_EXTENSIONS = frozenset(
     {
         ".csv",
@@ -110,6 +170,19 @@ DEFAULT_GLMOCR_OLLAMA_MODEL = "glm-ocr:latest"
 GLMOCR_OLLAMA_API_PATH = "/api/generate"
 GLMOCR_OLLAMA_TIMEOUT_SECONDS = 300
 GLMOCR_OLLAMA_MAX_TOKENS = 16384
+OLLAMA_IMAGE_FORMAT_JPEG = "jpeg"
+OLLAMA_IMAGE_FORMAT_PNG = "png"
+OLLAMA_IMAGE_FORMAT_WEBP = "webp"
+OLLAMA_IMAGE_FORMATS = (
+    OLLAMA_IMAGE_FORMAT_JPEG,
+    OLLAMA_IMAGE_FORMAT_PNG,
+    OLLAMA_IMAGE_FORMAT_WEBP,
+)
+# Pillow's own JPEG default, which uploads have always used.
+DEFAULT_OLLAMA_IMAGE_QUALITY = 75
+# Zero keeps the rendered size.
+DEFAULT_OLLAMA_IMAGE_MAX_EDGE = 0
+MAX_OLLAMA_IMAGE_MAX_EDGE = 10000
 GLMOCR_OLLAMA_PROMPT = (
     "Recognize the text in the image and output in Markdown format. "
     "Preserve the original layout, including headings, paragraphs, tables, and formulas. "
@@ -120,7 +193,24 @@ ZHIPU_API_KEY_ENV_VAR = "ZHIPU_API_KEY"
 GLMOCR_API_KEY_ENV_VAR = "GLMOCR_API_KEY"
 DEFAULT_HTTP_OCR_API_KEY_ENV = "OCR_HTTP_API_KEY"
 DEFAULT_HTTP_OCR_TIMEOUT_SECONDS = 300
+# Zero sends each PDF whole.
+DEFAULT_HTTP_OCR_CHUNK_PAGES = 0
+MAX_HTTP_OCR_CHUNK_PAGES = 1000
+DEFAULT_HTTP_OCR_CHUNK_WORKERS = 2
+MAX_HTTP_OCR_CHUNK_WORKERS = 8
+# A failed chunk is resubmitted this many times after the first round.
+HTTP_OCR_CHUNK_RETRIES = 2
+HTTP_OCR_PDF_CHUNK_DEPENDENCY_MESSAGE = (
+    "Splitting PDFs for HTTP OCR requires pypdfium2 to be installed."
+)
 OCR_CONNECTION_TEST_TIMEOUT_SECONDS = 10
+BATCH_POLL_INTERVAL_SECONDS = 0.1
+# pdfium is not thread-safe, even across separate documents, so concurrent
+# conversions serialise every pypdfium2 call through this lock.
+_PDFIUM_LOCK = threading.RLock()
+_PDFIUM_SHARED_BUFFER_MODES = frozenset({"RGBA", "RGBX", "L"})
+# Warm per-process session installed by the process-pool initializer.
+_PROCESS_MARKITDOWN_SESSION: MarkItDownSession | None = None
 
 
 @dataclass(frozen=True)
@@ -175,6 +265,7 @@ class ConversionOptions:
 
     ocr_enabled: bool = False
     fast_pdf_conversion: bool = False
+    hybrid_pdf_ocr: bool = False
     anydoc_conversion: bool = False
     preserve_pdf_images: bool = False
     preserve_docx_images: bool = False
@@ -184,6 +275,7 @@ class ConversionOptions:
     docintel_endpoint: str = ""
     ocr_languages: str = ""
     tesseract_path: str = ""
+    reuse_tesseract_engines: bool = True
     pdf_artifacts_dir: str = ""
     docx_artifacts_dir: str = ""
     glmocr_mode: str = GLMOCR_MODE_MAAS
@@ -195,6 +287,19 @@ class ConversionOptions:
     http_ocr_model: str = ""
     http_ocr_api_key_env: str = DEFAULT_HTTP_OCR_API_KEY_ENV
     http_ocr_timeout_seconds: int = DEFAULT_HTTP_OCR_TIMEOUT_SECONDS
+    http_ocr_chunk_pages: int = DEFAULT_HTTP_OCR_CHUNK_PAGES
+    http_ocr_chunk_workers: int = DEFAULT_HTTP_OCR_CHUNK_WORKERS
+    ocr_page_workers: int = 1
+    ocr_render_ahead: int = DEFAULT_OCR_RENDER_AHEAD
+    ocr_render_max_megapixels: int = DEFAULT_OCR_RENDER_MAX_MEGAPIXELS
+    ocr_render_color: str = OCR_RENDER_COLOR_RGB
+    glmocr_ollama_concurrency: int = 1
+    glmocr_ollama_image_format: str = OLLAMA_IMAGE_FORMAT_JPEG
+    glmocr_ollama_image_quality: int = DEFAULT_OLLAMA_IMAGE_QUALITY
+    glmocr_ollama_image_max_edge: int = DEFAULT_OLLAMA_IMAGE_MAX_EDGE
+    http_pool_size: int = DEFAULT_HTTP_POOL_SIZE
+    http_max_retries: int = DEFAULT_HTTP_MAX_RETRIES
+    ocr_page_cache_dir: str = ""
 
     @property
     def normalized_ocr_provider(self) -> str:
@@ -297,6 +402,97 @@ class ConversionOptions:
     def normalized_http_ocr_timeout_seconds(self) -> int:
         return max(1, min(3600, int(self.http_ocr_timeout_seconds)))
 
+    @property
+    def normalized_http_ocr_chunk_pages(self) -> int:
+        return max(0, min(MAX_HTTP_OCR_CHUNK_PAGES, int(self.http_ocr_chunk_pages)))
+
+    @property
+    def normalized_http_ocr_chunk_workers(self) -> int:
+        return max(
+            1,
+            min(MAX_HTTP_OCR_CHUNK_WORKERS, int(self.http_ocr_chunk_workers)),
+        )
+
+    @property
+    def normalized_hybrid_pdf_ocr(self) -> bool:
+        return bool(self.hybrid_pdf_ocr)
+
+    @property
+    def normalized_ocr_page_workers(self) -> int:
+        return max(1, min(MAX_OCR_PAGE_WORKERS, int(self.ocr_page_workers)))
+
+    @property
+    def normalized_ocr_render_ahead(self) -> int:
+        return max(0, min(MAX_OCR_RENDER_AHEAD, int(self.ocr_render_ahead)))
+
+    @property
+    def normalized_ocr_render_max_megapixels(self) -> int:
+        return max(
+            1,
+            min(MAX_OCR_RENDER_MAX_MEGAPIXELS, int(self.ocr_render_max_megapixels)),
+        )
+
+    @property
+    def normalized_ocr_render_color(self) -> str:
+        color = self.ocr_render_color.strip().lower()
+        return color if color in OCR_RENDER_COLORS else OCR_RENDER_COLOR_RGB
+
+    @property
+    def ocr_render_cache_tag(self) -> str:
+        """Describe the render policy so cached page texts follow its changes."""
+        return (
+            f"adaptive:{self.normalized_ocr_render_max_megapixels}mp:"
+            f"{self.normalized_ocr_render_color}"
+        )
+
+    @property
+    def normalized_glmocr_ollama_concurrency(self) -> int:
+        return max(
+            1,
+            min(MAX_GLMOCR_OLLAMA_CONCURRENCY, int(self.glmocr_ollama_concurrency)),
+        )
+
+    @property
+    def normalized_glmocr_ollama_image_format(self) -> str:
+        image_format = self.glmocr_ollama_image_format.strip().lower()
+        if image_format == "jpg":
+            return OLLAMA_IMAGE_FORMAT_JPEG
+        if image_format in OLLAMA_IMAGE_FORMATS:
+            return image_format
+        return OLLAMA_IMAGE_FORMAT_JPEG
+
+    @property
+    def normalized_glmocr_ollama_image_quality(self) -> int:
+        return max(1, min(100, int(self.glmocr_ollama_image_quality)))
+
+    @property
+    def normalized_glmocr_ollama_image_max_edge(self) -> int:
+        return max(
+            0,
+            min(MAX_OLLAMA_IMAGE_MAX_EDGE, int(self.glmocr_ollama_image_max_edge)),
+        )
+
+    @property
+    def glmocr_ollama_image_cache_tag(self) -> str:
+        """Describe the upload encoding so cached page texts follow its changes."""
+        return (
+            f"{self.normalized_glmocr_ollama_image_format}:"
+            f"q{self.normalized_glmocr_ollama_image_quality}:"
+            f"edge{self.normalized_glmocr_ollama_image_max_edge}"
+        )
+
+    @property
+    def normalized_http_pool_size(self) -> int:
+        return max(1, min(MAX_HTTP_POOL_SIZE, int(self.http_pool_size)))
+
+    @property
+    def normalized_http_max_retries(self) -> int:
+        return max(0, min(MAX_HTTP_RETRIES, int(self.http_max_retries)))
+
+    @property
+    def normalized_ocr_page_cache_dir(self) -> str:
+        return self.ocr_page_cache_dir.strip()
+
 
 @dataclass(frozen=True)
 class ConversionAsset:
@@ -315,11 +511,26 @@ class ConversionOutcome:
     assets: list[ConversionAsset] = field(default_factory=list)
 
 
+@dataclass(frozen=True)
+class ConversionBatchSummary:
+    """Counters for a finished batch; outcomes are only delivered per item."""
+
+    total: int = 0
+    completed: int = 0
+    failed: int = 0
+    cancelled: bool = False
+
+    @property
+    def succeeded(self) -> int:
+        return self.completed - self.failed
+
+
 class MarkItDownSession:
-    """Lazily reuse native MarkItDown instances within one serial worker."""
+    """Lazily reuse native MarkItDown instances across one worker's conversions."""
 
     def __init__(self) -> None:
         self._instances: dict[tuple[bool, str], object] = {}
+        self._lock = threading.Lock()
 
     def get(
         self,
@@ -329,25 +540,40 @@ class MarkItDownSession:
     ) -> object:
         endpoint = options.normalized_docintel_endpoint if use_docintel else ""
         key = (use_docintel, endpoint)
-        instance = self._instances.get(key)
-        if instance is not None:
-            return instance
+        with self._lock:
+            instance = self._instances.get(key)
+            if instance is not None:
+                return instance
 
-        # Delay the heavy import until a native conversion is actually requested.
-        from markitdown import MarkItDown
+            # Delay the heavy import until a native conversion is actually requested.
+            from markitdown import MarkItDown
 
-        kwargs: dict[str, object] = {}
-        if use_docintel and endpoint:
-            kwargs["docintel_endpoint"] = endpoint
-            kwargs["docintel_credential"], _auth_method = _build_docintel_credential()
+            kwargs: dict[str, object] = {}
+            if use_docintel and endpoint:
+                kwargs["docintel_endpoint"] = endpoint
+                kwargs["docintel_credential"], _auth_method = _build_docintel_credential()
 
-        instance = MarkItDown(**kwargs)
-        self._instances[key] = instance
-        return instance
+            instance = MarkItDown(**kwargs)
+            self._instances[key] = instance
+            return instance
 
 
 def format_conversion_error(file_path: str, error: Exception) -> str:
     return f"{CONVERSION_ERROR_PREFIX}{file_path}: {error}"
+
+
+def _http_session(
+    url: str,
+    options: ConversionOptions | None = None,
+    *,
+    retry: bool = True,
+) -> requests.Session:
+    effective_options = options or ConversionOptions()
+    return get_http_session(
+        url,
+        pool_size=effective_options.normalized_http_pool_size,
+        max_retries=effective_options.normalized_http_max_retries if retry else 0,
+    )
 
 
 def _summarize_error(error: Exception) -> str:
@@ -633,9 +859,14 @@ def test_http_ocr_connection(options: ConversionOptions) -> str:
 
 
 def test_glmocr_ollama_connection(options: ConversionOptions) -> str:
+    import requests
+
     tags_url = _build_glmocr_ollama_tags_url(options)
     try:
-        response = requests.get(tags_url, timeout=OCR_CONNECTION_TEST_TIMEOUT_SECONDS)
+        response = _http_session(tags_url, options, retry=False).get(
+            tags_url,
+            timeout=OCR_CONNECTION_TEST_TIMEOUT_SECONDS,
+        )
     except requests.Timeout as exc:
         raise RuntimeError("GLM-OCR Ollama test timed out.") from exc
     except requests.RequestException as exc:
@@ -669,10 +900,12 @@ def _test_http_endpoint_reachable(
     label: str,
     timeout: int = OCR_CONNECTION_TEST_TIMEOUT_SECONDS,
 ) -> str:
+    import requests
+
     if not endpoint:
         raise RuntimeError(f"Set a {label} URL before testing connectivity.")
     try:
-        response = requests.options(endpoint, timeout=timeout)
+        response = _http_session(endpoint, retry=False).options(endpoint, timeout=timeout)
     except requests.Timeout as exc:
         raise RuntimeError(f"{label} test timed out.") from exc
     except requests.RequestException as exc:
@@ -690,13 +923,38 @@ def convert_file_with_details(
     options: ConversionOptions | None = None,
     *,
     markitdown_session: MarkItDownSession | None = None,
+    conversion_cache: ConversionCache | None = None,
 ) -> ConversionOutcome:
     """Convert a single file to Markdown text and report which backend produced it."""
     effective_options = options or ConversionOptions()
 
+    cache_key = None
+    if conversion_cache is not None:
+        cache_key = conversion_cache.key_for(file_path, effective_options)
+        if cache_key is not None:
+            cached_outcome = conversion_cache.get(cache_key, effective_options)
+            if cached_outcome is not None:
+                return cached_outcome
+
+    outcome = _convert_file_uncached(
+        file_path,
+        effective_options,
+        markitdown_session=markitdown_session,
+    )
+    if cache_key is not None:
+        conversion_cache.put(cache_key, outcome)
+    return outcome
+
+
+def _convert_file_uncached(
+    file_path: str,
+    effective_options: ConversionOptions,
+    *,
+    markitdown_session: MarkItDownSession | None,
+) -> ConversionOutcome:
     if is_web_url(file_path):
         return ConversionOutcome(
-            markdown=_convert_url_with_defuddle(file_path),
+            markdown=_convert_url_with_defuddle(file_path, effective_options),
             backend=BACKEND_DEFUDDLE,
         )
 
@@ -731,6 +989,11 @@ def convert_file_with_details(
     if extension in IMAGE_EXTENSIONS:
         return _convert_image_with_ocr(file_path, effective_options, extension)
 
+    if extension == PDF_EXTENSION and effective_options.normalized_hybrid_pdf_ocr:
+        hybrid_outcome = _try_convert_pdf_hybrid(file_path, effective_options)
+        if hybrid_outcome is not None:
+            return hybrid_outcome
+
     if extension == PDF_EXTENSION:
         return _convert_pdf_with_ocr(file_path, effective_options)
 
@@ -808,6 +1071,162 @@ def _try_convert_pdf_with_pdf_inspector(file_path: str) -> ConversionOutcome | N
     return ConversionOutcome(markdown=markdown, backend=BACKEND_PDF_INSPECTOR)
 
 
+def _try_convert_pdf_hybrid(
+    file_path: str,
+    options: ConversionOptions,
+) -> ConversionOutcome | None:
+    """OCR only the image-only pages of a mixed PDF and keep native text elsewhere.
+
+    Scanned pages go through the OCR page cache like whole-document OCR does.
+    A page whose image OCR fails is retried alone through the whole-document
+    PDF pipeline, so one bad page keeps the native text of the others.
+    Returns None when every page has a text layer or none does, or when a
+    failed page cannot be recovered, so the whole-document pipeline handles
+    the file.
+    """
+    try:
+        native_pages = _classify_pdf_pages(file_path)
+    except Exception as exc:
+        logging.warning("Could not classify PDF pages for hybrid OCR: %s", exc)
+        return None
+
+    scanned_pages = [index for index, text in enumerate(native_pages) if text is None]
+    if not scanned_pages or len(scanned_pages) == len(native_pages):
+        return None
+
+    failed_pages: dict[int, Exception] = {}
+    try:
+        with tempfile.TemporaryDirectory(prefix="markitdown-hybrid-") as temp_dir:
+            ocr_texts = _ocr_pdf_page_texts(
+                file_path,
+                options,
+                page_indexes=scanned_pages,
+                render_pages=lambda page_indexes: _iter_pdf_page_images(
+                    file_path,
+                    missing_dependency_message=HYBRID_PDF_DEPENDENCY_MESSAGE,
+                    page_indexes=page_indexes,
+                    options=options,
+                ),
+                ocr_page=lambda image: _ocr_hybrid_pdf_page(image, temp_dir, options),
+                workers=options.normalized_ocr_page_workers,
+                label=f"Hybrid OCR of {Path(file_path).name}",
+                provider=f"hybrid:{_image_ocr_cache_identity(options)}",
+                model="",
+                missing_dependency_message=HYBRID_PDF_DEPENDENCY_MESSAGE,
+                failed_pages=failed_pages,
+            )
+            for page_index, error in sorted(failed_pages.items()):
+                logging.warning(
+                    "Hybrid OCR of page %d failed (%s); retrying it with "
+                    "whole-document OCR",
+                    page_index + 1,
+                    error,
+                )
+                ocr_texts[page_index] = _ocr_pdf_page_as_document(
+                    file_path,
+                    page_index,
+                    temp_dir,
+                    options,
+                )
+    except Exception as exc:
+        logging.warning("Hybrid PDF OCR failed; using whole-document OCR: %s", exc)
+        return None
+
+    page_texts = list(native_pages)
+    for page_index, text in ocr_texts.items():
+        page_texts[page_index] = text
+    logging.info(
+        "Hybrid OCR of %s: %d of %d pages sent to OCR",
+        Path(file_path).name,
+        len(scanned_pages),
+        len(native_pages),
+    )
+    return ConversionOutcome(
+        markdown="\n\n".join(text for text in page_texts if text).strip(),
+        backend=BACKEND_PDF_HYBRID,
+    )
+
+
+def _classify_pdf_pages(file_path: str) -> list[str | None]:
+    """Return each page's native text, or None for pages without a text layer."""
+    import pypdfium2 as pdfium
+
+    native_pages: list[str | None] = []
+    with _PDFIUM_LOCK:
+        pdf = pdfium.PdfDocument(file_path)
+        try:
+            for page_index in range(len(pdf)):
+                page = pdf[page_index]
+                textpage = None
+                try:
+                    textpage = page.get_textpage()
+                    text = textpage.get_text_range().replace("\r\n", "\n").strip()
+                finally:
+                    if textpage is not None and hasattr(textpage, "close"):
+                        textpage.close()
+                    if hasattr(page, "close"):
+                        page.close()
+                visible_chars = sum(1 for char in text if not char.isspace())
+                native_pages.append(text if visible_chars >= HYBRID_PDF_MIN_PAGE_CHARS else None)
+        finally:
+            if hasattr(pdf, "close"):
+                pdf.close()
+    return native_pages
+
+
+def _ocr_hybrid_pdf_page(image, temp_dir: str, options: ConversionOptions) -> str:
+    handle, image_path = tempfile.mkstemp(prefix="page-", suffix=".png", dir=temp_dir)
+    os.close(handle)
+    try:
+        image.save(image_path, format="PNG")
+    finally:
+        if hasattr(image, "close"):
+            image.close()
+    # The image pipeline carries the configured provider and its fallback.
+    return _convert_image_with_ocr(image_path, options, ".png").markdown
+
+
+def _ocr_pdf_page_as_document(
+    file_path: str,
+    page_index: int,
+    temp_dir: str,
+    options: ConversionOptions,
+) -> str:
+    """OCR one page through the whole-document PDF pipeline."""
+    try:
+        import pypdfium2 as pdfium
+    except ImportError as exc:
+        raise RuntimeError(HYBRID_PDF_DEPENDENCY_MESSAGE) from exc
+
+    page_path = Path(temp_dir) / f"page-{page_index + 1}.pdf"
+    with _PDFIUM_LOCK:
+        source = pdfium.PdfDocument(file_path)
+    try:
+        _write_pdf_page_range(pdfium, source, page_index, page_index + 1, page_path)
+    finally:
+        with _PDFIUM_LOCK:
+            source.close()
+    return _convert_pdf_with_ocr(str(page_path), options).markdown.strip()
+
+
+def _image_ocr_cache_identity(options: ConversionOptions) -> str:
+    """Describe the image OCR settings that shape a page's recognised text."""
+    return ":".join(
+        [
+            options.normalized_ocr_provider,
+            options.normalized_ocr_fallback_provider,
+            options.normalized_docintel_endpoint,
+            options.normalized_ocr_languages or "default",
+            options.normalized_glmocr_mode,
+            options.normalized_glmocr_ollama_model,
+            options.glmocr_ollama_image_cache_tag,
+            options.normalized_glmocr_sdk_server_url,
+            options.normalized_http_ocr_endpoint,
+            options.normalized_http_ocr_model,
+        ]
+    )
+
+
 def _should_try_anydoc(file_path: str, options: ConversionOptions) -> bool:
     if not options.normalized_anydoc_conversion:
         return False
@@ -1314,17 +1733,34 @@ def _convert_with_glmocr_ollama(
     file_path: str,
     options: ConversionOptions,
 ) -> str:
-    page_markdowns: list[str] = []
-
-    for image in _iter_glmocr_ollama_images(file_path):
-        try:
-            markdown = _call_glmocr_ollama(image, options)
-            if markdown.strip():
-                page_markdowns.append(markdown.strip())
-        finally:
-            if hasattr(image, "close"):
-                image.close()
+    label = f"GLM-OCR Ollama OCR of {Path(file_path).name}"
+    if Path(file_path).suffix.lower() == PDF_EXTENSION:
+        # Each page is an independent /api/generate request, so an Ollama
+        # server with several parallel slots can work on multiple pages at once.
+        page_markdowns = _ocr_pdf_pages(
+            file_path,
+            options,
+            render_pages=lambda page_indexes: _iter_glmocr_ollama_images(
+                file_path,
+                page_indexes=page_indexes,
+                options=options,
+            ),
+            ocr_page=lambda image: _call_glmocr_ollama(image, options),
+            workers=options.normalized_glmocr_ollama_concurrency,
+            label=label,
+            provider=f"{OCR_PROVIDER_GLMOCR}:{GLMOCR_MODE_OLLAMA}",
+            model=options.normalized_glmocr_ollama_model,
+            missing_dependency_message=GLMOCR_OLLAMA_PDF_DEPENDENCY_MESSAGE,
+            cache_tag=options.glmocr_ollama_image_cache_tag,
+        )
+        return "\n\n".join(page_markdowns).strip()
 
+    page_markdowns = _ocr_pages_in_order(
+        _iter_glmocr_ollama_images(file_path, options=options),
+        lambda image: _call_glmocr_ollama(image, options),
+        workers=1,
+        label=label,
+    )
     return "\n\n".join(page_markdowns).strip()
 
 
@@ -1342,22 +1778,33 @@ def _convert_pdf_with_http_ocr(
     file_path: str,
     options: ConversionOptions,
 ) -> ConversionOutcome:
-    markdown = _convert_with_http_ocr(file_path, options)
+    if options.normalized_http_ocr_chunk_pages:
+        markdown = _convert_pdf_with_chunked_http_ocr(file_path, options)
+    else:
+        markdown = _convert_with_http_ocr(file_path, options)
     if markdown.strip():
         return ConversionOutcome(markdown=markdown, backend=BACKEND_HTTP_OCR)
     raise RuntimeError("HTTP OCR did not extract any text from the PDF.")
 
 
-def _convert_with_http_ocr(file_path: str, options: ConversionOptions) -> str:
+def _convert_with_http_ocr(
+    file_path: str,
+    options: ConversionOptions,
+    *,
+    upload_name: str | None = None,
+) -> str:
+    import requests
+
     endpoint = options.normalized_http_ocr_endpoint
     if not endpoint:
         raise RuntimeError("Set an HTTP OCR endpoint in Settings first.")
 
     path = Path(file_path)
-    content_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
-    data: dict[str, str] = {}
+    upload_name = upload_name or path.name
+    content_type = mimetypes.guess_type(upload_name)[0] or "application/octet-stream"
+    fields: dict[str, str] = {}
     if options.normalized_http_ocr_model:
-        data["model"] = options.normalized_http_ocr_model
+        fields["model"] = options.normalized_http_ocr_model
 
     headers: dict[str, str] = {}
     api_key_env = options.normalized_http_ocr_api_key_env
@@ -1366,11 +1813,17 @@ def _convert_with_http_ocr(file_path: str, options: ConversionOptions) -> str:
         headers["Authorization"] = f"Bearer {api_key}"
 
     try:
-        with path.open("rb") as file_obj:
-            response = requests.post(
+        # Streamed from disk, so large scans are never held in memory whole.
+        with MultipartFileUpload(
+            path,
+            fields=fields,
+            file_name=upload_name,
+            content_type=content_type,
+        ) as body:
+            headers["Content-Type"] = body.content_type
+            response = _http_session(endpoint, options).post(
                 endpoint,
-                data=data,
-                files={"file": (path.name, file_obj, content_type)},
+                data=body,
                 headers=headers,
                 timeout=options.normalized_http_ocr_timeout_seconds,
             )
@@ -1388,6 +1841,171 @@ def _convert_with_http_ocr(file_path: str, options: ConversionOptions) -> str:
     return _extract_http_ocr_response_text(response)
 
 
+def _convert_pdf_with_chunked_http_ocr(
+    file_path: str,
+    options: ConversionOptions,
+) -> str:
+    """OCR a PDF over HTTP as concurrent uploads of ``http_ocr_chunk_pages`` pages.
+
+    Each chunk is split out with pypdfium2 just before it is sent, and its
+    text is stored in the OCR page cache once it arrives. Chunks that fail are
+    resubmitted up to ``HTTP_OCR_CHUNK_RETRIES`` times after the other chunks
+    finish; texts are joined in page order.
+    """
+    if not options.normalized_http_ocr_endpoint:
+        raise RuntimeError("Set an HTTP OCR endpoint in Settings first.")
+    try:
+        import pypdfium2 as pdfium
+    except ImportError as exc:
+        raise RuntimeError(HTTP_OCR_PDF_CHUNK_DEPENDENCY_MESSAGE) from exc
+
+    path = Path(file_path)
+    label = f"HTTP OCR of {path.name}"
+    chunk_pages = options.normalized_http_ocr_chunk_pages
+    with _PDFIUM_LOCK:
+        source = pdfium.PdfDocument(file_path)
+        page_count = len(source)
+    try:
+        if page_count <= chunk_pages:
+            return _convert_with_http_ocr(file_path, options)
+
+        chunks = [
+            (start, min(start + chunk_pages, page_count))
+            for start in range(0, page_count, chunk_pages)
+        ]
+        page_cache = _ocr_page_cache(options)
+        chunk_keys: list[str] = []
+        texts: list[str | None] = [None] * len(chunks)
+        if page_cache is not None:
+            document_key = page_cache.document_key(file_path)
+            provider = f"{OCR_PROVIDER_HTTP}:{options.normalized_http_ocr_endpoint}"
+            chunk_keys = [
+                page_cache.page_key(
+                    document_key,
+                    start,
+                    # Chunks are uploaded as PDF pages, not rendered.
+                    render_scale=0.0,
+                    provider=provider,
+                    model=options.normalized_http_ocr_model,
+                    render_mode=f"pages:{start + 1}-{stop}",
+                )
+                for start, stop in chunks
+            ]
+            texts = [page_cache.get(key) for key in chunk_keys]
+        pending = [index for index, text in enumerate(texts) if text is None]
+        if len(pending) < len(chunks):
+            logging.info(
+                "%s: reusing %d of %d chunks from the OCR page cache",
+                label,
+                len(chunks) - len(pending),
+                len(chunks),
+            )
+
+        with tempfile.TemporaryDirectory(prefix="markitdown-http-ocr-") as temp_dir:
+
+            def ocr_chunk(index: int) -> str:
+                start, stop = chunks[index]
+                chunk_name = f"{path.stem}-pages-{start + 1}-{stop}.pdf"
+                chunk_path = Path(temp_dir) / chunk_name
+                started_at = time.perf_counter()
+                _write_pdf_page_range(pdfium, source, start, stop, chunk_path)
+                try:
+                    text = _convert_with_http_ocr(
+                        str(chunk_path),
+                        options,
+                        upload_name=chunk_name,
+                    )
+                finally:
+                    chunk_path.unlink(missing_ok=True)
+                logging.info(
+                    "%s: pages %d-%d took %.2fs",
+                    label,
+                    start + 1,
+                    stop,
+                    time.perf_counter() - started_at,
+                )
+                if page_cache is not None:
+                    page_cache.put(chunk_keys[index], text.strip())
+                return text
+
+            errors = _run_http_ocr_chunks(
+                pending,
+                ocr_chunk,
+                texts,
+                workers=options.normalized_http_ocr_chunk_workers,
+                label=label,
+            )
+    finally:
+        with _PDFIUM_LOCK:
+            source.close()
+
+    if errors:
+        index, error = min(errors.items())
+        start, stop = chunks[index]
+        raise RuntimeError(
+            f"HTTP OCR failed for pages {start + 1}-{stop} after "
+            f"{HTTP_OCR_CHUNK_RETRIES + 1} attempts: {error}"
+        ) from error
+    return "\n\n".join(text.strip() for text in texts if text and text.strip())
+
+
+def _run_http_ocr_chunks(
+    pending: list[int],
+    ocr_chunk: Callable[[int], str],
+    texts: list[str | None],
+    *,
+    workers: int,
+    label: str,
+) -> dict[int, Exception]:
+    """Fill ``texts`` for the ``pending`` chunks, retrying only failed ones.
+
+    Returns the last error of every chunk that still failed.
+    """
+    errors: dict[int, Exception] = {}
+    with ThreadPoolExecutor(
+        max_workers=workers,
+        thread_name_prefix="markitdown-http-ocr",
+    ) as executor:
+        for attempt in range(HTTP_OCR_CHUNK_RETRIES + 1):
+            if not pending:
+                break
+            if attempt:
+                logging.warning(
+                    "%s: retrying %d failed chunk(s), attempt %d of %d",
+                    label,
+                    len(pending),
+                    attempt + 1,
+                    HTTP_OCR_CHUNK_RETRIES + 1,
+                )
+            futures = {executor.submit(ocr_chunk, index): index for index in pending}
+            errors = {}
+            for future in as_completed(futures):
+                index = futures[future]
+                try:
+                    texts[index] = future.result()
+                except Exception as exc:
+                    errors[index] = exc
+            pending = sorted(errors)
+    return errors
+
+
+def _write_pdf_page_range(
+    pdfium,
+    source,
+    start: int,
+    stop: int,
+    output_path: Path,
+) -> None:
+    # pdfium is not thread-safe, so splitting shares the render lock.
+    with _PDFIUM_LOCK:
+        part = pdfium.PdfDocument.new()
+        try:
+            part.import_pages(source, list(range(start, stop)))
+            part.save(str(output_path))
+        finally:
+            part.close()
+
+
 def _extract_http_ocr_response_text(response: requests.Response) -> str:
     content_type = response.headers.get("content-type", "").lower()
     if "application/json" not in content_type:
@@ -1429,33 +2047,23 @@ def _find_text_in_http_ocr_payload(payload: object) -> str | None:
     return None
 
 
-def _iter_glmocr_ollama_images(file_path: str):
+def _iter_glmocr_ollama_images(
+    file_path: str,
+    *,
+    page_indexes: Sequence[int] | None = None,
+    options: ConversionOptions | None = None,
+):
     extension = Path(file_path).suffix.lower()
 
     if extension == PDF_EXTENSION:
-        try:
-            import pypdfium2 as pdfium
-        except ImportError as exc:
-            raise RuntimeError(
-                "GLM-OCR Ollama PDF conversion requires pypdfium2 to be installed."
-            ) from exc
-
-        pdf = pdfium.PdfDocument(file_path)
-        try:
-            for page_index in range(len(pdf)):
-                page = pdf[page_index]
-                bitmap = None
-                try:
-                    bitmap = page.render(scale=PDF_RENDER_SCALE)
-                    yield bitmap.to_pil().convert("RGB")
-                finally:
-                    if bitmap is not None and hasattr(bitmap, "close"):
-                        bitmap.close()
-                    if hasattr(page, "close"):
-                        page.close()
-        finally:
-            if hasattr(pdf, "close"):
-                pdf.close()
+        # Pages keep their render mode; the upload encoder picks the output
+        # mode, so grayscale and binary renders stay single-channel.
+        yield from _iter_pdf_page_images(
+            file_path,
+            missing_dependency_message=GLMOCR_OLLAMA_PDF_DEPENDENCY_MESSAGE,
+            page_indexes=page_indexes,
+            options=options,
+        )
         return
 
     try:
@@ -1470,11 +2078,13 @@ def _iter_glmocr_ollama_images(file_path: str):
 
 
 def _call_glmocr_ollama(image, options: ConversionOptions) -> str:
+    import requests
+
     request_url = _build_glmocr_ollama_url(options)
+    encoded = _encode_image_for_ollama(image, options)
     payload = {
         "model": options.normalized_glmocr_ollama_model,
         "prompt": GLMOCR_OLLAMA_PROMPT,
-        "images": [_encode_image_for_ollama(image)],
         "stream": False,
         "options": {
             "num_predict": GLMOCR_OLLAMA_MAX_TOKENS,
@@ -1484,11 +2094,21 @@ def _call_glmocr_ollama(image, options: ConversionOptions) -> str:
             "repeat_penalty": 1.1,
         },
     }
+    body = _glmocr_ollama_body(payload, encoded.data)
+    logging.info(
+        "GLM-OCR Ollama upload: %dx%d %s, %.1f KB on the wire, encoded in %.0f ms",
+        encoded.width,
+        encoded.height,
+        encoded.image_format.upper(),
+        len(body) / 1024,
+        encoded.seconds * 1000,
+    )
 
     try:
-        response = requests.post(
+        response = _http_session(request_url, options).post(
             request_url,
-            json=payload,
+            data=body,
+            headers={"Content-Type": "application/json"},
             timeout=GLMOCR_OLLAMA_TIMEOUT_SECONDS,
         )
     except requests.Timeout as exc:
@@ -1538,12 +2158,77 @@ def _build_glmocr_ollama_tags_url(options: ConversionOptions) -> str:
     return request_url.rstrip("/") + "/api/tags"
 
 
-def _encode_image_for_ollama(image) -> str:
-    if image.mode != "RGB":
-        image = image.convert("RGB")
-    buffer = BytesIO()
-    image.save(buffer, format="JPEG")
-    return base64.b64encode(buffer.getvalue()).decode("ascii")
+@dataclass(frozen=True)
+class EncodedImage:
+    """A page image encoded for upload, with its base64 ``data`` as ASCII bytes."""
+
+    data: bytes
+    image_format: str
+    width: int
+    height: int
+    seconds: float
+
+
+# Each OCR thread keeps its encoder buffer, which grows to the largest page
+# once instead of being reallocated for every page.
+_ENCODER_BUFFERS = threading.local()
+
+
+def _encode_image_for_ollama(image, options: ConversionOptions) -> EncodedImage:
+    """Downscale ``image`` to the configured long edge and encode it for Ollama."""
+    started = time.perf_counter()
+    image_format = options.normalized_glmocr_ollama_image_format
+    max_edge = options.normalized_glmocr_ollama_image_max_edge
+    if image.mode == "1" and image_format != OLLAMA_IMAGE_FORMAT_PNG:
+        # Lossy encoders take grayscale; converting first also lets the
+        # resize below filter binary pages instead of sampling them.
+        image = image.convert("L")
+    if max_edge and max(image.size) > max_edge:
+        from PIL import Image
+
+        ratio = max_edge / max(image.size)
+        image = image.resize(
+            (max(1, round(image.width * ratio)), max(1, round(image.height * ratio))),
+            Image.Resampling.LANCZOS,
+            reducing_gap=3.0,
+        )
+
+    save_kwargs: dict[str, object] = {"format": image_format.upper()}
+    if image_format == OLLAMA_IMAGE_FORMAT_PNG:
+        if image.mode not in {"RGB", "L", "1"}:
+            image = image.convert("RGB")
+    elif image_format == OLLAMA_IMAGE_FORMAT_JPEG:
+        save_kwargs["quality"] = options.normalized_glmocr_ollama_image_quality
+        # Grayscale pages stay single-channel, a third of the RGB size.
+        if image.mode not in {"RGB", "L"}:
+            image = image.convert("RGB")
+    else:
+        save_kwargs["quality"] = options.normalized_glmocr_ollama_image_quality
+        if image.mode not in {"RGB", "RGBA"}:
+            image = image.convert("RGB")
+
+    buffer = getattr(_ENCODER_BUFFERS, "buffer", None)
+    if buffer is None:
+        buffer = _ENCODER_BUFFERS.buffer = BytesIO()
+    buffer.seek(0)
+    buffer.truncate()
+    image.save(buffer, **save_kwargs)
+    with buffer.getbuffer() as encoded:
+        data = base64.b64encode(encoded)
+    return EncodedImage(
+        data=data,
+        image_format=image_format,
+        width=image.width,
+        height=image.height,
+        seconds=time.perf_counter() - started,
+    )
+
+
+def _glmocr_ollama_body(payload: dict[str, object], image_data: bytes) -> bytes:
+    # Splicing the base64 image into the serialised payload avoids decoding
+    # it to str and re-encoding it as part of a multi-megabyte JSON dump.
+    head = json.dumps(payload, separators=(",", ":"))
+    return b"".join((head[:-1].encode("utf-8"), b',"images":["', image_data, b'"]}'))
 
 
 def _map_pdf_assets(assets: list[object]) -> list[ConversionAsset]:
@@ -1563,11 +2248,16 @@ def _map_pdf_assets(assets: list[object]) -> list[ConversionAsset]:
     return mapped_assets
 
 
-def _convert_url_with_defuddle(url: str) -> str:
+def _convert_url_with_defuddle(
+    url: str,
+    options: ConversionOptions | None = None,
+) -> str:
+    import requests
+
     request_url = _build_defuddle_request_url(url)
 
     try:
-        response = requests.get(
+        response = _http_session(request_url, options).get(
             request_url,
             timeout=DEFUDDLE_REQUEST_TIMEOUT_SECONDS,
         )
@@ -1609,37 +2299,441 @@ def _convert_image_with_local_ocr(file_path: str, options: ConversionOptions) ->
 
 
 def _convert_pdf_with_local_ocr(file_path: str, options: ConversionOptions) -> str:
+    # Tesseract releases the GIL in process and runs as a subprocess
+    # otherwise, so OCR threads overlap freely while a render thread stays up
+    # to render_ahead pages in front of them.
+    page_texts = _ocr_pdf_pages(
+        file_path,
+        options,
+        render_pages=lambda page_indexes: _iter_pdf_page_images(
+            file_path,
+            missing_dependency_message=LOCAL_PDF_OCR_DEPENDENCY_MESSAGE,
+            page_indexes=page_indexes,
+            options=options,
+        ),
+        ocr_page=lambda image: _run_tesseract_ocr(image, options),
+        workers=options.normalized_ocr_page_workers,
+        label=f"Local OCR of {Path(file_path).name}",
+        provider=OCR_PROVIDER_AZURE_TESSERACT,
+        model=f"tesseract:{options.normalized_ocr_languages or 'default'}",
+        missing_dependency_message=LOCAL_PDF_OCR_DEPENDENCY_MESSAGE,
+    )
+    return "\n\n".join(page_texts).strip()
+
+
+def _ocr_pdf_pages(
+    file_path: str,
+    options: ConversionOptions,
+    *,
+    render_pages: Callable[[Sequence[int] | None], object],
+    ocr_page: Callable[[object], str],
+    workers: int,
+    label: str,
+    provider: str,
+    model: str,
+    missing_dependency_message: str,
+    cache_tag: str = "",
+) -> list[str]:
+    """OCR a PDF's pages in order, reusing page texts from the OCR page cache.
+
+    Cached pages are neither rendered nor OCR'd. Each newly OCR'd page is stored
+    as soon as it finishes, so a run that fails part way through resumes from
+    the pages it already completed. ``cache_tag`` adds provider settings that
+    change the recognised text, such as how pages are encoded for upload.
+    """
+    page_texts = _ocr_pdf_page_texts(
+        file_path,
+        options,
+        page_indexes=None,
+        render_pages=render_pages,
+        ocr_page=ocr_page,
+        workers=workers,
+        label=label,
+        provider=provider,
+        model=model,
+        missing_dependency_message=missing_dependency_message,
+        cache_tag=cache_tag,
+    )
+    return [
+        text.strip()
+        for _page_index, text in sorted(page_texts.items())
+        if text.strip()
+    ]
+
+
+def _ocr_pdf_page_texts(
+    file_path: str,
+    options: ConversionOptions,
+    *,
+    page_indexes: Sequence[int] | None,
+    render_pages: Callable[[Sequence[int] | None], object],
+    ocr_page: Callable[[object], str],
+    workers: int,
+    label: str,
+    provider: str,
+    model: str,
+    missing_dependency_message: str,
+    cache_tag: str = "",
+    failed_pages: dict[int, Exception] | None = None,
+) -> dict[int, str]:
+    """Return OCR text by page index for ``page_indexes``, or every page.
+
+    With ``failed_pages``, a page whose OCR raises is recorded there and left
+    out of the result instead of failing the document. Failures are never
+    cached.
+    """
+    page_cache = _ocr_page_cache(options)
+    page_texts: dict[int, str] = {}
+    page_keys: dict[int, str] = {}
+    missing_pages: list[int] | None = (
+        None if page_indexes is None else list(page_indexes)
+    )
+    if page_cache is not None:
+        if missing_pages is None:
+            missing_pages = list(
+                range(
+                    _pdf_page_count(
+                        file_path,
+                        missing_dependency_message=missing_dependency_message,
+                    )
+                )
+            )
+        document_key = page_cache.document_key(file_path)
+        render_mode = options.ocr_render_cache_tag
+        if cache_tag:
+            render_mode = f"{render_mode}:{cache_tag}"
+        for page_index in missing_pages:
+            page_keys[page_index] = page_cache.page_key(
+                document_key,
+                page_index,
+                render_scale=PDF_RENDER_SCALE,
+                provider=provider,
+                model=model,
+                render_mode=render_mode,
+            )
+            text = page_cache.get(page_keys[page_index])
+            if text is not None:
+                page_texts[page_index] = text
+        if page_texts:
+            logging.info(
+                "%s: reusing %d of %d pages from the OCR page cache",
+                label,
+                len(page_texts),
+                len(page_keys),
+            )
+        missing_pages = [index for index in missing_pages if index not in page_texts]
+        if not missing_pages:
+            return page_texts
+
+    def ocr_and_store(page: tuple[int, object]) -> str:
+        page_index, image = page
+        try:
+            text = ocr_page(image)
+        except Exception as exc:
+            if failed_pages is None:
+                raise
+            failed_pages[page_index] = exc
+            return ""
+        finally:
+            if hasattr(image, "close"):
+                image.close()
+        if page_cache is not None:
+            page_cache.put(page_keys[page_index], text.strip())
+        return text
+
+    page_numbers = count() if missing_pages is None else iter(missing_pages)
+    with closing(
+        _iter_rendered_ahead(
+            render_pages(missing_pages),
+            options.normalized_ocr_render_ahead,
+        )
+    ) as images:
+        ocr_texts = _ocr_pages_in_order(
+            zip(page_numbers, images),
+            ocr_and_store,
+            workers=workers,
+            label=label,
+            skip_empty=False,
+        )
+    ordered_pages = range(len(ocr_texts)) if missing_pages is None else missing_pages
+    for page_index, text in zip(ordered_pages, ocr_texts):
+        if failed_pages is None or page_index not in failed_pages:
+            page_texts[page_index] = text
+    return page_texts
+
+
+def _ocr_page_cache(options: ConversionOptions) -> OcrPageCache | None:
+    cache_dir = options.normalized_ocr_page_cache_dir
+    return _ocr_page_cache_for_root(cache_dir) if cache_dir else None
+
+
+@lru_cache(maxsize=4)
+def _ocr_page_cache_for_root(cache_dir: str) -> OcrPageCache:
+    return OcrPageCache(cache_dir)
+
+
+def _pdf_page_count(file_path: str, *, missing_dependency_message: str) -> int:
     try:
         import pypdfium2 as pdfium
     except ImportError as exc:
-        raise RuntimeError(
-            "Local PDF OCR requires pypdfium2 to be installed."
-        ) from exc
+        raise RuntimeError(missing_dependency_message) from exc
+
+    with _PDFIUM_LOCK:
+        pdf = pdfium.PdfDocument(file_path)
+        try:
+            return len(pdf)
+        finally:
+            if hasattr(pdf, "close"):
+                pdf.close()
+
+
+def _ocr_pages_in_order(
+    images,
+    ocr_page: Callable[[object], str],
+    *,
+    workers: int,
+    label: str,
+    skip_empty: bool = True,
+) -> list[str]:
+    """OCR page images on up to ``workers`` threads and return texts in page order.
 
+    Results are collected oldest first, so at most ``workers + 1`` pages are in
+    flight. Each page's latency and the overall wall time are logged. Pages
+    without text are dropped unless ``skip_empty`` is False.
+    """
+    started_at = time.perf_counter()
     page_texts: list[str] = []
-    pdf = pdfium.PdfDocument(file_path)
-    try:
-        for page_index in range(len(pdf)):
-            page = pdf[page_index]
-            bitmap = None
+    pending: deque[Future] = deque()
+    page_count = 0
+
+    def run_page(page_number: int, image) -> str:
+        page_started_at = time.perf_counter()
+        try:
+            return ocr_page(image)
+        finally:
+            if hasattr(image, "close"):
+                image.close()
+            logging.info(
+                "%s: page %d took %.2fs",
+                label,
+                page_number,
+                time.perf_counter() - page_started_at,
+            )
+
+    def collect_oldest_page() -> None:
+        page_text = pending.popleft().result().strip()
+        if page_text or not skip_empty:
+            page_texts.append(page_text)
+
+    with ThreadPoolExecutor(
+        max_workers=workers,
+        thread_name_prefix="markitdown-ocr",
+    ) as executor:
+        try:
+            for image in images:
+                page_count += 1
+                pending.append(executor.submit(run_page, page_count, image))
+                if len(pending) > workers:
+                    collect_oldest_page()
+            while pending:
+                collect_oldest_page()
+        except BaseException:
+            for future in pending:
+                future.cancel()
+            raise
+
+    logging.info(
+        "%s: %d pages with %d workers in %.2fs",
+        label,
+        page_count,
+        workers,
+        time.perf_counter() - started_at,
+    )
+    return page_texts
+
+
+def _iter_rendered_ahead(items, window: int):
+    """Yield from ``items`` while a producer thread renders up to ``window`` ahead.
+
+    The bounded queue caps how many rendered pages wait in memory. Closing the
+    returned generator stops the producer and closes the source iterator.
+    """
+    if window <= 0:
+        yield from items
+        return
+
+    ready: queue.Queue = queue.Queue(maxsize=window)
+    stop = threading.Event()
+    done = object()
+
+    def offer(item) -> bool:
+        while not stop.is_set():
             try:
-                bitmap = page.render(scale=PDF_RENDER_SCALE)
-                page_text = _run_tesseract_ocr(bitmap.to_pil(), options)
-                if page_text.strip():
-                    page_texts.append(page_text.strip())
-            finally:
-                if bitmap is not None and hasattr(bitmap, "close"):
-                    bitmap.close()
-                if hasattr(page, "close"):
-                    page.close()
+                ready.put(item, timeout=BATCH_POLL_INTERVAL_SECONDS)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce() -> None:
+        try:
+            for item in items:
+                if not offer((item, None)):
+                    return
+        except BaseException as exc:
+            offer((done, exc))
+            return
+        finally:
+            if hasattr(items, "close"):
+                items.close()
+        offer((done, None))
+
+    producer = threading.Thread(target=produce, name="markitdown-render", daemon=True)
+    producer.start()
+    try:
+        while True:
+            item, error = ready.get()
+            if item is done:
+                if error is not None:
+                    raise error
+                return
+            yield item
+    finally:
+        stop.set()
+        producer.join()
+
+
+def _iter_pdf_page_images(
+    file_path: str,
+    *,
+    missing_dependency_message: str,
+    page_indexes: Sequence[int] | None = None,
+    options: ConversionOptions | None = None,
+):
+    """Yield PDF pages rendered to PIL images, in page order.
+
+    ``page_indexes`` limits rendering to those zero-based pages. Each page is
+    rendered at the scale picked by ``_pdf_page_render_scale`` and in the
+    colour mode set by ``options``.
+    """
+    try:
+        import pypdfium2 as pdfium
+    except ImportError as exc:
+        raise RuntimeError(missing_dependency_message) from exc
+
+    options = options or ConversionOptions()
+    max_pixels = options.normalized_ocr_render_max_megapixels * 1_000_000
+    color = options.normalized_ocr_render_color
+    render_kwargs = {} if color == OCR_RENDER_COLOR_RGB else {"grayscale": True}
+
+    with _PDFIUM_LOCK:
+        pdf = pdfium.PdfDocument(file_path)
+        page_count = len(pdf)
+    try:
+        for page_index in page_indexes if page_indexes is not None else range(page_count):
+            # Hold the lock only while rendering so other conversions can use
+            # pdfium while this page is being OCR'd.
+            with _PDFIUM_LOCK:
+                page = pdf[page_index]
+                bitmap = None
+                try:
+                    bitmap = page.render(
+                        scale=_pdf_page_render_scale(page, max_pixels=max_pixels),
+                        **render_kwargs,
+                    )
+                    image = bitmap.to_pil()
+                    if color == OCR_RENDER_COLOR_BINARY:
+                        # Converting copies the pixels out of pdfium's buffer.
+                        image = image.convert("1", dither=0)
+                    elif getattr(bitmap, "mode", None) in _PDFIUM_SHARED_BUFFER_MODES:
+                        # PIL maps these modes onto pdfium's buffer, which
+                        # bitmap.close() frees before the image is OCR'd.
+                        image = image.copy()
+                finally:
+                    if bitmap is not None and hasattr(bitmap, "close"):
+                        bitmap.close()
+                    if hasattr(page, "close"):
+                        page.close()
+            yield image
     finally:
         if hasattr(pdf, "close"):
-            pdf.close()
+            with _PDFIUM_LOCK:
+                pdf.close()
 
-    return "\n\n".join(page_texts).strip()
+
+def pdf_render_scale(
+    page_width: float,
+    page_height: float,
+    *,
+    max_pixels: int,
+    scan_dpi: float | None = None,
+) -> float:
+    """Pick the render scale for a page measured in PDF points.
+
+    Pages render at ``PDF_RENDER_SCALE`` unless their scan image has a lower
+    resolution, which extra pixels cannot add detail to, or the bitmap would
+    exceed ``max_pixels``. The pixel budget wins over ``MIN_PDF_RENDER_SCALE``
+    so large-format pages stay within memory.
+    """
+    scale = PDF_RENDER_SCALE
+    if scan_dpi:
+        scale = min(scale, max(MIN_PDF_RENDER_SCALE, scan_dpi / 72))
+    area = page_width * page_height
+    if area > 0 and max_pixels > 0:
+        scale = min(scale, (max_pixels / area) ** 0.5)
+    return scale
+
+
+def _pdf_page_render_scale(page, *, max_pixels: int) -> float:
+    try:
+        page_width, page_height = page.get_size()
+    except Exception:
+        return PDF_RENDER_SCALE
+    return pdf_render_scale(
+        page_width,
+        page_height,
+        max_pixels=max_pixels,
+        scan_dpi=_pdf_page_scan_dpi(page, page_width * page_height),
+    )
+
+
+def _pdf_page_scan_dpi(page, page_area: float) -> float | None:
+    """Return the resolution of an image covering most of ``page``, if any."""
+    try:
+        import pypdfium2.raw as pdfium_c
+
+        images = page.get_objects(filter=(pdfium_c.FPDF_PAGEOBJ_IMAGE,))
+        scan_dpi = None
+        for image in images:
+            get_bounds = getattr(image, "get_bounds", None) or image.get_pos
+            left, bottom, right, top = get_bounds()
+            covered = (right - left) * (top - bottom)
+            if covered <= 0 or covered < page_area * PDF_SCAN_IMAGE_MIN_COVERAGE:
+                continue
+            pixel_width, pixel_height = image.get_px_size()
+            # Area-based, so the result does not depend on image rotation.
+            dpi = ((pixel_width * pixel_height) / covered) ** 0.5 * 72
+            scan_dpi = max(scan_dpi or 0.0, dpi)
+        return scan_dpi
+    except Exception as exc:
+        logging.debug("Could not measure PDF page image resolution: %s", exc)
+        return None
 
 
 def _run_tesseract_ocr(image, options: ConversionOptions) -> str:
+    if options.reuse_tesseract_engines and tesserocr_available():
+        try:
+            return recognize_with_tesseract_engine(
+                image,
+                lang=options.normalized_ocr_languages,
+                tessdata_dir=tessdata_dir_for(options.normalized_tesseract_path),
+                timeout_seconds=LOCAL_OCR_TIMEOUT_SECONDS,
+            )
+        except Exception as exc:
+            raise RuntimeError(
+                "Local OCR failed. Install Tesseract or set its path in Settings."
+            ) from exc
+
     try:
         import pytesseract
     except ImportError as exc:
@@ -1662,62 +2756,221 @@ def _run_tesseract_ocr(image, options: ConversionOptions) -> str:
         ) from exc
 
 
-class ConversionWorker(QThread):
-    progress = Signal(int, str)
-    itemStarted = Signal(str)
-    itemFinished = Signal(str, object, bool)
-    finished = Signal(dict)
-    error = Signal(str)
+def _convert_batch_item(
+    file_path: str,
+    options: ConversionOptions,
+    markitdown_session: MarkItDownSession,
+    conversion_cache: ConversionCache | None = None,
+) -> tuple[ConversionOutcome, bool]:
+    try:
+        outcome = convert_file_with_details(
+            file_path,
+            options,
+            markitdown_session=markitdown_session,
+            conversion_cache=conversion_cache,
+        )
+    except Exception as exc:
+        return ConversionOutcome(markdown=format_conversion_error(file_path, exc)), True
+    return outcome, False
 
-    def __init__(
-        self,
-        files: list[str],
-        batch_size: int,
-        options: ConversionOptions | None = None,
-    ):
-        super().__init__()
-        self.files = files
-        # Retained for callers/settings profiles created before serial scheduling.
-        # A batch boundary never produced concurrency, so it no longer affects work.
-        self.batch_size = batch_size
-        self.options = options or ConversionOptions()
-        self.failed_files: set[str] = set()
-        self.processing_backends: dict[str, str] = {}
-        self.is_paused = False
-        self.is_cancelled = False
-
-    def run(self) -> None:
-        results: dict[str, ConversionOutcome] = {}
-        self.failed_files = set()
-        self.processing_backends = {}
-        markitdown_session = MarkItDownSession()
-
-        for index, file_path in enumerate(self.files):
-            while self.is_paused:
-                if self.is_cancelled:
+
+def _init_conversion_process(options: ConversionOptions) -> None:
+    global _PROCESS_MARKITDOWN_SESSION
+    _PROCESS_MARKITDOWN_SESSION = MarkItDownSession()
+    try:
+        # Pay MarkItDown's import and converter registration once per process
+        # instead of on the first file each process receives.
+        _PROCESS_MARKITDOWN_SESSION.get(options)
+    except Exception as exc:
+        logging.warning("Could not preload MarkItDown in conversion process: %s", exc)
+
+
+def _convert_batch_item_in_process(
+    file_path: str,
+    options: ConversionOptions,
+) -> tuple[ConversionOutcome, bool]:
+    global _PROCESS_MARKITDOWN_SESSION
+    if _PROCESS_MARKITDOWN_SESSION is None:
+        _PROCESS_MARKITDOWN_SESSION = MarkItDownSession()
+    return _convert_batch_item(file_path, options, _PROCESS_MARKITDOWN_SESSION)
+
+
+def _create_batch_executor(
+    pool_size: int,
+    options: ConversionOptions,
+    *,
+    use_process_pool: bool,
+) -> ThreadPoolExecutor | ProcessPoolExecutor:
+    if use_process_pool:
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        # Spawn keeps Qt and pdfium state out of children; fork would copy
+        # whatever the GUI threads hold mid-operation.
+        return ProcessPoolExecutor(
+            max_workers=pool_size,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_conversion_process,
+            initargs=(options,),
+        )
+    return ThreadPoolExecutor(
+        max_workers=pool_size,
+        thread_name_prefix="markitdown-convert",
+    )
+
+
+def _completed_batch_future(outcome: ConversionOutcome, failed: bool) -> Future:
+    future: Future = Future()
+    future.set_result((outcome, failed))
+    return future
+
+
+def _failed_batch_result(
+    file_path: str,
+    error: Exception,
+) -> tuple[ConversionOutcome, bool]:
+    return ConversionOutcome(markdown=format_conversion_error(file_path, error)), True
+
+
+def _submit_to_process_pool(
+    executor: ProcessPoolExecutor,
+    file_path: str,
+    options: ConversionOptions,
+    conversion_cache: ConversionCache | None,
+    process_cache_keys: dict[Future, str],
+) -> Future:
+    cache_key = None
+    if conversion_cache is not None:
+        cache_key = conversion_cache.key_for(file_path, options)
+        if cache_key is not None:
+            cached_outcome = conversion_cache.get(cache_key, options)
+            if cached_outcome is not None:
+                return _completed_batch_future(cached_outcome, False)
+
+    try:
+        future = executor.submit(_convert_batch_item_in_process, file_path, options)
+    except Exception as exc:
+        # A crashed child breaks the whole process pool.
+        return _completed_batch_future(*_failed_batch_result(file_path, exc))
+    if cache_key is not None:
+        process_cache_keys[future] = cache_key
+    return future
+
+
+def run_conversion_batch(
+    files: Sequence[str],
+    options: ConversionOptions | None = None,
+    *,
+    max_workers: int = 1,
+    on_started: Callable[[str], None] | None = None,
+    on_finished: Callable[[str, ConversionOutcome, bool], None] | None = None,
+    on_finished_batch: (
+        Callable[[list[tuple[str, ConversionOutcome, bool]]], None] | None
+    ) = None,
+    on_progress: Callable[[int, str], None] | None = None,
+    is_paused: Callable[[], bool] = lambda: False,
+    is_cancelled: Callable[[], bool] = lambda: False,
+    wait_while_paused: Callable[[], None] | None = None,
+    use_process_pool: bool = False,
+    conversion_cache: ConversionCache | None = None,
+) -> ConversionBatchSummary:
+    """Convert ``files`` on a bounded pool, streaming each outcome to ``on_finished``.
+
+    Outcomes are not retained, so memory does not grow with the batch; the
+    return value only carries counters. Callbacks run on the calling thread.
+    Pausing stops new dispatch and cancelling abandons queued files; in-flight
+    conversions always finish and are reported so every started item also
+    gets a finished callback. ``on_finished_batch`` additionally receives
+    every outcome that completed in the same poll round as one list, so UI
+    consumers can apply bursts of completions at once.
+
+    ``use_process_pool`` runs each conversion in a spawned process holding its
+    own warm ``MarkItDownSession``. That scales GIL-bound native converters
+    across cores at the cost of process start-up and pickling outcomes back.
+    With a ``conversion_cache`` thread workers consult it themselves, while
+    process mode looks files up before dispatch and stores results on return.
+    """
+    options = options or ConversionOptions()
+    files = list(files)
+    pool_size = max(1, int(max_workers))
+    wait_while_paused = wait_while_paused or (
+        lambda: time.sleep(BATCH_POLL_INTERVAL_SECONDS)
+    )
+    markitdown_session = None if use_process_pool else MarkItDownSession()
+    pending: dict[Future, str] = {}
+    process_cache_keys: dict[Future, str] = {}
+    next_index = 0
+    completed = 0
+    failed_count = 0
+
+    with _create_batch_executor(
+        pool_size,
+        options,
+        use_process_pool=use_process_pool,
+    ) as executor:
+        while True:
+            while (
+                next_index < len(files)
+                and len(pending) < pool_size
+                and not is_cancelled()
+                and not is_paused()
+            ):
+                file_path = files[next_index]
+                next_index += 1
+                if on_started is not None:
+                    on_started(file_path)
+                if markitdown_session is None:
+                    future = _submit_to_process_pool(
+                        executor,
+                        file_path,
+                        options,
+                        conversion_cache,
+                        process_cache_keys,
+                    )
+                else:
+                    future = executor.submit(
+                        _convert_batch_item,
+                        file_path,
+                        options,
+                        markitdown_session,
+                        conversion_cache,
+                    )
+                pending[future] = file_path
+
+            if not pending:
+                if next_index >= len(files) or is_cancelled():
                     break
-                self.msleep(100)
-            if self.is_cancelled:
-                break
+                wait_while_paused()
+                continue
 
-            failed = False
-            self.itemStarted.emit(file_path)
-            try:
-                outcome = convert_file_with_details(
-                    file_path,
-                    self.options,
-                    markitdown_session=markitdown_session,
-                )
-                results[file_path] = outcome
-                self.processing_backends[file_path] = outcome.backend
-            except Exception as exc:
-                failed = True
-                self.failed_files.add(file_path)
-                outcome = ConversionOutcome(markdown=format_conversion_error(file_path, exc))
-                results[file_path] = outcome
-
-            self.itemFinished.emit(file_path, outcome, failed)
-            progress = int((index + 1) / len(self.files) * 100)
-            self.progress.emit(progress, file_path)
-
-        self.finished.emit(results)
+            done, _not_done = wait(
+                pending,
+                timeout=BATCH_POLL_INTERVAL_SECONDS,
+                return_when=FIRST_COMPLETED,
+            )
+            finished_batch: list[tuple[str, ConversionOutcome, bool]] = []
+            for future in [future for future in pending if future in done]:
+                file_path = pending.pop(future)
+                try:
+                    outcome, failed = future.result()
+                except Exception as exc:
+                    outcome, failed = _failed_batch_result(file_path, exc)
+                cache_key = process_cache_keys.pop(future, None)
+                if cache_key is not None and not failed:
+                    conversion_cache.put(cache_key, outcome)
+                completed += 1
+                failed_count += int(failed)
+                if on_finished is not None:
+                    on_finished(file_path, outcome, failed)
+                finished_batch.append((file_path, outcome, failed))
+                if on_progress is not None:
+                    on_progress(int(completed / len(files) * 100), file_path)
+            if finished_batch and on_finished_batch is not None:
+                on_finished_batch(finished_batch)
+
+    return ConversionBatchSummary(
+        total=len(files),
+        completed=completed,
+        failed=failed_count,
+        cancelled=completed < len(files) and is_cancelled(),
+    )
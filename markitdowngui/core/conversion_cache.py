@@ -0,0 +1,342 @@
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass, fields
+from functools import lru_cache
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from secrets import token_hex
+import shutil
+import tempfile
+import threading
+
+from markitdowngui.core.conversion import (
+    ConversionAsset,
+    ConversionOptions,
+    ConversionOutcome,
+)
+from markitdowngui.core.input_sources import is_web_url
+
+
+CACHE_FORMAT_VERSION = 1
+DEFAULT_CACHE_MAX_BYTES = 512 * 1024 * 1024
+_HASH_CHUNK_BYTES = 1024 * 1024
+_ENTRY_FILENAME = "outcome.json"
+_ASSETS_DIRNAME = "assets"
+# Evicting after a store trims to this share of max_bytes, so a full cache is
+# rescanned once per few stores instead of on every one.
+_EVICT_LOW_WATER_RATIO = 0.9
+# Options that only change where files land, how long a request may take or
+# how much work runs at once.
+_NON_OUTPUT_OPTION_FIELDS = frozenset(
+    {
+        "pdf_artifacts_dir",
+        "docx_artifacts_dir",
+        "http_ocr_api_key_env",
+        "http_ocr_timeout_seconds",
+        "ocr_page_workers",
+        "ocr_render_ahead",
+        "glmocr_ollama_concurrency",
+        "http_pool_size",
+        "http_max_retries",
+        "ocr_page_cache_dir",
+        "reuse_tesseract_engines",
+        "http_ocr_chunk_workers",
+    }
+)
+_FINGERPRINT_PACKAGES = ("markitdown", "markitdowngui")
+
+
+def default_cache_dir() -> Path:
+    """Return the persistent conversion cache directory under ~/.markitdown."""
+    return Path.home() / ".markitdown" / "cache" / "conversions"
+
+
+def options_fingerprint(options: ConversionOptions) -> str:
+    """Return a stable digest of the options that can change conversion output."""
+    values = {
+        item.name: getattr(options, item.name)
+        for item in fields(options)
+        if item.name not in _NON_OUTPUT_OPTION_FIELDS
+    }
+    payload = {
+        "format": CACHE_FORMAT_VERSION,
+        "options": values,
+        "packages": _package_versions(),
+    }
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def file_content_hash(file_path: str | Path) -> str:
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(_HASH_CHUNK_BYTES), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+@dataclass(frozen=True)
+class ConversionCacheStats:
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+    size_bytes: int = 0
+    entries: int = 0
+
+
+class ConversionCache:
+    """Persistent, size-bounded cache of conversion outcomes keyed by content.
+
+    Entries are stored as ``<root>/<key[:2]>/<key>/outcome.json`` plus an
+    ``assets`` directory holding copies of preserved images. Each hit touches
+    the entry, so evicting the oldest modification time first is LRU.
+
+    The total size is scanned once and then tracked as entries are stored, so
+    the directory is only walked again when a store pushes it over budget.
+    """
+
+    def __init__(
+        self,
+        root: str | Path | None = None,
+        *,
+        max_bytes: int = DEFAULT_CACHE_MAX_BYTES,
+    ) -> None:
+        self.root = Path(root) if root is not None else default_cache_dir()
+        self.max_bytes = max(0, int(max_bytes))
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._stores = 0
+        self._evictions = 0
+        self._size_bytes: int | None = None
+        self._entry_count = 0
+
+    def key_for(self, file_path: str, options: ConversionOptions) -> str | None:
+        """Return the cache key for a local file, or None when it cannot be cached."""
+        if is_web_url(file_path) or not Path(file_path).is_file():
+            return None
+        try:
+            content_hash = file_content_hash(file_path)
+        except OSError as exc:
+            logging.warning("Could not hash %s for the conversion cache: %s", file_path, exc)
+            return None
+        # The converter is chosen by extension, so identical bytes under a
+        # different suffix can convert differently.
+        suffix = Path(file_path).suffix.lower()
+        combined = f"{content_hash}:{suffix}:{options_fingerprint(options)}"
+        return hashlib.sha256(combined.encode("utf-8")).hexdigest()
+
+    def get(self, key: str, options: ConversionOptions) -> ConversionOutcome | None:
+        entry_dir = self._entry_dir(key)
+        try:
+            payload = json.loads((entry_dir / _ENTRY_FILENAME).read_text(encoding="utf-8"))
+            outcome = self._restore_outcome(entry_dir, payload, options)
+        except (OSError, ValueError, KeyError, TypeError) as exc:
+            if not isinstance(exc, FileNotFoundError):
+                logging.warning("Discarding unreadable conversion cache entry %s: %s", key, exc)
+                shutil.rmtree(entry_dir, ignore_errors=True)
+            self._count("_misses")
+            return None
+
+        try:
+            os.utime(entry_dir / _ENTRY_FILENAME)
+        except OSError:
+            pass
+        self._count("_hits")
+        return outcome
+
+    def put(self, key: str, outcome: ConversionOutcome) -> None:
+        entry_dir = self._entry_dir(key)
+        if (entry_dir / _ENTRY_FILENAME).is_file():
+            return
+
+        entry_dir.parent.mkdir(parents=True, exist_ok=True)
+        staging_dir = Path(
+            tempfile.mkdtemp(prefix=f".{key[:8]}-{token_hex(4)}-", dir=entry_dir.parent)
+        )
+        try:
+            assets = []
+            for index, asset in enumerate(outcome.assets):
+                cached_name = ""
+                if asset.source_path and Path(asset.source_path).is_file():
+                    cached_name = f"{index:04d}-{Path(asset.source_path).name}"
+                    (staging_dir / _ASSETS_DIRNAME).mkdir(exist_ok=True)
+                    shutil.copy2(
+                        asset.source_path,
+                        staging_dir / _ASSETS_DIRNAME / cached_name,
+                    )
+                assets.append({**asdict(asset), "source_path": cached_name or None})
+
+            payload = {
+                "format": CACHE_FORMAT_VERSION,
+                "markdown": outcome.markdown,
+                "backend": outcome.backend,
+                "assets": assets,
+            }
+            (staging_dir / _ENTRY_FILENAME).write_text(
+                json.dumps(payload, ensure_ascii=False),
+                encoding="utf-8",
+            )
+            entry_size = _directory_size(staging_dir)
+            try:
+                staging_dir.replace(entry_dir)
+            except OSError:
+                # Another worker stored the same key first; keep its entry.
+                return
+        except OSError as exc:
+            logging.warning("Could not store conversion cache entry %s: %s", key, exc)
+            return
+        finally:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+
+        with self._lock:
+            self._stores += 1
+            if self._size_bytes is not None:
+                self._size_bytes += entry_size
+                self._entry_count += 1
+            should_evict = self._size_bytes is None or self._size_bytes > self.max_bytes
+        if should_evict:
+            self._evict_to(int(self.max_bytes * _EVICT_LOW_WATER_RATIO))
+
+    def evict(self) -> int:
+        """Remove least recently used entries until the cache fits in max_bytes."""
+        return self._evict_to(self.max_bytes)
+
+    def clear(self) -> None:
+        shutil.rmtree(self.root, ignore_errors=True)
+        with self._lock:
+            self._size_bytes = None
+
+    def stats(self) -> ConversionCacheStats:
+        entries = self._scan_entries()
+        with self._lock:
+            return ConversionCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                stores=self._stores,
+                evictions=self._evictions,
+                size_bytes=sum(size for _mtime, size, _path in entries),
+                entries=len(entries),
+            )
+
+    def tracked_stats(self) -> ConversionCacheStats:
+        """Return the counters and tracked size without walking the cache.
+
+        Size and entry count reflect the last scan plus later stores, and are
+        zero until this instance has stored or evicted anything.
+        """
+        with self._lock:
+            return ConversionCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                stores=self._stores,
+                evictions=self._evictions,
+                size_bytes=self._size_bytes or 0,
+                entries=self._entry_count if self._size_bytes is not None else 0,
+            )
+
+    def _entry_dir(self, key: str) -> Path:
+        return self.root / key[:2] / key
+
+    def _restore_outcome(
+        self,
+        entry_dir: Path,
+        payload: dict,
+        options: ConversionOptions,
+    ) -> ConversionOutcome:
+        if payload.get("format") != CACHE_FORMAT_VERSION:
+            raise ValueError("unsupported cache entry format")
+
+        raw_assets = payload["assets"]
+        asset_dir = self._asset_restore_dir(options) if raw_assets else None
+        assets: list[ConversionAsset] = []
+        for raw_asset in raw_assets:
+            source_path = None
+            if raw_asset.get("source_path"):
+                cached_path = entry_dir / _ASSETS_DIRNAME / raw_asset["source_path"]
+                if not cached_path.is_file():
+                    raise FileNotFoundError(str(cached_path))
+                if asset_dir is not None:
+                    # Copy out so eviction cannot remove files a result still uses.
+                    restored_path = asset_dir / cached_path.name
+                    shutil.copy2(cached_path, restored_path)
+                    source_path = str(restored_path)
+                else:
+                    source_path = str(cached_path)
+            assets.append(ConversionAsset(**{**raw_asset, "source_path": source_path}))
+
+        return ConversionOutcome(
+            markdown=payload["markdown"],
+            backend=payload["backend"],
+            assets=assets,
+        )
+
+    @staticmethod
+    def _asset_restore_dir(options: ConversionOptions) -> Path | None:
+        artifacts_dir = (
+            options.normalized_pdf_artifacts_dir
+            or options.normalized_docx_artifacts_dir
+        )
+        if not artifacts_dir:
+            return None
+        root = Path(artifacts_dir)
+        root.mkdir(parents=True, exist_ok=True)
+        return Path(tempfile.mkdtemp(prefix="cached-assets-", dir=root))
+
+    def _evict_to(self, max_bytes: int) -> int:
+        entries = self._scan_entries()
+        total = sum(size for _mtime, size, _path in entries)
+        removed = 0
+        if total > self.max_bytes:
+            for _mtime, size, entry_dir in sorted(entries):
+                if total <= max_bytes:
+                    break
+                shutil.rmtree(entry_dir, ignore_errors=True)
+                total -= size
+                removed += 1
+        with self._lock:
+            self._size_bytes = total
+            self._entry_count = len(entries) - removed
+            self._evictions += removed
+        return removed
+
+    def _scan_entries(self) -> list[tuple[float, int, Path]]:
+        entries: list[tuple[float, int, Path]] = []
+        if not self.root.is_dir():
+            return entries
+        for shard in self.root.iterdir():
+            if not shard.is_dir():
+                continue
+            for entry_dir in shard.iterdir():
+                marker = entry_dir / _ENTRY_FILENAME
+                try:
+                    mtime = marker.stat().st_mtime
+                except OSError:
+                    continue
+                entries.append((mtime, _directory_size(entry_dir), entry_dir))
+        return entries
+
+    def _count(self, counter: str, amount: int = 1) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + amount)
+
+
+def _directory_size(path: Path) -> int:
+    return sum(item.stat().st_size for item in path.rglob("*") if item.is_file())
+
+
+@lru_cache(maxsize=1)
+def _package_versions() -> dict[str, str]:
+    from importlib import metadata
+
+    versions: dict[str, str] = {}
+    for package in _FINGERPRINT_PACKAGES:
+        try:
+            versions[package] = metadata.version(package)
+        except metadata.PackageNotFoundError:
+            versions[package] = ""
+    return versions
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from PySide6.QtCore import QThread, Signal
+
+from markitdowngui.core.conversion import (
+    ConversionBatchSummary,
+    ConversionOptions,
+    ConversionOutcome,
+    run_conversion_batch,
+)
+from markitdowngui.core.conversion_cache import ConversionCache
+
+
+class ConversionWorker(QThread):
+    progress = Signal(int, str)
+    itemStarted = Signal(str)
+    itemFinished = Signal(str, object, bool)
+    # Outcomes that completed together, as (source, outcome, failed) tuples.
+    itemsFinished = Signal(list)
+    # Outcomes stream through itemFinished; finished only carries the
+    # ConversionBatchSummary counters.
+    finished = Signal(object)
+    error = Signal(str)
+
+    def __init__(
+        self,
+        files: list[str],
+        batch_size: int,
+        options: ConversionOptions | None = None,
+        *,
+        use_process_pool: bool = False,
+        conversion_cache: ConversionCache | None = None,
+    ):
+        super().__init__()
+        self.files = files
+        # Upper bound on conversions running at once; clamped to at least one.
+        self.batch_size = batch_size
+        self.options = options or ConversionOptions()
+        self.use_process_pool = use_process_pool
+        self.conversion_cache = conversion_cache
+        self.failed_files: set[str] = set()
+        self.processing_backends: dict[str, str] = {}
+        self.is_paused = False
+        self.is_cancelled = False
+
+    def run(self) -> None:
+        self.failed_files = set()
+        self.processing_backends = {}
+
+        summary: ConversionBatchSummary = run_conversion_batch(
+            self.files,
+            self.options,
+            max_workers=self.batch_size,
+            on_started=self.itemStarted.emit,
+            on_finished=self._handle_item_finished,
+            on_finished_batch=self.itemsFinished.emit,
+            on_progress=self.progress.emit,
+            is_paused=lambda: self.is_paused,
+            is_cancelled=lambda: self.is_cancelled,
+            wait_while_paused=lambda: self.msleep(100),
+            use_process_pool=self.use_process_pool,
+            conversion_cache=self.conversion_cache,
+        )
+        self.finished.emit(summary)
+
+    def _handle_item_finished(
+        self,
+        file_path: str,
+        outcome: ConversionOutcome,
+        failed: bool,
+    ) -> None:
+        if failed:
+            self.failed_files.add(file_path)
+        else:
+            self.processing_backends[file_path] = outcome.backend
+        self.itemFinished.emit(file_path, outcome, failed)
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, fields
+import re
+
+
+HEADING_LINE = re.compile(r"^ {0,3}#{1,6}(?:\s|$)")
+# A delimiter row needs a pipe, so a bare "---" rule is not a table.
+TABLE_DELIMITER_LINE = re.compile(
+    r"^\s*(?:\|\s*:?-{3,}:?\s*(?:\|\s*:?-{3,}:?\s*)*"
+    r"|:?-{3,}:?\s*(?:\|\s*:?-{3,}:?\s*)+)\|?\s*$"
+)
+IMAGE_REFERENCE = re.compile(r"!\[[^\]]*\]\([^)]*\)|<img\b", re.IGNORECASE)
+CODE_FENCE_LINE = re.compile(r"^ {0,3}(`{3,}|~{3,})")
+# pdfminer-based converters separate PDF pages with form feeds.
+PAGE_BREAK = "\f"
+
+
+@dataclass(frozen=True)
+class DocumentStats:
+    """Size and structure counters for one Markdown document.
+
+    ``pages`` is only known when the converter kept page breaks and is zero
+    otherwise. Instances add up, so batch totals are a sum of per-item stats.
+    """
+
+    words: int = 0
+    characters: int = 0
+    lines: int = 0
+    headings: int = 0
+    tables: int = 0
+    images: int = 0
+    pages: int = 0
+
+    def __add__(self, other: DocumentStats) -> DocumentStats:
+        return DocumentStats(
+            **{
+                item.name: getattr(self, item.name) + getattr(other, item.name)
+                for item in fields(self)
+            }
+        )
+
+    def __sub__(self, other: DocumentStats) -> DocumentStats:
+        return DocumentStats(
+            **{
+                item.name: getattr(self, item.name) - getattr(other, item.name)
+                for item in fields(self)
+            }
+        )
+
+
+def compute_document_stats(markdown: str) -> DocumentStats:
+    """Count words and Markdown structure in a single pass over the lines.
+
+    Headings, tables and images inside fenced code blocks are not counted.
+    """
+    words = 0
+    lines = 0
+    headings = 0
+    tables = 0
+    images = 0
+    open_fence = ""
+    # Split on newlines only: str.splitlines() also breaks at the form feeds
+    # that separate PDF pages, which would inflate the line count.
+    text_lines = markdown.split("\n")
+    if text_lines[-1] == "":
+        text_lines.pop()
+    for line in text_lines:
+        lines += 1
+        words += len(line.split())
+        fence = CODE_FENCE_LINE.match(line)
+        if fence:
+            marker = fence.group(1)
+            if not open_fence:
+                open_fence = marker
+            elif marker[0] == open_fence[0] and len(marker) >= len(open_fence):
+                open_fence = ""
+            continue
+        if open_fence:
+            continue
+        if HEADING_LINE.match(line):
+            headings += 1
+        elif TABLE_DELIMITER_LINE.match(line):
+            tables += 1
+        if "![" in line or "<img" in line.lower():
+            images += len(IMAGE_REFERENCE.findall(line))
+
+    page_breaks = markdown.count(PAGE_BREAK)
+    return DocumentStats(
+        words=words,
+        characters=len(markdown),
+        lines=lines,
+        headings=headings,
+        tables=tables,
+        images=images,
+        pages=page_breaks + 1 if page_breaks else 0,
+    )
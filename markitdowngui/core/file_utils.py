@@ -4,7 +4,7 @@ from pathlib import Path
 import stat
 from secrets import token_hex
 from datetime import datetime
-from typing import List, Dict
+from typing import Dict, Iterable, List
 
 
 @dataclass
@@ -61,8 +61,31 @@ class FileManager:
             staged_file.abort()
 
     @staticmethod
-    def stage_markdown_file(filepath: str, content: str) -> StagedMarkdownFile:
-        """Write Markdown beside its destination without replacing the current file."""
+    def stage_markdown_file(
+        filepath: str,
+        content: str,
+        *,
+        fsync: bool = True,
+    ) -> StagedMarkdownFile:
+        """Write Markdown beside its destination without replacing the current file.
+
+        Callers passing ``fsync=False`` must sync the staged file before
+        committing it.
+        """
+        return FileManager.stage_markdown_chunks(filepath, (content,), fsync=fsync)
+
+    @staticmethod
+    def stage_markdown_chunks(
+        filepath: str,
+        chunks: Iterable[str],
+        *,
+        fsync: bool = True,
+    ) -> StagedMarkdownFile:
+        """Stage Markdown produced piece by piece, e.g. a streamed combined save.
+
+        Each chunk is written as it arrives, so the full document never has to
+        exist as one string. If the iterable raises, the staged file is removed.
+        """
         destination = Path(filepath)
         if destination.is_symlink():
             destination = destination.resolve()
@@ -77,9 +100,11 @@ class FileManager:
                 os.fchmod(descriptor, stat.S_IMODE(destination.stat().st_mode))
             with os.fdopen(descriptor, "w", encoding="utf-8") as handle:
                 descriptor = -1
-                handle.write(content)
+                for chunk in chunks:
+                    handle.write(chunk)
                 handle.flush()
-                os.fsync(handle.fileno())
+                if fsync:
+                    os.fsync(handle.fileno())
         except Exception:
             if descriptor != -1:
                 os.close(descriptor)
@@ -87,6 +112,7 @@ class FileManager:
                 os.unlink(temporary_path)
             raise
         return StagedMarkdownFile(destination, Path(temporary_path))
+
     @staticmethod
     def update_recent_list(filepath: str, recent_list: List[str], max_items: int = 10) -> List[str]:
         """Update a list of recent files."""
@@ -0,0 +1,222 @@
+from __future__ import annotations
+
+from bisect import bisect_right
+from functools import lru_cache
+from io import BytesIO
+import os
+from pathlib import Path
+from secrets import token_hex
+import threading
+from typing import TYPE_CHECKING, BinaryIO, Iterator, Mapping
+from urllib.parse import quote, urlsplit
+
+if TYPE_CHECKING:
+    import requests
+
+
+DEFAULT_HTTP_POOL_SIZE = 8
+DEFAULT_HTTP_MAX_RETRIES = 2
+HTTP_RETRY_BACKOFF_FACTOR = 0.5
+HTTP_RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+HTTP_RETRY_AFTER_MAX_SECONDS = 30
+MAX_HTTP_POOL_SIZE = 64
+MAX_HTTP_RETRIES = 10
+HTTP_UPLOAD_BLOCK_SIZE = 1024 * 1024
+
+
+class HttpSessionPool:
+    """Share one keep-alive ``requests.Session`` per endpoint origin.
+
+    Sessions are keyed by scheme, host and port together with the pool size and
+    retry budget, so per-page OCR calls reuse warm TCP/TLS connections instead
+    of opening a new one for every request.
+    """
+
+    def __init__(self) -> None:
+        self._sessions: dict[tuple[str, int, int], requests.Session] = {}
+        self._lock = threading.Lock()
+
+    def session_for(
+        self,
+        url: str,
+        *,
+        pool_size: int = DEFAULT_HTTP_POOL_SIZE,
+        max_retries: int = DEFAULT_HTTP_MAX_RETRIES,
+    ) -> requests.Session:
+        key = (_endpoint_origin(url), max(1, int(pool_size)), max(0, int(max_retries)))
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is None:
+                session = _build_session(pool_size=key[1], max_retries=key[2])
+                self._sessions[key] = session
+            return session
+
+    def close(self) -> None:
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+        for session in sessions:
+            session.close()
+
+
+_DEFAULT_POOL = HttpSessionPool()
+
+
+def get_http_session(
+    url: str,
+    *,
+    pool_size: int = DEFAULT_HTTP_POOL_SIZE,
+    max_retries: int = DEFAULT_HTTP_MAX_RETRIES,
+) -> requests.Session:
+    """Return the shared pooled session for ``url``'s origin."""
+    return _DEFAULT_POOL.session_for(url, pool_size=pool_size, max_retries=max_retries)
+
+
+def close_http_sessions() -> None:
+    """Close every pooled session, releasing kept-alive connections."""
+    _DEFAULT_POOL.close()
+
+
+class MultipartFileUpload:
+    """A ``multipart/form-data`` request body that streams one file from disk.
+
+    ``requests`` sends it with a Content-Length while reading the file in
+    blocks, instead of building the whole body in memory the way ``files=``
+    does. It supports ``tell`` and ``seek`` so urllib3 can rewind it when a
+    request is retried.
+    """
+
+    def __init__(
+        self,
+        file_path: str | Path,
+        *,
+        fields: Mapping[str, str] | None = None,
+        field_name: str = "file",
+        file_name: str | None = None,
+        content_type: str = "application/octet-stream",
+    ) -> None:
+        path = Path(file_path)
+        self.boundary = token_hex(16)
+        head = BytesIO()
+        for name, value in (fields or {}).items():
+            head.write(
+                f"--{self.boundary}\r\n"
+                f'Content-Disposition: form-data; name="{_quote_header(name)}"\r\n\r\n'
+                f"{value}\r\n".encode("utf-8")
+            )
+        head.write(
+            f"--{self.boundary}\r\n"
+            f'Content-Disposition: form-data; name="{_quote_header(field_name)}"; '
+            f'filename="{_quote_header(file_name or path.name)}"\r\n'
+            f"Content-Type: {content_type}\r\n\r\n".encode("utf-8")
+        )
+        tail = f"\r\n--{self.boundary}--\r\n".encode("ascii")
+        file_obj = path.open("rb")
+        self._parts: list[BinaryIO] = [head, file_obj, BytesIO(tail)]
+        sizes = [head.tell(), os.fstat(file_obj.fileno()).st_size, len(tail)]
+        self._starts = [0, sizes[0], sizes[0] + sizes[1]]
+        self._length = sum(sizes)
+        self._position = 0
+
+    @property
+    def content_type(self) -> str:
+        return f"multipart/form-data; boundary={self.boundary}"
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator[bytes]:
+        while block := self.read(HTTP_UPLOAD_BLOCK_SIZE):
+            yield block
+
+    def __enter__(self) -> MultipartFileUpload:
+        return self
+
+    def __exit__(self, *_exc_info: object) -> None:
+        self.close()
+
+    def read(self, size: int | None = -1) -> bytes:
+        remaining = self._length - self._position
+        if size is None or size < 0 or size > remaining:
+            size = remaining
+        blocks: list[bytes] = []
+        while size > 0:
+            index = bisect_right(self._starts, self._position) - 1
+            end = self._starts[index + 1] if index + 1 < len(self._starts) else self._length
+            part = self._parts[index]
+            part.seek(self._position - self._starts[index])
+            # Never read past the announced size, even if the file grew.
+            block = part.read(min(size, end - self._position))
+            if not block:
+                break
+            blocks.append(block)
+            self._position += len(block)
+            size -= len(block)
+        return b"".join(blocks)
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        base = {os.SEEK_SET: 0, os.SEEK_CUR: self._position, os.SEEK_END: self._length}
+        self._position = max(0, min(self._length, base[whence] + offset))
+        return self._position
+
+    def close(self) -> None:
+        for part in self._parts:
+            part.close()
+
+
+def _quote_header(value: str) -> str:
+    # Quote marks and line breaks would end the header parameter early.
+    return quote(value, safe=" !#$&'()*+,-./:;<=>?@[]^_`{|}~")
+
+
+def _endpoint_origin(url: str) -> str:
+    parts = urlsplit(url)
+    return f"{parts.scheme.lower()}://{parts.netloc.lower()}"
+
+
+@lru_cache(maxsize=1)
+def _capped_retry_class():
+    # Built on first use so importing this module does not load requests/urllib3.
+    from urllib3.util.retry import Retry
+
+    class _CappedRetry(Retry):
+        """Honour Retry-After without letting a server park a conversion for hours."""
+
+        def get_retry_after(self, response):
+            retry_after = super().get_retry_after(response)
+            if retry_after is None:
+                return None
+            return min(retry_after, HTTP_RETRY_AFTER_MAX_SECONDS)
+
+    return _CappedRetry
+
+
+def _build_session(*, pool_size: int, max_retries: int) -> requests.Session:
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    retry = _capped_retry_class()(
+        total=max_retries,
+        connect=max_retries,
+        read=0,
+        status=max_retries,
+        backoff_factor=HTTP_RETRY_BACKOFF_FACTOR,
+        status_forcelist=HTTP_RETRY_STATUS_CODES,
+        # OCR and defuddle requests are safe to repeat, including POST uploads.
+        allowed_methods=None,
+        respect_retry_after_header=True,
+        # Hand the final response back so callers keep their status messages.
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=pool_size,
+        max_retries=retry,
+    )
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
@@ -1,12 +1,18 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
 import json
+import os
 from pathlib import Path
+import re
 from secrets import token_hex
 import shutil
+import sys
 import tempfile
-from typing import Protocol, Sequence
+import time
+from typing import Iterator, Protocol, Sequence
 from uuid import uuid4
 
 from markitdowngui.core.input_sources import source_output_stem
@@ -17,6 +23,15 @@ _ASSET_ROOT_MANIFEST = {
     "format": "markitdowngui-assets",
     "version": 1,
 }
+# Linux FICLONE ioctl: share the source blocks copy-on-write (Btrfs, XFS, ...).
+_FICLONE = 0x40049409 if sys.platform.startswith("linux") else None
+ASSET_COPY_WORKERS = 4
+# Session roots from create_temp_asset_root; only their files may be hardlinked.
+_TEMP_ASSET_ROOTS: set[Path] = set()
+
+ASSET_REFLINKED = "reflinked"
+ASSET_HARDLINKED = "hardlinked"
+ASSET_COPIED = "copied"
 
 
 class AssetLike(Protocol):
@@ -25,6 +40,14 @@ class AssetLike(Protocol):
     preview_markdown_path: str
 
 
+class MarkdownResult(Protocol):
+    @property
+    def markdown(self) -> str: ...
+
+    @property
+    def assets(self) -> Sequence[AssetLike]: ...
+
+
 @dataclass(frozen=True)
 class MarkdownSaveInput:
     source: str
@@ -32,6 +55,75 @@ class MarkdownSaveInput:
     assets: Sequence[AssetLike]
 
 
+@dataclass(frozen=True)
+class ResultSaveInput:
+    """A document to save whose Markdown is only read when it is written.
+
+    Streaming combined saves then hold one result body at a time, even when
+    bodies live in a spill-to-disk result store.
+    """
+
+    source: str
+    result: MarkdownResult
+
+    @property
+    def markdown(self) -> str:
+        return self.result.markdown
+
+    @property
+    def assets(self) -> Sequence[AssetLike]:
+        return self.result.assets
+
+
+SaveDocument = MarkdownSaveInput | ResultSaveInput
+
+
+@dataclass
+class AssetTransferStats:
+    """How saved assets were materialised and how many bytes were not copied."""
+
+    reflinked: int = 0
+    hardlinked: int = 0
+    copied: int = 0
+    linked_bytes: int = 0
+    copied_bytes: int = 0
+    seconds: float = 0.0
+
+    @property
+    def bytes_avoided(self) -> int:
+        return self.linked_bytes
+
+    @property
+    def files(self) -> int:
+        return self.reflinked + self.hardlinked + self.copied
+
+    def record(self, method: str, size: int) -> None:
+        if method == ASSET_REFLINKED:
+            self.reflinked += 1
+        elif method == ASSET_HARDLINKED:
+            self.hardlinked += 1
+        else:
+            self.copied += 1
+            self.copied_bytes += size
+            return
+        self.linked_bytes += size
+
+    def add(self, other: AssetTransferStats) -> None:
+        self.reflinked += other.reflinked
+        self.hardlinked += other.hardlinked
+        self.copied += other.copied
+        self.linked_bytes += other.linked_bytes
+        self.copied_bytes += other.copied_bytes
+        self.seconds += other.seconds
+
+    def describe(self) -> str:
+        return (
+            f"Saved {self.files} assets in {self.seconds:.2f}s: "
+            f"{self.reflinked} reflinked, {self.hardlinked} hardlinked, "
+            f"{self.copied} copied; {_format_bytes(self.bytes_avoided)} not copied"
+        )
+
+
 @dataclass
 class PreparedMarkdownAssets:
     """Staged asset changes that can be committed with a Markdown file write."""
@@ -40,6 +132,7 @@ class PreparedMarkdownAssets:
     asset_root: Path
     staging_root: Path | None = None
     remove_owned_asset_root: bool = False
+    asset_transfer: AssetTransferStats = field(default_factory=AssetTransferStats)
     _backup_root: Path | None = None
     _assets_committed: bool = False
     _new_asset_root_committed: bool = False
@@ -108,12 +201,15 @@ class PreparedMarkdownAssets:
 
 
 def create_temp_asset_root() -> Path:
-    return Path(tempfile.mkdtemp(prefix="markitdowngui-pdf-assets-")).resolve()
+    asset_root = Path(tempfile.mkdtemp(prefix="markitdowngui-pdf-assets-")).resolve()
+    _TEMP_ASSET_ROOTS.add(asset_root)
+    return asset_root
 
 
 def cleanup_temp_asset_root(asset_root: str | Path | None) -> None:
     if not asset_root:
         return
+    _TEMP_ASSET_ROOTS.discard(Path(asset_root).resolve())
     shutil.rmtree(Path(asset_root), ignore_errors=True)
 
 
@@ -159,7 +255,7 @@ def prepare_markdown_for_separate_save_transaction(
 
 
 def prepare_combined_markdown_for_save(
-    documents: Sequence[MarkdownSaveInput],
+    documents: Sequence[SaveDocument],
     output_path: str | Path,
     *,
     source_heading_template: str,
@@ -174,53 +270,89 @@ def prepare_combined_markdown_for_save(
 
 
 def prepare_combined_markdown_for_save_transaction(
-    documents: Sequence[MarkdownSaveInput],
+    documents: Sequence[SaveDocument],
     output_path: str | Path,
     *,
     source_heading_template: str,
 ) -> PreparedMarkdownAssets:
     """Stage combined-output assets until the corresponding Markdown is ready."""
+    prepared, chunks = prepare_combined_markdown_stream_for_save_transaction(
+        documents,
+        output_path,
+        source_heading_template=source_heading_template,
+    )
+    try:
+        prepared.markdown = "".join(chunks)
+    except Exception:
+        prepared.rollback_assets()
+        raise
+    return prepared
+
+
+def prepare_combined_markdown_stream_for_save_transaction(
+    documents: Sequence[SaveDocument],
+    output_path: str | Path,
+    *,
+    source_heading_template: str,
+) -> tuple[PreparedMarkdownAssets, Iterator[str]]:
+    """Stage combined-output assets document by document as Markdown streams out.
+
+    The returned chunks are each document's heading and rewritten body in
+    order. A document's assets are staged just before its body is yielded
+    and the ownership marker after the last one, so only one document is in
+    memory at a time. ``markdown`` on the prepared assets stays empty; call
+    ``rollback_assets`` if writing the chunks fails part way.
+    """
     destination_path = Path(output_path)
     asset_root = _asset_root_for_output(destination_path)
-    parts: list[str] = []
 
     if not _documents_have_copyable_assets(documents):
-        for document in documents:
-            parts.append(
-                source_heading_template.format(source=document.source)
-                + f"\n{document.markdown}"
-            )
-        return PreparedMarkdownAssets(
-            markdown="\n\n".join(parts),
+        prepared = PreparedMarkdownAssets(
+            markdown="",
             asset_root=asset_root,
             remove_owned_asset_root=_is_app_owned_asset_root(asset_root),
         )
+        return prepared, _combined_markdown_chunks(
+            documents,
+            source_heading_template=source_heading_template,
+        )
 
     _ensure_asset_root_can_be_replaced(asset_root)
     staging_root = _create_asset_root_staging_directory(asset_root)
-    try:
-        for index, document in enumerate(documents, start=1):
-            rewritten_markdown = _copy_assets_and_rewrite_markdown(
-                document.markdown,
-                document.assets,
-                asset_root=staging_root,
-                markdown_asset_root_name=asset_root.name,
-                document_scope=_document_scope_name(document.source, index),
-            )
-            parts.append(
-                source_heading_template.format(source=document.source)
-                + f"\n{rewritten_markdown}"
-            )
+    prepared = PreparedMarkdownAssets(
+        markdown="",
+        asset_root=asset_root,
+        staging_root=staging_root,
+    )
+    return prepared, _combined_markdown_chunks(
+        documents,
+        source_heading_template=source_heading_template,
+        prepared=prepared,
+    )
 
-        _write_asset_root_marker(staging_root)
-        return PreparedMarkdownAssets(
-            markdown="\n\n".join(parts),
-            asset_root=asset_root,
-            staging_root=staging_root,
+
+def _combined_markdown_chunks(
+    documents: Sequence[SaveDocument],
+    *,
+    source_heading_template: str,
+    prepared: PreparedMarkdownAssets | None = None,
+) -> Iterator[str]:
+    for index, document in enumerate(documents, start=1):
+        heading = source_heading_template.format(source=document.source)
+        yield f"\n\n{heading}\n" if index > 1 else f"{heading}\n"
+        if prepared is None or prepared.staging_root is None:
+            yield document.markdown
+            continue
+        yield _copy_assets_and_rewrite_markdown(
+            document.markdown,
+            document.assets,
+            asset_root=prepared.staging_root,
+            markdown_asset_root_name=prepared.asset_root.name,
+            document_scope=_document_scope_name(document.source, index),
+            asset_transfer=prepared.asset_transfer,
         )
-    except Exception:
-        _remove_directory_if_present(staging_root)
-        raise
+    if prepared is not None and prepared.staging_root is not None:
+        _write_asset_root_marker(prepared.staging_root)
 
 
 def _prepare_markdown_with_assets_transaction(
@@ -238,18 +370,21 @@ def _prepare_markdown_with_assets_transaction(
 
     _ensure_asset_root_can_be_replaced(asset_root)
     staging_root = _create_asset_root_staging_directory(asset_root)
+    asset_transfer = AssetTransferStats()
     try:
         rewritten_markdown = _copy_assets_and_rewrite_markdown(
             markdown,
             assets,
             asset_root=staging_root,
             markdown_asset_root_name=asset_root.name,
+            asset_transfer=asset_transfer,
         )
         _write_asset_root_marker(staging_root)
         return PreparedMarkdownAssets(
             markdown=rewritten_markdown,
             asset_root=asset_root,
             staging_root=staging_root,
+            asset_transfer=asset_transfer,
         )
     except Exception:
         _remove_directory_if_present(staging_root)
@@ -270,7 +405,7 @@ def _assets_have_copyable_sources(assets: Sequence[AssetLike]) -> bool:
     return any(asset.source_path for asset in assets)
 
 
-def _documents_have_copyable_assets(documents: Sequence[MarkdownSaveInput]) -> bool:
+def _documents_have_copyable_assets(documents: Sequence[SaveDocument]) -> bool:
     return any(_assets_have_copyable_sources(document.assets) for document in documents)
 
 
@@ -369,11 +504,13 @@ def _copy_assets_and_rewrite_markdown(
     asset_root: Path,
     markdown_asset_root_name: str | None = None,
     document_scope: str = "",
+    asset_transfer: AssetTransferStats | None = None,
 ) -> str:
     if not assets:
         return markdown
 
     replacements: dict[str, str] = {}
+    transfers: list[tuple[Path, Path]] = []
     used_relative_paths: set[Path] = set()
     if not document_scope:
         used_relative_paths.add(Path(_ASSET_ROOT_MARKER))
@@ -393,7 +530,7 @@ def _copy_assets_and_rewrite_markdown(
         )
         destination_path = asset_root / relative_path
         destination_path.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(source_path, destination_path)
+        transfers.append((source_path, destination_path))
         replacements[asset.preview_markdown_path] = (
             Path(
                 markdown_asset_root_name or asset_root.name,
@@ -401,9 +538,93 @@ def _copy_assets_and_rewrite_markdown(
             ).as_posix()
         )
 
+    _materialize_assets(transfers, asset_transfer or AssetTransferStats())
     return _replace_markdown_paths(markdown, replacements)
 
 
+def _materialize_assets(
+    transfers: Sequence[tuple[Path, Path]],
+    asset_transfer: AssetTransferStats,
+) -> None:
+    """Place each source file at its destination, copying only as a last resort.
+
+    Reflinks and hardlinks are near-instant; the copies that remain run on a
+    small thread pool because they are dominated by file I/O.
+    """
+    if not transfers:
+        return
+    started = time.perf_counter()
+    if len(transfers) == 1:
+        methods = [_materialize_asset(*transfers[0])]
+    else:
+        with ThreadPoolExecutor(
+            max_workers=min(ASSET_COPY_WORKERS, len(transfers)),
+            thread_name_prefix="markitdown-assets",
+        ) as executor:
+            methods = list(
+                executor.map(lambda transfer: _materialize_asset(*transfer), transfers)
+            )
+    for (source_path, _destination_path), method in zip(transfers, methods):
+        asset_transfer.record(method, source_path.stat().st_size)
+    asset_transfer.seconds += time.perf_counter() - started
+
+
+def _materialize_asset(source_path: Path, destination_path: Path) -> str:
+    if _try_reflink(source_path, destination_path):
+        return ASSET_REFLINKED
+    # Converters never touch their temp assets again, so sharing the inode is
+    # safe for them; it only works when both paths are on one filesystem. Any
+    # other source may still be edited, and a hardlink would edit the saved
+    # copy with it.
+    if _is_temp_asset(source_path):
+        try:
+            os.link(source_path, destination_path)
+        except OSError:
+            pass
+        else:
+            return ASSET_HARDLINKED
+    shutil.copy2(source_path, destination_path)
+    return ASSET_COPIED
+
+
+def _is_temp_asset(source_path: Path) -> bool:
+    resolved = source_path.resolve()
+    return any(resolved.is_relative_to(root) for root in _TEMP_ASSET_ROOTS)
+
+
+def _try_reflink(source_path: Path, destination_path: Path) -> bool:
+    if _FICLONE is None:
+        return False
+    try:
+        import fcntl
+    except ImportError:
+        return False
+    cloned = False
+    try:
+        with source_path.open("rb") as source, destination_path.open("xb") as destination:
+            try:
+                fcntl.ioctl(destination.fileno(), _FICLONE, source.fileno())
+                cloned = True
+            except OSError:
+                pass
+    except OSError:
+        return False
+    if not cloned:
+        destination_path.unlink(missing_ok=True)
+        return False
+    shutil.copystat(source_path, destination_path)
+    return True
+
+
+def _format_bytes(size: int) -> str:
+    value = float(size)
+    for unit in ("B", "KB", "MB"):
+        if value < 1024:
+            return f"{value:.0f} {unit}" if unit == "B" else f"{value:.1f} {unit}"
+        value /= 1024
+    return f"{value:.1f} GB"
+
+
 def _reserve_relative_path(
     filename: str,
     used_relative_paths: set[Path],
@@ -429,11 +650,42 @@ def _document_scope_name(source: str, index: int) -> str:
 
 
 def _replace_markdown_paths(markdown: str, replacements: dict[str, str]) -> str:
-    rewritten = markdown
-    for old_path, new_path in sorted(
-        replacements.items(),
-        key=lambda item: len(item[0]),
-        reverse=True,
-    ):
-        rewritten = rewritten.replace(old_path, new_path)
-    return rewritten
+    """Replace every asset path in one scan, preferring the longest match.
+
+    Paths already written by a replacement are not scanned again.
+    """
+    if not replacements:
+        return markdown
+    if len(replacements) == 1:
+        ((old_path, new_path),) = replacements.items()
+        return markdown.replace(old_path, new_path)
+    pattern = _literal_trie_pattern(tuple(sorted(replacements)))
+    return pattern.sub(lambda match: replacements[match.group(0)], markdown)
+
+
+@lru_cache(maxsize=32)
+def _literal_trie_pattern(literals: tuple[str, ...]) -> re.Pattern[str]:
+    # A flat alternation retries every path at each offset; a prefix trie
+    # makes the regex engine follow shared prefixes like "images/page_" once.
+    trie: dict[str, dict] = {}
+    for literal in literals:
+        node = trie
+        for character in literal:
+            node = node.setdefault(character, {})
+        node[""] = {}
+    return re.compile(_trie_regex(trie))
+
+
+def _trie_regex(node: dict[str, dict]) -> str:
+    branches = [
+        re.escape(character) + _trie_regex(child)
+        for character, child in node.items()
+        if character
+    ]
+    if not branches:
+        return ""
+    body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+    if "" in node:
+        # Greedy, so the longer path wins over one that is its prefix.
+        return f"(?:{body})?"
+    return body
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from secrets import token_hex
+import shutil
+import threading
+
+
+OCR_PAGE_CACHE_FORMAT_VERSION = 1
+DEFAULT_OCR_PAGE_CACHE_MAX_BYTES = 128 * 1024 * 1024
+# Scanning the cache directory is not free, so evict every few stores.
+_EVICT_EVERY_STORES = 64
+_ENTRY_SUFFIX = ".txt"
+
+
+def default_ocr_page_cache_dir() -> Path:
+    """Return the persistent per-page OCR cache directory under ~/.markitdown."""
+    return Path.home() / ".markitdown" / "cache" / "ocr-pages"
+
+
+class OcrPageCache:
+    """Persistent cache of OCR text for individual PDF pages.
+
+    A page is identified by the document's content hash, its zero-based index,
+    the render scale and mode and the OCR provider and model, so a retried or
+    resumed conversion only OCRs pages that did not finish last time. Entries
+    are plain text files under ``<root>/<key[:2]>/<key>.txt``; hits touch the
+    file so eviction by oldest modification time is LRU.
+    """
+
+    def __init__(
+        self,
+        root: str | Path | None = None,
+        *,
+        max_bytes: int = DEFAULT_OCR_PAGE_CACHE_MAX_BYTES,
+    ) -> None:
+        self.root = Path(root) if root is not None else default_ocr_page_cache_dir()
+        self.max_bytes = max(0, int(max_bytes))
+        self._lock = threading.Lock()
+        self._stores_since_evict = 0
+
+    @staticmethod
+    def document_key(file_path: str | Path) -> str:
+        from markitdowngui.core.conversion_cache import file_content_hash
+
+        return file_content_hash(file_path)
+
+    @staticmethod
+    def page_key(
+        document_key: str,
+        page_index: int,
+        *,
+        render_scale: float,
+        provider: str,
+        model: str,
+        render_mode: str = "",
+    ) -> str:
+        payload = {
+            "format": OCR_PAGE_CACHE_FORMAT_VERSION,
+            "document": document_key,
+            "page": int(page_index),
+            "scale": float(render_scale),
+            "provider": provider,
+            "model": model,
+            "render": render_mode,
+        }
+        encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> str | None:
+        entry_path = self._entry_path(key)
+        try:
+            text = entry_path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as exc:
+            logging.warning("Discarding unreadable OCR page cache entry %s: %s", key, exc)
+            entry_path.unlink(missing_ok=True)
+            return None
+
+        try:
+            os.utime(entry_path)
+        except OSError:
+            pass
+        return text
+
+    def put(self, key: str, text: str) -> None:
+        entry_path = self._entry_path(key)
+        staging_path = entry_path.with_name(f".{key[:8]}-{token_hex(4)}.tmp")
+        try:
+            entry_path.parent.mkdir(parents=True, exist_ok=True)
+            staging_path.write_text(text, encoding="utf-8")
+            staging_path.replace(entry_path)
+        except OSError as exc:
+            logging.warning("Could not store OCR page cache entry %s: %s", key, exc)
+            staging_path.unlink(missing_ok=True)
+            return
+
+        with self._lock:
+            self._stores_since_evict += 1
+            should_evict = self._stores_since_evict >= _EVICT_EVERY_STORES
+            if should_evict:
+                self._stores_since_evict = 0
+        if should_evict:
+            self.evict()
+
+    def evict(self) -> int:
+        """Remove least recently used pages until the cache fits in max_bytes."""
+        entries: list[tuple[float, int, Path]] = []
+        if self.root.is_dir():
+            for entry_path in self.root.glob(f"*/*{_ENTRY_SUFFIX}"):
+                try:
+                    stat = entry_path.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry_path))
+
+        total = sum(size for _mtime, size, _path in entries)
+        removed = 0
+        for _mtime, size, entry_path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            entry_path.unlink(missing_ok=True)
+            total -= size
+            removed += 1
+        return removed
+
+    def clear(self) -> None:
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def _entry_path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}{_ENTRY_SUFFIX}"
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass, field
+import logging
+from pathlib import Path
+import shutil
+import tempfile
+import threading
+
+from markitdowngui.core.conversion import ConversionAsset, ConversionOutcome
+
+
+DEFAULT_RESULT_MEMORY_BUDGET_BYTES = 256 * 1024 * 1024
+
+
+@dataclass(frozen=True, eq=False)
+class StoredOutcome:
+    """A ``ConversionOutcome`` whose Markdown body lives in a ``ResultStore``.
+
+    It exposes the same ``markdown``, ``backend`` and ``assets`` attributes,
+    loading the body from memory or the spill file each time it is read.
+    """
+
+    store: ResultStore
+    key: int
+    backend: str
+    assets: list[ConversionAsset] = field(default_factory=list)
+
+    @property
+    def markdown(self) -> str:
+        return self.store.get(self.key)
+
+
+class ResultStore:
+    """Hold converted Markdown bodies within an in-memory budget.
+
+    Bodies are kept in memory in least-recently-used order. Once their total
+    size exceeds ``memory_budget_bytes`` the oldest ones are written to a
+    private temporary directory and dropped from memory, then read back on
+    demand for preview and save. Sizes are counted in characters, which is
+    close to bytes for the mostly ASCII Markdown the converters produce.
+    """
+
+    def __init__(
+        self,
+        *,
+        memory_budget_bytes: int = DEFAULT_RESULT_MEMORY_BUDGET_BYTES,
+    ) -> None:
+        self.memory_budget_bytes = max(0, int(memory_budget_bytes))
+        self._memory: OrderedDict[int, str] = OrderedDict()
+        self._memory_chars = 0
+        self._spilled: set[int] = set()
+        self._spill_root: Path | None = None
+        self._next_key = 0
+        self._lock = threading.Lock()
+
+    @property
+    def memory_chars(self) -> int:
+        return self._memory_chars
+
+    @property
+    def spilled_count(self) -> int:
+        return len(self._spilled)
+
+    def stash(self, outcome: ConversionOutcome | StoredOutcome) -> StoredOutcome:
+        if isinstance(outcome, StoredOutcome) and outcome.store is self:
+            return outcome
+        key = self.put(outcome.markdown)
+        return StoredOutcome(self, key, outcome.backend, list(outcome.assets))
+
+    def put(self, markdown: str) -> int:
+        with self._lock:
+            key = self._next_key
+            self._next_key += 1
+            if len(markdown) > self.memory_budget_bytes and self._spill(key, markdown):
+                return key
+            self._remember(key, markdown)
+        return key
+
+    def get(self, key: int) -> str:
+        with self._lock:
+            markdown = self._memory.get(key)
+            if markdown is not None:
+                self._memory.move_to_end(key)
+                return markdown
+            if key not in self._spilled:
+                raise KeyError(key)
+            markdown = self._spill_path(key).read_text(encoding="utf-8")
+            # The spill file stays valid, so evicting this body again is free.
+            if len(markdown) <= self.memory_budget_bytes:
+                self._remember(key, markdown)
+            return markdown
+
+    def discard(self, key: int) -> None:
+        with self._lock:
+            markdown = self._memory.pop(key, None)
+            if markdown is not None:
+                self._memory_chars -= len(markdown)
+            if key in self._spilled:
+                self._spilled.discard(key)
+                self._spill_path(key).unlink(missing_ok=True)
+
+    def set_memory_budget(self, memory_budget_bytes: int) -> None:
+        with self._lock:
+            self.memory_budget_bytes = max(0, int(memory_budget_bytes))
+            self._enforce_budget()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+            self._memory_chars = 0
+            self._spilled.clear()
+            if self._spill_root is not None:
+                shutil.rmtree(self._spill_root, ignore_errors=True)
+                self._spill_root = None
+
+    def _remember(self, key: int, markdown: str) -> None:
+        self._memory[key] = markdown
+        self._memory_chars += len(markdown)
+        self._enforce_budget()
+
+    def _enforce_budget(self) -> None:
+        # The newest body stays in memory; it is the one being added or read.
+        while self._memory_chars > self.memory_budget_bytes and len(self._memory) > 1:
+            key = next(iter(self._memory))
+            if key not in self._spilled and not self._spill(key, self._memory[key]):
+                # Keeping bodies in memory is better than losing results.
+                return
+            self._memory_chars -= len(self._memory.pop(key))
+
+    def _spill(self, key: int, markdown: str) -> bool:
+        try:
+            path = self._spill_path(key)
+            path.write_text(markdown, encoding="utf-8")
+        except OSError as exc:
+            logging.warning("Could not spill conversion result %s: %s", key, exc)
+            return False
+        self._spilled.add(key)
+        return True
+
+    def _spill_path(self, key: int) -> Path:
+        if self._spill_root is None:
+            self._spill_root = Path(tempfile.mkdtemp(prefix="markitdown-results-"))
+        return self._spill_root / f"{key}.md"
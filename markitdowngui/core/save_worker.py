@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from PySide6.QtCore import QThread, Signal
+
+from markitdowngui.core.separate_save import (
+    DEFAULT_SAVE_WORKERS,
+    SeparateSaveJob,
+    SeparateSaveResult,
+    run_separate_saves,
+)
+
+
+class SeparateSaveWorker(QThread):
+    # Saved or failed outputs so far, out of the total.
+    progress = Signal(int, int)
+    # Carries the SeparateSaveSummary once every job finished or was skipped.
+    finished = Signal(object)
+
+    def __init__(
+        self,
+        jobs: list[SeparateSaveJob],
+        *,
+        max_workers: int = DEFAULT_SAVE_WORKERS,
+        grouped_durability: bool = False,
+    ):
+        super().__init__()
+        self.jobs = jobs
+        self.max_workers = max_workers
+        self.grouped_durability = grouped_durability
+        self.is_cancelled = False
+        self._completed = 0
+
+    def run(self) -> None:
+        self._completed = 0
+        summary = run_separate_saves(
+            self.jobs,
+            max_workers=self.max_workers,
+            grouped_durability=self.grouped_durability,
+            on_saved=self._handle_saved,
+            is_cancelled=lambda: self.is_cancelled,
+        )
+        self.finished.emit(summary)
+
+    def _handle_saved(self, _result: SeparateSaveResult) -> None:
+        self._completed += 1
+        self.progress.emit(self._completed, len(self.jobs))
@@ -0,0 +1,300 @@
+"""Parallel saving of separate Markdown outputs.
+
+Every output keeps the staged-commit guarantees of a single save: assets and
+Markdown are written beside their destination first and only then moved into
+place, and a failed Markdown replace rolls the assets back.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+import os
+from pathlib import Path
+from typing import Callable, Iterable, Sequence
+
+from markitdowngui.core.file_utils import FileManager, StagedMarkdownFile
+from markitdowngui.core.markdown_assets import (
+    AssetTransferStats,
+    MarkdownResult,
+    PreparedMarkdownAssets,
+    prepare_markdown_for_separate_save_transaction,
+)
+
+
+DEFAULT_SAVE_WORKERS = 4
+# Grouped durability stages this many outputs before syncing them together,
+# which bounds how much rewritten Markdown is held at once.
+DURABILITY_GROUP_SIZE = 64
+
+
+@dataclass(frozen=True)
+class SeparateSaveJob:
+    source: str
+    output_path: str
+    # Read on a save thread, so spilled result bodies load off the GUI thread.
+    result: MarkdownResult
+
+
+@dataclass(frozen=True)
+class SeparateSaveResult:
+    source: str
+    output_path: str
+    error: str = ""
+    asset_transfer: AssetTransferStats = field(default_factory=AssetTransferStats)
+
+    @property
+    def saved(self) -> bool:
+        return not self.error
+
+
+@dataclass
+class SeparateSaveSummary:
+    total: int
+    results: list[SeparateSaveResult] = field(default_factory=list)
+    cancelled: bool = False
+
+    @property
+    def saved(self) -> list[SeparateSaveResult]:
+        return [result for result in self.results if result.saved]
+
+    @property
+    def failed(self) -> list[SeparateSaveResult]:
+        return [result for result in self.results if not result.saved]
+
+    @property
+    def asset_transfer(self) -> AssetTransferStats:
+        stats = AssetTransferStats()
+        for result in self.results:
+            stats.add(result.asset_transfer)
+        return stats
+
+
+@dataclass
+class _StagedSave:
+    job: SeparateSaveJob
+    prepared: PreparedMarkdownAssets
+    staged_markdown: StagedMarkdownFile
+
+
+def run_separate_saves(
+    jobs: Sequence[SeparateSaveJob],
+    *,
+    max_workers: int = DEFAULT_SAVE_WORKERS,
+    grouped_durability: bool = False,
+    on_saved: Callable[[SeparateSaveResult], None] | None = None,
+    is_cancelled: Callable[[], bool] | None = None,
+) -> SeparateSaveSummary:
+    """Save ``jobs`` on a bounded thread pool and report each one.
+
+    ``on_saved`` runs on the calling thread once per finished job. Jobs that
+    have not started when ``is_cancelled`` turns true are skipped.
+
+    With ``grouped_durability`` each group of outputs is staged without
+    syncing, every staged file is then synced in one pass before any of them
+    replaces its destination, and every touched directory is synced once per
+    group so the renames themselves are durable.
+    """
+    summary = SeparateSaveSummary(total=len(jobs))
+    cancelled = is_cancelled or (lambda: False)
+
+    def report(result: SeparateSaveResult) -> None:
+        summary.results.append(result)
+        if on_saved is not None:
+            on_saved(result)
+
+    with ThreadPoolExecutor(
+        max_workers=max(1, int(max_workers)),
+        thread_name_prefix="markitdown-save",
+    ) as executor:
+        if grouped_durability:
+            for start in range(0, len(jobs), DURABILITY_GROUP_SIZE):
+                if cancelled():
+                    break
+                group = jobs[start : start + DURABILITY_GROUP_SIZE]
+                for result in _save_group(executor, group, cancelled):
+                    report(result)
+        else:
+            futures = [executor.submit(_save_job, job, cancelled) for job in jobs]
+            for future in as_completed(futures):
+                result = future.result()
+                if result is not None:
+                    report(result)
+
+    summary.cancelled = len(summary.results) < len(jobs)
+    return summary
+
+
+def save_prepared_markdown(
+    output_path: str | Path,
+    prepared: PreparedMarkdownAssets,
+    chunks: Iterable[str] | None = None,
+    *,
+    staged_markdown: StagedMarkdownFile | None = None,
+) -> None:
+    """Replace ``output_path`` and activate its assets as one transaction.
+
+    ``chunks`` streams the Markdown instead of ``prepared.markdown``, as a
+    combined save does.
+    """
+    try:
+        if staged_markdown is None and chunks is not None:
+            staged_markdown = FileManager.stage_markdown_chunks(
+                str(output_path),
+                chunks,
+            )
+        elif staged_markdown is None:
+            staged_markdown = FileManager.stage_markdown_file(
+                str(output_path),
+                prepared.markdown,
+            )
+        prepared.commit_assets()
+        staged_markdown.commit()
+    except Exception:
+        prepared.rollback_assets()
+        raise
+    else:
+        prepared.finalize_assets()
+    finally:
+        if staged_markdown is not None:
+            staged_markdown.abort()
+
+
+def _save_job(
+    job: SeparateSaveJob,
+    cancelled: Callable[[], bool],
+) -> SeparateSaveResult | None:
+    if cancelled():
+        return None
+    try:
+        prepared = prepare_markdown_for_separate_save_transaction(
+            job.result.markdown,
+            job.result.assets,
+            job.output_path,
+        )
+        save_prepared_markdown(job.output_path, prepared)
+    except Exception as exc:
+        return SeparateSaveResult(job.source, job.output_path, error=str(exc))
+    return SeparateSaveResult(
+        job.source,
+        job.output_path,
+        asset_transfer=prepared.asset_transfer,
+    )
+
+
+def _save_group(
+    executor: ThreadPoolExecutor,
+    jobs: Sequence[SeparateSaveJob],
+    cancelled: Callable[[], bool],
+) -> list[SeparateSaveResult]:
+    results: list[SeparateSaveResult] = []
+    pending: list[_StagedSave] = []
+    for staged in executor.map(lambda job: _stage_job(job, cancelled), jobs):
+        if isinstance(staged, _StagedSave):
+            pending.append(staged)
+        elif staged is not None:
+            results.append(staged)
+
+    # The content must be durable before a rename makes it visible, so the
+    # whole group is flushed before the first output is committed.
+    synced: list[_StagedSave] = []
+    for staged, error in zip(pending, executor.map(_sync_staged, pending)):
+        if error is None:
+            synced.append(staged)
+        else:
+            results.append(error)
+
+    saved: list[_StagedSave] = []
+    for staged, result in zip(synced, executor.map(_commit_staged, synced)):
+        results.append(result)
+        if result.saved:
+            saved.append(staged)
+
+    directories = {Path(staged.job.output_path).parent for staged in saved}
+    directories.update(
+        staged.prepared.asset_root
+        for staged in saved
+        if staged.prepared.asset_root.is_dir()
+    )
+    list(executor.map(_sync_directory, directories))
+    return results
+
+
+def _stage_job(
+    job: SeparateSaveJob,
+    cancelled: Callable[[], bool],
+) -> _StagedSave | SeparateSaveResult | None:
+    if cancelled():
+        return None
+    prepared: PreparedMarkdownAssets | None = None
+    try:
+        prepared = prepare_markdown_for_separate_save_transaction(
+            job.result.markdown,
+            job.result.assets,
+            job.output_path,
+        )
+        staged_markdown = FileManager.stage_markdown_file(
+            job.output_path,
+            prepared.markdown,
+            fsync=False,
+        )
+    except Exception as exc:
+        if prepared is not None:
+            prepared.rollback_assets()
+        return SeparateSaveResult(job.source, job.output_path, error=str(exc))
+    return _StagedSave(job, prepared, staged_markdown)
+
+
+def _sync_staged(staged: _StagedSave) -> SeparateSaveResult | None:
+    try:
+        _sync_file(staged.staged_markdown.temporary_path)
+    except Exception as exc:
+        staged.prepared.rollback_assets()
+        staged.staged_markdown.abort()
+        return SeparateSaveResult(
+            staged.job.source,
+            staged.job.output_path,
+            error=str(exc),
+        )
+    return None
+
+
+def _commit_staged(staged: _StagedSave) -> SeparateSaveResult:
+    job = staged.job
+    try:
+        save_prepared_markdown(
+            job.output_path,
+            staged.prepared,
+            staged_markdown=staged.staged_markdown,
+        )
+    except Exception as exc:
+        staged.prepared.rollback_assets()
+        staged.staged_markdown.abort()
+        return SeparateSaveResult(job.source, job.output_path, error=str(exc))
+    return SeparateSaveResult(
+        job.source,
+        job.output_path,
+        asset_transfer=staged.prepared.asset_transfer,
+    )
+
+
+def _sync_file(path: Path) -> None:
+    with open(path, "r+b") as handle:
+        os.fsync(handle.fileno())
+
+
+def _sync_directory(path: Path) -> None:
+    # Windows cannot open directories for syncing; NTFS journals renames.
+    if os.name == "nt":
+        return
+    try:
+        descriptor = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(descriptor)
+    except OSError:
+        # Some network and FUSE filesystems reject directory syncs.
+        pass
+    finally:
+        os.close(descriptor)
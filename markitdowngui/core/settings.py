@@ -1,6 +1,8 @@
 from PySide6.QtCore import QSettings
 from typing import cast, List
 
+from markitdowngui.core.conversion import DEFAULT_OCR_PAGE_WORKERS
+
 
 OCR_PROVIDER_AZURE_TESSERACT = "azure_tesseract"
 OCR_PROVIDER_GLMOCR = "glmocr"
@@ -32,8 +34,15 @@ DEFAULT_GLMOCR_SDK_SERVER_URL = "http://127.0.0.1:5002/glmocr/parse"
 DEFAULT_GLMOCR_OLLAMA_HOST = "127.0.0.1"
 DEFAULT_GLMOCR_OLLAMA_PORT = 11434
 DEFAULT_GLMOCR_OLLAMA_MODEL = "glm-ocr:latest"
+OLLAMA_IMAGE_FORMATS = ("jpeg", "png", "webp")
+DEFAULT_OLLAMA_IMAGE_QUALITY = 75
 DEFAULT_HTTP_OCR_API_KEY_ENV = "OCR_HTTP_API_KEY"
 DEFAULT_HTTP_OCR_TIMEOUT_SECONDS = 300
+DEFAULT_OCR_RENDER_AHEAD = 2
+DEFAULT_OCR_RENDER_MAX_MEGAPIXELS = 16
+OCR_RENDER_COLORS = ("rgb", "grayscale", "binary")
+DEFAULT_HTTP_POOL_SIZE = 8
+DEFAULT_HTTP_MAX_RETRIES = 2
 
 
 def normalize_ocr_provider(value: str, default: str = OCR_PROVIDER_AZURE_TESSERACT) -> str:
@@ -152,6 +161,14 @@ class SettingsManager:
         """Set whether file outputs should default to the source folder."""
         self.settings.setValue('saveToSourceFolder', enabled)
 
+    def get_grouped_save_durability(self) -> bool:
+        """Get whether separate saves sync files and folders once per group."""
+        return bool(self.settings.value('groupedSaveDurability', False, type=bool))
+
+    def set_grouped_save_durability(self, enabled: bool) -> None:
+        """Set whether separate saves sync files and folders once per group."""
+        self.settings.setValue('groupedSaveDurability', enabled)
+
     def get_batch_size(self) -> int:
         """Get default conversion batch size."""
         return int(self.settings.value('batchSize', 3, type=int))
@@ -161,6 +178,62 @@ class SettingsManager:
         size = max(1, min(10, int(batch_size)))
         self.settings.setValue('batchSize', size)
 
+    def get_process_pool_conversion(self) -> bool:
+        """Get whether conversions run in separate worker processes."""
+        return bool(self.settings.value('processPoolConversion', False, type=bool))
+
+    def set_process_pool_conversion(self, enabled: bool) -> None:
+        """Set whether conversions run in separate worker processes."""
+        self.settings.setValue('processPoolConversion', enabled)
+
+    def get_http_pool_size(self) -> int:
+        """Get how many kept-alive connections each OCR or web endpoint may use."""
+        value = int(self.settings.value('httpPoolSize', DEFAULT_HTTP_POOL_SIZE, type=int))
+        return max(1, min(64, value))
+
+    def set_http_pool_size(self, size: int) -> None:
+        """Set how many kept-alive connections each OCR or web endpoint may use."""
+        self.settings.setValue('httpPoolSize', max(1, min(64, int(size))))
+
+    def get_http_max_retries(self) -> int:
+        """Get how often rate-limited or failing OCR requests are retried."""
+        value = int(
+            self.settings.value('httpMaxRetries', DEFAULT_HTTP_MAX_RETRIES, type=int)
+        )
+        return max(0, min(10, value))
+
+    def set_http_max_retries(self, retries: int) -> None:
+        """Set how often rate-limited or failing OCR requests are retried."""
+        self.settings.setValue('httpMaxRetries', max(0, min(10, int(retries))))
+
+    def get_conversion_cache_enabled(self) -> bool:
+        """Get whether unchanged files reuse cached conversion results."""
+        return bool(self.settings.value('conversionCacheEnabled', False, type=bool))
+
+    def set_conversion_cache_enabled(self, enabled: bool) -> None:
+        """Set whether unchanged files reuse cached conversion results."""
+        self.settings.setValue('conversionCacheEnabled', enabled)
+
+    def get_conversion_cache_max_mb(self) -> int:
+        """Get the conversion cache size limit in megabytes."""
+        value = int(self.settings.value('conversionCacheMaxMb', 512, type=int))
+        return max(16, min(16384, value))
+
+    def set_conversion_cache_max_mb(self, size_mb: int) -> None:
+        """Set the conversion cache size limit in megabytes."""
+        size = max(16, min(16384, int(size_mb)))
+        self.settings.setValue('conversionCacheMaxMb', size)
+
+    def get_result_memory_budget_mb(self) -> int:
+        """Get how much converted Markdown is kept in memory before spilling to disk."""
+        value = int(self.settings.value('resultMemoryBudgetMb', 256, type=int))
+        return max(16, min(16384, value))
+
+    def set_result_memory_budget_mb(self, size_mb: int) -> None:
+        """Set how much converted Markdown is kept in memory before spilling to disk."""
+        size = max(16, min(16384, int(size_mb)))
+        self.settings.setValue('resultMemoryBudgetMb', size)
+
     def get_ocr_enabled(self) -> bool:
         """Get whether OCR is enabled."""
         return bool(self.settings.value('ocrEnabled', False, type=bool))
@@ -177,6 +250,14 @@ class SettingsManager:
         """Set whether eligible digital PDFs use pdf-inspector first."""
         self.settings.setValue('fastPdfConversion', enabled)
 
+    def get_hybrid_pdf_ocr(self) -> bool:
+        """Get whether OCR is limited to the image-only pages of mixed PDFs."""
+        return bool(self.settings.value('hybridPdfOcr', False, type=bool))
+
+    def set_hybrid_pdf_ocr(self, enabled: bool) -> None:
+        """Set whether OCR is limited to the image-only pages of mixed PDFs."""
+        self.settings.setValue('hybridPdfOcr', enabled)
+
     def get_anydoc_enabled(self) -> bool:
         """Get whether anydoc should be used for conversions by default."""
         return bool(self.settings.value('anydocEnabled', False, type=bool))
@@ -320,6 +401,63 @@ class SettingsManager:
         normalized = (model or '').strip() or DEFAULT_GLMOCR_OLLAMA_MODEL
         self.settings.setValue('glmocrOllamaModel', normalized)
 
+    def get_glmocr_ollama_concurrency(self) -> int:
+        """Get how many pages are sent to Ollama at the same time."""
+        value = int(self.settings.value('glmocrOllamaConcurrency', 1, type=int))
+        return max(1, min(8, value))
+
+    def set_glmocr_ollama_concurrency(self, concurrency: int) -> None:
+        """Set how many pages are sent to Ollama at the same time."""
+        self.settings.setValue(
+            'glmocrOllamaConcurrency',
+            max(1, min(8, int(concurrency))),
+        )
+
+    def get_glmocr_ollama_image_format(self) -> str:
+        """Get the image format pages are uploaded to Ollama in."""
+        value = str(
+            self.settings.value('glmocrOllamaImageFormat', 'jpeg', type=str)
+        ).strip().lower()
+        return value if value in OLLAMA_IMAGE_FORMATS else 'jpeg'
+
+    def set_glmocr_ollama_image_format(self, image_format: str) -> None:
+        """Set the image format pages are uploaded to Ollama in."""
+        normalized = (image_format or '').strip().lower()
+        self.settings.setValue(
+            'glmocrOllamaImageFormat',
+            normalized if normalized in OLLAMA_IMAGE_FORMATS else 'jpeg',
+        )
+
+    def get_glmocr_ollama_image_quality(self) -> int:
+        """Get the JPEG/WebP quality of page images uploaded to Ollama."""
+        value = int(
+            self.settings.value(
+                'glmocrOllamaImageQuality',
+                DEFAULT_OLLAMA_IMAGE_QUALITY,
+                type=int,
+            )
+        )
+        return max(1, min(100, value))
+
+    def set_glmocr_ollama_image_quality(self, quality: int) -> None:
+        """Set the JPEG/WebP quality of page images uploaded to Ollama."""
+        self.settings.setValue(
+            'glmocrOllamaImageQuality',
+            max(1, min(100, int(quality))),
+        )
+
+    def get_glmocr_ollama_image_max_edge(self) -> int:
+        """Get the longest edge of Ollama page uploads in pixels; 0 keeps the size."""
+        value = int(self.settings.value('glmocrOllamaImageMaxEdge', 0, type=int))
+        return max(0, min(10000, value))
+
+    def set_glmocr_ollama_image_max_edge(self, pixels: int) -> None:
+        """Set the longest edge of Ollama page uploads in pixels; 0 keeps the size."""
+        self.settings.setValue(
+            'glmocrOllamaImageMaxEdge',
+            max(0, min(10000, int(pixels))),
+        )
+
     def get_glmocr_sdk_server_url(self) -> str:
         """Get the configured GLM-OCR SDK server parse endpoint."""
         value = str(
@@ -392,6 +530,24 @@ class SettingsManager:
         normalized = max(1, min(3600, int(timeout_seconds)))
         self.settings.setValue('httpOcrTimeoutSeconds', normalized)
 
+    def get_http_ocr_chunk_pages(self) -> int:
+        """Get how many PDF pages each HTTP OCR upload holds; 0 sends PDFs whole."""
+        value = int(self.settings.value('httpOcrChunkPages', 0, type=int))
+        return max(0, min(1000, value))
+
+    def set_http_ocr_chunk_pages(self, pages: int) -> None:
+        """Set how many PDF pages each HTTP OCR upload holds; 0 sends PDFs whole."""
+        self.settings.setValue('httpOcrChunkPages', max(0, min(1000, int(pages))))
+
+    def get_http_ocr_chunk_workers(self) -> int:
+        """Get how many PDF chunks are sent to the HTTP OCR endpoint at once."""
+        value = int(self.settings.value('httpOcrChunkWorkers', 2, type=int))
+        return max(1, min(8, value))
+
+    def set_http_ocr_chunk_workers(self, workers: int) -> None:
+        """Set how many PDF chunks are sent to the HTTP OCR endpoint at once."""
+        self.settings.setValue('httpOcrChunkWorkers', max(1, min(8, int(workers))))
+
     def get_docintel_endpoint(self) -> str:
         """Get the configured Azure Document Intelligence endpoint."""
         return str(self.settings.value('docintelEndpoint', '', type=str)).strip()
@@ -408,6 +564,67 @@ class SettingsManager:
         """Set Tesseract language codes such as 'eng' or 'eng+deu'."""
         self.settings.setValue('ocrLanguages', (languages or '').strip())
 
+    def get_ocr_page_workers(self) -> int:
+        """Get how many PDF pages local Tesseract OCR processes at once."""
+        value = int(
+            self.settings.value('ocrPageWorkers', DEFAULT_OCR_PAGE_WORKERS, type=int)
+        )
+        return max(1, min(16, value))
+
+    def set_ocr_page_workers(self, workers: int) -> None:
+        """Set how many PDF pages local Tesseract OCR processes at once."""
+        self.settings.setValue('ocrPageWorkers', max(1, min(16, int(workers))))
+
+    def get_ocr_render_ahead(self) -> int:
+        """Get how many PDF pages are rendered ahead of OCR."""
+        value = int(
+            self.settings.value('ocrRenderAhead', DEFAULT_OCR_RENDER_AHEAD, type=int)
+        )
+        return max(0, min(16, value))
+
+    def set_ocr_render_ahead(self, pages: int) -> None:
+        """Set how many PDF pages are rendered ahead of OCR."""
+        self.settings.setValue('ocrRenderAhead', max(0, min(16, int(pages))))
+
+    def get_ocr_render_max_megapixels(self) -> int:
+        """Get the pixel budget for one PDF page rendered for OCR, in megapixels."""
+        value = int(
+            self.settings.value(
+                'ocrRenderMaxMegapixels',
+                DEFAULT_OCR_RENDER_MAX_MEGAPIXELS,
+                type=int,
+            )
+        )
+        return max(1, min(100, value))
+
+    def set_ocr_render_max_megapixels(self, megapixels: int) -> None:
+        """Set the pixel budget for one PDF page rendered for OCR, in megapixels."""
+        self.settings.setValue(
+            'ocrRenderMaxMegapixels',
+            max(1, min(100, int(megapixels))),
+        )
+
+    def get_ocr_render_color(self) -> str:
+        """Get whether PDF pages render for OCR in colour, grayscale or black and white."""
+        color = str(self.settings.value('ocrRenderColor', 'rgb', type=str)).strip().lower()
+        return color if color in OCR_RENDER_COLORS else 'rgb'
+
+    def set_ocr_render_color(self, color: str) -> None:
+        """Set whether PDF pages render for OCR in colour, grayscale or black and white."""
+        normalized = (color or '').strip().lower()
+        self.settings.setValue(
+            'ocrRenderColor',
+            normalized if normalized in OCR_RENDER_COLORS else 'rgb',
+        )
+
+    def get_ocr_page_cache_enabled(self) -> bool:
+        """Get whether OCR'd PDF pages are cached so retries skip finished pages."""
+        return bool(self.settings.value('ocrPageCacheEnabled', True, type=bool))
+
+    def set_ocr_page_cache_enabled(self, enabled: bool) -> None:
+        """Set whether OCR'd PDF pages are cached so retries skip finished pages."""
+        self.settings.setValue('ocrPageCacheEnabled', enabled)
+
     def get_tesseract_path(self) -> str:
         """Get the optional Tesseract executable path."""
         return str(self.settings.value('tesseractPath', '', type=str)).strip()
@@ -415,6 +632,14 @@ class SettingsManager:
     def set_tesseract_path(self, path: str) -> None:
         """Set the optional Tesseract executable path."""
         self.settings.setValue('tesseractPath', (path or '').strip())
+
+    def get_tesseract_engine_reuse(self) -> bool:
+        """Get whether Tesseract engines stay loaded between OCR pages."""
+        return bool(self.settings.value('tesseractEngineReuse', True, type=bool))
+
+    def set_tesseract_engine_reuse(self, enabled: bool) -> None:
+        """Set whether Tesseract engines stay loaded between OCR pages."""
+        self.settings.setValue('tesseractEngineReuse', enabled)
         
     def get_update_notifications_enabled(self) -> bool:
         """Get whether update notifications are enabled."""
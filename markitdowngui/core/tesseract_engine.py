@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from contextlib import contextmanager
+from pathlib import Path
+import threading
+from typing import Iterator
+
+
+# Enough for every OCR page worker to keep its own warm engine.
+MAX_IDLE_TESSERACT_ENGINES = 16
+
+
+def tesserocr_available() -> bool:
+    """Return whether the in-process libtesseract binding can be imported."""
+    try:
+        import tesserocr  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def tessdata_dir_for(executable_path: str) -> str:
+    """Return the ``tessdata`` directory installed next to a Tesseract executable.
+
+    Windows installers ship the language models beside ``tesseract.exe``; an
+    empty string leaves the choice to libtesseract's compiled-in default.
+    """
+    if not executable_path:
+        return ""
+    tessdata = Path(executable_path).expanduser().parent / "tessdata"
+    return str(tessdata) if tessdata.is_dir() else ""
+
+
+class TesseractEnginePool:
+    """Keep initialised libtesseract engines alive between OCR calls.
+
+    Engines are keyed by language and ``tessdata`` directory. Each engine is
+    used by one thread at a time and parked again afterwards, so the language
+    models load once per OCR worker instead of once per page or file, and no
+    process is spawned per image.
+    """
+
+    def __init__(self, *, max_idle: int = MAX_IDLE_TESSERACT_ENGINES) -> None:
+        self.max_idle = max(0, int(max_idle))
+        self._idle: defaultdict[tuple[str, str], list[object]] = defaultdict(list)
+        self._created = 0
+        self._lock = threading.Lock()
+
+    @property
+    def created_count(self) -> int:
+        return self._created
+
+    @contextmanager
+    def engine(self, *, lang: str = "", tessdata_dir: str = "") -> Iterator[object]:
+        key = (lang, tessdata_dir)
+        engine = self._acquire(key)
+        try:
+            yield engine
+        except BaseException:
+            # A failed recognition may leave the engine mid-page.
+            _end_engine(engine)
+            raise
+        else:
+            self._release(key, engine)
+
+    def recognize(
+        self,
+        image,
+        *,
+        lang: str = "",
+        tessdata_dir: str = "",
+        timeout_seconds: float = 0,
+    ) -> str:
+        """OCR ``image``, cancelling recognition after ``timeout_seconds``.
+
+        libtesseract checks the deadline while it works, so a page that hangs
+        releases its worker instead of blocking it; zero disables the limit.
+        """
+        with self.engine(lang=lang, tessdata_dir=tessdata_dir) as engine:
+            engine.SetImage(image)
+            timeout_ms = max(0, int(timeout_seconds * 1000))
+            if not engine.Recognize(timeout=timeout_ms):
+                raise RuntimeError(
+                    f"Tesseract recognition timed out after {timeout_seconds:g} seconds"
+                )
+            return str(engine.GetUTF8Text()).strip()
+
+    def close(self) -> None:
+        with self._lock:
+            engines = [engine for idle in self._idle.values() for engine in idle]
+            self._idle.clear()
+        for engine in engines:
+            _end_engine(engine)
+
+    def _acquire(self, key: tuple[str, str]) -> object:
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                return idle.pop()
+        engine = _build_engine(*key)
+        with self._lock:
+            self._created += 1
+        return engine
+
+    def _release(self, key: tuple[str, str], engine: object) -> None:
+        with self._lock:
+            idle_count = sum(len(idle) for idle in self._idle.values())
+            if idle_count < self.max_idle:
+                self._idle[key].append(engine)
+                return
+        _end_engine(engine)
+
+
+_DEFAULT_POOL = TesseractEnginePool()
+
+
+def recognize_with_tesseract_engine(
+    image,
+    *,
+    lang: str = "",
+    tessdata_dir: str = "",
+    timeout_seconds: float = 0,
+) -> str:
+    """OCR ``image`` on a shared, already initialised libtesseract engine."""
+    return _DEFAULT_POOL.recognize(
+        image,
+        lang=lang,
+        tessdata_dir=tessdata_dir,
+        timeout_seconds=timeout_seconds,
+    )
+
+
+def close_tesseract_engines() -> None:
+    """Free every parked engine and the language models it holds."""
+    _DEFAULT_POOL.close()
+
+
+def _build_engine(lang: str, tessdata_dir: str) -> object:
+    import tesserocr
+
+    kwargs: dict[str, str] = {}
+    if lang:
+        kwargs["lang"] = lang
+    if tessdata_dir:
+        kwargs["path"] = tessdata_dir
+    return tesserocr.PyTessBaseAPI(**kwargs)
+
+
+def _end_engine(engine: object) -> None:
+    end = getattr(engine, "End", None)
+    if end is not None:
+        end()
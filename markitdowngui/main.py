@@ -1,5 +1,6 @@
 """Main entry point for the MarkItDown GUI application."""
 
+import multiprocessing
 import sys
 
 from markitdowngui.ui_qml.app import main as run_qml_app
@@ -7,6 +8,8 @@ from markitdowngui.ui_qml.app import main as run_qml_app
 
 def main() -> None:
     """Start the MarkItDown GUI application."""
+    # Frozen builds re-enter main() in process-pool conversion workers.
+    multiprocessing.freeze_support()
     sys.exit(run_qml_app())
 
 if __name__ == '__main__':
@@ -81,6 +81,12 @@ ApplicationWindow {
             saveSeparateDialog.open()
     }
 
+    function saveProgressText() {
+        return root.tr("qml_cancel_save")
+            .replace("{done}", app.savedOutputCount)
+            .replace("{total}", app.saveOutputTotal)
+    }
+
     function showAzureTesseractSettings() {
         return app.ocrEnabled
             && (app.ocrProvider === "azure_tesseract" || app.ocrFallbackProvider === "azure_tesseract")
@@ -1401,6 +1407,26 @@ ApplicationWindow {
                             }
                         }
 
+                        ThemeToggleRow {
+                            id: hybridPdfOcrToggle
+                            title: root.tr("home_hybrid_pdf_ocr_label")
+                            detail: root.tr("home_hybrid_pdf_ocr_detail")
+                            enabled: !app.converting && app.ocrEnabled && !app.preservePdfImages
+                            checked: app.hybridPdfOcr
+                            textColor: colors.text
+                            mutedTextColor: colors.muted
+                            Layout.fillWidth: true
+                            Layout.minimumWidth: 0
+                        }
+
+                        Connections {
+                            target: hybridPdfOcrToggle
+
+                            function onToggled(enabled) {
+                                app.setHybridPdfOcr(enabled)
+                            }
+                        }
+
                         ThemeToggleRow {
                             title: root.tr("home_anydoc_conversion_label")
                             detail: root.tr("home_anydoc_conversion_detail")
@@ -1605,7 +1631,11 @@ ApplicationWindow {
 
             SectionPanel {
                 title: root.tr("qml_converted_files")
-                subtitle: root.tr("qml_converted_files_detail")
+                subtitle: app.hasSuccessfulResults
+                    ? root.tr("qml_converted_files_totals")
+                        .replace("{files}", app.resultStatistics.files)
+                        .replace("{words}", app.resultStatistics.words)
+                    : root.tr("qml_converted_files_detail")
                 surfaceColor: colors.surface
                 borderColor: colors.border
                 textColor: colors.text
@@ -1922,10 +1952,12 @@ ApplicationWindow {
 
                         AppButton {
                             visible: !previewToolbar.compactActions
-                            text: app.saveCombined
-                                ? root.tr("qml_save_as_one_file")
-                                : root.tr("qml_save_files")
-                            enabled: app.hasSuccessfulResults
+                            text: app.savingOutputs
+                                ? root.saveProgressText()
+                                : app.saveCombined
+                                    ? root.tr("qml_save_as_one_file")
+                                    : root.tr("qml_save_files")
+                            enabled: app.savingOutputs || app.hasSuccessfulResults
                             primary: app.hasSuccessfulResults
                             iconName: "save"
                             accentColor: colors.action
@@ -1933,7 +1965,7 @@ ApplicationWindow {
                             surfaceColor: colors.surfaceAlt
                             borderColor: colors.border
                             textColor: colors.text
-                            onClicked: root.requestSave()
+                            onClicked: app.savingOutputs ? app.cancelSave() : root.requestSave()
                         }
                     }
 
@@ -1960,8 +1992,8 @@ ApplicationWindow {
                         }
 
                         AppButton {
-                            text: root.tr("save_button")
-                            enabled: app.hasSuccessfulResults
+                            text: app.savingOutputs ? root.saveProgressText() : root.tr("save_button")
+                            enabled: app.savingOutputs || app.hasSuccessfulResults
                             primary: app.hasSuccessfulResults
                             iconName: "save"
                             accentColor: colors.action
@@ -1969,7 +2001,7 @@ ApplicationWindow {
                             surfaceColor: colors.surfaceAlt
                             borderColor: colors.border
                             textColor: colors.text
-                            onClicked: root.requestSave()
+                            onClicked: app.savingOutputs ? app.cancelSave() : root.requestSave()
                         }
                     }
                 }
@@ -1985,6 +2017,7 @@ ApplicationWindow {
 
                         property bool canScroll: contentHeight > height + 1
 
+                        visible: !app.selectedPreviewChunked
                         anchors.fill: parent
                         clip: true
                         contentWidth: availableWidth
@@ -2086,7 +2119,9 @@ ApplicationWindow {
                                     }
 
                                     TextArea {
-                                        text: app.selectedMarkdown
+                                        // Only failures show their text here; a large successful
+                                        // result must not be loaded into this item as well.
+                                        text: app.selectedResultFailed ? app.selectedMarkdown : ""
                                         textFormat: TextEdit.PlainText
                                         readOnly: true
                                         wrapMode: TextEdit.Wrap
@@ -2162,7 +2197,7 @@ ApplicationWindow {
 
                                 visible: !app.selectedResultFailed && app.previewMode === "raw"
                                 anchors.fill: parent
-                                text: app.selectedMarkdown
+                                text: app.selectedPreviewChunked ? "" : app.selectedMarkdown
                                 textFormat: TextEdit.PlainText
                                 readOnly: true
                                 wrapMode: TextEdit.Wrap
@@ -2182,6 +2217,82 @@ ApplicationWindow {
                         }
                     }
 
+                    ColumnLayout {
+                        id: chunkedPreviewLayout
+
+                        // Very large results are listed in chunks so only the
+                        // visible window plus the cache buffer is laid out.
+                        visible: app.selectedPreviewChunked
+                        anchors.fill: parent
+                        spacing: 8
+
+                        AppTextField {
+                            id: previewFindField
+                            placeholderText: root.tr("qml_preview_find")
+                            surfaceColor: colors.input
+                            borderColor: colors.border
+                            accentColor: colors.accent
+                            textColor: colors.text
+                            placeholderColor: colors.subtle
+                            Accessible.name: root.tr("qml_preview_find")
+                            Layout.fillWidth: true
+                            onAccepted: {
+                                const row = app.findInSelectedPreview(text, chunkedPreview.currentIndex + 1)
+                                if (row >= 0) {
+                                    chunkedPreview.currentIndex = row
+                                    chunkedPreview.positionViewAtIndex(row, ListView.Beginning)
+                                }
+                            }
+                        }
+
+                        Rectangle {
+                            color: app.previewMode === "rendered" ? colors.document : colors.input
+                            radius: 9
+                            border.color: Qt.rgba(colors.border.r, colors.border.g, colors.border.b, dark ? 0.90 : 0.78)
+                            Layout.fillWidth: true
+                            Layout.fillHeight: true
+
+                            ListView {
+                                id: chunkedPreview
+                                objectName: "chunkedPreview"
+
+                                anchors.fill: parent
+                                anchors.margins: 1
+                                model: app.previewChunkModel
+                                clip: true
+                                currentIndex: -1
+                                cacheBuffer: Math.max(0, height * 2)
+                                reuseItems: true
+                                topMargin: 14
+                                bottomMargin: 14
+                                ScrollBar.vertical: ScrollBar {
+                                    policy: ScrollBar.AsNeeded
+                                    minimumSize: 0.04
+                                }
+
+                                // Roles are read through `model` so raw mode never
+                                // renders HTML for the chunks it shows.
+                                delegate: TextEdit {
+                                    width: chunkedPreview.width
+                                    text: app.previewMode === "rendered" ? model.html : model.markdown
+                                    textFormat: app.previewMode === "rendered" ? TextEdit.RichText : TextEdit.PlainText
+                                    readOnly: true
+                                    selectByMouse: true
+                                    wrapMode: TextEdit.Wrap
+                                    color: colors.text
+                                    selectedTextColor: "#FFFFFF"
+                                    selectionColor: colors.accent
+                                    font.pixelSize: 13
+                                    font.family: app.previewMode === "rendered"
+                                        ? root.font.family
+                                        : Qt.platform.os === "windows" ? "Cascadia Mono" : Qt.platform.os === "osx" ? "Menlo" : "monospace"
+                                    leftPadding: 18
+                                    rightPadding: 18
+                                }
+                            }
+                        }
+                    }
+
                     Item {
                         id: previewScrollIndicator
 
@@ -2329,6 +2440,16 @@ ApplicationWindow {
                     Layout.fillWidth: true
                 }
 
+                ThemeToggleRow {
+                    title: root.tr("settings_grouped_save_durability_label")
+                    detail: root.tr("settings_grouped_save_durability_detail")
+                    checked: app.groupedSaveDurability
+                    textColor: colors.text
+                    mutedTextColor: colors.muted
+                    onToggled: checked => app.setGroupedSaveDurability(checked)
+                    Layout.fillWidth: true
+                }
+
                 ThemeToggleRow {
                     title: root.tr("qml_update_notifications")
                     detail: root.tr("qml_update_notifications_detail")
@@ -2362,6 +2483,139 @@ ApplicationWindow {
                     onToggled: checked => app.setAnydocDefaultEnabled(checked)
                     Layout.fillWidth: true
                 }
+
+                SettingsField {
+                    label: root.tr("settings_parallel_conversions_label")
+                    detail: root.tr("settings_parallel_conversions_detail")
+                    Layout.fillWidth: true
+
+                    ThemeSpinBox {
+                        Accessible.name: root.tr("qml_parallel_conversions")
+                        from: 1
+                        to: 10
+                        value: app.batchSize
+                        textFromValue: function(value, locale) { return value.toString() }
+                        onValueModified: app.setBatchSize(value)
+                    }
+                }
+
+                ThemeToggleRow {
+                    title: root.tr("settings_process_pool_label")
+                    detail: root.tr("settings_process_pool_detail")
+                    checked: app.processPoolConversion
+                    textColor: colors.text
+                    mutedTextColor: colors.muted
+                    onToggled: checked => app.setProcessPoolConversion(checked)
+                    Layout.fillWidth: true
+                }
+
+                FieldGroup {
+                    label: root.tr("settings_result_memory_budget_label")
+                    detail: root.tr("settings_result_memory_budget_detail")
+                    Layout.fillWidth: true
+
+                    ThemeSpinBox {
+                        Accessible.name: root.tr("settings_result_memory_budget_label")
+                        from: 16
+                        to: 16384
+                        stepSize: 64
+                        value: app.resultMemoryBudgetMb
+                        textFromValue: function(value, locale) { return value.toString() }
+                        onValueModified: app.setResultMemoryBudgetMb(value)
+                    }
+                }
+
+                RowLayout {
+                    spacing: 10
+                    Layout.fillWidth: true
+
+                    FieldGroup {
+                        label: root.tr("settings_http_pool_size_label")
+                        detail: root.tr("settings_http_pool_size_detail")
+                        Layout.fillWidth: true
+
+                        ThemeSpinBox {
+                            Accessible.name: root.tr("settings_http_pool_size_label")
+                            from: 1
+                            to: 64
+                            value: app.httpPoolSize
+                            textFromValue: function(value, locale) { return value.toString() }
+                            onValueModified: app.setHttpPoolSize(value)
+                        }
+                    }
+
+                    FieldGroup {
+                        label: root.tr("settings_http_max_retries_label")
+                        detail: root.tr("settings_http_max_retries_detail")
+                        Layout.fillWidth: true
+
+                        ThemeSpinBox {
+                            Accessible.name: root.tr("settings_http_max_retries_label")
+                            from: 0
+                            to: 10
+                            value: app.httpMaxRetries
+                            textFromValue: function(value, locale) { return value.toString() }
+                            onValueModified: app.setHttpMaxRetries(value)
+                        }
+                    }
+                }
+
+                ThemeToggleRow {
+                    title: root.tr("settings_conversion_cache_label")
+                    detail: root.tr("settings_conversion_cache_detail")
+                    checked: app.conversionCacheEnabled
+                    textColor: colors.text
+                    mutedTextColor: colors.muted
+                    onToggled: checked => app.setConversionCacheEnabled(checked)
+                    Layout.fillWidth: true
+                }
+
+                ThemeToggleRow {
+                    title: root.tr("settings_ocr_page_cache_label")
+                    detail: root.tr("settings_ocr_page_cache_detail")
+                    checked: app.ocrPageCacheEnabled
+                    textColor: colors.text
+                    mutedTextColor: colors.muted
+                    onToggled: checked => app.setOcrPageCacheEnabled(checked)
+                    Layout.fillWidth: true
+                }
+
+                RowLayout {
+                    visible: app.conversionCacheEnabled || app.ocrPageCacheEnabled
+                    spacing: 10
+                    Layout.fillWidth: true
+
+                    FieldGroup {
+                        visible: app.conversionCacheEnabled
+                        label: root.tr("settings_conversion_cache_size_label")
+                        Layout.preferredWidth: 150
+                        Layout.fillWidth: false
+
+                        ThemeSpinBox {
+                            Accessible.name: root.tr("qml_conversion_cache_size")
+                            from: 16
+                            to: 16384
+                            stepSize: 64
+                            value: app.conversionCacheMaxMb
+                            textFromValue: function(value, locale) { return value.toString() }
+                            onValueModified: app.setConversionCacheMaxMb(value)
+                        }
+                    }
+
+                    Item {
+                        Layout.fillWidth: true
+                    }
+
+                    AppButton {
+                        text: root.tr("qml_clear_conversion_cache")
+                        iconName: "trash-2"
+                        accentColor: colors.action
+                        surfaceColor: colors.surfaceAlt
+                        borderColor: colors.border
+                        textColor: colors.text
+                        onClicked: app.clearConversionCache()
+                    }
+                }
             }
 
             SectionPanel {
@@ -2704,6 +2958,86 @@ ApplicationWindow {
                     }
                 }
 
+                FieldGroup {
+                    label: root.tr("qml_tesseract_page_workers")
+                    detail: root.tr("qml_tesseract_page_workers_detail")
+                    visible: root.showAzureTesseractSettings()
+                    Layout.fillWidth: true
+
+                    ThemeSpinBox {
+                        Accessible.name: root.tr("qml_tesseract_page_workers")
+                        from: 1
+                        to: 16
+                        value: app.ocrPageWorkers
+                        textFromValue: function(value, locale) { return value.toString() }
+                        onValueModified: app.setOcrPageWorkers(value)
+                    }
+                }
+
+                ThemeToggleRow {
+                    title: root.tr("settings_tesseract_engine_reuse_label")
+                    detail: root.tr("settings_tesseract_engine_reuse_detail")
+                    visible: root.showAzureTesseractSettings()
+                    checked: app.tesseractEngineReuse
+                    textColor: colors.text
+                    mutedTextColor: colors.muted
+                    onToggled: checked => app.setTesseractEngineReuse(checked)
+                    Layout.fillWidth: true
+                }
+
+                FieldGroup {
+                    label: root.tr("qml_ocr_render_ahead")
+                    detail: root.tr("qml_ocr_render_ahead_detail")
+                    visible: app.ocrEnabled
+                    Layout.fillWidth: true
+
+                    ThemeSpinBox {
+                        Accessible.name: root.tr("qml_ocr_render_ahead")
+                        from: 0
+                        to: 16
+                        value: app.ocrRenderAhead
+                        textFromValue: function(value, locale) { return value.toString() }
+                        onValueModified: app.setOcrRenderAhead(value)
+                    }
+                }
+
+                FieldGroup {
+                    label: root.tr("qml_ocr_render_max_megapixels")
+                    detail: root.tr("qml_ocr_render_max_megapixels_detail")
+                    visible: app.ocrEnabled
+                    Layout.fillWidth: true
+
+                    ThemeSpinBox {
+                        Accessible.name: root.tr("qml_ocr_render_max_megapixels")
+                        from: 1
+                        to: 100
+                        value: app.ocrRenderMaxMegapixels
+                        textFromValue: function(value, locale) { return value.toString() }
+                        onValueModified: app.setOcrRenderMaxMegapixels(value)
+                    }
+                }
+
+                FieldGroup {
+                    label: root.tr("qml_ocr_render_color")
+                    detail: root.tr("qml_ocr_render_color_detail")
+                    visible: app.ocrEnabled
+                    Layout.fillWidth: true
+
+                    ThemeComboBox {
+                        readonly property var colorModes: ["rgb", "grayscale", "binary"]
+
+                        Accessible.name: root.tr("qml_ocr_render_color")
+                        model: [
+                            root.tr("qml_ocr_render_color_rgb"),
+                            root.tr("qml_ocr_render_color_grayscale"),
+                            root.tr("qml_ocr_render_color_binary")
+                        ]
+                        currentIndex: Math.max(0, colorModes.indexOf(app.ocrRenderColor))
+                        onActivated: index => app.setOcrRenderColor(colorModes[index])
+                        Layout.fillWidth: true
+                    }
+                }
+
                 RowLayout {
                     visible: app.ocrEnabled
                     spacing: 10
@@ -2833,6 +3167,71 @@ ApplicationWindow {
                     }
                 }
 
+                FieldGroup {
+                    label: root.tr("settings_glmocr_ollama_concurrency_label")
+                    detail: root.tr("settings_glmocr_ollama_concurrency_detail")
+                    visible: app.glmocrMode === "ollama"
+                    Layout.fillWidth: true
+
+                    ThemeSpinBox {
+                        Accessible.name: root.tr("qml_glmocr_ollama_concurrency")
+                        from: 1
+                        to: 8
+                        value: app.glmocrOllamaConcurrency
+                        textFromValue: function(value, locale) { return value.toString() }
+                        onValueModified: app.setGlmocrOllamaConcurrency(value)
+                    }
+                }
+
+                FieldGroup {
+                    label: root.tr("settings_glmocr_ollama_image_format_label")
+                    detail: root.tr("settings_glmocr_ollama_image_format_detail")
+                    visible: app.glmocrMode === "ollama"
+                    Layout.fillWidth: true
+
+                    RowLayout {
+                        spacing: 10
+                        Layout.fillWidth: true
+
+                        ThemeComboBox {
+                            readonly property var imageFormats: ["jpeg", "png", "webp"]
+
+                            Accessible.name: root.tr("qml_glmocr_ollama_image_format")
+                            model: ["JPEG", "PNG", "WebP"]
+                            currentIndex: Math.max(0, imageFormats.indexOf(app.glmocrOllamaImageFormat))
+                            onActivated: index => app.setGlmocrOllamaImageFormat(imageFormats[index])
+                            Layout.fillWidth: true
+                        }
+
+                        ThemeSpinBox {
+                            Accessible.name: root.tr("qml_glmocr_ollama_image_quality")
+                            enabled: app.glmocrOllamaImageFormat !== "png"
+                            from: 1
+                            to: 100
+                            value: app.glmocrOllamaImageQuality
+                            textFromValue: function(value, locale) { return value.toString() }
+                            onValueModified: app.setGlmocrOllamaImageQuality(value)
+                        }
+                    }
+                }
+
+                FieldGroup {
+                    label: root.tr("settings_glmocr_ollama_image_max_edge_label")
+                    detail: root.tr("settings_glmocr_ollama_image_max_edge_detail")
+                    visible: app.glmocrMode === "ollama"
+                    Layout.fillWidth: true
+
+                    ThemeSpinBox {
+                        Accessible.name: root.tr("settings_glmocr_ollama_image_max_edge_label")
+                        from: 0
+                        to: 10000
+                        stepSize: 256
+                        value: app.glmocrOllamaImageMaxEdge
+                        textFromValue: function(value, locale) { return value.toString() }
+                        onValueModified: app.setGlmocrOllamaImageMaxEdge(value)
+                    }
+                }
+
                 FieldGroup {
                     label: root.tr("settings_glmocr_sdk_server_url_label")
                     visible: app.glmocrMode === "sdk_server"
@@ -2926,6 +3325,43 @@ ApplicationWindow {
                     }
                 }
 
+                RowLayout {
+                    spacing: 10
+                    Layout.fillWidth: true
+
+                    FieldGroup {
+                        label: root.tr("settings_http_ocr_chunk_pages_label")
+                        detail: root.tr("settings_http_ocr_chunk_pages_detail")
+                        Layout.fillWidth: true
+
+                        ThemeSpinBox {
+                            Accessible.name: root.tr("settings_http_ocr_chunk_pages_label")
+                            from: 0
+                            to: 1000
+                            value: app.httpOcrChunkPages
+                            textFromValue: function(value, locale) { return value.toString() }
+                            onValueModified: app.setHttpOcrChunkPages(value)
+                        }
+                    }
+
+                    FieldGroup {
+                        label: root.tr("settings_http_ocr_chunk_workers_label")
+                        detail: root.tr("settings_http_ocr_chunk_workers_detail")
+                        visible: app.httpOcrChunkPages > 0
+                        Layout.preferredWidth: 180
+                        Layout.fillWidth: false
+
+                        ThemeSpinBox {
+                            Accessible.name: root.tr("settings_http_ocr_chunk_workers_label")
+                            from: 1
+                            to: 8
+                            value: app.httpOcrChunkWorkers
+                            textFromValue: function(value, locale) { return value.toString() }
+                            onValueModified: app.setHttpOcrChunkWorkers(value)
+                        }
+                    }
+                }
+
                 FieldGroup {
                     label: root.tr("qml_api_key_environment_variable")
                     detail: root.tr("qml_api_key_environment_variable_detail")
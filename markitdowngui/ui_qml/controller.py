@@ -4,11 +4,12 @@ import os
 import re
 import sys
 import tempfile
+from dataclasses import asdict
 from pathlib import Path
 from typing import Any, Callable
 
 from PySide6.QtCore import QObject, Property, QProcess, QThread, QUrl, Signal, Slot
-from PySide6.QtGui import QDesktopServices, QGuiApplication, QPalette, QTextDocument
+from PySide6.QtGui import QDesktopServices, QGuiApplication, QPalette
 
 from markitdowngui.core.conversion import (
     AZURE_OCR_API_KEY_ENV_VAR,
@@ -28,30 +29,44 @@ from markitdowngui.core.conversion import (
     OCR_PROVIDER_NONE,
     PDF_EXTENSION,
     ZHIPU_API_KEY_ENV_VAR,
+    ConversionBatchSummary,
     ConversionOutcome,
     ConversionOptions,
-    ConversionWorker,
     get_ocr_provider_specs,
     test_ocr_provider_connection,
     validate_ocr_setup,
 )
+from markitdowngui.core.conversion_cache import ConversionCache
+from markitdowngui.core.conversion_worker import ConversionWorker
 from markitdowngui.core.file_utils import FileManager
+from markitdowngui.core.http_sessions import close_http_sessions
+from markitdowngui.core.tesseract_engine import close_tesseract_engines
+from markitdowngui.core.ocr_page_cache import OcrPageCache, default_ocr_page_cache_dir
 from markitdowngui.core.input_sources import (
     is_web_url,
     source_output_dir,
     source_output_stem,
 )
 from markitdowngui.core.markdown_assets import (
-    MarkdownSaveInput,
-    PreparedMarkdownAssets,
+    AssetTransferStats,
+    ResultSaveInput,
     cleanup_temp_asset_root,
     create_temp_asset_root,
-    prepare_combined_markdown_for_save_transaction,
-    prepare_markdown_for_separate_save_transaction,
-    rewrite_markdown_for_preview,
+    prepare_combined_markdown_stream_for_save_transaction,
+)
+from markitdowngui.core.save_worker import SeparateSaveWorker
+from markitdowngui.core.separate_save import (
+    SeparateSaveJob,
+    SeparateSaveSummary,
+    save_prepared_markdown,
 )
 from markitdowngui.core.settings import SettingsManager
-from markitdowngui.ui_qml.models import QueueModel, ResultModel
+from markitdowngui.ui_qml.models import QueueModel, ResultItem, ResultModel
+from markitdowngui.ui_qml.preview import (
+    PREVIEW_CHUNKED_MIN_CHARS,
+    PreviewChunkModel,
+    PreviewRenderer,
+)
 from markitdowngui.utils.logger import AppLogger, build_diagnostic_report
 from markitdowngui.utils.packaged_updater import (
     PackagedUpdateError,
@@ -89,12 +104,6 @@ from markitdowngui.utils.update_checker import (
 )
 
 
-_PREVIEW_HEADING_RE = re.compile(r'<h([1-3]) style="([^"]*)"><span style="([^"]*)">')
-_PREVIEW_HEADING_MARGINS = {
-    "1": "10px",
-    "2": "8px",
-    "3": "6px",
-}
 _MARKDOWN_LINK_RE = re.compile(r"\[([^\]]+)\]\([^)]+\)")
 _MARKDOWN_DECORATION_RE = re.compile(r"[*_`>#]")
 _SOURCE_UPDATE_COMPLETE_MESSAGE = "Source update complete. Restart the app."
@@ -155,15 +164,40 @@ class SourceUpdateInstaller(QThread):
         self.updateError.emit(f"Source update failed with exit code {result}.")
 
 
+class CacheClearWorker(QThread):
+    cacheCleared = Signal()
+    clearError = Signal(str)
+
+    def __init__(
+        self,
+        caches: list[ConversionCache | OcrPageCache],
+        parent: QObject | None = None,
+    ) -> None:
+        super().__init__(parent)
+        self.caches = list(caches)
+
+    def run(self) -> None:
+        # Removing a large cache tree can take seconds; keep it off the GUI thread.
+        try:
+            for cache in self.caches:
+                cache.clear()
+        except Exception as exc:
+            self.clearError.emit(f"Could not clear the conversion cache: {exc}")
+            return
+        self.cacheCleared.emit()
+
+
 class AppController(QObject):
     statusChanged = Signal()
     progressChanged = Signal()
     conversionActivityChanged = Signal()
     convertingChanged = Signal()
     pausedChanged = Signal()
+    savingChanged = Signal()
     queueChanged = Signal()
     resultsChanged = Signal()
     selectedResultChanged = Signal()
+    selectedPreviewChanged = Signal()
     previewModeChanged = Signal()
     settingsChanged = Signal()
     themeChanged = Signal()
@@ -183,7 +217,16 @@ class AppController(QObject):
         self.file_manager = FileManager()
         self.queue_model = QueueModel()
         self.result_model = ResultModel()
+        self._preview_renderer = PreviewRenderer(self)
+        self._preview_renderer.previewReady.connect(self._handle_preview_ready)
+        self.preview_chunk_model = PreviewChunkModel(self._preview_renderer, self)
+        self.selectedResultChanged.connect(self._sync_preview_chunks)
+        self.selectedResultChanged.connect(self.selectedPreviewChanged)
         self.worker: ConversionWorker | None = None
+        self.save_worker: SeparateSaveWorker | None = None
+        self._saved_output_count = 0
+        self._save_output_total = 0
+        self._conversion_cache: ConversionCache | None = None
         self._status = "Ready to convert"
         self._progress = 0
         self._completed_count = 0
@@ -199,11 +242,11 @@ class AppController(QObject):
         # outlive the next conversion worker until the result set is cleared.
         self._temp_asset_roots: set[str] = set()
         self._cancel_requested = False
-        self._unsaved_result_sources: set[str] = set()
         self._pending_result_discard: Callable[[], None] | None = None
         self._pending_update_helper: Path | None = None
         self._update_checker: UpdateChecker | None = None
         self._update_installer: PackagedUpdateInstaller | None = None
+        self._cache_clear_worker: CacheClearWorker | None = None
         self._update_check_manual = False
         self._available_update_version = ""
         self._available_release_url = ""
@@ -227,6 +270,10 @@ class AppController(QObject):
     def resultModel(self) -> ResultModel:
         return self.result_model
 
+    @Property(QObject, constant=True)
+    def previewChunkModel(self) -> PreviewChunkModel:
+        return self.preview_chunk_model
+
     @Property(str, notify=statusChanged)
     def statusText(self) -> str:
         return self._status
@@ -269,22 +316,25 @@ class AppController(QObject):
 
     @Property(bool, notify=resultsChanged)
     def hasSuccessfulResults(self) -> bool:
-        return bool(self._successful_result_items())
+        return self.result_model.successful_count > 0
 
     @Property(bool, notify=resultsChanged)
     def hasUnsavedSuccessfulResults(self) -> bool:
-        successful_sources = {
-            item.source for item in self._successful_result_items()
-        }
-        return bool(self._unsaved_result_sources & successful_sources)
+        return self.result_model.unsaved_count > 0
 
     @Property(bool, notify=resultsChanged)
     def hasFailedResults(self) -> bool:
-        return bool(self._failed_result_items())
+        return self.result_model.failed_count > 0
 
     @Property(int, notify=resultsChanged)
     def failedResultCount(self) -> int:
-        return len(self._failed_result_items())
+        return self.result_model.failed_count
+
+    @Property("QVariant", notify=resultsChanged)
+    def resultStatistics(self) -> dict[str, int]:
+        statistics = asdict(self.result_model.totals)
+        statistics["files"] = self.result_model.successful_count
+        return statistics
 
     @Property(int, notify=selectedResultChanged)
     def selectedResultIndex(self) -> int:
@@ -300,19 +350,26 @@ class AppController(QObject):
         item = self.result_model.item_at(self._selected_result_index)
         return bool(item and item.failed)
 
-    @Property(str, notify=selectedResultChanged)
+    @Property(bool, notify=selectedPreviewChanged)
+    def selectedPreviewChunked(self) -> bool:
+        item = self.result_model.item_at(self._selected_result_index)
+        return self._is_chunked_preview(item)
+
+    @Property(str, notify=selectedPreviewChanged)
     def selectedPreviewHtml(self) -> str:
         item = self.result_model.item_at(self._selected_result_index)
-        if not item:
+        if not item or self._is_chunked_preview(item):
             return ""
-        markdown = rewrite_markdown_for_preview(
+        html = self._preview_renderer.html_for(
+            self._preview_key(item),
             item.outcome.markdown,
             item.outcome.assets,
+            self._preview_css(),
         )
-        doc = QTextDocument()
-        doc.setMarkdown(markdown)
-        html = self._compact_preview_html(doc.toHtml())
-        return f"<style>{self._preview_css()}</style>{html}"
+        if html is None:
+            placeholder = self.translate("qml_preview_rendering")
+            return f"<style>{self._preview_css()}</style><p>{placeholder}</p>"
+        return html
 
     @Property(str, notify=previewModeChanged)
     def previewMode(self) -> str:
@@ -372,10 +429,14 @@ class AppController(QObject):
         if not output_dir:
             return ""
 
-        items = self._successful_result_items()
-        if not items:
+        first_item = self.result_model.first_successful_item()
+        if first_item is None:
             return ""
-        stem = source_output_stem(items[0].source) if len(items) == 1 else "converted"
+        stem = (
+            source_output_stem(first_item.source)
+            if self.result_model.successful_count == 1
+            else "converted"
+        )
         output_path = Path(output_dir) / f"{stem}{self.settings.get_default_output_format()}"
         return QUrl.fromLocalFile(str(output_path)).toString()
 
@@ -395,6 +456,22 @@ class AppController(QObject):
     def saveToSourceFolder(self) -> bool:
         return self.settings.get_save_to_source_folder()
 
+    @Property(bool, notify=settingsChanged)
+    def groupedSaveDurability(self) -> bool:
+        return self.settings.get_grouped_save_durability()
+
+    @Property(bool, notify=savingChanged)
+    def savingOutputs(self) -> bool:
+        return self.save_worker is not None
+
+    @Property(int, notify=savingChanged)
+    def savedOutputCount(self) -> int:
+        return self._saved_output_count
+
+    @Property(int, notify=savingChanged)
+    def saveOutputTotal(self) -> int:
+        return self._save_output_total
+
     @Property(bool, notify=settingsChanged)
     def updateNotificationsEnabled(self) -> bool:
         return self.settings.get_update_notifications_enabled()
@@ -403,6 +480,30 @@ class AppController(QObject):
     def batchSize(self) -> int:
         return self.settings.get_batch_size()
 
+    @Property(bool, notify=settingsChanged)
+    def processPoolConversion(self) -> bool:
+        return self.settings.get_process_pool_conversion()
+
+    @Property(int, notify=settingsChanged)
+    def httpPoolSize(self) -> int:
+        return self.settings.get_http_pool_size()
+
+    @Property(int, notify=settingsChanged)
+    def httpMaxRetries(self) -> int:
+        return self.settings.get_http_max_retries()
+
+    @Property(bool, notify=settingsChanged)
+    def conversionCacheEnabled(self) -> bool:
+        return self.settings.get_conversion_cache_enabled()
+
+    @Property(int, notify=settingsChanged)
+    def conversionCacheMaxMb(self) -> int:
+        return self.settings.get_conversion_cache_max_mb()
+
+    @Property(int, notify=settingsChanged)
+    def resultMemoryBudgetMb(self) -> int:
+        return self.settings.get_result_memory_budget_mb()
+
     @Property(bool, notify=settingsChanged)
     def ocrEnabled(self) -> bool:
         return self.settings.get_ocr_enabled()
@@ -411,6 +512,10 @@ class AppController(QObject):
     def fastPdfConversion(self) -> bool:
         return self.settings.get_fast_pdf_conversion()
 
+    @Property(bool, notify=settingsChanged)
+    def hybridPdfOcr(self) -> bool:
+        return self.settings.get_hybrid_pdf_ocr()
+
     @Property(bool, notify=settingsChanged)
     def anydocDefaultEnabled(self) -> bool:
         return self.settings.get_anydoc_enabled()
@@ -457,6 +562,22 @@ class AppController(QObject):
     def glmocrOllamaModel(self) -> str:
         return self.settings.get_glmocr_ollama_model()
 
+    @Property(int, notify=settingsChanged)
+    def glmocrOllamaConcurrency(self) -> int:
+        return self.settings.get_glmocr_ollama_concurrency()
+
+    @Property(str, notify=settingsChanged)
+    def glmocrOllamaImageFormat(self) -> str:
+        return self.settings.get_glmocr_ollama_image_format()
+
+    @Property(int, notify=settingsChanged)
+    def glmocrOllamaImageQuality(self) -> int:
+        return self.settings.get_glmocr_ollama_image_quality()
+
+    @Property(int, notify=settingsChanged)
+    def glmocrOllamaImageMaxEdge(self) -> int:
+        return self.settings.get_glmocr_ollama_image_max_edge()
+
     @Property(str, notify=settingsChanged)
     def glmocrSdkServerUrl(self) -> str:
         return self.settings.get_glmocr_sdk_server_url()
@@ -477,6 +598,14 @@ class AppController(QObject):
     def httpOcrTimeoutSeconds(self) -> int:
         return self.settings.get_http_ocr_timeout_seconds()
 
+    @Property(int, notify=settingsChanged)
+    def httpOcrChunkPages(self) -> int:
+        return self.settings.get_http_ocr_chunk_pages()
+
+    @Property(int, notify=settingsChanged)
+    def httpOcrChunkWorkers(self) -> int:
+        return self.settings.get_http_ocr_chunk_workers()
+
     @Property("QVariant", constant=True)
     def ocrProviderOptions(self) -> list[dict[str, object]]:
         return [
@@ -527,6 +656,30 @@ class AppController(QObject):
     def tesseractPath(self) -> str:
         return self.settings.get_tesseract_path()
 
+    @Property(bool, notify=settingsChanged)
+    def tesseractEngineReuse(self) -> bool:
+        return self.settings.get_tesseract_engine_reuse()
+
+    @Property(int, notify=settingsChanged)
+    def ocrPageWorkers(self) -> int:
+        return self.settings.get_ocr_page_workers()
+
+    @Property(int, notify=settingsChanged)
+    def ocrRenderAhead(self) -> int:
+        return self.settings.get_ocr_render_ahead()
+
+    @Property(int, notify=settingsChanged)
+    def ocrRenderMaxMegapixels(self) -> int:
+        return self.settings.get_ocr_render_max_megapixels()
+
+    @Property(str, notify=settingsChanged)
+    def ocrRenderColor(self) -> str:
+        return self.settings.get_ocr_render_color()
+
+    @Property(bool, notify=settingsChanged)
+    def ocrPageCacheEnabled(self) -> bool:
+        return self.settings.get_ocr_page_cache_enabled()
+
     @Property(bool, notify=updateNotificationChanged)
     def hasUpdateNotification(self) -> bool:
         return bool(self._available_update_version)
@@ -729,8 +882,10 @@ class AppController(QObject):
         self._cleanup_pending_update_helper()
 
     def _clear_results(self) -> None:
+        # Background saves read result bodies from the store being cleared.
+        self._stop_separate_save()
         self.result_model.clear()
-        self._unsaved_result_sources.clear()
+        self._preview_renderer.clear()
         self._selected_result_index = -1
         self._progress = 0
         self._completed_count = 0
@@ -761,11 +916,11 @@ class AppController(QObject):
         self.queue_model.clear()
         added = self.queue_model.add_sources(failed_sources)
         self.result_model.remove_sources(set(failed_sources))
-        remaining_sources = [item.source for item in self.result_model.items()]
+        selected_row = self.result_model.row_for_source(selected_source)
         self._selected_result_index = (
-            remaining_sources.index(selected_source)
-            if selected_source in remaining_sources
-            else 0 if remaining_sources else -1
+            selected_row
+            if selected_row >= 0
+            else 0 if self.result_model.rowCount() else -1
         )
         self.queueChanged.emit()
         self.resultsChanged.emit()
@@ -805,6 +960,7 @@ class AppController(QObject):
 
         if not preserve_results:
             self._clear_results()
+        self._apply_result_memory_budget()
         self._cancel_requested = False
         self._completed_count = 0
         self._total_count = len(sources)
@@ -813,10 +969,12 @@ class AppController(QObject):
             files=sources,
             batch_size=self.settings.get_batch_size(),
             options=self._build_conversion_options(),
+            use_process_pool=self.settings.get_process_pool_conversion(),
+            conversion_cache=self._active_conversion_cache(),
         )
         self.worker.itemStarted.connect(self._handle_item_started)
         self.worker.progress.connect(self._handle_progress)
-        self.worker.itemFinished.connect(self._handle_item_finished)
+        self.worker.itemsFinished.connect(self._handle_items_finished)
         self.worker.finished.connect(self._handle_finished)
         self.worker.error.connect(lambda message: self.toastRequested.emit("error", message))
         self.worker.start()
@@ -900,21 +1058,15 @@ class AppController(QObject):
             self.notifyNoSuccessfulOutputToSave()
             return
 
-        documents = [
-            MarkdownSaveInput(
-                source=item.source,
-                markdown=item.outcome.markdown,
-                assets=item.outcome.assets,
-            )
-            for item in items
-        ]
+        documents = [ResultSaveInput(item.source, item.outcome) for item in items]
         try:
-            prepared_output = prepare_combined_markdown_for_save_transaction(
+            prepared_output, chunks = prepare_combined_markdown_stream_for_save_transaction(
                 documents,
                 output_path,
                 source_heading_template="## {source}",
             )
-            self._save_prepared_markdown(output_path, prepared_output)
+            save_prepared_markdown(output_path, prepared_output, chunks)
+            self._log_asset_transfer(prepared_output.asset_transfer)
             self.settings.set_recent_outputs(
                 self.file_manager.update_recent_list(
                     output_path,
@@ -929,6 +1081,9 @@ class AppController(QObject):
 
     @Slot("QVariant")
     def saveSeparateOutputs(self, folder_url: Any) -> None:
+        if self.save_worker is not None:
+            self.toastRequested.emit("error", "Wait for the current save to finish.")
+            return
         fallback_dir = self._path_from_url(folder_url)
         all_items = self.result_model.items()
         if not all_items:
@@ -946,44 +1101,103 @@ class AppController(QObject):
         if fallback_dir:
             Path(fallback_dir).mkdir(parents=True, exist_ok=True)
 
-        saved_paths: list[str] = []
-        failed_paths: list[str] = []
-        saved_sources: set[str] = set()
+        jobs: list[SeparateSaveJob] = []
+        reserved_paths: set[str] = set()
         for item in items:
             output_dir = self._separate_output_dir(fallback_dir, item.source)
             if not output_dir:
                 AppLogger.error(f"No output folder available for {item.source}")
                 continue
             Path(output_dir).mkdir(parents=True, exist_ok=True)
-            output_path = self._unique_output_path(output_dir, item.source)
-            try:
-                prepared_output = prepare_markdown_for_separate_save_transaction(
-                    item.outcome.markdown,
-                    item.outcome.assets,
-                    output_path,
-                )
-                self._save_prepared_markdown(output_path, prepared_output)
-                saved_paths.append(output_path)
-                saved_sources.add(item.source)
-            except Exception as exc:
-                AppLogger.error(f"Failed saving {output_path}: {exc}")
-                failed_paths.append(output_path)
-
-        if saved_paths and failed_paths:
-            self._mark_results_saved(saved_sources)
-            saved_label = "file" if len(saved_paths) == 1 else "files"
-            failed_label = "file" if len(failed_paths) == 1 else "files"
+            output_path = self._unique_output_path(output_dir, item.source, reserved_paths)
+            reserved_paths.add(output_path)
+            jobs.append(SeparateSaveJob(item.source, output_path, item.outcome))
+
+        if not jobs:
+            self.toastRequested.emit("error", "No files were saved.")
+            return
+
+        worker = SeparateSaveWorker(
+            jobs,
+            grouped_durability=self.settings.get_grouped_save_durability(),
+        )
+        worker.progress.connect(self._handle_save_progress)
+        worker.finished.connect(
+            lambda summary, worker=worker: self._handle_separate_save_finished(
+                worker,
+                summary,
+            )
+        )
+        self.save_worker = worker
+        self._saved_output_count = 0
+        self._save_output_total = len(jobs)
+        worker.start()
+        self.savingChanged.emit()
+
+    @Slot()
+    def cancelSave(self) -> None:
+        if self.save_worker is not None:
+            self.save_worker.is_cancelled = True
+
+    def _handle_save_progress(self, completed: int, total: int) -> None:
+        self._saved_output_count = completed
+        self._save_output_total = total
+        self.savingChanged.emit()
+
+    def _handle_separate_save_finished(
+        self,
+        worker: SeparateSaveWorker,
+        summary: SeparateSaveSummary,
+    ) -> None:
+        if worker is not self.save_worker:
+            # The save was stopped because its results were discarded.
+            return
+        # finished is emitted from run(), just before the thread exits.
+        worker.wait()
+        self.save_worker = None
+        self.savingChanged.emit()
+        for result in summary.failed:
+            AppLogger.error(f"Failed saving {result.output_path}: {result.error}")
+        self._log_asset_transfer(summary.asset_transfer)
+
+        saved_count = len(summary.saved)
+        failed_count = len(summary.failed)
+        if saved_count:
+            self._mark_results_saved({result.source for result in summary.saved})
+        if summary.cancelled:
+            self.toastRequested.emit(
+                "success",
+                f"Save cancelled after {saved_count} "
+                f"{'file' if saved_count == 1 else 'files'}.",
+            )
+        elif saved_count and failed_count:
+            saved_label = "file" if saved_count == 1 else "files"
+            failed_label = "file" if failed_count == 1 else "files"
             self.toastRequested.emit(
                 "error",
-                f"Saved {len(saved_paths)} {saved_label}; "
-                f"{len(failed_paths)} {failed_label} failed to save.",
+                f"Saved {saved_count} {saved_label}; "
+                f"{failed_count} {failed_label} failed to save.",
             )
-        elif saved_paths:
-            self._mark_results_saved(saved_sources)
-            self.toastRequested.emit("success", f"Saved {len(saved_paths)} files.")
+        elif saved_count:
+            self.toastRequested.emit("success", f"Saved {saved_count} files.")
         else:
             self.toastRequested.emit("error", "No files were saved.")
 
+    def _wait_for_separate_save(self, timeout_ms: int = 1500) -> bool:
+        if self.save_worker is None or not self.save_worker.isRunning():
+            return True
+        self.save_worker.is_cancelled = True
+        return self.save_worker.wait(timeout_ms)
+
+    def _stop_separate_save(self) -> None:
+        worker = self.save_worker
+        if worker is None:
+            return
+        worker.is_cancelled = True
+        worker.wait()
+        self.save_worker = None
+        self.savingChanged.emit()
+
     @Slot("QVariant")
     def setOutputFolderFromUrl(self, folder_url: Any) -> None:
         output_dir = self._path_from_url(folder_url)
@@ -1024,6 +1238,11 @@ class AppController(QObject):
         self.settingsChanged.emit()
         self.saveDefaultsChanged.emit()
 
+    @Slot(bool)
+    def setGroupedSaveDurability(self, enabled: bool) -> None:
+        self.settings.set_grouped_save_durability(enabled)
+        self.settingsChanged.emit()
+
     @Slot(bool)
     def setReduceMotion(self, enabled: bool) -> None:
         self.settings.set_reduce_motion(enabled)
@@ -1034,6 +1253,65 @@ class AppController(QObject):
         self.settings.set_batch_size(value)
         self.settingsChanged.emit()
 
+    @Slot(bool)
+    def setProcessPoolConversion(self, enabled: bool) -> None:
+        self.settings.set_process_pool_conversion(enabled)
+        self.settingsChanged.emit()
+
+    @Slot(int)
+    def setHttpPoolSize(self, value: int) -> None:
+        self.settings.set_http_pool_size(value)
+        self.settingsChanged.emit()
+
+    @Slot(int)
+    def setHttpMaxRetries(self, value: int) -> None:
+        self.settings.set_http_max_retries(value)
+        self.settingsChanged.emit()
+
+    @Slot(bool)
+    def setConversionCacheEnabled(self, enabled: bool) -> None:
+        self.settings.set_conversion_cache_enabled(enabled)
+        self.settingsChanged.emit()
+
+    @Slot(int)
+    def setResultMemoryBudgetMb(self, value: int) -> None:
+        self.settings.set_result_memory_budget_mb(value)
+        self._apply_result_memory_budget()
+        self.settingsChanged.emit()
+
+    def _apply_result_memory_budget(self) -> None:
+        self.result_model.store.set_memory_budget(
+            self.settings.get_result_memory_budget_mb() * 1024 * 1024
+        )
+
+    @Slot(int)
+    def setConversionCacheMaxMb(self, value: int) -> None:
+        self.settings.set_conversion_cache_max_mb(value)
+        if self._conversion_cache is not None:
+            self._conversion_cache.max_bytes = (
+                self.settings.get_conversion_cache_max_mb() * 1024 * 1024
+            )
+        self.settingsChanged.emit()
+
+    @Slot()
+    def clearConversionCache(self) -> None:
+        if self._cache_clear_worker is not None:
+            return
+        worker = CacheClearWorker(
+            [self._conversion_cache or ConversionCache(), OcrPageCache()],
+            self,
+        )
+        worker.cacheCleared.connect(
+            lambda: self.toastRequested.emit("success", "Conversion cache cleared.")
+        )
+        worker.clearError.connect(lambda message: self.toastRequested.emit("error", message))
+        worker.finished.connect(self._clear_cache_clear_worker)
+        self._cache_clear_worker = worker
+        worker.start()
+
+    def _clear_cache_clear_worker(self) -> None:
+        self._cache_clear_worker = None
+
     @Slot(bool)
     def setOcrEnabled(self, enabled: bool) -> None:
         self.settings.set_ocr_enabled(enabled)
@@ -1045,6 +1323,11 @@ class AppController(QObject):
         self.settings.set_fast_pdf_conversion(enabled)
         self.settingsChanged.emit()
 
+    @Slot(bool)
+    def setHybridPdfOcr(self, enabled: bool) -> None:
+        self.settings.set_hybrid_pdf_ocr(enabled)
+        self.settingsChanged.emit()
+
     @Slot(bool)
     def setAnydocDefaultEnabled(self, enabled: bool) -> None:
         self.settings.set_anydoc_enabled(enabled)
@@ -1116,6 +1399,26 @@ class AppController(QObject):
         self.settingsChanged.emit()
         self.diagnosticsChanged.emit()
 
+    @Slot(int)
+    def setGlmocrOllamaConcurrency(self, value: int) -> None:
+        self.settings.set_glmocr_ollama_concurrency(value)
+        self.settingsChanged.emit()
+
+    @Slot(str)
+    def setGlmocrOllamaImageFormat(self, value: str) -> None:
+        self.settings.set_glmocr_ollama_image_format(value)
+        self.settingsChanged.emit()
+
+    @Slot(int)
+    def setGlmocrOllamaImageQuality(self, value: int) -> None:
+        self.settings.set_glmocr_ollama_image_quality(value)
+        self.settingsChanged.emit()
+
+    @Slot(int)
+    def setGlmocrOllamaImageMaxEdge(self, value: int) -> None:
+        self.settings.set_glmocr_ollama_image_max_edge(value)
+        self.settingsChanged.emit()
+
     @Slot(str)
     def setGlmocrSdkServerUrl(self, value: str) -> None:
         self.settings.set_glmocr_sdk_server_url(value)
@@ -1146,6 +1449,16 @@ class AppController(QObject):
         self.settingsChanged.emit()
         self.diagnosticsChanged.emit()
 
+    @Slot(int)
+    def setHttpOcrChunkPages(self, value: int) -> None:
+        self.settings.set_http_ocr_chunk_pages(value)
+        self.settingsChanged.emit()
+
+    @Slot(int)
+    def setHttpOcrChunkWorkers(self, value: int) -> None:
+        self.settings.set_http_ocr_chunk_workers(value)
+        self.settingsChanged.emit()
+
     @Slot(str)
     def setDocintelEndpoint(self, value: str) -> None:
         self.settings.set_docintel_endpoint(value)
@@ -1164,6 +1477,36 @@ class AppController(QObject):
         self.settingsChanged.emit()
         self.diagnosticsChanged.emit()
 
+    @Slot(bool)
+    def setTesseractEngineReuse(self, enabled: bool) -> None:
+        self.settings.set_tesseract_engine_reuse(enabled)
+        self.settingsChanged.emit()
+
+    @Slot(int)
+    def setOcrPageWorkers(self, value: int) -> None:
+        self.settings.set_ocr_page_workers(value)
+        self.settingsChanged.emit()
+
+    @Slot(int)
+    def setOcrRenderAhead(self, value: int) -> None:
+        self.settings.set_ocr_render_ahead(value)
+        self.settingsChanged.emit()
+
+    @Slot(int)
+    def setOcrRenderMaxMegapixels(self, value: int) -> None:
+        self.settings.set_ocr_render_max_megapixels(value)
+        self.settingsChanged.emit()
+
+    @Slot(str)
+    def setOcrRenderColor(self, value: str) -> None:
+        self.settings.set_ocr_render_color(value)
+        self.settingsChanged.emit()
+
+    @Slot(bool)
+    def setOcrPageCacheEnabled(self, enabled: bool) -> None:
+        self.settings.set_ocr_page_cache_enabled(enabled)
+        self.settingsChanged.emit()
+
     @Slot(str)
     def applyOcrPreset(self, preset_id: str) -> None:
         if preset_id == "glmocr_ollama":
@@ -1531,7 +1874,19 @@ class AppController(QObject):
                     "Conversion is still stopping. Close again after it finishes.",
                 )
                 return False
+        if not self._wait_for_separate_save():
+            self.toastRequested.emit(
+                "error",
+                "Saving is still stopping. Close again after it finishes.",
+            )
+            return False
+        self._preview_renderer.shutdown()
+        self.result_model.store.clear()
         self._cleanup_temp_assets()
+        close_http_sessions()
+        close_tesseract_engines()
+        if self._cache_clear_worker is not None:
+            self._cache_clear_worker.wait()
         if self._update_checker and self._update_checker.isRunning():
             self._update_checker.wait(2000)
         if self._update_installer and self._update_installer.isRunning():
@@ -1925,6 +2280,7 @@ class AppController(QObject):
             docintel_endpoint=self.settings.get_docintel_endpoint(),
             ocr_languages=self.settings.get_ocr_languages(),
             tesseract_path=self.settings.get_tesseract_path(),
+            reuse_tesseract_engines=self.settings.get_tesseract_engine_reuse(),
             glmocr_mode=self.settings.get_glmocr_mode(),
             glmocr_ollama_host=self.settings.get_glmocr_ollama_host(),
             glmocr_ollama_port=self.settings.get_glmocr_ollama_port(),
@@ -2066,6 +2422,7 @@ class AppController(QObject):
         return ConversionOptions(
             ocr_enabled=self.settings.get_ocr_enabled(),
             fast_pdf_conversion=self.settings.get_fast_pdf_conversion(),
+            hybrid_pdf_ocr=self.settings.get_hybrid_pdf_ocr(),
             anydoc_conversion=(
                 self._anydoc_override
                 if self._anydoc_override is not None
@@ -2079,6 +2436,22 @@ class AppController(QObject):
             docintel_endpoint=self.settings.get_docintel_endpoint(),
             ocr_languages=self.settings.get_ocr_languages(),
             tesseract_path=self.settings.get_tesseract_path(),
+            reuse_tesseract_engines=self.settings.get_tesseract_engine_reuse(),
+            ocr_page_workers=self.settings.get_ocr_page_workers(),
+            ocr_render_ahead=self.settings.get_ocr_render_ahead(),
+            ocr_render_max_megapixels=self.settings.get_ocr_render_max_megapixels(),
+            ocr_render_color=self.settings.get_ocr_render_color(),
+            glmocr_ollama_concurrency=self.settings.get_glmocr_ollama_concurrency(),
+            glmocr_ollama_image_format=self.settings.get_glmocr_ollama_image_format(),
+            glmocr_ollama_image_quality=self.settings.get_glmocr_ollama_image_quality(),
+            glmocr_ollama_image_max_edge=self.settings.get_glmocr_ollama_image_max_edge(),
+            http_pool_size=self.settings.get_http_pool_size(),
+            http_max_retries=self.settings.get_http_max_retries(),
+            ocr_page_cache_dir=(
+                str(default_ocr_page_cache_dir())
+                if self.settings.get_ocr_page_cache_enabled()
+                else ""
+            ),
             pdf_artifacts_dir=artifacts_dir,
             docx_artifacts_dir=artifacts_dir,
             glmocr_mode=self.settings.get_glmocr_mode(),
@@ -2090,6 +2463,8 @@ class AppController(QObject):
             http_ocr_model=self.settings.get_http_ocr_model(),
             http_ocr_api_key_env=self.settings.get_http_ocr_api_key_env(),
             http_ocr_timeout_seconds=self.settings.get_http_ocr_timeout_seconds(),
+            http_ocr_chunk_pages=self.settings.get_http_ocr_chunk_pages(),
+            http_ocr_chunk_workers=self.settings.get_http_ocr_chunk_workers(),
         )
 
     def _reset_anydoc_conversion_override(self) -> None:
@@ -2111,19 +2486,20 @@ class AppController(QObject):
         self.progressChanged.emit()
         self.conversionActivityChanged.emit()
 
-    def _handle_item_finished(
+    def _handle_items_finished(
         self,
-        source: str,
-        outcome: ConversionOutcome,
-        failed: bool,
+        entries: list[tuple[str, ConversionOutcome, bool]],
     ) -> None:
-        self.result_model.add_result(source, outcome, failed=failed)
-        self._completed_count += 1
+        # The worker groups outcomes that completed in the same poll round, so
+        # a burst of small files costs one row insert and one round of
+        # property notifications instead of one per file.
+        if not entries:
+            return
+        self.result_model.add_results(entries, unsaved=True)
+        self._completed_count += len(entries)
         if self._total_count:
             self._completed_count = min(self._total_count, self._completed_count)
-        self._active_source = source
-        if not failed:
-            self._unsaved_result_sources.add(source)
+        self._active_source = entries[-1][0]
         if self._selected_result_index < 0:
             self._selected_result_index = 0
         self.resultsChanged.emit()
@@ -2131,43 +2507,59 @@ class AppController(QObject):
         self.saveDefaultsChanged.emit()
         self.conversionActivityChanged.emit()
 
-    def _handle_finished(self, results: dict) -> None:
+    def _active_conversion_cache(self) -> ConversionCache | None:
+        if not self.settings.get_conversion_cache_enabled():
+            return None
+        max_bytes = self.settings.get_conversion_cache_max_mb() * 1024 * 1024
+        if self._conversion_cache is None:
+            self._conversion_cache = ConversionCache(max_bytes=max_bytes)
+        else:
+            self._conversion_cache.max_bytes = max_bytes
+        return self._conversion_cache
+
+    def _handle_finished(self, summary: ConversionBatchSummary) -> None:
+        # Every outcome already arrived through _handle_items_finished; the
+        # summary only closes out the batch.
         worker = self.worker
-        was_cancelled = self._cancel_requested or bool(worker and worker.is_cancelled)
-        failed = set(worker.failed_files) if worker else set()
-        completed_sources = {item.source for item in self.result_model.items()}
-        for source, outcome in results.items():
-            item_failed = source in failed
-            self.result_model.add_result(source, outcome, failed=item_failed)
-            if not item_failed and source not in completed_sources:
-                self._unsaved_result_sources.add(source)
+        was_cancelled = (
+            self._cancel_requested
+            or summary.cancelled
+            or bool(worker and worker.is_cancelled)
+        )
+        completed = summary.completed
+        failed_count = summary.failed
         if self._selected_result_index < 0:
-            self._selected_result_index = 0 if results else -1
+            self._selected_result_index = 0 if self.result_model.rowCount() else -1
         self._converting = False
         self._paused = False
         self._completed_count = (
-            min(self._total_count, len(results))
-            if self._total_count
-            else len(results)
+            min(self._total_count, completed) if self._total_count else completed
         )
         self._active_source = ""
-        self._progress = self._progress if was_cancelled else 100 if results else 0
+        self._progress = self._progress if was_cancelled else 100 if completed else 0
         if was_cancelled:
             self._set_status(
-                f"Cancelled after {len(results)} input{'s' if len(results) != 1 else ''}"
-                if results
+                f"Cancelled after {completed} input{'s' if completed != 1 else ''}"
+                if completed
                 else "Cancelled"
             )
-        elif failed:
-            failed_count = len(failed)
-            converted_count = max(0, len(results) - failed_count)
+        elif failed_count:
+            converted_count = summary.succeeded
             self._set_status(
                 f"{converted_count} converted, {failed_count} failed"
                 if converted_count
                 else f"{failed_count} failed"
             )
         else:
-            self._set_status(f"Converted {len(results)} input{'s' if len(results) != 1 else ''}")
+            self._set_status(f"Converted {completed} input{'s' if completed != 1 else ''}")
+        if worker is not None and getattr(worker, "conversion_cache", None) is not None:
+            # Tracked counters only: a full stats() scan would walk the cache
+            # directory on the GUI thread.
+            stats = worker.conversion_cache.tracked_stats()
+            AppLogger.info(
+                f"Conversion cache: {stats.hits} hits, {stats.misses} misses, "
+                f"{stats.evictions} evictions, {stats.size_bytes} bytes"
+            )
         self.worker = None
         self._cancel_requested = False
         self.resultsChanged.emit()
@@ -2179,8 +2571,7 @@ class AppController(QObject):
         self.saveDefaultsChanged.emit()
         if was_cancelled:
             self.toastRequested.emit("success", "Conversion cancelled.")
-        elif failed:
-            failed_count = len(failed)
+        elif failed_count:
             self.toastRequested.emit(
                 "error",
                 "1 conversion failed."
@@ -2265,9 +2656,8 @@ class AppController(QObject):
         )
 
     def _mark_results_saved(self, sources: set[str]) -> None:
-        if not self._unsaved_result_sources.intersection(sources):
+        if not self.result_model.mark_saved(sources):
             return
-        self._unsaved_result_sources.difference_update(sources)
         if not self.hasUnsavedSuccessfulResults:
             self._pending_result_discard = None
         self.resultsChanged.emit()
@@ -2276,27 +2666,10 @@ class AppController(QObject):
         self._clear_results()
         action()
 
-    def _save_prepared_markdown(
-        self,
-        output_path: str,
-        prepared_output: PreparedMarkdownAssets,
-    ) -> None:
-        staged_markdown = None
-        try:
-            staged_markdown = self.file_manager.stage_markdown_file(
-                output_path,
-                prepared_output.markdown,
-            )
-            prepared_output.commit_assets()
-            staged_markdown.commit()
-        except Exception:
-            prepared_output.rollback_assets()
-            raise
-        else:
-            prepared_output.finalize_assets()
-        finally:
-            if staged_markdown is not None:
-                staged_markdown.abort()
+    @staticmethod
+    def _log_asset_transfer(asset_transfer: AssetTransferStats) -> None:
+        if asset_transfer.files:
+            AppLogger.info(asset_transfer.describe())
 
     def _cleanup_temp_assets(self) -> None:
         asset_roots = set(self._temp_asset_roots)
@@ -2329,11 +2702,19 @@ class AppController(QObject):
             return QUrl(text).toLocalFile()
         return text
 
-    def _unique_output_path(self, output_dir: str, source: str) -> str:
+    def _unique_output_path(
+        self,
+        output_dir: str,
+        source: str,
+        reserved_paths: set[str] | None = None,
+    ) -> str:
+        # Separate saves run in the background, so paths handed to earlier
+        # jobs of the same batch may not exist on disk yet.
+        reserved_paths = reserved_paths or set()
         output_ext = self.settings.get_default_output_format()
         path = Path(output_dir) / f"{source_output_stem(source)}{output_ext}"
         counter = 1
-        while path.exists():
+        while path.exists() or str(path) in reserved_paths:
             path = Path(output_dir) / f"{source_output_stem(source)}_{counter}{output_ext}"
             counter += 1
         return str(path)
@@ -2364,18 +2745,20 @@ class AppController(QObject):
         if output_dir:
             return output_dir
 
-        items = self._successful_result_items()
-        if not items:
+        first_item = self.result_model.first_successful_item()
+        if first_item is None:
             return ""
-        return self._separate_output_dir("", items[0].source)
+        return self._separate_output_dir("", first_item.source)
 
     def _successful_result_items(self, items: list[Any] | None = None) -> list[Any]:
-        result_items = self.result_model.items() if items is None else items
-        return [item for item in result_items if not item.failed]
+        if items is None:
+            return self.result_model.successful_items()
+        return [item for item in items if not item.failed]
 
     def _failed_result_items(self, items: list[Any] | None = None) -> list[Any]:
-        result_items = self.result_model.items() if items is None else items
-        return [item for item in result_items if item.failed]
+        if items is None:
+            return self.result_model.failed_items()
+        return [item for item in items if item.failed]
 
     @staticmethod
     def _folder_url(folder: str) -> str:
@@ -2404,6 +2787,39 @@ class AppController(QObject):
                 except OSError:
                     pass
 
+    @Slot(str, int, result=int)
+    def findInSelectedPreview(self, query: str, start_chunk: int) -> int:
+        return self.preview_chunk_model.find(query, max(0, start_chunk))
+
+    @staticmethod
+    def _is_chunked_preview(item: ResultItem | None) -> bool:
+        return bool(
+            item
+            and not item.failed
+            # Cached stats, so a spilled body is not read back on every binding.
+            and item.stats.characters >= PREVIEW_CHUNKED_MIN_CHARS
+        )
+
+    def _sync_preview_chunks(self) -> None:
+        item = self.result_model.item_at(self._selected_result_index)
+        if not self._is_chunked_preview(item):
+            self.preview_chunk_model.clear()
+            return
+        self.preview_chunk_model.set_document(
+            (item.source, item.markdown_digest),
+            item.outcome.markdown,
+            item.outcome.assets,
+            self._preview_css(),
+        )
+
+    def _preview_key(self, item: ResultItem) -> tuple[str, str, bool]:
+        return (item.source, item.markdown_digest, self.darkMode)
+
+    def _handle_preview_ready(self, key: tuple[str, str, bool]) -> None:
+        item = self.result_model.item_at(self._selected_result_index)
+        if item is not None and self._preview_key(item) == key:
+            self.selectedPreviewChanged.emit()
+
     def _preview_css(self) -> str:
         if self.darkMode:
             return (
@@ -2439,28 +2855,6 @@ class AppController(QObject):
             "border-radius:6px;color:#586e75;} ul,ol{margin:0 0 14px 22px;} hr{border:0;border-top:1px solid #d6ccb2;}"
         )
 
-    @staticmethod
-    def _compact_preview_html(html: str) -> str:
-        # Qt RichText applies built-in heading scale even when the span font is restyled.
-        html = (
-            html.replace("font-size:xx-large;", "font-size:18px;")
-            .replace("font-size:x-large;", "font-size:15px;")
-            .replace("font-size:large;", "font-size:14px;")
-        )
-        html = _PREVIEW_HEADING_RE.sub(AppController._preview_heading_to_paragraph, html)
-        return (
-            html.replace("</h1>", "</p>")
-            .replace("</h2>", "</p>")
-            .replace("</h3>", "</p>")
-        )
-
-    @staticmethod
-    def _preview_heading_to_paragraph(match: re.Match[str]) -> str:
-        level, style, span_style = match.groups()
-        margin = _PREVIEW_HEADING_MARGINS[level]
-        style = style.replace("margin-bottom:0px;", f"margin-bottom:{margin};")
-        return f'<p style="{style}"><span style="{span_style}">'
-
     @Slot(str, result=str)
     def translate(self, key: str) -> str:
         return get_translation(self.currentLanguage, key)
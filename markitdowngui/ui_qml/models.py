@@ -1,11 +1,16 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from functools import cached_property
+import hashlib
+from typing import Iterable
 
 from PySide6.QtCore import QAbstractListModel, QModelIndex, Qt
 
 from markitdowngui.core.conversion import ConversionOutcome
+from markitdowngui.core.document_stats import DocumentStats, compute_document_stats
 from markitdowngui.core.input_sources import is_web_url, source_display_name
+from markitdowngui.core.result_store import ResultStore, StoredOutcome
 
 
 @dataclass(frozen=True)
@@ -24,7 +29,7 @@ class QueueItem:
 @dataclass(frozen=True)
 class ResultItem:
     source: str
-    outcome: ConversionOutcome
+    outcome: ConversionOutcome | StoredOutcome
     failed: bool = False
 
     @property
@@ -44,6 +49,7 @@ class ResultItem:
             "docx-images": "DOCX assets",
             "pdf-images": "PDF assets",
             "pdf-inspector": "Fast PDF",
+            "pdf-hybrid": "Hybrid PDF",
         }
         return labels.get(self.outcome.backend, self.outcome.backend or "Native")
 
@@ -60,12 +66,25 @@ class ResultItem:
             "docx-images": "conversion_backend_docx_images",
             "pdf-images": "conversion_backend_pdf_images",
             "pdf-inspector": "conversion_backend_pdf_inspector",
+            "pdf-hybrid": "conversion_backend_pdf_hybrid",
         }
         return keys.get(self.outcome.backend, "")
 
+    @cached_property
+    def stats(self) -> DocumentStats:
+        # Views ask for counts on every repaint; tokenise each outcome once.
+        return compute_document_stats(self.outcome.markdown)
+
     @property
     def word_count(self) -> int:
-        return len(self.outcome.markdown.split())
+        return self.stats.words
+
+    @cached_property
+    def markdown_digest(self) -> str:
+        return hashlib.blake2b(
+            self.outcome.markdown.encode("utf-8"),
+            digest_size=16,
+        ).hexdigest()
 
 
 class QueueModel(QAbstractListModel):
@@ -144,10 +163,24 @@ class ResultModel(QAbstractListModel):
     FailedRole = SourceRole + 3
     WordCountRole = SourceRole + 4
     BackendKeyRole = SourceRole + 5
-
-    def __init__(self) -> None:
+    CharacterCountRole = SourceRole + 6
+    LineCountRole = SourceRole + 7
+    HeadingCountRole = SourceRole + 8
+    TableCountRole = SourceRole + 9
+    ImageCountRole = SourceRole + 10
+    PageCountRole = SourceRole + 11
+
+    def __init__(self, store: ResultStore | None = None) -> None:
         super().__init__()
+        # Markdown bodies live in the store so large batches can spill to disk.
+        self.store = store or ResultStore()
         self._items: list[ResultItem] = []
+        # Row of each source, plus aggregates kept in step with _items so
+        # controller properties never scan the whole result list.
+        self._rows: dict[str, int] = {}
+        self._failed_count = 0
+        self._totals = DocumentStats()
+        self._unsaved: set[str] = set()
 
     def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
         if parent.isValid():
@@ -171,6 +204,18 @@ class ResultModel(QAbstractListModel):
             return item.failed
         if role == self.WordCountRole:
             return item.word_count
+        if role == self.CharacterCountRole:
+            return item.stats.characters
+        if role == self.LineCountRole:
+            return item.stats.lines
+        if role == self.HeadingCountRole:
+            return item.stats.headings
+        if role == self.TableCountRole:
+            return item.stats.tables
+        if role == self.ImageCountRole:
+            return item.stats.images
+        if role == self.PageCountRole:
+            return item.stats.pages
         return None
 
     def roleNames(self) -> dict[int, bytes]:
@@ -181,6 +226,12 @@ class ResultModel(QAbstractListModel):
             self.FailedRole: b"failed",
             self.WordCountRole: b"wordCount",
             self.BackendKeyRole: b"backendKey",
+            self.CharacterCountRole: b"characterCount",
+            self.LineCountRole: b"lineCount",
+            self.HeadingCountRole: b"headingCount",
+            self.TableCountRole: b"tableCount",
+            self.ImageCountRole: b"imageCount",
+            self.PageCountRole: b"pageCount",
         }
 
     def set_results(
@@ -190,10 +241,13 @@ class ResultModel(QAbstractListModel):
     ) -> None:
         failed_sources = failed_sources or set()
         self.beginResetModel()
+        self.store.clear()
         self._items = [
-            ResultItem(source, outcome, source in failed_sources)
+            ResultItem(source, self.store.stash(outcome), source in failed_sources)
             for source, outcome in results.items()
         ]
+        self._unsaved.clear()
+        self._reindex()
         self.endResetModel()
 
     def add_result(
@@ -202,38 +256,81 @@ class ResultModel(QAbstractListModel):
         outcome: ConversionOutcome,
         *,
         failed: bool = False,
+        unsaved: bool = False,
     ) -> None:
         """Append or replace one completed conversion without resetting the model."""
-        item = ResultItem(source, outcome, failed)
-        for row, existing in enumerate(self._items):
-            if existing.source != source:
-                continue
-            self._items[row] = item
-            model_index = self.index(row, 0)
-            self.dataChanged.emit(model_index, model_index)
+        self.add_results([(source, outcome, failed)], unsaved=unsaved)
+
+    def add_results(
+        self,
+        entries: Iterable[tuple[str, ConversionOutcome, bool]],
+        *,
+        unsaved: bool = False,
+    ) -> None:
+        """Apply a burst of ``(source, outcome, failed)`` completions.
+
+        Known sources are replaced in place; new sources are appended with a
+        single row insertion so views relayout once per burst.
+        """
+        new_items: list[ResultItem] = []
+        new_rows: dict[str, int] = {}
+        changed_rows: list[int] = []
+        for source, outcome, failed in entries:
+            item = ResultItem(source, self.store.stash(outcome), failed)
+            row = self._rows.get(source)
+            if row is not None:
+                self._forget(self._items[row])
+                self._discard_body(self._items[row])
+                self._items[row] = item
+                self._account(item, unsaved)
+                changed_rows.append(row)
+            elif source in new_rows:
+                self._discard_body(new_items[new_rows[source]])
+                new_items[new_rows[source]] = item
+            else:
+                new_rows[source] = len(new_items)
+                new_items.append(item)
+
+        if changed_rows:
+            self.dataChanged.emit(
+                self.index(min(changed_rows), 0),
+                self.index(max(changed_rows), 0),
+            )
+        if not new_items:
             return
 
-        row = len(self._items)
-        self.beginInsertRows(QModelIndex(), row, row)
-        self._items.append(item)
+        start = len(self._items)
+        self.beginInsertRows(QModelIndex(), start, start + len(new_items) - 1)
+        for row, item in enumerate(new_items, start):
+            self._items.append(item)
+            self._rows[item.source] = row
+            self._account(item, unsaved)
         self.endInsertRows()
 
     def remove_sources(self, sources: set[str]) -> None:
         """Remove completed entries that are about to be retried."""
-        if not sources:
-            return
-        remaining = [item for item in self._items if item.source not in sources]
-        if len(remaining) == len(self._items):
+        if not sources or not any(source in self._rows for source in sources):
             return
         self.beginResetModel()
+        remaining: list[ResultItem] = []
+        for item in self._items:
+            if item.source in sources:
+                self._discard_body(item)
+            else:
+                remaining.append(item)
         self._items = remaining
+        self._unsaved.difference_update(sources)
+        self._reindex()
         self.endResetModel()
 
     def clear(self) -> None:
+        self._unsaved.clear()
+        self.store.clear()
         if not self._items:
             return
         self.beginResetModel()
         self._items.clear()
+        self._reindex()
         self.endResetModel()
 
     def item_at(self, row: int) -> ResultItem | None:
@@ -243,3 +340,76 @@ class ResultModel(QAbstractListModel):
 
     def items(self) -> list[ResultItem]:
         return list(self._items)
+
+    def row_for_source(self, source: str) -> int:
+        return self._rows.get(source, -1)
+
+    @property
+    def successful_count(self) -> int:
+        return len(self._items) - self._failed_count
+
+    @property
+    def failed_count(self) -> int:
+        return self._failed_count
+
+    @property
+    def unsaved_count(self) -> int:
+        return len(self._unsaved)
+
+    @property
+    def total_words(self) -> int:
+        return self._totals.words
+
+    @property
+    def totals(self) -> DocumentStats:
+        """Document statistics summed over successful results."""
+        return self._totals
+
+    def successful_items(self) -> list[ResultItem]:
+        if not self._failed_count:
+            return list(self._items)
+        return [item for item in self._items if not item.failed]
+
+    def failed_items(self) -> list[ResultItem]:
+        if not self._failed_count:
+            return []
+        return [item for item in self._items if item.failed]
+
+    def first_successful_item(self) -> ResultItem | None:
+        return next((item for item in self._items if not item.failed), None)
+
+    def mark_saved(self, sources: Iterable[str]) -> bool:
+        """Forget unsaved state for ``sources``; return whether anything changed."""
+        before = len(self._unsaved)
+        self._unsaved.difference_update(sources)
+        return len(self._unsaved) != before
+
+    def _account(self, item: ResultItem, unsaved: bool) -> None:
+        if item.failed:
+            self._failed_count += 1
+            self._unsaved.discard(item.source)
+            return
+        self._totals += item.stats
+        if unsaved:
+            self._unsaved.add(item.source)
+
+    def _forget(self, item: ResultItem) -> None:
+        if item.failed:
+            self._failed_count -= 1
+        else:
+            self._totals -= item.stats
+
+    def _discard_body(self, item: ResultItem) -> None:
+        if isinstance(item.outcome, StoredOutcome) and item.outcome.store is self.store:
+            self.store.discard(item.outcome.key)
+
+    def _reindex(self) -> None:
+        self._rows = {item.source: row for row, item in enumerate(self._items)}
+        self._failed_count = sum(1 for item in self._items if item.failed)
+        self._totals = sum(
+            (item.stats for item in self._items if not item.failed),
+            DocumentStats(),
+        )
+        self._unsaved.intersection_update(
+            item.source for item in self._items if not item.failed
+        )
@@ -0,0 +1,346 @@
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections import OrderedDict
+import re
+from typing import Hashable, Sequence
+
+from PySide6.QtCore import QAbstractListModel, QModelIndex, QObject, QThread, Qt, Signal
+from PySide6.QtGui import QTextDocument
+
+from markitdowngui.core.markdown_assets import AssetLike, rewrite_markdown_for_preview
+
+
+# Documents up to this size render inline: it takes a few milliseconds and
+# avoids flashing a placeholder for typical results.
+PREVIEW_INLINE_RENDER_MAX_CHARS = 64 * 1024
+DEFAULT_PREVIEW_CACHE_MAX_CHARS = 32 * 1024 * 1024
+# Larger documents are shown as a list of chunks so only the visible window
+# is laid out instead of one text item holding the whole output.
+PREVIEW_CHUNKED_MIN_CHARS = 512 * 1024
+PREVIEW_CHUNK_CHARS = 16 * 1024
+
+_PREVIEW_HEADING_RE = re.compile(r'<h([1-3]) style="([^"]*)"><span style="([^"]*)">')
+_PREVIEW_HEADING_MARGINS = {
+    "1": "10px",
+    "2": "8px",
+    "3": "6px",
+}
+_CODE_FENCE_RE = re.compile(r"^ {0,3}(?:`{3,}|~{3,})", re.MULTILINE)
+
+
+def render_preview_html(
+    markdown: str,
+    assets: Sequence[AssetLike],
+    css: str,
+) -> str:
+    """Render Markdown to the rich-text HTML shown in the preview pane."""
+    doc = QTextDocument()
+    doc.setMarkdown(rewrite_markdown_for_preview(markdown, assets))
+    html = compact_preview_html(doc.toHtml())
+    return f"<style>{css}</style>{html}"
+
+
+def compact_preview_html(html: str) -> str:
+    # Qt RichText applies built-in heading scale even when the span font is restyled.
+    html = (
+        html.replace("font-size:xx-large;", "font-size:18px;")
+        .replace("font-size:x-large;", "font-size:15px;")
+        .replace("font-size:large;", "font-size:14px;")
+    )
+    html = _PREVIEW_HEADING_RE.sub(_preview_heading_to_paragraph, html)
+    return (
+        html.replace("</h1>", "</p>")
+        .replace("</h2>", "</p>")
+        .replace("</h3>", "</p>")
+    )
+
+
+def _preview_heading_to_paragraph(match: re.Match[str]) -> str:
+    level, style, span_style = match.groups()
+    margin = _PREVIEW_HEADING_MARGINS[level]
+    style = style.replace("margin-bottom:0px;", f"margin-bottom:{margin};")
+    return f'<p style="{style}"><span style="{span_style}">'
+
+
+def split_markdown_chunks(
+    markdown: str,
+    chunk_chars: int = PREVIEW_CHUNK_CHARS,
+) -> list[tuple[int, int]]:
+    """Return ``(start, end)`` offsets cutting ``markdown`` into preview chunks.
+
+    Chunks end at a blank line after ``chunk_chars`` where possible, else at
+    a line break, and never inside a fenced code block, so each chunk renders
+    on its own.
+    """
+    chunk_chars = max(1, int(chunk_chars))
+    fences = [match.start() for match in _CODE_FENCE_RE.finditer(markdown)]
+    chunks: list[tuple[int, int]] = []
+    start = 0
+    length = len(markdown)
+    while start < length:
+        end = _chunk_end(markdown, start + chunk_chars, chunk_chars)
+        # An odd number of fence lines before the cut means it is inside a block.
+        open_fences = bisect_left(fences, end)
+        if open_fences % 2 and open_fences < len(fences):
+            closing = markdown.find("\n", fences[open_fences])
+            end = length if closing < 0 else closing + 1
+        chunks.append((start, end))
+        start = end
+    return chunks
+
+
+def _chunk_end(markdown: str, target: int, chunk_chars: int) -> int:
+    if target >= len(markdown):
+        return len(markdown)
+    for separator in ("\n\n", "\n"):
+        boundary = markdown.find(separator, target, target + chunk_chars)
+        if boundary >= 0:
+            return boundary + len(separator)
+    return target
+
+
+class PreviewRenderJob(QThread):
+    rendered = Signal(object, str)
+
+    def __init__(
+        self,
+        key: Hashable,
+        markdown: str,
+        assets: Sequence[AssetLike],
+        css: str,
+        parent: QObject | None = None,
+    ) -> None:
+        super().__init__(parent)
+        self.key = key
+        self.markdown = markdown
+        self.assets = list(assets)
+        self.css = css
+
+    def run(self) -> None:
+        self.rendered.emit(self.key, render_preview_html(self.markdown, self.assets, self.css))
+
+
+class PreviewRenderer(QObject):
+    """Render previews off the GUI thread and keep recent ones in an LRU cache.
+
+    ``html_for`` returns cached HTML at once, renders small documents inline
+    and otherwise queues a background job and returns ``None``;
+    ``previewReady`` fires with the key once that job's HTML is cached.
+
+    One job runs at a time. A request made while it runs replaces any older
+    queued one, so flicking through results renders the running document and
+    the latest selection, not everything scrolled past.
+    """
+
+    previewReady = Signal(object)
+
+    def __init__(
+        self,
+        parent: QObject | None = None,
+        *,
+        max_chars: int = DEFAULT_PREVIEW_CACHE_MAX_CHARS,
+        inline_max_chars: int = PREVIEW_INLINE_RENDER_MAX_CHARS,
+    ) -> None:
+        super().__init__(parent)
+        self.max_chars = max(0, int(max_chars))
+        self.inline_max_chars = max(0, int(inline_max_chars))
+        self._cache: OrderedDict[Hashable, str] = OrderedDict()
+        self._cached_chars = 0
+        self._job: PreviewRenderJob | None = None
+        self._pending: tuple[Hashable, str, Sequence[AssetLike], str] | None = None
+
+    def html_for(
+        self,
+        key: Hashable,
+        markdown: str,
+        assets: Sequence[AssetLike],
+        css: str,
+    ) -> str | None:
+        html = self._cache.get(key)
+        if html is not None:
+            self._cache.move_to_end(key)
+            return html
+        if len(markdown) <= self.inline_max_chars:
+            html = render_preview_html(markdown, assets, css)
+            self._store(key, html)
+            return html
+        if self.is_rendering(key):
+            return None
+        if self._job is None:
+            self._start_job(key, markdown, assets, css)
+        else:
+            self._pending = (key, markdown, assets, css)
+        return None
+
+    def is_rendering(self, key: Hashable) -> bool:
+        """Return whether ``key`` is being rendered or queued to render next."""
+        if self._job is not None and self._job.key == key:
+            return True
+        return self._pending is not None and self._pending[0] == key
+
+    def clear(self) -> None:
+        self._cache.clear()
+        self._cached_chars = 0
+
+    def shutdown(self) -> None:
+        """Drop the queued request and wait for the running job to finish."""
+        self._pending = None
+        if self._job is not None:
+            self._job.wait()
+
+    def _handle_rendered(self, key: Hashable, html: str) -> None:
+        self._store(key, html)
+        self.previewReady.emit(key)
+
+    def _start_job(
+        self,
+        key: Hashable,
+        markdown: str,
+        assets: Sequence[AssetLike],
+        css: str,
+    ) -> None:
+        job = PreviewRenderJob(key, markdown, assets, css, self)
+        job.rendered.connect(self._handle_rendered)
+        job.finished.connect(lambda job=job: self._forget_job(job))
+        self._job = job
+        job.start()
+
+    def _forget_job(self, job: PreviewRenderJob) -> None:
+        if job is self._job:
+            self._job = None
+        job.deleteLater()
+        if self._job is None and self._pending is not None:
+            key, markdown, assets, css = self._pending
+            self._pending = None
+            if key not in self._cache:
+                self._start_job(key, markdown, assets, css)
+
+    def _store(self, key: Hashable, html: str) -> None:
+        previous = self._cache.pop(key, None)
+        if previous is not None:
+            self._cached_chars -= len(previous)
+        self._cache[key] = html
+        self._cached_chars += len(html)
+        # Always keep the newest entry, even when it alone exceeds the budget.
+        while self._cached_chars > self.max_chars and len(self._cache) > 1:
+            _key, evicted = self._cache.popitem(last=False)
+            self._cached_chars -= len(evicted)
+
+
+class PreviewChunkModel(QAbstractListModel):
+    """List model exposing one large result as preview chunks.
+
+    Views built on it only create delegates for the visible rows plus their
+    cache buffer, and rendered HTML is produced per chunk on demand through
+    the shared ``PreviewRenderer`` cache.
+    """
+
+    MarkdownRole = Qt.ItemDataRole.UserRole + 1
+    HtmlRole = MarkdownRole + 1
+
+    def __init__(self, renderer: PreviewRenderer, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._renderer = renderer
+        self._renderer.previewReady.connect(self._handle_preview_ready)
+        self._document_key: Hashable = None
+        self._markdown = ""
+        self._assets: list[AssetLike] = []
+        self._css = ""
+        self._chunks: list[tuple[int, int]] = []
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._chunks)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self._chunks):
+            return None
+        if role in {Qt.ItemDataRole.DisplayRole, self.MarkdownRole}:
+            return self.chunk_text(index.row())
+        if role == self.HtmlRole:
+            return self._renderer.html_for(
+                self._chunk_key(index.row()),
+                self.chunk_text(index.row()),
+                self._assets,
+                self._css,
+            ) or ""
+        return None
+
+    def roleNames(self) -> dict[int, bytes]:
+        return {
+            self.MarkdownRole: b"markdown",
+            self.HtmlRole: b"html",
+        }
+
+    def set_document(
+        self,
+        document_key: Hashable,
+        markdown: str,
+        assets: Sequence[AssetLike],
+        css: str,
+        *,
+        chunk_chars: int = PREVIEW_CHUNK_CHARS,
+    ) -> None:
+        if document_key == self._document_key:
+            if css != self._css:
+                self._css = css
+                if self._chunks:
+                    self.dataChanged.emit(
+                        self.index(0, 0),
+                        self.index(len(self._chunks) - 1, 0),
+                        [self.HtmlRole],
+                    )
+            return
+        self.beginResetModel()
+        self._document_key = document_key
+        self._markdown = markdown
+        self._assets = list(assets)
+        self._css = css
+        self._chunks = split_markdown_chunks(markdown, chunk_chars)
+        self.endResetModel()
+
+    def clear(self) -> None:
+        if self._document_key is None:
+            return
+        self.beginResetModel()
+        self._document_key = None
+        self._markdown = ""
+        self._assets = []
+        self._chunks = []
+        self.endResetModel()
+
+    def _chunk_key(self, row: int) -> tuple[Hashable, str, int]:
+        return (self._document_key, self._css, row)
+
+    def _handle_preview_ready(self, key: Hashable) -> None:
+        # Chunks that were too large to render inline arrive later.
+        if not isinstance(key, tuple) or len(key) != 3:
+            return
+        document_key, css, row = key
+        if document_key != self._document_key or css != self._css:
+            return
+        if 0 <= row < len(self._chunks):
+            model_index = self.index(row, 0)
+            self.dataChanged.emit(model_index, model_index, [self.HtmlRole])
+
+    def chunk_text(self, row: int) -> str:
+        start, end = self._chunks[row]
+        return self._markdown[start:end]
+
+    def find(self, query: str, start_row: int = 0) -> int:
+        """Return the first chunk at or after ``start_row`` containing ``query``.
+
+        The search is case-insensitive and wraps around; -1 means no match.
+        """
+        needle = query.casefold()
+        if not needle or not self._chunks:
+            return -1
+        count = len(self._chunks)
+        start_row = start_row % count
+        for offset in range(count):
+            row = (start_row + offset) % count
+            if needle in self.chunk_text(row).casefold():
+                return row
+        return -1
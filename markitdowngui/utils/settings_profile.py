@@ -35,10 +35,18 @@ def build_settings_profile(
                 "defaultFormat": settings.get_default_output_format(),
                 "saveToSourceFolder": settings.get_save_to_source_folder(),
                 "combinedSaveMode": settings.get_save_mode(),
+                "groupedSaveDurability": settings.get_grouped_save_durability(),
             },
             "conversion": {
                 "batchSize": settings.get_batch_size(),
+                "processPoolConversion": settings.get_process_pool_conversion(),
+                "httpPoolSize": settings.get_http_pool_size(),
+                "httpMaxRetries": settings.get_http_max_retries(),
+                "cacheEnabled": settings.get_conversion_cache_enabled(),
+                "cacheMaxMb": settings.get_conversion_cache_max_mb(),
+                "resultMemoryBudgetMb": settings.get_result_memory_budget_mb(),
                 "fastPdfConversion": settings.get_fast_pdf_conversion(),
+                "hybridPdfOcr": settings.get_hybrid_pdf_ocr(),
                 "anydocEnabled": settings.get_anydoc_enabled(),
                 "preservePdfImages": settings.get_preserve_pdf_images(),
                 "preserveDocxImages": settings.get_preserve_docx_images(),
@@ -51,13 +59,25 @@ def build_settings_profile(
                 "glmocrOllamaHost": settings.get_glmocr_ollama_host(),
                 "glmocrOllamaPort": settings.get_glmocr_ollama_port(),
                 "glmocrOllamaModel": settings.get_glmocr_ollama_model(),
+                "glmocrOllamaConcurrency": settings.get_glmocr_ollama_concurrency(),
+                "glmocrOllamaImageFormat": settings.get_glmocr_ollama_image_format(),
+                "glmocrOllamaImageQuality": settings.get_glmocr_ollama_image_quality(),
+                "glmocrOllamaImageMaxEdge": settings.get_glmocr_ollama_image_max_edge(),
                 "glmocrSdkServerUrl": settings.get_glmocr_sdk_server_url(),
                 "httpEndpoint": settings.get_http_ocr_endpoint(),
                 "httpModel": settings.get_http_ocr_model(),
                 "httpApiKeyEnv": settings.get_http_ocr_api_key_env(),
                 "httpTimeoutSeconds": settings.get_http_ocr_timeout_seconds(),
+                "httpChunkPages": settings.get_http_ocr_chunk_pages(),
+                "httpChunkWorkers": settings.get_http_ocr_chunk_workers(),
                 "docintelEndpoint": settings.get_docintel_endpoint(),
                 "ocrLanguages": settings.get_ocr_languages(),
+                "ocrPageWorkers": settings.get_ocr_page_workers(),
+                "ocrRenderAhead": settings.get_ocr_render_ahead(),
+                "ocrRenderMaxMegapixels": settings.get_ocr_render_max_megapixels(),
+                "ocrRenderColor": settings.get_ocr_render_color(),
+                "ocrPageCacheEnabled": settings.get_ocr_page_cache_enabled(),
+                "tesseractEngineReuse": settings.get_tesseract_engine_reuse(),
             },
             "updates": {
                 "notificationsEnabled": settings.get_update_notifications_enabled(),
@@ -115,11 +135,31 @@ def apply_settings_profile(settings: SettingsManager, payload: dict[str, Any]) -
         settings.set_save_to_source_folder(_bool_value(output["saveToSourceFolder"]))
     if "combinedSaveMode" in output:
         settings.set_save_mode(_bool_value(output["combinedSaveMode"]))
+    if "groupedSaveDurability" in output:
+        settings.set_grouped_save_durability(_bool_value(output["groupedSaveDurability"]))
 
     if "batchSize" in conversion:
         settings.set_batch_size(_int_value(conversion["batchSize"]))
+    if "processPoolConversion" in conversion:
+        settings.set_process_pool_conversion(
+            _bool_value(conversion["processPoolConversion"])
+        )
+    if "httpPoolSize" in conversion:
+        settings.set_http_pool_size(_int_value(conversion["httpPoolSize"]))
+    if "httpMaxRetries" in conversion:
+        settings.set_http_max_retries(_int_value(conversion["httpMaxRetries"]))
+    if "cacheEnabled" in conversion:
+        settings.set_conversion_cache_enabled(_bool_value(conversion["cacheEnabled"]))
+    if "cacheMaxMb" in conversion:
+        settings.set_conversion_cache_max_mb(_int_value(conversion["cacheMaxMb"]))
+    if "resultMemoryBudgetMb" in conversion:
+        settings.set_result_memory_budget_mb(
+            _int_value(conversion["resultMemoryBudgetMb"])
+        )
     if "fastPdfConversion" in conversion:
         settings.set_fast_pdf_conversion(_bool_value(conversion["fastPdfConversion"]))
+    if "hybridPdfOcr" in conversion:
+        settings.set_hybrid_pdf_ocr(_bool_value(conversion["hybridPdfOcr"]))
     if "anydocEnabled" in conversion:
         settings.set_anydoc_enabled(_bool_value(conversion["anydocEnabled"]))
     if "preservePdfImages" in conversion:
@@ -141,6 +181,14 @@ def apply_settings_profile(settings: SettingsManager, payload: dict[str, Any]) -
         settings.set_glmocr_ollama_port(_int_value(ocr["glmocrOllamaPort"]))
     if "glmocrOllamaModel" in ocr:
         settings.set_glmocr_ollama_model(str(ocr["glmocrOllamaModel"]))
+    if "glmocrOllamaConcurrency" in ocr:
+        settings.set_glmocr_ollama_concurrency(_int_value(ocr["glmocrOllamaConcurrency"]))
+    if "glmocrOllamaImageFormat" in ocr:
+        settings.set_glmocr_ollama_image_format(str(ocr["glmocrOllamaImageFormat"]))
+    if "glmocrOllamaImageQuality" in ocr:
+        settings.set_glmocr_ollama_image_quality(_int_value(ocr["glmocrOllamaImageQuality"]))
+    if "glmocrOllamaImageMaxEdge" in ocr:
+        settings.set_glmocr_ollama_image_max_edge(_int_value(ocr["glmocrOllamaImageMaxEdge"]))
     if "glmocrSdkServerUrl" in ocr:
         settings.set_glmocr_sdk_server_url(str(ocr["glmocrSdkServerUrl"]))
     if "httpEndpoint" in ocr:
@@ -151,10 +199,26 @@ def apply_settings_profile(settings: SettingsManager, payload: dict[str, Any]) -
         settings.set_http_ocr_api_key_env(str(ocr["httpApiKeyEnv"]))
     if "httpTimeoutSeconds" in ocr:
         settings.set_http_ocr_timeout_seconds(_int_value(ocr["httpTimeoutSeconds"]))
+    if "httpChunkPages" in ocr:
+        settings.set_http_ocr_chunk_pages(_int_value(ocr["httpChunkPages"]))
+    if "httpChunkWorkers" in ocr:
+        settings.set_http_ocr_chunk_workers(_int_value(ocr["httpChunkWorkers"]))
     if "docintelEndpoint" in ocr:
         settings.set_docintel_endpoint(str(ocr["docintelEndpoint"]))
     if "ocrLanguages" in ocr:
         settings.set_ocr_languages(str(ocr["ocrLanguages"]))
+    if "ocrPageWorkers" in ocr:
+        settings.set_ocr_page_workers(_int_value(ocr["ocrPageWorkers"]))
+    if "ocrRenderAhead" in ocr:
+        settings.set_ocr_render_ahead(_int_value(ocr["ocrRenderAhead"]))
+    if "ocrRenderMaxMegapixels" in ocr:
+        settings.set_ocr_render_max_megapixels(_int_value(ocr["ocrRenderMaxMegapixels"]))
+    if "ocrRenderColor" in ocr:
+        settings.set_ocr_render_color(str(ocr["ocrRenderColor"]))
+    if "ocrPageCacheEnabled" in ocr:
+        settings.set_ocr_page_cache_enabled(_bool_value(ocr["ocrPageCacheEnabled"]))
+    if "tesseractEngineReuse" in ocr:
+        settings.set_tesseract_engine_reuse(_bool_value(ocr["tesseractEngineReuse"]))
 
     if "notificationsEnabled" in updates:
         settings.set_update_notifications_enabled(_bool_value(updates["notificationsEnabled"]))
@@ -81,12 +81,20 @@ def build_sanitized_settings_snapshot(settings: SettingsManager) -> dict[str, An
             "defaultOutputFolderConfigured": bool(settings.get_default_output_folder()),
             "saveToSourceFolder": settings.get_save_to_source_folder(),
             "combinedSaveMode": settings.get_save_mode(),
+            "groupedSaveDurability": settings.get_grouped_save_durability(),
             "recentFilesCount": len(settings.get_recent_files()),
             "recentOutputsCount": len(settings.get_recent_outputs()),
         },
         "conversion": {
             "batchSize": settings.get_batch_size(),
+            "processPoolConversion": settings.get_process_pool_conversion(),
+            "httpPoolSize": settings.get_http_pool_size(),
+            "httpMaxRetries": settings.get_http_max_retries(),
+            "cacheEnabled": settings.get_conversion_cache_enabled(),
+            "cacheMaxMb": settings.get_conversion_cache_max_mb(),
+            "resultMemoryBudgetMb": settings.get_result_memory_budget_mb(),
             "fastPdfConversion": settings.get_fast_pdf_conversion(),
+            "hybridPdfOcr": settings.get_hybrid_pdf_ocr(),
             "preservePdfImages": settings.get_preserve_pdf_images(),
             "preserveDocxImages": settings.get_preserve_docx_images(),
         },
@@ -98,13 +106,25 @@ def build_sanitized_settings_snapshot(settings: SettingsManager) -> dict[str, An
             "glmocrOllamaHostConfigured": bool(settings.get_glmocr_ollama_host()),
             "glmocrOllamaPort": settings.get_glmocr_ollama_port(),
             "glmocrOllamaModelConfigured": bool(settings.get_glmocr_ollama_model()),
+            "glmocrOllamaConcurrency": settings.get_glmocr_ollama_concurrency(),
+            "glmocrOllamaImageFormat": settings.get_glmocr_ollama_image_format(),
+            "glmocrOllamaImageQuality": settings.get_glmocr_ollama_image_quality(),
+            "glmocrOllamaImageMaxEdge": settings.get_glmocr_ollama_image_max_edge(),
             "glmocrSdkServerUrlConfigured": bool(settings.get_glmocr_sdk_server_url()),
             "httpEndpointConfigured": bool(settings.get_http_ocr_endpoint()),
             "httpModelConfigured": bool(settings.get_http_ocr_model()),
             "httpApiKeyEnv": settings.get_http_ocr_api_key_env(),
             "httpTimeoutSeconds": settings.get_http_ocr_timeout_seconds(),
+            "httpChunkPages": settings.get_http_ocr_chunk_pages(),
+            "httpChunkWorkers": settings.get_http_ocr_chunk_workers(),
             "docintelEndpointConfigured": bool(settings.get_docintel_endpoint()),
             "ocrLanguagesConfigured": bool(settings.get_ocr_languages()),
+            "ocrPageWorkers": settings.get_ocr_page_workers(),
+            "ocrRenderAhead": settings.get_ocr_render_ahead(),
+            "ocrRenderMaxMegapixels": settings.get_ocr_render_max_megapixels(),
+            "ocrRenderColor": settings.get_ocr_render_color(),
+            "ocrPageCacheEnabled": settings.get_ocr_page_cache_enabled(),
+            "tesseractEngineReuse": settings.get_tesseract_engine_reuse(),
             "tesseractPathConfigured": bool(tesseract_path),
             "tesseractPathExists": bool(tesseract_path and Path(tesseract_path).exists()),
         },
@@ -17,6 +17,8 @@ TRANSLATIONS = {
         "settings_output_folder_dialog": "Select Default Output Folder",
         "settings_save_to_source_folder_label": "Save file outputs to source folder",
         "settings_save_to_source_folder_tooltip": "Use each source file's folder and filename stem as the default Markdown save target.",
+        "settings_grouped_save_durability_label": "Sync saved files in groups",
+        "settings_grouped_save_durability_detail": "When saving separate files, flush them to disk together and sync each folder once. Faster on network drives; files still only replace earlier ones once complete.",
         "browse_button_compact": "Browse...",
         "theme_light": "Light",
         "theme_dark": "Dark",
@@ -83,6 +85,8 @@ TRANSLATIONS = {
         "home_save_mode_separate": "Separate files",
         "home_fast_pdf_conversion_label": "Fast PDF conversion",
         "home_fast_pdf_conversion_detail": "Use the fast local parser for clear digital PDFs. Mixed, scanned, or uncertain PDFs keep the existing conversion path.",
+        "home_hybrid_pdf_ocr_label": "OCR scanned pages only",
+        "home_hybrid_pdf_ocr_detail": "For PDFs that mix digital and scanned pages, keep the native text and run OCR only on pages without a text layer.",
         "home_anydoc_conversion_label": "Use anydoc for this conversion",
         "home_anydoc_conversion_detail": "Use Firecrawl's fast local Markdown engine for supported documents. If anydoc cannot convert a file, the existing converter is used.",
         "home_preserve_pdf_images_label": "Preserve PDF images",
@@ -195,6 +199,7 @@ TRANSLATIONS = {
         "conversion_backend_docx_images": "DOCX images",
         "conversion_backend_pdf_images": "PDF images",
         "conversion_backend_pdf_inspector": "Fast PDF",
+        "conversion_backend_pdf_hybrid": "Hybrid PDF",
         "conversion_source_heading": "Source: {source}",
         "conversion_error_title": "Error",
         "save_combined_title": "Save Combined Markdown Output",
@@ -292,6 +297,8 @@ TRANSLATIONS = {
         "settings_output_folder_dialog": "选择默认输出文件夹",
         "settings_save_to_source_folder_label": "将文件输出保存到源文件夹",
         "settings_save_to_source_folder_tooltip": "默认使用每个源文件的文件夹和文件名作为 Markdown 保存目标。",
+        "settings_grouped_save_durability_label": "分组同步保存的文件",
+        "settings_grouped_save_durability_detail": "分别保存文件时，将它们一起写入磁盘，并且每个文件夹只同步一次。在网络驱动器上更快；文件仍然只会在完整写入后替换旧文件。",
         "browse_button_compact": "浏览...",
         "theme_light": "浅色",
         "theme_dark": "深色",
@@ -358,6 +365,8 @@ TRANSLATIONS = {
         "home_save_mode_separate": "分别保存",
         "home_fast_pdf_conversion_label": "快速 PDF 转换",
         "home_fast_pdf_conversion_detail": "对清晰的数字 PDF 使用快速本地解析器。混合、扫描或不确定的 PDF 会继续使用现有转换流程。",
+        "home_hybrid_pdf_ocr_label": "仅对扫描页执行 OCR",
+        "home_hybrid_pdf_ocr_detail": "对于混合数字页和扫描页的 PDF，保留原生文本，仅对没有文本层的页面执行 OCR。",
         "home_anydoc_conversion_label": "在此次转换中使用 anydoc",
         "home_anydoc_conversion_detail": "对支持的文档使用 Firecrawl 的快速本地 Markdown 引擎。如果 anydoc 无法转换文件，则使用现有转换器。",
         "home_preserve_pdf_images_label": "保留 PDF 图片",
@@ -470,6 +479,7 @@ TRANSLATIONS = {
         "conversion_backend_docx_images": "DOCX 图片",
         "conversion_backend_pdf_images": "PDF 图片",
         "conversion_backend_pdf_inspector": "快速 PDF",
+        "conversion_backend_pdf_hybrid": "混合 PDF",
         "conversion_source_heading": "来源: {source}",
         "conversion_error_title": "错误",
         "save_combined_title": "保存合并的 Markdown 输出",
@@ -559,6 +569,8 @@ TRANSLATIONS = {
         "settings_output_folder_dialog": "選擇預設輸出資料夾",
         "settings_save_to_source_folder_label": "將輸出檔案儲存到來源資料夾",
         "settings_save_to_source_folder_tooltip": "以每個來源檔案的資料夾和檔名作為預設 Markdown 儲存目標。",
+        "settings_grouped_save_durability_label": "分組同步儲存的檔案",
+        "settings_grouped_save_durability_detail": "分別儲存檔案時，將它們一起寫入磁碟，且每個資料夾只同步一次。在網路磁碟機上更快；檔案仍只會在完整寫入後取代舊檔案。",
         "browse_button_compact": "瀏覽...",
         "theme_light": "淺色",
         "theme_dark": "深色",
@@ -625,6 +637,8 @@ TRANSLATIONS = {
         "home_save_mode_separate": "分別儲存",
         "home_fast_pdf_conversion_label": "快速 PDF 轉換",
         "home_fast_pdf_conversion_detail": "對清晰的數位 PDF 使用快速本機解析器。混合、掃描或不確定的 PDF 會繼續使用既有轉換流程。",
+        "home_hybrid_pdf_ocr_label": "僅對掃描頁執行 OCR",
+        "home_hybrid_pdf_ocr_detail": "對於混合數位頁與掃描頁的 PDF，保留原生文字，僅對沒有文字層的頁面執行 OCR。",
         "home_anydoc_conversion_label": "在此次轉換中使用 anydoc",
         "home_anydoc_conversion_detail": "對支援的文件使用 Firecrawl 的快速本機 Markdown 引擎。如果 anydoc 無法轉換檔案，則使用既有轉換器。",
         "home_preserve_pdf_images_label": "保留 PDF 圖片",
@@ -737,6 +751,7 @@ TRANSLATIONS = {
         "conversion_backend_docx_images": "DOCX 圖片",
         "conversion_backend_pdf_images": "PDF 圖片",
         "conversion_backend_pdf_inspector": "快速 PDF",
+        "conversion_backend_pdf_hybrid": "混合 PDF",
         "conversion_source_heading": "來源：{source}",
         "conversion_error_title": "錯誤",
         "save_combined_title": "儲存合併的 Markdown 輸出",
@@ -846,6 +861,9 @@ _QML_TRANSLATIONS = {
         "qml_conversion_progress": "{completed} of {total} files",
         "qml_converted_files": "Converted files",
         "qml_converted_files_detail": "Select an item to inspect the generated Markdown.",
+        "qml_converted_files_totals": "{files} converted, {words} words in total.",
+        "qml_preview_rendering": "Rendering preview…",
+        "qml_preview_find": "Find in large output (Enter for next match)",
         "qml_converted_words_accessible": "{name}, converted, {count} words",
         "qml_converting": "Converting",
         "qml_copy_command": "Copy command",
@@ -897,6 +915,10 @@ _QML_TRANSLATIONS = {
         "qml_http_ocr_endpoint_detail": "POST endpoint. The app sends a `file` part plus optional `model`.",
         "qml_http_ocr_model": "HTTP OCR model",
         "qml_http_ocr_timeout": "HTTP OCR timeout in seconds",
+        "settings_http_ocr_chunk_pages_label": "Pages per PDF upload",
+        "settings_http_ocr_chunk_pages_detail": "Split larger PDFs into parts of this many pages, send them in parallel and retry only parts that fail. 0 sends each PDF whole.",
+        "settings_http_ocr_chunk_workers_label": "Parallel uploads",
+        "settings_http_ocr_chunk_workers_detail": "PDF parts sent at once.",
         "qml_import": "Import",
         "qml_import_settings_profile": "Import settings profile",
         "qml_input_conversion_failed": "This input could not be converted",
@@ -958,6 +980,7 @@ _QML_TRANSLATIONS = {
         "qml_run_source_update": "Run source update",
         "qml_save_as_one_file": "Save as one file",
         "qml_save_files": "Save files",
+        "qml_cancel_save": "Cancel save ({done}/{total})",
         "qml_selected": ", selected",
         "qml_seconds_detail": "Seconds.",
         "qml_separate_markdown_files": "Separate Markdown files",
@@ -1021,6 +1044,46 @@ _QML_TRANSLATIONS = {
         "settings_conversion_detail": "Choose the optional Markdown engine used for the next conversion.",
         "settings_anydoc_default_label": "Use anydoc by default",
         "settings_anydoc_default_detail": "Start conversions with anydoc enabled. This remains opt-in; unsupported files fall back to the existing converter.",
+        "settings_parallel_conversions_label": "Parallel conversions",
+        "settings_parallel_conversions_detail": "How many files convert at the same time. Lower this for slow OCR services or limited memory.",
+        "qml_parallel_conversions": "Parallel conversions",
+        "settings_process_pool_label": "Use separate processes",
+        "settings_process_pool_detail": "Run each parallel conversion in its own process so Office and PDF files use every CPU core. Uses more memory and starts slightly slower.",
+        "settings_result_memory_budget_label": "Results kept in memory (MB)",
+        "settings_result_memory_budget_detail": "Converted Markdown beyond this size is moved to a temporary folder and read back when you preview or save it.",
+        "settings_http_pool_size_label": "Connections per server",
+        "settings_http_pool_size_detail": "Kept-alive connections reused for each OCR or website service.",
+        "settings_http_max_retries_label": "Retries for busy servers",
+        "settings_http_max_retries_detail": "Retries after rate limits (429) or server errors (5xx), with increasing waits.",
+        "qml_tesseract_page_workers": "Parallel OCR pages",
+        "qml_tesseract_page_workers_detail": "Pages of a scanned PDF that Tesseract reads at the same time.",
+        "settings_tesseract_engine_reuse_label": "Keep Tesseract loaded",
+        "settings_tesseract_engine_reuse_detail": "Reuse loaded language models across pages and files when tesserocr is installed, instead of starting Tesseract for every page.",
+        "qml_ocr_render_ahead": "Pages rendered ahead",
+        "qml_ocr_render_ahead_detail": "How many scanned PDF pages are prepared while OCR is busy. Higher values keep OCR fed but use more memory; 0 renders one page at a time.",
+        "qml_ocr_render_max_megapixels": "Largest page render (MP)",
+        "qml_ocr_render_max_megapixels_detail": "Pages render at 216 DPI, or at their scan resolution when that is lower, but never above this many megapixels, so large-format pages do not exhaust memory.",
+        "qml_ocr_render_color": "Page render colours",
+        "qml_ocr_render_color_detail": "Grayscale and black and white renders use less memory and upload faster. Keep colour when it matters to the OCR model.",
+        "qml_ocr_render_color_rgb": "Colour",
+        "qml_ocr_render_color_grayscale": "Grayscale",
+        "qml_ocr_render_color_binary": "Black and white",
+        "settings_glmocr_ollama_concurrency_label": "Parallel page requests",
+        "settings_glmocr_ollama_concurrency_detail": "Pages sent to Ollama at once. Match OLLAMA_NUM_PARALLEL on the server; 1 sends pages one by one.",
+        "qml_glmocr_ollama_concurrency": "Parallel Ollama page requests",
+        "settings_glmocr_ollama_image_format_label": "Page upload format and quality",
+        "settings_glmocr_ollama_image_format_detail": "How page images are encoded for Ollama. Lower JPEG or WebP quality sends fewer bytes; PNG is lossless and often smallest for clean text pages.",
+        "qml_glmocr_ollama_image_format": "Ollama page image format",
+        "qml_glmocr_ollama_image_quality": "Ollama page image quality",
+        "settings_glmocr_ollama_image_max_edge_label": "Longest upload edge (px)",
+        "settings_glmocr_ollama_image_max_edge_detail": "Pages larger than this are scaled down before upload. 0 sends pages at their rendered size.",
+        "settings_conversion_cache_label": "Reuse cached results",
+        "settings_conversion_cache_detail": "Skip conversion for files whose contents and settings match an earlier run. Results are stored under ~/.markitdown.",
+        "settings_conversion_cache_size_label": "Cache size (MB)",
+        "qml_conversion_cache_size": "Conversion cache size in megabytes",
+        "qml_clear_conversion_cache": "Clear cache",
+        "settings_ocr_page_cache_label": "Resume OCR from finished pages",
+        "settings_ocr_page_cache_detail": "Keep the OCR text of each PDF page so retried or interrupted conversions only OCR the pages that did not finish.",
         "settings_appearance_detail": "Solarized Light for daytime work, Nord Dark for low-light sessions.",
         "settings_theme_label": "Theme",
         "settings_theme_detail": "Use explicit palettes or follow the operating system.",
@@ -1054,6 +1117,9 @@ _QML_TRANSLATIONS = {
         "qml_conversion_progress": "已完成 {completed}/{total} 个文件",
         "qml_converted_files": "已转换文件",
         "qml_converted_files_detail": "选择项目以查看生成的 Markdown。",
+        "qml_converted_files_totals": "已转换 {files} 个，共 {words} 个词。",
+        "qml_preview_rendering": "正在渲染预览…",
+        "qml_preview_find": "在大型输出中查找（按 Enter 查找下一个）",
         "qml_converted_words_accessible": "{name}，已转换，{count} 个词",
         "qml_converting": "转换中",
         "qml_copy_command": "复制命令",
@@ -1105,6 +1171,10 @@ _QML_TRANSLATIONS = {
         "qml_http_ocr_endpoint_detail": "POST 终结点。应用会发送 `file` 部分和可选的 `model`。",
         "qml_http_ocr_model": "HTTP OCR 模型",
         "qml_http_ocr_timeout": "HTTP OCR 超时秒数",
+        "settings_http_ocr_chunk_pages_label": "每次上传的 PDF 页数",
+        "settings_http_ocr_chunk_pages_detail": "将较大的 PDF 按此页数拆分，并行发送，只重试失败的部分。0 表示整份 PDF 一次发送。",
+        "settings_http_ocr_chunk_workers_label": "并行上传数",
+        "settings_http_ocr_chunk_workers_detail": "同时发送的 PDF 部分数。",
         "qml_import": "导入",
         "qml_import_settings_profile": "导入设置配置",
         "qml_input_conversion_failed": "无法转换此输入",
@@ -1166,6 +1236,7 @@ _QML_TRANSLATIONS = {
         "qml_run_source_update": "运行源代码更新",
         "qml_save_as_one_file": "保存为一个文件",
         "qml_save_files": "保存文件",
+        "qml_cancel_save": "取消保存（{done}/{total}）",
         "qml_selected": "，已选择",
         "qml_seconds_detail": "秒。",
         "qml_separate_markdown_files": "分开的 Markdown 文件",
@@ -1229,6 +1300,46 @@ _QML_TRANSLATIONS = {
         "settings_conversion_detail": "选择下一次转换使用的可选 Markdown 引擎。",
         "settings_anydoc_default_label": "默认使用 anydoc",
         "settings_anydoc_default_detail": "开始转换时启用 anydoc。该功能仍为可选项；不支持的文件会回退到现有转换器。",
+        "settings_parallel_conversions_label": "并行转换数",
+        "settings_parallel_conversions_detail": "同时转换的文件数量。OCR 服务较慢或内存有限时请调低。",
+        "qml_parallel_conversions": "并行转换数",
+        "settings_process_pool_label": "使用独立进程",
+        "settings_process_pool_detail": "每个并行转换在独立进程中运行，使 Office 和 PDF 文件能利用所有 CPU 核心。会占用更多内存，启动稍慢。",
+        "settings_result_memory_budget_label": "内存中保留的结果 (MB)",
+        "settings_result_memory_budget_detail": "超过此大小的已转换 Markdown 会移到临时文件夹，预览或保存时再读回。",
+        "settings_http_pool_size_label": "每个服务器的连接数",
+        "settings_http_pool_size_detail": "每个 OCR 或网站服务复用的长连接数量。",
+        "settings_http_max_retries_label": "繁忙服务器重试次数",
+        "settings_http_max_retries_detail": "遇到限流 (429) 或服务器错误 (5xx) 时的重试次数，等待时间逐次增加。",
+        "qml_tesseract_page_workers": "并行 OCR 页数",
+        "qml_tesseract_page_workers_detail": "Tesseract 同时识别的扫描 PDF 页数。",
+        "settings_tesseract_engine_reuse_label": "保持 Tesseract 已加载",
+        "settings_tesseract_engine_reuse_detail": "安装 tesserocr 后，在页面和文件之间复用已加载的语言模型，而不是为每一页启动 Tesseract。",
+        "qml_ocr_render_ahead": "预渲染页数",
+        "qml_ocr_render_ahead_detail": "OCR 忙碌时预先准备的扫描 PDF 页数。数值越高 OCR 等待越少，但占用更多内存；0 表示逐页渲染。",
+        "qml_ocr_render_max_megapixels": "页面渲染上限（百万像素）",
+        "qml_ocr_render_max_megapixels_detail": "页面按 216 DPI 渲染，扫描分辨率更低时按扫描分辨率渲染，但不会超过此像素数，避免大幅面页面耗尽内存。",
+        "qml_ocr_render_color": "页面渲染颜色",
+        "qml_ocr_render_color_detail": "灰度和黑白渲染占用更少内存，上传更快。OCR 模型需要颜色信息时请保留彩色。",
+        "qml_ocr_render_color_rgb": "彩色",
+        "qml_ocr_render_color_grayscale": "灰度",
+        "qml_ocr_render_color_binary": "黑白",
+        "settings_glmocr_ollama_concurrency_label": "并行页面请求",
+        "settings_glmocr_ollama_concurrency_detail": "同时发送给 Ollama 的页数。请与服务器的 OLLAMA_NUM_PARALLEL 保持一致；1 表示逐页发送。",
+        "qml_glmocr_ollama_concurrency": "Ollama 并行页面请求",
+        "settings_glmocr_ollama_image_format_label": "页面上传格式与质量",
+        "settings_glmocr_ollama_image_format_detail": "发送给 Ollama 的页面图像编码方式。降低 JPEG 或 WebP 质量可减少传输字节；PNG 无损，对清晰文字页通常最小。",
+        "qml_glmocr_ollama_image_format": "Ollama 页面图像格式",
+        "qml_glmocr_ollama_image_quality": "Ollama 页面图像质量",
+        "settings_glmocr_ollama_image_max_edge_label": "上传最长边（像素）",
+        "settings_glmocr_ollama_image_max_edge_detail": "超过此尺寸的页面会在上传前缩小。0 表示按渲染尺寸发送。",
+        "settings_conversion_cache_label": "复用缓存结果",
+        "settings_conversion_cache_detail": "内容和设置与先前转换相同的文件将跳过转换。结果保存在 ~/.markitdown 下。",
+        "settings_conversion_cache_size_label": "缓存大小 (MB)",
+        "qml_conversion_cache_size": "转换缓存大小（MB）",
+        "qml_clear_conversion_cache": "清除缓存",
+        "settings_ocr_page_cache_label": "从已完成页面继续 OCR",
+        "settings_ocr_page_cache_detail": "保存每个 PDF 页面的 OCR 文本，重试或中断的转换只会处理尚未完成的页面。",
         "settings_appearance_detail": "白天使用 Solarized Light，低光环境使用 Nord Dark。",
         "settings_theme_label": "主题",
         "settings_theme_detail": "选择固定配色或跟随操作系统。",
@@ -1262,6 +1373,9 @@ _QML_TRANSLATIONS = {
         "qml_conversion_progress": "已完成 {completed}/{total} 個檔案",
         "qml_converted_files": "已轉換檔案",
         "qml_converted_files_detail": "選擇項目以檢視產生的 Markdown。",
+        "qml_converted_files_totals": "已轉換 {files} 個，共 {words} 個字。",
+        "qml_preview_rendering": "正在轉譯預覽…",
+        "qml_preview_find": "在大型輸出中尋找（按 Enter 尋找下一個）",
         "qml_converted_words_accessible": "{name}，已轉換，{count} 個字",
         "qml_converting": "轉換中",
         "qml_copy_command": "複製指令",
@@ -1313,6 +1427,10 @@ _QML_TRANSLATIONS = {
         "qml_http_ocr_endpoint_detail": "POST 端點。應用程式會傳送 `file` 部分和選填的 `model`。",
         "qml_http_ocr_model": "HTTP OCR 模型",
         "qml_http_ocr_timeout": "HTTP OCR 逾時秒數",
+        "settings_http_ocr_chunk_pages_label": "每次上傳的 PDF 頁數",
+        "settings_http_ocr_chunk_pages_detail": "將較大的 PDF 依此頁數拆分，平行傳送，只重試失敗的部分。0 表示整份 PDF 一次傳送。",
+        "settings_http_ocr_chunk_workers_label": "平行上傳數",
+        "settings_http_ocr_chunk_workers_detail": "同時傳送的 PDF 部分數。",
         "qml_import": "匯入",
         "qml_import_settings_profile": "匯入設定設定檔",
         "qml_input_conversion_failed": "無法轉換此輸入",
@@ -1374,6 +1492,7 @@ _QML_TRANSLATIONS = {
         "qml_run_source_update": "執行來源更新",
         "qml_save_as_one_file": "儲存為一個檔案",
         "qml_save_files": "儲存檔案",
+        "qml_cancel_save": "取消儲存（{done}/{total}）",
         "qml_selected": "，已選取",
         "qml_seconds_detail": "秒。",
         "qml_separate_markdown_files": "分開的 Markdown 檔案",
@@ -1437,6 +1556,46 @@ _QML_TRANSLATIONS = {
         "settings_conversion_detail": "選擇下一次轉換使用的選用 Markdown 引擎。",
         "settings_anydoc_default_label": "預設使用 anydoc",
         "settings_anydoc_default_detail": "開始轉換時啟用 anydoc。此功能仍為選用項目；不支援的檔案會備援到既有轉換器。",
+        "settings_parallel_conversions_label": "平行轉換數",
+        "settings_parallel_conversions_detail": "同時轉換的檔案數量。OCR 服務較慢或記憶體有限時請調低。",
+        "qml_parallel_conversions": "平行轉換數",
+        "settings_process_pool_label": "使用獨立處理程序",
+        "settings_process_pool_detail": "每個平行轉換在獨立處理程序中執行，讓 Office 與 PDF 檔案能使用所有 CPU 核心。會占用更多記憶體，啟動稍慢。",
+        "settings_result_memory_budget_label": "記憶體中保留的結果 (MB)",
+        "settings_result_memory_budget_detail": "超過此大小的已轉換 Markdown 會移到暫存資料夾，預覽或儲存時再讀回。",
+        "settings_http_pool_size_label": "每個伺服器的連線數",
+        "settings_http_pool_size_detail": "每個 OCR 或網站服務重複使用的持續連線數量。",
+        "settings_http_max_retries_label": "忙碌伺服器重試次數",
+        "settings_http_max_retries_detail": "遇到限流 (429) 或伺服器錯誤 (5xx) 時的重試次數，等待時間逐次增加。",
+        "qml_tesseract_page_workers": "平行 OCR 頁數",
+        "qml_tesseract_page_workers_detail": "Tesseract 同時辨識的掃描 PDF 頁數。",
+        "settings_tesseract_engine_reuse_label": "保持 Tesseract 已載入",
+        "settings_tesseract_engine_reuse_detail": "安裝 tesserocr 後，在頁面和檔案之間重複使用已載入的語言模型，而不是為每一頁啟動 Tesseract。",
+        "qml_ocr_render_ahead": "預先轉譯頁數",
+        "qml_ocr_render_ahead_detail": "OCR 忙碌時預先準備的掃描 PDF 頁數。數值越高 OCR 等待越少，但占用更多記憶體；0 表示逐頁轉譯。",
+        "qml_ocr_render_max_megapixels": "頁面轉譯上限（百萬像素）",
+        "qml_ocr_render_max_megapixels_detail": "頁面以 216 DPI 轉譯，掃描解析度較低時以掃描解析度轉譯，但不會超過此像素數，避免大尺寸頁面耗盡記憶體。",
+        "qml_ocr_render_color": "頁面轉譯色彩",
+        "qml_ocr_render_color_detail": "灰階與黑白轉譯占用較少記憶體，上傳更快。OCR 模型需要色彩資訊時請保留彩色。",
+        "qml_ocr_render_color_rgb": "彩色",
+        "qml_ocr_render_color_grayscale": "灰階",
+        "qml_ocr_render_color_binary": "黑白",
+        "settings_glmocr_ollama_concurrency_label": "平行頁面請求",
+        "settings_glmocr_ollama_concurrency_detail": "同時傳送給 Ollama 的頁數。請與伺服器的 OLLAMA_NUM_PARALLEL 一致；1 表示逐頁傳送。",
+        "qml_glmocr_ollama_concurrency": "Ollama 平行頁面請求",
+        "settings_glmocr_ollama_image_format_label": "頁面上傳格式與品質",
+        "settings_glmocr_ollama_image_format_detail": "傳送給 Ollama 的頁面影像編碼方式。降低 JPEG 或 WebP 品質可減少傳輸位元組；PNG 無損，對清晰文字頁通常最小。",
+        "qml_glmocr_ollama_image_format": "Ollama 頁面影像格式",
+        "qml_glmocr_ollama_image_quality": "Ollama 頁面影像品質",
+        "settings_glmocr_ollama_image_max_edge_label": "上傳最長邊（像素）",
+        "settings_glmocr_ollama_image_max_edge_detail": "超過此尺寸的頁面會在上傳前縮小。0 表示以轉譯尺寸傳送。",
+        "settings_conversion_cache_label": "重複使用快取結果",
+        "settings_conversion_cache_detail": "內容與設定與先前轉換相同的檔案將略過轉換。結果儲存在 ~/.markitdown 下。",
+        "settings_conversion_cache_size_label": "快取大小 (MB)",
+        "qml_conversion_cache_size": "轉換快取大小（MB）",
+        "qml_clear_conversion_cache": "清除快取",
+        "settings_ocr_page_cache_label": "從已完成頁面繼續 OCR",
+        "settings_ocr_page_cache_detail": "保存每個 PDF 頁面的 OCR 文字，重試或中斷的轉換只會處理尚未完成的頁面。",
         "settings_appearance_detail": "白天使用 Solarized Light，低光環境使用 Nord Dark。",
         "settings_theme_label": "主題",
         "settings_theme_detail": "選擇固定配色或跟隨作業系統。",
@@ -1,10 +1,18 @@
+import base64
 import importlib
 import io
+import json
 import logging
 import sys
+import threading
+import time
 import types
+from pathlib import Path
 
 import pytest
+import requests
+
+from markitdowngui.core import tesseract_engine
 
 
 class _FakeSignal:
@@ -40,6 +48,12 @@ def conversion(monkeypatch):
     return importlib.reload(module)
 
 
+@pytest.fixture
+def conversion_worker(conversion):
+    module = importlib.import_module("markitdowngui.core.conversion_worker")
+    return importlib.reload(module)
+
+
 def _install_fake_glmocr(monkeypatch, glmocr_cls):
     glmocr_package = types.ModuleType("glmocr")
     glmocr_api_module = types.ModuleType("glmocr.api")
@@ -55,6 +69,28 @@ def _install_fake_pdf_images(monkeypatch, convert_pdf):
     monkeypatch.setitem(sys.modules, "markitdown_pdf_images", package)
 
 
+def _patch_http_session(monkeypatch, conversion, **methods):
+    session = types.SimpleNamespace(**methods)
+    monkeypatch.setattr(conversion, "_http_session", lambda *_args, **_kwargs: session)
+
+
+def _parse_multipart(body, content_type):
+    from email.parser import BytesParser
+    from email.policy import HTTP
+
+    message = BytesParser(policy=HTTP).parsebytes(
+        f"Content-Type: {content_type}\r\n\r\n".encode("ascii") + body
+    )
+    return {
+        part.get_param("name", header="content-disposition"): (
+            part.get_filename(),
+            part.get_content_type(),
+            part.get_payload(decode=True),
+        )
+        for part in message.iter_parts()
+    }
+
+
 def _install_fake_pdf_inspector(monkeypatch, conversion, process_pdf):
     monkeypatch.setattr(conversion, "process_pdf", process_pdf)
 
@@ -400,7 +436,7 @@ def test_convert_url_uses_defuddle_http_api(monkeypatch, conversion):
         captured["kwargs"] = kwargs
         return FakeResponse()
 
-    monkeypatch.setattr(conversion.requests, "get", fake_get)
+    _patch_http_session(monkeypatch, conversion, get=fake_get)
 
     outcome = conversion.convert_file_with_details("https://example.com/article")
 
@@ -428,7 +464,7 @@ def test_convert_url_surfaces_rate_limit(monkeypatch, conversion):
         ok = False
         text = "Too many requests"
 
-    monkeypatch.setattr(conversion.requests, "get", lambda *_args, **_kwargs: FakeResponse())
+    _patch_http_session(monkeypatch, conversion, get=lambda *_args, **_kwargs: FakeResponse())
 
     with pytest.raises(RuntimeError) as exc_info:
         conversion.convert_file("https://example.com/article")
@@ -438,9 +474,9 @@ def test_convert_url_surfaces_rate_limit(monkeypatch, conversion):
 
 def test_convert_url_surfaces_request_errors(monkeypatch, conversion):
     def fake_get(*_args, **_kwargs):
-        raise conversion.requests.RequestException("network down")
+        raise requests.RequestException("network down")
 
-    monkeypatch.setattr(conversion.requests, "get", fake_get)
+    _patch_http_session(monkeypatch, conversion, get=fake_get)
 
     with pytest.raises(RuntimeError) as exc_info:
         conversion.convert_file("https://example.com/article")
@@ -1209,13 +1245,14 @@ def test_convert_with_glmocr_ollama_calls_native_api_without_glmocr(
         def json(self):
             return {"response": "glm text"}
 
-    def fake_post(url, json, timeout):
+    def fake_post(url, data, headers, timeout):
         captured["url"] = url
-        captured["payload"] = json
+        captured["payload"] = json.loads(data)
+        captured["headers"] = headers
         captured["timeout"] = timeout
         return FakeResponse()
 
-    monkeypatch.setattr(conversion.requests, "post", fake_post)
+    _patch_http_session(monkeypatch, conversion, post=fake_post)
 
     result = conversion._convert_with_glmocr(
         str(image_path),
@@ -1237,6 +1274,7 @@ def test_convert_with_glmocr_ollama_calls_native_api_without_glmocr(
     assert captured["payload"]["prompt"] == conversion.GLMOCR_OLLAMA_PROMPT
     assert captured["payload"]["images"]
     assert captured["payload"]["options"]["num_predict"] == 16384
+    assert captured["headers"] == {"Content-Type": "application/json"}
 
 
 def test_convert_with_glmocr_ollama_joins_page_results(monkeypatch, conversion):
@@ -1251,7 +1289,7 @@ def test_convert_with_glmocr_ollama_joins_page_results(monkeypatch, conversion):
     monkeypatch.setattr(
         conversion,
         "_iter_glmocr_ollama_images",
-        lambda _file_path: iter(images),
+        lambda _file_path, **_kwargs: iter(images),
     )
 
     class FakeResponse:
@@ -1262,10 +1300,10 @@ def test_convert_with_glmocr_ollama_joins_page_results(monkeypatch, conversion):
         def json(self):
             return {"response": responses.pop(0)}
 
-    monkeypatch.setattr(
-        conversion.requests,
-        "post",
-        lambda *_args, **_kwargs: FakeResponse(),
+    _patch_http_session(
+        monkeypatch,
+        conversion,
+        post=lambda *_args, **_kwargs: FakeResponse(),
     )
 
     result = conversion._convert_with_glmocr(
@@ -1295,19 +1333,20 @@ def test_convert_image_uses_http_ocr_provider(monkeypatch, conversion, tmp_path)
         def json(self):
             return {"markdown": "http image text"}
 
-    def fake_post(url, data, files, headers, timeout):
-        file_name, file_obj, content_type = files["file"]
+    def fake_post(url, data, headers, timeout):
+        parts = _parse_multipart(data.read(), headers.pop("Content-Type"))
+        file_name, content_type, file_bytes = parts.pop("file")
         captured["url"] = url
-        captured["data"] = data
+        captured["data"] = {name: value.decode() for name, (*_, value) in parts.items()}
         captured["file_name"] = file_name
-        captured["file_bytes"] = file_obj.read()
+        captured["file_bytes"] = file_bytes
         captured["content_type"] = content_type
         captured["headers"] = headers
         captured["timeout"] = timeout
         return FakeResponse()
 
     monkeypatch.setenv("OCR_HTTP_API_KEY", "secret")
-    monkeypatch.setattr(conversion.requests, "post", fake_post)
+    _patch_http_session(monkeypatch, conversion, post=fake_post)
 
     outcome = conversion.convert_file_with_details(
         str(image_path),
@@ -1601,7 +1640,7 @@ def test_test_http_ocr_connection_uses_options_request(monkeypatch, conversion):
         captured["timeout"] = timeout
         return FakeResponse()
 
-    monkeypatch.setattr(conversion.requests, "options", fake_options)
+    _patch_http_session(monkeypatch, conversion, options=fake_options)
 
     message = conversion.test_http_ocr_connection(
         conversion.ConversionOptions(
@@ -1620,10 +1659,10 @@ def test_test_http_ocr_connection_reports_missing_route(monkeypatch, conversion)
     class FakeResponse:
         status_code = 404
 
-    monkeypatch.setattr(
-        conversion.requests,
-        "options",
-        lambda _url, timeout: FakeResponse(),
+    _patch_http_session(
+        monkeypatch,
+        conversion,
+        options=lambda _url, timeout: FakeResponse(),
     )
 
     with pytest.raises(RuntimeError) as exc_info:
@@ -1653,7 +1692,7 @@ def test_test_glmocr_ollama_connection_checks_model(monkeypatch, conversion):
         captured["timeout"] = timeout
         return FakeResponse()
 
-    monkeypatch.setattr(conversion.requests, "get", fake_get)
+    _patch_http_session(monkeypatch, conversion, get=fake_get)
 
     message = conversion.test_glmocr_ollama_connection(
         conversion.ConversionOptions(
@@ -1678,7 +1717,7 @@ def test_test_glmocr_ollama_connection_reports_missing_model(monkeypatch, conver
         def json(self):
             return {"models": [{"name": "other-model"}]}
 
-    monkeypatch.setattr(conversion.requests, "get", lambda _url, timeout: FakeResponse())
+    _patch_http_session(monkeypatch, conversion, get=lambda _url, timeout: FakeResponse())
 
     with pytest.raises(RuntimeError) as exc_info:
         conversion.test_glmocr_ollama_connection(
@@ -1787,6 +1826,7 @@ def test_validate_ocr_setup_deduplicates_duplicate_fallback_provider(conversion)
 def test_conversion_worker_tracks_failed_files_separately_from_result_text(
     monkeypatch,
     conversion,
+    conversion_worker,
 ):
     def fake_convert_with_details(file_path, _options, **_kwargs):
         if file_path == "failure.pdf":
@@ -1798,7 +1838,7 @@ def test_conversion_worker_tracks_failed_files_separately_from_result_text(
 
     monkeypatch.setattr(conversion, "convert_file_with_details", fake_convert_with_details)
 
-    worker = conversion.ConversionWorker(
+    worker = conversion_worker.ConversionWorker(
         ["success.md", "failure.pdf"],
         batch_size=2,
     )
@@ -1807,7 +1847,11 @@ def test_conversion_worker_tracks_failed_files_separately_from_result_text(
     assert worker.failed_files == {"failure.pdf"}
 
 
-def test_conversion_worker_tracks_processing_backends(monkeypatch, conversion):
+def test_conversion_worker_tracks_processing_backends(
+    monkeypatch,
+    conversion,
+    conversion_worker,
+):
     def fake_convert_with_details(file_path, _options, **_kwargs):
         backend = (
             conversion.BACKEND_AZURE
@@ -1818,7 +1862,7 @@ def test_conversion_worker_tracks_processing_backends(monkeypatch, conversion):
 
     monkeypatch.setattr(conversion, "convert_file_with_details", fake_convert_with_details)
 
-    worker = conversion.ConversionWorker(
+    worker = conversion_worker.ConversionWorker(
         ["scan.pdf", "notes.txt"],
         batch_size=2,
     )
@@ -1830,21 +1874,25 @@ def test_conversion_worker_tracks_processing_backends(monkeypatch, conversion):
     }
 
 
-def test_conversion_worker_emits_finished_when_cancelled_while_paused(conversion):
-    worker = conversion.ConversionWorker(["scan.pdf"], batch_size=1)
+def test_conversion_worker_emits_finished_when_cancelled_while_paused(
+    conversion,
+    conversion_worker,
+):
+    worker = conversion_worker.ConversionWorker(["scan.pdf"], batch_size=1)
     worker.is_paused = True
     worker.is_cancelled = True
-    finished: list[dict] = []
-    worker.finished.connect(lambda results: finished.append(results))
+    finished: list = []
+    worker.finished.connect(finished.append)
 
     worker.run()
 
-    assert finished == [{}]
+    assert finished == [conversion.ConversionBatchSummary(total=1, cancelled=True)]
 
 
 def test_conversion_worker_reuses_markitdown_instance_for_native_files(
     monkeypatch,
     conversion,
+    conversion_worker,
 ):
     constructions: list[dict[str, object]] = []
     converted: list[str] = []
@@ -1863,7 +1911,7 @@ def test_conversion_worker_reuses_markitdown_instance_for_native_files(
         types.SimpleNamespace(MarkItDown=FakeMarkItDown),
     )
 
-    worker = conversion.ConversionWorker(
+    worker = conversion_worker.ConversionWorker(
         ["first.txt", "second.txt", "third.txt"],
         batch_size=10,
     )
@@ -1873,17 +1921,386 @@ def test_conversion_worker_reuses_markitdown_instance_for_native_files(
     worker.itemFinished.connect(
         lambda source, _outcome, failed: completed.append((source, failed))
     )
+    batches: list[list[tuple[str, object, bool]]] = []
+    worker.itemsFinished.connect(batches.append)
 
     worker.run()
 
     assert constructions == [{}]
-    assert converted == ["first.txt", "second.txt", "third.txt"]
+    assert sorted(converted) == ["first.txt", "second.txt", "third.txt"]
     assert started == ["first.txt", "second.txt", "third.txt"]
-    assert completed == [
+    assert sorted(completed) == [
         ("first.txt", False),
         ("second.txt", False),
         ("third.txt", False),
     ]
+    assert all(batches)
+    assert sorted(
+        (source, failed) for batch in batches for source, _outcome, failed in batch
+    ) == sorted(completed)
+
+
+def test_conversion_worker_runs_up_to_batch_size_conversions_at_once(
+    monkeypatch,
+    conversion,
+    conversion_worker,
+):
+    lock = threading.Lock()
+    release = threading.Event()
+    in_flight = 0
+    peak = 0
+
+    def fake_convert_with_details(file_path, _options, **_kwargs):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+            if in_flight == 2:
+                release.set()
+        release.wait(timeout=5)
+        with lock:
+            in_flight -= 1
+        return conversion.ConversionOutcome(markdown=f"# {file_path}")
+
+    monkeypatch.setattr(conversion, "convert_file_with_details", fake_convert_with_details)
+
+    files = ["a.txt", "b.txt", "c.txt", "d.txt", "e.txt"]
+    worker = conversion_worker.ConversionWorker(files, batch_size=2)
+    progress: list[int] = []
+    finished_items: list[str] = []
+    finished: list = []
+    worker.progress.connect(lambda value, _source: progress.append(value))
+    worker.itemFinished.connect(lambda source, _outcome, _failed: finished_items.append(source))
+    worker.finished.connect(finished.append)
+
+    worker.run()
+
+    assert peak == 2
+    assert sorted(finished_items) == files
+    assert finished == [conversion.ConversionBatchSummary(total=5, completed=5)]
+    assert progress == [20, 40, 60, 80, 100]
+
+
+def test_conversion_worker_does_not_dispatch_new_files_after_cancel(
+    monkeypatch,
+    conversion,
+    conversion_worker,
+):
+    worker = conversion_worker.ConversionWorker(["a.txt", "b.txt", "c.txt"], batch_size=1)
+
+    def fake_convert_with_details(file_path, _options, **_kwargs):
+        worker.is_cancelled = True
+        return conversion.ConversionOutcome(markdown=f"# {file_path}")
+
+    monkeypatch.setattr(conversion, "convert_file_with_details", fake_convert_with_details)
+    started: list[str] = []
+    finished: list = []
+    worker.itemStarted.connect(started.append)
+    worker.finished.connect(finished.append)
+
+    worker.run()
+
+    assert started == ["a.txt"]
+    assert finished == [
+        conversion.ConversionBatchSummary(total=3, completed=1, cancelled=True)
+    ]
+
+
+def test_run_conversion_batch_returns_outcomes_from_process_pool(
+    tmp_path,
+    conversion,
+):
+    first = tmp_path / "first.md"
+    second = tmp_path / "second.md"
+    first.write_text("# First", encoding="utf-8")
+    second.write_text("# Second", encoding="utf-8")
+    finished: list[tuple[str, bool]] = []
+    results: dict[str, object] = {}
+
+    def on_finished(source, outcome, failed):
+        finished.append((source, failed))
+        results[source] = outcome
+
+    summary = conversion.run_conversion_batch(
+        [str(first), str(second)],
+        max_workers=2,
+        on_finished=on_finished,
+        use_process_pool=True,
+    )
+
+    assert summary == conversion.ConversionBatchSummary(total=2, completed=2)
+    assert isinstance(results[str(first)], conversion.ConversionOutcome)
+    assert "# First" in results[str(first)].markdown
+    assert "# Second" in results[str(second)].markdown
+    assert sorted(finished) == [(str(first), False), (str(second), False)]
+
+
+def test_run_conversion_batch_reports_broken_pool_as_failed_item(
+    monkeypatch,
+    conversion,
+):
+    class BrokenExecutor:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *_args):
+            return False
+
+        def submit(self, *_args, **_kwargs):
+            raise RuntimeError("process pool is broken")
+
+    monkeypatch.setattr(
+        conversion,
+        "_create_batch_executor",
+        lambda *_args, **_kwargs: BrokenExecutor(),
+    )
+
+    finished: list[tuple[str, str, bool]] = []
+
+    summary = conversion.run_conversion_batch(
+        ["scan.pdf"],
+        use_process_pool=True,
+        on_finished=lambda source, outcome, failed: finished.append(
+            (source, outcome.markdown, failed)
+        ),
+    )
+
+    assert summary.failed == 1
+    assert finished[0][0] == "scan.pdf"
+    assert "process pool is broken" in finished[0][1]
+    assert finished[0][2] is True
+
+
+def _install_fake_pdfium(monkeypatch, page_count, page_texts=None):
+    class FakeTextPage:
+        def __init__(self, page_index):
+            self.page_index = page_index
+
+        def get_text_range(self):
+            return (page_texts or {}).get(self.page_index, "")
+
+        def close(self):
+            pass
+
+    class FakeBitmap:
+        def __init__(self, page_index):
+            self.page_index = page_index
+
+        def to_pil(self):
+            return types.SimpleNamespace(page_index=self.page_index)
+
+        def close(self):
+            pass
+
+    class FakePage:
+        def __init__(self, page_index):
+            self.page_index = page_index
+
+        def render(self, scale):
+            return FakeBitmap(self.page_index)
+
+        def get_textpage(self):
+            return FakeTextPage(self.page_index)
+
+        def close(self):
+            pass
+
+    class FakePdfDocument:
+        def __init__(self, _file_path):
+            pass
+
+        def __len__(self):
+            return page_count
+
+        def __getitem__(self, page_index):
+            return FakePage(page_index)
+
+        def close(self):
+            pass
+
+    monkeypatch.setitem(
+        sys.modules,
+        "pypdfium2",
+        types.SimpleNamespace(PdfDocument=FakePdfDocument),
+    )
+
+
+def test_local_pdf_ocr_runs_pages_in_parallel_and_keeps_page_order(
+    monkeypatch,
+    conversion,
+):
+    _install_fake_pdfium(monkeypatch, page_count=6)
+    lock = threading.Lock()
+    in_flight = 0
+    peak = 0
+
+    def fake_tesseract(image, _options):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        # Later pages finish first so ordering relies on page index, not timing.
+        time.sleep(0.02 * (6 - image.page_index))
+        with lock:
+            in_flight -= 1
+        return f"page {image.page_index + 1}"
+
+    monkeypatch.setattr(conversion, "_run_tesseract_ocr", fake_tesseract)
+
+    text = conversion._convert_pdf_with_local_ocr(
+        "scan.pdf",
+        conversion.ConversionOptions(ocr_enabled=True, ocr_page_workers=3),
+    )
+
+    assert text == "\n\n".join(f"page {index}" for index in range(1, 7))
+    assert 1 < peak <= 3
+
+
+def test_local_pdf_ocr_serial_path_uses_one_worker(monkeypatch, conversion):
+    _install_fake_pdfium(monkeypatch, page_count=3)
+    threads: set[str] = set()
+
+    def fake_tesseract(image, _options):
+        threads.add(threading.current_thread().name)
+        return "" if image.page_index == 1 else f"page {image.page_index + 1}"
+
+    monkeypatch.setattr(conversion, "_run_tesseract_ocr", fake_tesseract)
+
+    text = conversion._convert_pdf_with_local_ocr(
+        "scan.pdf",
+        conversion.ConversionOptions(ocr_enabled=True),
+    )
+
+    assert text == "page 1\n\npage 3"
+    assert len(threads) == 1
+
+
+def test_local_pdf_ocr_propagates_page_failures(monkeypatch, conversion):
+    _install_fake_pdfium(monkeypatch, page_count=4)
+
+    def fake_tesseract(image, _options):
+        if image.page_index == 2:
+            raise RuntimeError("Local OCR failed.")
+        return "text"
+
+    monkeypatch.setattr(conversion, "_run_tesseract_ocr", fake_tesseract)
+
+    with pytest.raises(RuntimeError, match="Local OCR failed"):
+        conversion._convert_pdf_with_local_ocr(
+            "scan.pdf",
+            conversion.ConversionOptions(ocr_enabled=True, ocr_page_workers=2),
+        )
+
+
+def test_rendered_ahead_pipeline_bounds_pages_waiting_for_ocr(conversion):
+    produced: list[int] = []
+
+    def pages():
+        for index in range(10):
+            produced.append(index)
+            yield index
+
+    images = conversion._iter_rendered_ahead(pages(), 2)
+    assert next(images) == 0
+    deadline = time.monotonic() + 2
+    while len(produced) < 4 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    time.sleep(0.05)
+
+    # One page consumed, two queued, one held by the blocked producer.
+    assert len(produced) == 4
+    assert list(images) == list(range(1, 10))
+
+
+def test_rendered_ahead_pipeline_propagates_render_errors(conversion):
+    def pages():
+        yield "first"
+        raise RuntimeError("render failed")
+
+    images = conversion._iter_rendered_ahead(pages(), 3)
+
+    assert next(images) == "first"
+    with pytest.raises(RuntimeError, match="render failed"):
+        next(images)
+
+
+def test_rendered_ahead_pipeline_closes_source_when_consumer_stops(conversion):
+    closed = threading.Event()
+
+    def pages():
+        try:
+            for index in range(100):
+                yield index
+        finally:
+            closed.set()
+
+    images = conversion._iter_rendered_ahead(pages(), 1)
+    assert next(images) == 0
+    images.close()
+
+    assert closed.is_set()
+
+
+def test_glmocr_ollama_renders_pages_ahead_on_separate_thread(monkeypatch, conversion):
+    render_threads: set[str] = set()
+
+    def fake_images(_file_path, **_kwargs):
+        for index in range(3):
+            render_threads.add(threading.current_thread().name)
+            yield f"image-{index}"
+
+    monkeypatch.setattr(conversion, "_iter_glmocr_ollama_images", fake_images)
+    monkeypatch.setattr(
+        conversion,
+        "_call_glmocr_ollama",
+        lambda image, _options: image.replace("image", "page"),
+    )
+
+    markdown = conversion._convert_with_glmocr_ollama(
+        "scan.pdf",
+        conversion.ConversionOptions(ocr_render_ahead=2),
+    )
+
+    assert markdown == "page-0\n\npage-1\n\npage-2"
+    assert render_threads == {"markitdown-render"}
+
+
+def test_glmocr_ollama_sends_pages_concurrently_in_page_order(
+    monkeypatch,
+    conversion,
+    caplog,
+):
+    lock = threading.Lock()
+    in_flight = 0
+    peak = 0
+
+    def fake_images(_file_path, **_kwargs):
+        for index in range(5):
+            yield types.SimpleNamespace(page_index=index)
+
+    def fake_call(image, _options):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.02 * (5 - image.page_index))
+        with lock:
+            in_flight -= 1
+        return f"page {image.page_index + 1}"
+
+    monkeypatch.setattr(conversion, "_iter_glmocr_ollama_images", fake_images)
+    monkeypatch.setattr(conversion, "_call_glmocr_ollama", fake_call)
+    caplog.set_level(logging.INFO)
+
+    markdown = conversion._convert_with_glmocr_ollama(
+        "scan.pdf",
+        conversion.ConversionOptions(glmocr_ollama_concurrency=3),
+    )
+
+    assert markdown == "\n\n".join(f"page {index}" for index in range(1, 6))
+    assert 1 < peak <= 3
+    assert "GLM-OCR Ollama OCR of scan.pdf: page 5 took" in caplog.text
+    assert "GLM-OCR Ollama OCR of scan.pdf: 5 pages with 3 workers" in caplog.text
 
 
 def test_run_tesseract_ocr_resets_executable_path_when_custom_path_is_cleared(
@@ -1910,3 +2327,681 @@ def test_run_tesseract_ocr_resets_executable_path_when_custom_path_is_cleared(
     assert first_result == "ocr text"
     assert second_result == "ocr text"
     assert pytesseract_impl.tesseract_cmd == "tesseract"
+
+
+def _hybrid_page_text(page_number):
+    return f"Native text layer for page {page_number} with enough characters."
+
+
+def test_hybrid_pdf_ocr_sends_only_image_only_pages_to_ocr(monkeypatch, conversion, tmp_path):
+    _install_fake_pdfium(
+        monkeypatch,
+        page_count=4,
+        page_texts={0: _hybrid_page_text(1), 2: _hybrid_page_text(3), 3: "  7 \n"},
+    )
+    rendered_pages: list[int] = []
+
+    class FakeImage:
+        def __init__(self, page_index):
+            self.page_index = page_index
+
+        def save(self, path, format):
+            rendered_pages.append(self.page_index)
+            Path(path).write_text(str(self.page_index), encoding="utf-8")
+
+        def close(self):
+            pass
+
+    monkeypatch.setattr(
+        conversion,
+        "_iter_pdf_page_images",
+        lambda _path, *, missing_dependency_message, page_indexes, options: iter(
+            FakeImage(index) for index in page_indexes
+        ),
+    )
+
+    def fake_image_ocr(file_path, _options, extension):
+        assert extension == ".png"
+        page_index = int(Path(file_path).read_text(encoding="utf-8"))
+        return conversion.ConversionOutcome(markdown=f"ocr page {page_index + 1}")
+
+    monkeypatch.setattr(conversion, "_convert_image_with_ocr", fake_image_ocr)
+    monkeypatch.setattr(
+        conversion,
+        "_convert_pdf_with_ocr",
+        lambda *_args: pytest.fail("whole-document OCR should not run"),
+    )
+    source = tmp_path / "mixed.pdf"
+    source.write_bytes(b"%PDF-1.7")
+
+    outcome = conversion.convert_file_with_details(
+        str(source),
+        conversion.ConversionOptions(ocr_enabled=True, hybrid_pdf_ocr=True),
+    )
+
+    assert rendered_pages == [1, 3]
+    assert outcome.backend == conversion.BACKEND_PDF_HYBRID
+    assert outcome.markdown == "\n\n".join(
+        [_hybrid_page_text(1), "ocr page 2", _hybrid_page_text(3), "ocr page 4"]
+    )
+
+
+@pytest.mark.parametrize("page_texts", [{}, {0: _hybrid_page_text(1), 1: _hybrid_page_text(2)}])
+def test_hybrid_pdf_ocr_defers_uniform_documents_to_existing_path(
+    monkeypatch,
+    conversion,
+    page_texts,
+):
+    _install_fake_pdfium(monkeypatch, page_count=2, page_texts=page_texts)
+    options = conversion.ConversionOptions(ocr_enabled=True, hybrid_pdf_ocr=True)
+
+    assert conversion._try_convert_pdf_hybrid("doc.pdf", options) is None
+
+
+def test_hybrid_pdf_ocr_retries_only_failed_pages_with_whole_document_ocr(
+    monkeypatch,
+    conversion,
+):
+    _install_fake_pdfium(monkeypatch, page_count=3, page_texts={0: _hybrid_page_text(1)})
+
+    def flaky_image_ocr(image, _temp_dir, _options):
+        if image.page_index == 1:
+            raise RuntimeError("provider down")
+        return f"ocr page {image.page_index + 1}"
+
+    retried_pages: list[int] = []
+
+    def fake_page_as_document(_path, page_index, _temp_dir, _options):
+        retried_pages.append(page_index)
+        return f"document ocr page {page_index + 1}"
+
+    monkeypatch.setattr(conversion, "_ocr_hybrid_pdf_page", flaky_image_ocr)
+    monkeypatch.setattr(conversion, "_ocr_pdf_page_as_document", fake_page_as_document)
+    options = conversion.ConversionOptions(ocr_enabled=True, hybrid_pdf_ocr=True)
+
+    outcome = conversion._try_convert_pdf_hybrid("doc.pdf", options)
+
+    assert retried_pages == [1]
+    assert outcome.markdown == "\n\n".join(
+        [_hybrid_page_text(1), "document ocr page 2", "ocr page 3"]
+    )
+
+
+def test_hybrid_pdf_ocr_defers_when_a_failed_page_cannot_be_recovered(
+    monkeypatch,
+    conversion,
+):
+    _install_fake_pdfium(monkeypatch, page_count=2, page_texts={0: _hybrid_page_text(1)})
+
+    def failing_ocr(*_args):
+        raise RuntimeError("provider down")
+
+    monkeypatch.setattr(conversion, "_ocr_hybrid_pdf_page", failing_ocr)
+    monkeypatch.setattr(conversion, "_ocr_pdf_page_as_document", failing_ocr)
+    options = conversion.ConversionOptions(ocr_enabled=True, hybrid_pdf_ocr=True)
+
+    assert conversion._try_convert_pdf_hybrid("doc.pdf", options) is None
+
+
+def test_hybrid_pdf_ocr_reuses_cached_scanned_pages(monkeypatch, conversion, tmp_path):
+    _install_fake_pdfium(
+        monkeypatch,
+        page_count=3,
+        page_texts={0: _hybrid_page_text(1), 2: _hybrid_page_text(3)},
+    )
+    source = tmp_path / "mixed.pdf"
+    source.write_bytes(b"%PDF-1.7 mixed")
+    ocr_calls: list[int] = []
+
+    def fake_image_ocr(image, _temp_dir, _options):
+        ocr_calls.append(image.page_index)
+        return f"ocr page {image.page_index + 1}"
+
+    monkeypatch.setattr(conversion, "_ocr_hybrid_pdf_page", fake_image_ocr)
+    options = conversion.ConversionOptions(
+        ocr_enabled=True,
+        hybrid_pdf_ocr=True,
+        ocr_page_cache_dir=str(tmp_path / "ocr-pages"),
+    )
+
+    first = conversion._try_convert_pdf_hybrid(str(source), options)
+    second = conversion._try_convert_pdf_hybrid(str(source), options)
+
+    assert ocr_calls == [1]
+    assert first.markdown == second.markdown
+    assert "ocr page 2" in second.markdown
+
+
+def test_local_pdf_ocr_resumes_from_cached_pages_after_failure(
+    monkeypatch,
+    conversion,
+    tmp_path,
+):
+    _install_fake_pdfium(monkeypatch, page_count=4)
+    source = tmp_path / "scan.pdf"
+    source.write_bytes(b"%PDF-1.7 scanned")
+    options = conversion.ConversionOptions(
+        ocr_page_workers=1,
+        ocr_page_cache_dir=str(tmp_path / "ocr-pages"),
+    )
+    ocr_calls: list[int] = []
+    failing_page = 2
+
+    def fake_tesseract(image, _options):
+        ocr_calls.append(image.page_index)
+        if image.page_index == failing_page:
+            raise RuntimeError("provider timed out")
+        return f"page {image.page_index + 1}"
+
+    monkeypatch.setattr(conversion, "_run_tesseract_ocr", fake_tesseract)
+
+    with pytest.raises(RuntimeError, match="provider timed out"):
+        conversion._convert_pdf_with_local_ocr(str(source), options)
+
+    ocr_calls.clear()
+    failing_page = None
+    markdown = conversion._convert_pdf_with_local_ocr(str(source), options)
+
+    # Page 4 may or may not have finished before the failure cancelled it.
+    assert ocr_calls in ([2, 3], [2])
+    assert markdown == "page 1\n\npage 2\n\npage 3\n\npage 4"
+
+    other_language = conversion.ConversionOptions(
+        ocr_languages="deu",
+        ocr_page_cache_dir=options.ocr_page_cache_dir,
+    )
+    ocr_calls.clear()
+    conversion._convert_pdf_with_local_ocr(str(source), other_language)
+    assert ocr_calls == [0, 1, 2, 3]
+
+
+def test_run_tesseract_ocr_reuses_loaded_engines_when_tesserocr_is_installed(
+    monkeypatch,
+    conversion,
+    tmp_path,
+):
+    created: list[dict[str, str]] = []
+    timeouts: list[int] = []
+
+    class FakeTessBaseAPI:
+        def __init__(self, **kwargs):
+            created.append(kwargs)
+
+        def SetImage(self, image):
+            self.image = image
+
+        def Recognize(self, timeout=0):
+            timeouts.append(timeout)
+            return True
+
+        def GetUTF8Text(self):
+            return f"{self.image} text\n"
+
+        def End(self):
+            pass
+
+    def fail_subprocess(*_args, **_kwargs):
+        raise AssertionError("pytesseract should not run")
+
+    executable = tmp_path / "tesseract.exe"
+    (tmp_path / "tessdata").mkdir()
+    monkeypatch.setitem(
+        sys.modules,
+        "tesserocr",
+        types.SimpleNamespace(PyTessBaseAPI=FakeTessBaseAPI),
+    )
+    monkeypatch.setitem(
+        sys.modules,
+        "pytesseract",
+        types.SimpleNamespace(
+            pytesseract=types.SimpleNamespace(tesseract_cmd="tesseract"),
+            image_to_string=fail_subprocess,
+        ),
+    )
+    pool = tesseract_engine.TesseractEnginePool()
+    monkeypatch.setattr(tesseract_engine, "_DEFAULT_POOL", pool)
+    options = conversion.ConversionOptions(
+        ocr_languages="deu",
+        tesseract_path=str(executable),
+    )
+
+    texts = [conversion._run_tesseract_ocr(f"page {index}", options) for index in range(4)]
+
+    assert texts == [f"page {index} text" for index in range(4)]
+    assert created == [{"lang": "deu", "path": str(tmp_path / "tessdata")}]
+    assert timeouts == [conversion.LOCAL_OCR_TIMEOUT_SECONDS * 1000] * 4
+    pool.close()
+
+
+def test_run_tesseract_ocr_uses_subprocess_when_engine_reuse_is_off(
+    monkeypatch,
+    conversion,
+):
+    def fail_engine(**_kwargs):
+        raise AssertionError("tesserocr should not be used")
+
+    monkeypatch.setitem(
+        sys.modules,
+        "tesserocr",
+        types.SimpleNamespace(PyTessBaseAPI=fail_engine),
+    )
+    monkeypatch.setitem(
+        sys.modules,
+        "pytesseract",
+        types.SimpleNamespace(
+            pytesseract=types.SimpleNamespace(tesseract_cmd="tesseract"),
+            image_to_string=lambda *_args, **_kwargs: "subprocess text",
+        ),
+    )
+
+    text = conversion._run_tesseract_ocr(
+        object(),
+        conversion.ConversionOptions(reuse_tesseract_engines=False),
+    )
+
+    assert text == "subprocess text"
+
+
+def test_pdf_render_scale_follows_scan_resolution_within_pixel_budget(conversion):
+    budget = 16_000_000
+    letter = (612, 792)
+
+    assert conversion.pdf_render_scale(*letter, max_pixels=budget) == 3.0
+    # A 600 DPI scan gains nothing over the default 216 DPI render.
+    assert conversion.pdf_render_scale(*letter, max_pixels=budget, scan_dpi=600) == 3.0
+    assert conversion.pdf_render_scale(
+        *letter, max_pixels=budget, scan_dpi=200
+    ) == pytest.approx(200 / 72)
+    # Low-resolution scans are still upsampled to a readable minimum.
+    assert conversion.pdf_render_scale(
+        *letter, max_pixels=budget, scan_dpi=72
+    ) == pytest.approx(150 / 72)
+
+    a0_scale = conversion.pdf_render_scale(2384, 3370, max_pixels=budget)
+    assert 2384 * 3370 * a0_scale**2 == pytest.approx(budget)
+
+
+def _write_pdf_with_scan_and_large_page(path, *, scan_pixels, page_size=(612, 792)):
+    pdfium = pytest.importorskip("pypdfium2")
+    from PIL import Image
+
+    pdf = pdfium.PdfDocument.new()
+    page = pdf.new_page(*page_size)
+    scan = pdfium.PdfImage.new(pdf)
+    scan.set_bitmap(pdfium.PdfBitmap.from_pil(Image.new("RGB", scan_pixels, "white")))
+    scan.set_matrix(pdfium.PdfMatrix().scale(*page_size))
+    page.insert_obj(scan)
+    page.gen_content()
+    pdf.new_page(2384, 3370)
+    pdf.save(path)
+    pdf.close()
+
+
+@pytest.mark.parametrize(
+    ("render_color", "mode"),
+    [("rgb", "RGB"), ("grayscale", "L"), ("binary", "1")],
+)
+def test_pdf_page_images_render_adaptively_in_selected_colour(
+    conversion,
+    tmp_path,
+    render_color,
+    mode,
+):
+    pdf_path = tmp_path / "scan.pdf"
+    # A 200 DPI letter-size scan followed by an A0 drawing.
+    _write_pdf_with_scan_and_large_page(pdf_path, scan_pixels=(1700, 2200))
+
+    images = list(
+        conversion._iter_pdf_page_images(
+            str(pdf_path),
+            missing_dependency_message="pypdfium2 missing",
+            options=conversion.ConversionOptions(
+                ocr_render_max_megapixels=8,
+                ocr_render_color=render_color,
+            ),
+        )
+    )
+
+    assert [image.mode for image in images] == [mode, mode]
+    assert images[0].size == pytest.approx((1700, 2200), abs=2)
+    width, height = images[1].size
+    assert width * height <= 8_000_000 * 1.001
+    assert width * height > 7_900_000
+
+
+def _decode_ollama_upload(encoded):
+    from PIL import Image
+
+    return Image.open(io.BytesIO(base64.b64decode(encoded.data)))
+
+
+@pytest.mark.parametrize(
+    ("image_format", "pil_format"),
+    [("jpeg", "JPEG"), ("png", "PNG"), ("webp", "WEBP")],
+)
+def test_encode_image_for_ollama_applies_format_and_long_edge(
+    conversion,
+    image_format,
+    pil_format,
+):
+    from PIL import Image
+
+    page = Image.new("RGB", (1200, 1600), "white")
+
+    encoded = conversion._encode_image_for_ollama(
+        page,
+        conversion.ConversionOptions(
+            glmocr_ollama_image_format=image_format,
+            glmocr_ollama_image_max_edge=800,
+        ),
+    )
+
+    uploaded = _decode_ollama_upload(encoded)
+    assert uploaded.format == pil_format
+    assert uploaded.size == (600, 800)
+    assert (encoded.width, encoded.height) == (600, 800)
+    assert encoded.seconds >= 0
+
+
+def test_encode_image_for_ollama_reuses_buffer_and_keeps_grayscale_jpeg(conversion):
+    from PIL import Image, ImageDraw
+
+    page = Image.new("L", (400, 300), 255)
+    ImageDraw.Draw(page).text((10, 10), "scanned text " * 4, fill=0)
+    options = conversion.ConversionOptions(glmocr_ollama_image_quality=40)
+
+    low_quality = conversion._encode_image_for_ollama(page, options)
+    buffer = conversion._ENCODER_BUFFERS.buffer
+    high_quality = conversion._encode_image_for_ollama(
+        page,
+        conversion.ConversionOptions(glmocr_ollama_image_quality=95),
+    )
+
+    assert conversion._ENCODER_BUFFERS.buffer is buffer
+    assert _decode_ollama_upload(low_quality).mode == "L"
+    assert len(low_quality.data) < len(high_quality.data)
+    # The later, larger encode did not leak into the earlier result.
+    assert _decode_ollama_upload(low_quality).size == (400, 300)
+
+
+def test_glmocr_ollama_body_is_valid_json_with_spliced_image(conversion):
+    body = conversion._glmocr_ollama_body(
+        {"model": "glm-ocr", "prompt": "Recognize \"text\"", "stream": False},
+        b"aGVsbG8=",
+    )
+
+    assert json.loads(body) == {
+        "model": "glm-ocr",
+        "prompt": 'Recognize "text"',
+        "stream": False,
+        "images": ["aGVsbG8="],
+    }
+
+
+def test_call_glmocr_ollama_logs_bytes_on_wire_and_encode_time(
+    monkeypatch,
+    conversion,
+    caplog,
+):
+    from PIL import Image
+
+    captured = {}
+
+    class FakeResponse:
+        ok = True
+        status_code = 200
+        text = ""
+
+        def json(self):
+            return {"response": "page text"}
+
+    def fake_post(_url, data, headers, timeout):
+        captured["bytes"] = len(data)
+        return FakeResponse()
+
+    _patch_http_session(monkeypatch, conversion, post=fake_post)
+    caplog.set_level(logging.INFO)
+
+    text = conversion._call_glmocr_ollama(
+        Image.new("RGB", (3000, 2000), "white"),
+        conversion.ConversionOptions(
+            glmocr_ollama_image_format="png",
+            glmocr_ollama_image_max_edge=1500,
+        ),
+    )
+
+    assert text == "page text"
+    assert "GLM-OCR Ollama upload: 1500x1000 PNG" in caplog.text
+    assert f"{captured['bytes'] / 1024:.1f} KB on the wire" in caplog.text
+
+
+def _write_text_pdf(path, page_count):
+    pdfium = pytest.importorskip("pypdfium2")
+
+    pdf = pdfium.PdfDocument.new()
+    for _ in range(page_count):
+        pdf.new_page(612, 792)
+    pdf.save(str(path))
+    pdf.close()
+
+
+def _chunked_http_ocr_server(monkeypatch, conversion, fail_once=(), fail_always=()):
+    import pypdfium2 as pdfium
+
+    uploads: list[tuple[str, int]] = []
+    lock = threading.Lock()
+
+    class FakeResponse:
+        ok = True
+        status_code = 200
+        headers = {"content-type": "text/plain"}
+
+        def __init__(self, text):
+            self.text = text
+
+    def fake_post(_url, data, headers, timeout):
+        parts = _parse_multipart(data.read(), headers["Content-Type"])
+        file_name, _content_type, pdf_bytes = parts["file"]
+        pdf = pdfium.PdfDocument(pdf_bytes)
+        page_count = len(pdf)
+        pdf.close()
+        with lock:
+            uploads.append((file_name, page_count))
+            failed_before = sum(1 for name, _ in uploads if name == file_name) > 1
+        if file_name in fail_always or (file_name in fail_once and not failed_before):
+            raise RuntimeError(f"server dropped {file_name}")
+        return FakeResponse(f"text of {file_name}")
+
+    _patch_http_session(monkeypatch, conversion, post=fake_post)
+    return uploads
+
+
+def test_chunked_http_ocr_uploads_page_ranges_and_retries_only_failed_chunks(
+    monkeypatch,
+    conversion,
+    tmp_path,
+):
+    pdf_path = tmp_path / "scan.pdf"
+    _write_text_pdf(pdf_path, 7)
+    uploads = _chunked_http_ocr_server(
+        monkeypatch,
+        conversion,
+        fail_once={"scan-pages-4-6.pdf"},
+    )
+
+    outcome = conversion.convert_file_with_details(
+        str(pdf_path),
+        conversion.ConversionOptions(
+            ocr_enabled=True,
+            ocr_provider=conversion.OCR_PROVIDER_HTTP,
+            http_ocr_endpoint="http://localhost:8000/ocr",
+            http_ocr_chunk_pages=3,
+            http_ocr_chunk_workers=3,
+        ),
+    )
+
+    assert outcome.backend == conversion.BACKEND_HTTP_OCR
+    assert outcome.markdown == (
+        "text of scan-pages-1-3.pdf\n\n"
+        "text of scan-pages-4-6.pdf\n\n"
+        "text of scan-pages-7-7.pdf"
+    )
+    assert sorted(uploads) == [
+        ("scan-pages-1-3.pdf", 3),
+        ("scan-pages-4-6.pdf", 3),
+        ("scan-pages-4-6.pdf", 3),
+        ("scan-pages-7-7.pdf", 1),
+    ]
+    assert list(tmp_path.iterdir()) == [pdf_path]
+
+
+def test_chunked_http_ocr_reports_chunks_that_keep_failing(
+    monkeypatch,
+    conversion,
+    tmp_path,
+):
+    pdf_path = tmp_path / "scan.pdf"
+    _write_text_pdf(pdf_path, 4)
+    uploads = _chunked_http_ocr_server(
+        monkeypatch,
+        conversion,
+        fail_always={"scan-pages-3-4.pdf"},
+    )
+
+    with pytest.raises(RuntimeError, match="pages 3-4 after 3 attempts: server dropped"):
+        conversion._convert_pdf_with_chunked_http_ocr(
+            str(pdf_path),
+            conversion.ConversionOptions(
+                http_ocr_endpoint="http://localhost:8000/ocr",
+                http_ocr_chunk_pages=2,
+            ),
+        )
+
+    assert [name for name, _ in uploads].count("scan-pages-1-2.pdf") == 1
+    assert [name for name, _ in uploads].count("scan-pages-3-4.pdf") == 3
+
+
+def test_chunked_http_ocr_resumes_from_cached_chunks(monkeypatch, conversion, tmp_path):
+    pdf_path = tmp_path / "scan.pdf"
+    _write_text_pdf(pdf_path, 4)
+    options = conversion.ConversionOptions(
+        http_ocr_endpoint="http://localhost:8000/ocr",
+        http_ocr_chunk_pages=2,
+        ocr_page_cache_dir=str(tmp_path / "cache"),
+    )
+    _chunked_http_ocr_server(
+        monkeypatch,
+        conversion,
+        fail_always={"scan-pages-3-4.pdf"},
+    )
+    with pytest.raises(RuntimeError):
+        conversion._convert_pdf_with_chunked_http_ocr(str(pdf_path), options)
+
+    uploads = _chunked_http_ocr_server(monkeypatch, conversion)
+    markdown = conversion._convert_pdf_with_chunked_http_ocr(str(pdf_path), options)
+
+    assert markdown == "text of scan-pages-1-2.pdf\n\ntext of scan-pages-3-4.pdf"
+    assert uploads == [("scan-pages-3-4.pdf", 2)]
+
+
+def test_chunked_http_ocr_sends_short_pdfs_whole(monkeypatch, conversion, tmp_path):
+    pdf_path = tmp_path / "scan.pdf"
+    _write_text_pdf(pdf_path, 2)
+    uploads = _chunked_http_ocr_server(monkeypatch, conversion)
+
+    markdown = conversion._convert_pdf_with_chunked_http_ocr(
+        str(pdf_path),
+        conversion.ConversionOptions(
+            http_ocr_endpoint="http://localhost:8000/ocr",
+            http_ocr_chunk_pages=10,
+        ),
+    )
+
+    assert markdown == "text of scan.pdf"
+    assert uploads == [("scan.pdf", 2)]
+
+
+@pytest.mark.parametrize(
+    ("render_color", "mode"),
+    [("rgb", "RGB"), ("grayscale", "L"), ("binary", "1")],
+)
+def test_glmocr_ollama_pdf_pages_keep_their_render_mode(
+    conversion,
+    tmp_path,
+    render_color,
+    mode,
+):
+    pdf_path = tmp_path / "scan.pdf"
+    _write_text_pdf(pdf_path, 2)
+
+    images = list(
+        conversion._iter_glmocr_ollama_images(
+            str(pdf_path),
+            options=conversion.ConversionOptions(ocr_render_color=render_color),
+        )
+    )
+
+    assert [image.mode for image in images] == [mode, mode]
+
+
+@pytest.mark.parametrize(
+    ("render_color", "image_format", "mode"),
+    [
+        ("grayscale", "jpeg", "L"),
+        ("binary", "jpeg", "L"),
+        ("binary", "png", "1"),
+        ("rgb", "jpeg", "RGB"),
+    ],
+)
+def test_glmocr_ollama_uploads_pdf_pages_in_their_render_mode(
+    conversion,
+    tmp_path,
+    render_color,
+    image_format,
+    mode,
+):
+    pdf_path = tmp_path / "scan.pdf"
+    _write_text_pdf(pdf_path, 1)
+    options = conversion.ConversionOptions(
+        ocr_render_color=render_color,
+        glmocr_ollama_image_format=image_format,
+        glmocr_ollama_image_max_edge=400,
+    )
+
+    (page,) = conversion._iter_glmocr_ollama_images(str(pdf_path), options=options)
+    uploaded = _decode_ollama_upload(conversion._encode_image_for_ollama(page, options))
+
+    assert uploaded.mode == mode
+    assert max(uploaded.size) == 400
+
+
+def test_glmocr_ollama_page_cache_follows_image_encoding_settings(
+    monkeypatch,
+    conversion,
+    tmp_path,
+):
+    pdf_path = tmp_path / "scan.pdf"
+    _write_text_pdf(pdf_path, 2)
+    calls: list[int] = []
+
+    def fake_call(_image, options):
+        calls.append(options.normalized_glmocr_ollama_image_quality)
+        return "page text"
+
+    monkeypatch.setattr(conversion, "_call_glmocr_ollama", fake_call)
+    cache_dir = str(tmp_path / "ocr-pages")
+
+    def run(**encoding):
+        conversion._convert_with_glmocr_ollama(
+            str(pdf_path),
+            conversion.ConversionOptions(ocr_page_cache_dir=cache_dir, **encoding),
+        )
+
+    run()
+    run()
+    assert calls == [75, 75]
+
+    run(glmocr_ollama_image_quality=90)
+    run(glmocr_ollama_image_format="png")
+    run(glmocr_ollama_image_max_edge=1024)
+    assert calls == [75, 75, 90, 90, 75, 75, 75, 75]
@@ -0,0 +1,175 @@
+import os
+
+from markitdowngui.core import conversion
+from markitdowngui.core.conversion import (
+    ConversionAsset,
+    ConversionOptions,
+    ConversionOutcome,
+)
+from markitdowngui.core.conversion_cache import ConversionCache, options_fingerprint
+
+
+def test_conversion_cache_returns_stored_outcome_without_backend(monkeypatch, tmp_path):
+    source = tmp_path / "notes.txt"
+    source.write_text("hello", encoding="utf-8")
+    cache = ConversionCache(tmp_path / "cache")
+    calls: list[str] = []
+
+    def fake_uncached(file_path, _options, **_kwargs):
+        calls.append(file_path)
+        return ConversionOutcome(markdown="# hello", backend=conversion.BACKEND_NATIVE)
+
+    monkeypatch.setattr(conversion, "_convert_file_uncached", fake_uncached)
+
+    first = conversion.convert_file_with_details(str(source), conversion_cache=cache)
+    second = conversion.convert_file_with_details(str(source), conversion_cache=cache)
+
+    assert calls == [str(source)]
+    assert second == first
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.stores, stats.entries) == (1, 1, 1, 1)
+
+
+def test_conversion_cache_key_changes_with_content_and_output_options(tmp_path):
+    source = tmp_path / "scan.pdf"
+    source.write_bytes(b"%PDF-1.7 first")
+    cache = ConversionCache(tmp_path / "cache")
+    base_key = cache.key_for(str(source), ConversionOptions())
+
+    assert base_key == cache.key_for(
+        str(source),
+        ConversionOptions(pdf_artifacts_dir=str(tmp_path / "assets")),
+    )
+    assert base_key != cache.key_for(str(source), ConversionOptions(ocr_enabled=True))
+
+    source.write_bytes(b"%PDF-1.7 second")
+    assert base_key != cache.key_for(str(source), ConversionOptions())
+    assert cache.key_for("https://example.com/page", ConversionOptions()) is None
+
+
+def test_conversion_cache_keeps_identical_bytes_with_different_suffixes_apart(
+    monkeypatch,
+    tmp_path,
+):
+    table = tmp_path / "x.csv"
+    text = tmp_path / "x.txt"
+    table.write_text("a,b\n1,2\n", encoding="utf-8")
+    text.write_text("a,b\n1,2\n", encoding="utf-8")
+    cache = ConversionCache(tmp_path / "cache")
+
+    def fake_uncached(file_path, _options, **_kwargs):
+        return ConversionOutcome(markdown=f"converted {file_path}")
+
+    monkeypatch.setattr(conversion, "_convert_file_uncached", fake_uncached)
+
+    conversion.convert_file_with_details(str(table), conversion_cache=cache)
+    outcome = conversion.convert_file_with_details(str(text), conversion_cache=cache)
+
+    assert outcome.markdown == f"converted {text}"
+    assert cache.key_for(str(table), ConversionOptions()) != cache.key_for(
+        str(text),
+        ConversionOptions(),
+    )
+    upper = tmp_path / "copy.TXT"
+    upper.write_bytes(text.read_bytes())
+    assert cache.key_for(str(upper), ConversionOptions()) == cache.key_for(
+        str(text),
+        ConversionOptions(),
+    )
+
+
+def test_options_fingerprint_ignores_timeouts_and_asset_locations():
+    assert options_fingerprint(ConversionOptions()) == options_fingerprint(
+        ConversionOptions(
+            http_ocr_timeout_seconds=30,
+            docx_artifacts_dir="/tmp/assets",
+            http_ocr_api_key_env="OTHER_KEY",
+            reuse_tesseract_engines=False,
+            http_ocr_chunk_workers=6,
+        )
+    )
+    assert options_fingerprint(ConversionOptions()) != options_fingerprint(
+        ConversionOptions(ocr_languages="deu")
+    )
+
+
+def test_conversion_cache_restores_assets_into_artifacts_dir(tmp_path):
+    image = tmp_path / "page-1.png"
+    image.write_bytes(b"png-bytes")
+    cache = ConversionCache(tmp_path / "cache")
+    outcome = ConversionOutcome(
+        markdown="![page](page-1.png)",
+        backend=conversion.BACKEND_PDF_IMAGES,
+        assets=[
+            ConversionAsset(
+                filename="page-1.png",
+                source_path=str(image),
+                preview_markdown_path="page-1.png",
+                page_number=1,
+                kind="image",
+            )
+        ],
+    )
+
+    cache.put("ab" * 32, outcome)
+    image.unlink()
+    restored = cache.get(
+        "ab" * 32,
+        ConversionOptions(pdf_artifacts_dir=str(tmp_path / "session-assets")),
+    )
+
+    assert restored is not None
+    asset = restored.assets[0]
+    assert asset.filename == "page-1.png"
+    assert asset.page_number == 1
+    assert asset.source_path.startswith(str(tmp_path / "session-assets"))
+    with open(asset.source_path, "rb") as handle:
+        assert handle.read() == b"png-bytes"
+
+
+def test_conversion_cache_evicts_least_recently_used_entries(tmp_path):
+    cache = ConversionCache(tmp_path / "cache", max_bytes=10_000)
+    cache.put("aa" * 32, ConversionOutcome(markdown="a" * 4000))
+    cache.put("bb" * 32, ConversionOutcome(markdown="b" * 4000))
+    old_time = 1_000_000_000
+    os.utime(tmp_path / "cache" / "aa" / ("aa" * 32) / "outcome.json", (old_time, old_time))
+    os.utime(
+        tmp_path / "cache" / "bb" / ("bb" * 32) / "outcome.json",
+        (old_time + 10, old_time + 10),
+    )
+
+    assert cache.get("aa" * 32, ConversionOptions()) is not None
+    cache.put("cc" * 32, ConversionOutcome(markdown="c" * 4000))
+
+    assert cache.get("bb" * 32, ConversionOptions()) is None
+    assert cache.get("aa" * 32, ConversionOptions()) is not None
+    assert cache.stats().evictions == 1
+
+
+def test_conversion_cache_tracks_size_instead_of_rescanning_each_store(
+    monkeypatch,
+    tmp_path,
+):
+    cache = ConversionCache(tmp_path / "cache", max_bytes=40_000)
+    scans: list[None] = []
+    original_scan = ConversionCache._scan_entries
+
+    def counting_scan(self):
+        scans.append(None)
+        return original_scan(self)
+
+    monkeypatch.setattr(ConversionCache, "_scan_entries", counting_scan)
+
+    for index in range(9):
+        cache.put(f"{index:02d}" * 32, ConversionOutcome(markdown="x" * 4000))
+    assert len(scans) == 1
+
+    cache.put("ee" * 32, ConversionOutcome(markdown="e" * 4000))
+    assert len(scans) == 2
+    # Trimmed below the budget, so the next store fits without another scan.
+    cache.put("ff" * 32, ConversionOutcome(markdown="f" * 4000))
+    assert len(scans) == 2
+    tracked = cache.tracked_stats()
+    assert len(scans) == 2
+    assert tracked == cache.stats()
+    assert tracked.evictions == 2
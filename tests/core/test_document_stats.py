@@ -0,0 +1,48 @@
+from markitdowngui.core.document_stats import DocumentStats, compute_document_stats
+
+
+def test_compute_document_stats_counts_markdown_structure():
+    markdown = "\n".join(
+        [
+            "# Report",
+            "",
+            "Intro with ![chart](chart.png) and <img src='x.png'>.",
+            "",
+            "| a | b |",
+            "| --- | :---: |",
+            "| 1 | 2 |",
+            "",
+            "```",
+            "# not a heading",
+            "![not](counted.png)",
+            "```",
+            "## Summary",
+        ]
+    )
+
+    stats = compute_document_stats(markdown)
+
+    assert stats.headings == 2
+    assert stats.tables == 1
+    assert stats.images == 2
+    assert stats.lines == 13
+    assert stats.characters == len(markdown)
+    assert stats.words == len(markdown.split())
+    assert stats.pages == 0
+
+
+def test_compute_document_stats_counts_form_feed_pages():
+    stats = compute_document_stats("first page\fsecond page\fthird\nlast line\n")
+    assert stats.pages == 3
+    assert stats.lines == 2
+    assert compute_document_stats("") == DocumentStats()
+
+
+def test_document_stats_add_and_subtract_field_by_field():
+    first = DocumentStats(words=3, characters=10, lines=2, headings=1)
+    second = DocumentStats(words=2, characters=5, lines=1, images=1)
+
+    assert first + second == DocumentStats(
+        words=5, characters=15, lines=3, headings=1, images=1
+    )
+    assert (first + second) - second == first
@@ -0,0 +1,162 @@
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import threading
+
+import pytest
+
+from markitdowngui.core import http_sessions
+
+
+@pytest.fixture
+def pool():
+    session_pool = http_sessions.HttpSessionPool()
+    yield session_pool
+    session_pool.close()
+
+
+def test_session_pool_reuses_one_session_per_endpoint_origin(pool):
+    first = pool.session_for("http://localhost:11434/api/generate")
+    second = pool.session_for("HTTP://LOCALHOST:11434/api/tags")
+    other_port = pool.session_for("http://localhost:8000/ocr")
+
+    assert first is second
+    assert first is not other_port
+
+
+def test_session_pool_configures_pool_size_and_retries(pool):
+    session = pool.session_for("https://example.com/ocr", pool_size=12, max_retries=3)
+    adapter = session.get_adapter("https://example.com/ocr")
+
+    assert adapter._pool_maxsize == 12
+    assert adapter.max_retries.total == 3
+    assert adapter.max_retries.read == 0
+    assert 429 in adapter.max_retries.status_forcelist
+    assert 503 in adapter.max_retries.status_forcelist
+    assert adapter.max_retries.raise_on_status is False
+    assert pool.session_for("https://example.com/ocr", pool_size=12, max_retries=0) is not session
+
+
+def test_retry_after_is_capped():
+    retry = http_sessions._capped_retry_class()(total=1)
+    response = type("Response", (), {"headers": {"Retry-After": "86400"}})()
+
+    assert retry.get_retry_after(response) == http_sessions.HTTP_RETRY_AFTER_MAX_SECONDS
+
+
+def test_pooled_session_retries_unavailable_responses_and_keeps_connection(pool):
+    statuses = [503, 200]
+    client_ports: set[int] = set()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):
+            self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            client_ports.add(self.client_address[1])
+            status = statuses.pop(0) if statuses else 200
+            body = b"ok" if status == 200 else b"busy"
+            self.send_response(status)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *_args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/ocr"
+    try:
+        session = pool.session_for(url, max_retries=2)
+        first = session.post(url, json={"page": 1}, timeout=5)
+        second = session.post(url, json={"page": 2}, timeout=5)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert first.status_code == 200
+    assert second.text == "ok"
+    assert len(client_ports) == 1
+
+
+def _parse_multipart(body, content_type):
+    from email.parser import BytesParser
+    from email.policy import HTTP
+
+    message = BytesParser(policy=HTTP).parsebytes(
+        f"Content-Type: {content_type}\r\n\r\n".encode("ascii") + body
+    )
+    return {
+        part.get_param("name", header="content-disposition"): (
+            part.get_filename(),
+            part.get_content_type(),
+            part.get_payload(decode=True),
+        )
+        for part in message.iter_parts()
+    }
+
+
+def test_multipart_file_upload_streams_a_valid_form_body(tmp_path):
+    scan = tmp_path / "scan.pdf"
+    scan.write_bytes(b"%PDF-1.7 " + bytes(range(256)) * 64)
+
+    with http_sessions.MultipartFileUpload(
+        scan,
+        fields={"model": "surya"},
+        file_name='report "final".pdf',
+        content_type="application/pdf",
+    ) as upload:
+        blocks = list(upload)
+        body = b"".join(blocks)
+        assert len(upload) == len(body)
+        assert upload.tell() == len(body)
+        upload.seek(0)
+        assert upload.read(10) == body[:10]
+        assert upload.read() == body[10:]
+
+    parts = _parse_multipart(body, upload.content_type)
+    assert parts["model"][2] == b"surya"
+    assert parts["file"] == ('report %22final%22.pdf', "application/pdf", scan.read_bytes())
+
+
+def test_multipart_file_upload_is_rewound_when_a_request_is_retried(pool, tmp_path):
+    scan = tmp_path / "scan.pdf"
+    scan.write_bytes(b"page data " * 50_000)
+    statuses = [503, 200]
+    received: list[tuple[str | None, bytes]] = []
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):
+            length = self.headers.get("Content-Length")
+            received.append((length, self.rfile.read(int(length or 0))))
+            status = statuses.pop(0) if statuses else 200
+            self.send_response(status)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, *_args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/ocr"
+    try:
+        with http_sessions.MultipartFileUpload(scan) as upload:
+            response = pool.session_for(url, max_retries=1).post(
+                url,
+                data=upload,
+                headers={"Content-Type": upload.content_type},
+                timeout=5,
+            )
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert response.status_code == 200
+    assert len(received) == 2
+    assert received[0] == received[1]
+    assert int(received[1][0]) == len(received[1][1])
+    assert scan.read_bytes() in received[1][1]
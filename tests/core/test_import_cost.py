@@ -0,0 +1,52 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+
+# Backends and toolkits that must only load when a conversion actually needs them.
+HEAVY_MODULES = (
+    "PySide6",
+    "requests",
+    "urllib3",
+    "markitdown",
+    "pypdfium2",
+    "PIL",
+    "pdf_inspector",
+    "glmocr",
+    "anydoc",
+    "pytesseract",
+    "azure",
+    "bs4",
+)
+
+
+def _loaded_heavy_modules(module_name: str) -> list[str]:
+    script = (
+        "import importlib, json, sys\n"
+        f"importlib.import_module({module_name!r})\n"
+        f"heavy = {HEAVY_MODULES!r}\n"
+        "print(json.dumps(sorted({name.split('.')[0] for name in sys.modules}"
+        " & set(heavy))))\n"
+    )
+    completed = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        text=True,
+        check=True,
+        timeout=60,
+    )
+    return json.loads(completed.stdout)
+
+
+@pytest.mark.parametrize(
+    "module_name",
+    [
+        "markitdowngui.core.conversion",
+        "markitdowngui.core.conversion_cache",
+        "markitdowngui.cli",
+    ],
+)
+def test_conversion_core_imports_without_qt_or_backends(module_name):
+    assert _loaded_heavy_modules(module_name) == []
@@ -1,15 +1,23 @@
 from dataclasses import dataclass
 import os
 import stat
+import time
+import tracemalloc
 
 import pytest
 
+from markitdowngui.core import markdown_assets
+from markitdowngui.core.file_utils import FileManager
 from markitdowngui.core.markdown_assets import (
     MarkdownSaveInput,
+    ResultSaveInput,
     cleanup_temp_asset_root,
     create_temp_asset_root,
     prepare_combined_markdown_for_save,
+    prepare_combined_markdown_for_save_transaction,
+    prepare_combined_markdown_stream_for_save_transaction,
     prepare_markdown_for_separate_save,
+    prepare_markdown_for_separate_save_transaction,
     rewrite_markdown_for_preview,
 )
 
@@ -380,3 +388,263 @@ def test_temp_asset_root_creation_and_cleanup():
     cleanup_temp_asset_root(asset_root)
 
     assert not asset_root.exists()
+
+
+def test_separate_save_hardlinks_assets_on_the_same_filesystem(monkeypatch, tmp_path):
+    monkeypatch.setattr(markdown_assets, "_try_reflink", lambda _source, _destination: False)
+    monkeypatch.setattr(markdown_assets.tempfile, "tempdir", str(tmp_path))
+    asset_root = create_temp_asset_root()
+    asset_path = asset_root / "page-1.png"
+    asset_path.write_bytes(b"png-bytes")
+
+    try:
+        prepared = prepare_markdown_for_separate_save_transaction(
+            "![page](tmp/page-1.png)",
+            [_FakeAsset("page-1.png", str(asset_path), "tmp/page-1.png")],
+            tmp_path / "report.md",
+        )
+        prepared.commit_assets()
+        prepared.finalize_assets()
+    finally:
+        saved_inode = asset_path.stat().st_ino
+        cleanup_temp_asset_root(asset_root)
+
+    saved_asset = tmp_path / "report_assets" / "page-1.png"
+    assert saved_asset.stat().st_ino == saved_inode
+    assert prepared.asset_transfer.hardlinked == 1
+    assert prepared.asset_transfer.bytes_avoided == len(b"png-bytes")
+    assert prepared.asset_transfer.copied_bytes == 0
+
+
+def test_separate_save_copies_assets_outside_the_temp_asset_root(monkeypatch, tmp_path):
+    monkeypatch.setattr(markdown_assets, "_try_reflink", lambda _source, _destination: False)
+    asset_path = tmp_path / "pictures" / "photo.png"
+    asset_path.parent.mkdir(parents=True)
+    asset_path.write_bytes(b"png-bytes")
+
+    prepared = prepare_markdown_for_separate_save_transaction(
+        "![photo](tmp/photo.png)",
+        [_FakeAsset("photo.png", str(asset_path), "tmp/photo.png")],
+        tmp_path / "report.md",
+    )
+    prepared.commit_assets()
+    prepared.finalize_assets()
+    asset_path.write_bytes(b"edited")
+
+    saved_asset = tmp_path / "report_assets" / "photo.png"
+    assert saved_asset.read_bytes() == b"png-bytes"
+    assert prepared.asset_transfer.hardlinked == 0
+    assert prepared.asset_transfer.copied == 1
+
+
+def test_combined_save_copies_assets_in_parallel_when_links_fail(monkeypatch, tmp_path):
+    def refuse_link(_source, _destination):
+        raise OSError("Invalid cross-device link")
+
+    monkeypatch.setattr(markdown_assets, "_try_reflink", lambda _source, _destination: False)
+    monkeypatch.setattr(markdown_assets.os, "link", refuse_link)
+    assets = []
+    for index in range(6):
+        asset_path = tmp_path / "temp-assets" / f"image-{index}.png"
+        asset_path.parent.mkdir(parents=True, exist_ok=True)
+        asset_path.write_bytes(b"x" * (index + 1))
+        assets.append(_FakeAsset(asset_path.name, str(asset_path), f"tmp/{asset_path.name}"))
+
+    prepared = prepare_combined_markdown_for_save_transaction(
+        [MarkdownSaveInput("report.pdf", "![](tmp/image-5.png)", assets)],
+        tmp_path / "all.md",
+        source_heading_template="## {source}",
+    )
+    prepared.commit_assets()
+    prepared.finalize_assets()
+
+    copied = tmp_path / "all_assets" / "001_report" / "image-5.png"
+    assert copied.read_bytes() == b"x" * 6
+    assert copied.stat().st_ino != (tmp_path / "temp-assets" / "image-5.png").stat().st_ino
+    assert "all_assets/001_report/image-5.png" in prepared.markdown
+    assert (prepared.asset_transfer.copied, prepared.asset_transfer.copied_bytes) == (6, 21)
+    assert prepared.asset_transfer.bytes_avoided == 0
+
+
+class _GeneratedResult:
+    """Produces its Markdown on every read, like a spilled result body."""
+
+    def __init__(self, index: int, size: int, assets=()):
+        self.index = index
+        self.size = size
+        self.assets = list(assets)
+        self.reads = 0
+
+    @property
+    def markdown(self) -> str:
+        self.reads += 1
+        body = f"# Document {self.index}\n\n"
+        return body + "x" * (self.size - len(body))
+
+
+def test_streamed_combined_save_stages_assets_and_reads_bodies_one_document_at_a_time(
+    tmp_path,
+):
+    asset_paths = []
+    for index in range(2):
+        asset_path = tmp_path / "temp" / f"page-{index}.png"
+        asset_path.parent.mkdir(exist_ok=True)
+        asset_path.write_bytes(b"png")
+        asset_paths.append(asset_path)
+    results = [
+        _GeneratedResult(
+            index,
+            64,
+            [_FakeAsset("page.png", str(asset_paths[index]), f"tmp/page-{index}.png")],
+        )
+        for index in range(2)
+    ]
+    documents = [ResultSaveInput(f"doc-{index}.pdf", result) for index, result in enumerate(results)]
+
+    prepared, chunks = prepare_combined_markdown_stream_for_save_transaction(
+        documents,
+        tmp_path / "all.md",
+        source_heading_template="## {source}",
+    )
+    assert next(chunks) == "## doc-0.pdf\n"
+    assert next(chunks).startswith("# Document 0")
+    assert [result.reads for result in results] == [1, 0]
+    assert list(prepared.staging_root.rglob("*.png")) == [
+        prepared.staging_root / "001_doc-0" / "page.png"
+    ]
+    streamed = "## doc-0.pdf\n" + results[0].markdown + "".join(chunks)
+
+    expected = prepare_combined_markdown_for_save_transaction(
+        [
+            MarkdownSaveInput(document.source, document.markdown, document.assets)
+            for document in documents
+        ],
+        tmp_path / "other.md",
+        source_heading_template="## {source}",
+    )
+    assert streamed == expected.markdown
+    assert (prepared.staging_root / ".markitdowngui-assets.json").is_file()
+    prepared.rollback_assets()
+    expected.rollback_assets()
+
+
+def test_streamed_combined_save_keeps_memory_near_one_document(tmp_path):
+    document_size = 256 * 1024
+    documents = [
+        ResultSaveInput(f"doc-{index}.pdf", _GeneratedResult(index, document_size))
+        for index in range(40)
+    ]
+    output_path = tmp_path / "all.md"
+
+    tracemalloc.start()
+    try:
+        prepared, chunks = prepare_combined_markdown_stream_for_save_transaction(
+            documents,
+            output_path,
+            source_heading_template="## {source}",
+        )
+        FileManager.stage_markdown_chunks(str(output_path), chunks).commit()
+        _current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    prepared.commit_assets()
+    prepared.finalize_assets()
+
+    assert output_path.stat().st_size > 40 * document_size
+    # The corpus is 10 MB; a joined string would need at least that much.
+    assert peak < 4 * document_size
+
+
+def test_streamed_combined_save_rolls_back_when_a_document_fails(tmp_path):
+    asset_path = tmp_path / "temp" / "page.png"
+    asset_path.parent.mkdir()
+    asset_path.write_bytes(b"png")
+    output_path = tmp_path / "all.md"
+    output_path.write_text("previous", encoding="utf-8")
+
+    class _BrokenResult:
+        assets = ()
+
+        @property
+        def markdown(self) -> str:
+            raise OSError("spill file missing")
+
+    prepared, chunks = prepare_combined_markdown_stream_for_save_transaction(
+        [
+            MarkdownSaveInput(
+                "ok.pdf",
+                "![](tmp/page.png)",
+                [_FakeAsset("page.png", str(asset_path), "tmp/page.png")],
+            ),
+            ResultSaveInput("broken.pdf", _BrokenResult()),
+        ],
+        output_path,
+        source_heading_template="## {source}",
+    )
+    with pytest.raises(OSError, match="spill file missing"):
+        FileManager.stage_markdown_chunks(str(output_path), chunks)
+    prepared.rollback_assets()
+
+    assert output_path.read_text(encoding="utf-8") == "previous"
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["all.md", "temp"]
+
+
+def test_replace_markdown_paths_prefers_longest_match_and_does_not_rescan():
+    markdown = "![a](img/p1.png) ![b](img/p1.png.bak) ![c](img/p10.png)"
+
+    rewritten = markdown_assets._replace_markdown_paths(
+        markdown,
+        {
+            "img/p1.png": "out/img/p1.png",
+            "img/p1.png.bak": "out/p1-backup.png",
+            "img/p10.png": "img/p1.png",
+        },
+    )
+
+    assert rewritten == (
+        "![a](out/img/p1.png) ![b](out/p1-backup.png) ![c](img/p1.png)"
+    )
+
+
+def test_replace_markdown_paths_escapes_regex_characters():
+    rewritten = markdown_assets._replace_markdown_paths(
+        "![x](C:\\run\\page (1).png) ![y](a+b.png)",
+        {"C:\\run\\page (1).png": "assets/page_1.png", "a+b.png": "assets/ab.png"},
+    )
+
+    assert rewritten == "![x](assets/page_1.png) ![y](assets/ab.png)"
+
+
+def test_replace_markdown_paths_benchmark_on_image_heavy_document():
+    replacements = {
+        f"/tmp/run/report/page_{index // 10}_image_{index}.png": (
+            f"report_assets/page_{index // 10}_image_{index}.png"
+        )
+        for index in range(400)
+    }
+    markdown = "".join(
+        f"Paragraph {index} " + "lorem ipsum dolor sit amet " * 40
+        + f"\n\n![]({old_path})\n\n"
+        for index, old_path in enumerate(replacements)
+    )
+
+    def replace_one_by_one(text: str) -> str:
+        for old_path, new_path in sorted(
+            replacements.items(),
+            key=lambda item: len(item[0]),
+            reverse=True,
+        ):
+            text = text.replace(old_path, new_path)
+        return text
+
+    started = time.perf_counter()
+    expected = replace_one_by_one(markdown)
+    one_by_one_seconds = time.perf_counter() - started
+    markdown_assets._replace_markdown_paths(markdown, replacements)
+    started = time.perf_counter()
+    rewritten = markdown_assets._replace_markdown_paths(markdown, replacements)
+    single_pass_seconds = time.perf_counter() - started
+
+    assert rewritten == expected
+    # Typically around 80x faster; the margin keeps slow CI machines green.
+    assert single_pass_seconds < one_by_one_seconds / 2
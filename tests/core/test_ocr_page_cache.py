@@ -0,0 +1,53 @@
+import os
+
+from markitdowngui.core.ocr_page_cache import OcrPageCache
+
+
+def _page_key(page_index, **overrides):
+    values = {"render_scale": 2.0, "provider": "glmocr:ollama", "model": "glm-ocr"}
+    values.update(overrides)
+    return OcrPageCache.page_key("doc-hash", page_index, **values)
+
+
+def test_ocr_page_key_covers_page_scale_provider_and_model():
+    base = _page_key(0)
+
+    assert base == _page_key(0)
+    assert base != _page_key(1)
+    assert base != _page_key(0, render_scale=1.5)
+    assert base != _page_key(0, provider="azure-tesseract")
+    assert base != _page_key(0, model="other-model")
+    assert base != _page_key(0, render_mode="adaptive:16mp:grayscale")
+    assert base != OcrPageCache.page_key(
+        "other-hash",
+        0,
+        render_scale=2.0,
+        provider="glmocr:ollama",
+        model="glm-ocr",
+    )
+
+
+def test_ocr_page_cache_round_trips_text_including_blank_pages(tmp_path):
+    cache = OcrPageCache(tmp_path / "pages")
+
+    assert cache.get(_page_key(0)) is None
+    cache.put(_page_key(0), "first page")
+    cache.put(_page_key(1), "")
+
+    assert cache.get(_page_key(0)) == "first page"
+    assert cache.get(_page_key(1)) == ""
+
+    cache.clear()
+    assert cache.get(_page_key(0)) is None
+
+
+def test_ocr_page_cache_evicts_least_recently_used_pages(tmp_path):
+    cache = OcrPageCache(tmp_path / "pages", max_bytes=2500)
+    for page_index, text in enumerate(["a" * 1000, "b" * 1000, "c" * 1000]):
+        cache.put(_page_key(page_index), text)
+        entry = tmp_path / "pages" / _page_key(page_index)[:2] / f"{_page_key(page_index)}.txt"
+        os.utime(entry, (1_000_000_000 + page_index, 1_000_000_000 + page_index))
+
+    assert cache.evict() == 1
+    assert cache.get(_page_key(0)) is None
+    assert cache.get(_page_key(2)) == "c" * 1000
@@ -0,0 +1,43 @@
+from markitdowngui.core.conversion import ConversionOutcome
+from markitdowngui.core.result_store import ResultStore, StoredOutcome
+
+
+def test_result_store_spills_oldest_bodies_beyond_the_memory_budget():
+    store = ResultStore(memory_budget_bytes=10)
+    first = store.put("aaaaaa")
+    second = store.put("bbbbbb")
+
+    assert store.spilled_count == 1
+    assert store.memory_chars == 6
+    assert store.get(first) == "aaaaaa"
+    assert store.get(second) == "bbbbbb"
+
+    store.clear()
+
+    assert store.memory_chars == 0
+    assert store.spilled_count == 0
+
+
+def test_result_store_writes_oversized_bodies_straight_to_disk():
+    store = ResultStore(memory_budget_bytes=4)
+    key = store.put("too large for memory")
+
+    assert store.memory_chars == 0
+    assert store.get(key) == "too large for memory"
+    assert store.memory_chars == 0
+
+    store.discard(key)
+
+    assert store.spilled_count == 0
+    store.clear()
+
+
+def test_stored_outcome_reads_markdown_through_the_store():
+    store = ResultStore(memory_budget_bytes=0)
+    outcome = store.stash(ConversionOutcome("# Spilled", backend="pdf-inspector"))
+
+    assert isinstance(outcome, StoredOutcome)
+    assert outcome.backend == "pdf-inspector"
+    assert outcome.markdown == "# Spilled"
+    assert store.stash(outcome) is outcome
+    store.clear()
@@ -0,0 +1,166 @@
+from dataclasses import dataclass, field
+from pathlib import Path
+import threading
+
+from markitdowngui.core import separate_save
+from markitdowngui.core.conversion import ConversionOutcome
+from markitdowngui.core.separate_save import SeparateSaveJob, run_separate_saves
+
+
+@dataclass(frozen=True)
+class _FakeAsset:
+    filename: str
+    source_path: str | None
+    preview_markdown_path: str
+
+
+@dataclass(frozen=True)
+class _FakeResult:
+    markdown: str
+    assets: list[_FakeAsset] = field(default_factory=list)
+
+
+def _jobs(tmp_path, count):
+    return [
+        SeparateSaveJob(
+            f"C:/docs/report-{index}.pdf",
+            str(tmp_path / f"report-{index}.md"),
+            ConversionOutcome(f"# Report {index}", backend="native"),
+        )
+        for index in range(count)
+    ]
+
+
+def test_run_separate_saves_writes_every_output_and_reports_on_caller_thread(tmp_path):
+    reported: list[tuple[str, int]] = []
+
+    summary = run_separate_saves(
+        _jobs(tmp_path, 12),
+        max_workers=4,
+        on_saved=lambda result: reported.append((result.source, threading.get_ident())),
+    )
+
+    assert len(summary.saved) == 12
+    assert summary.failed == []
+    assert summary.cancelled is False
+    assert {thread_id for _source, thread_id in reported} == {threading.get_ident()}
+    assert (tmp_path / "report-7.md").read_text(encoding="utf-8") == "# Report 7"
+
+
+def test_run_separate_saves_isolates_failures_and_keeps_asset_transfer_stats(tmp_path):
+    asset_path = tmp_path / "temp" / "page-1.png"
+    asset_path.parent.mkdir()
+    asset_path.write_bytes(b"png")
+    jobs = [
+        SeparateSaveJob(
+            "with-asset.pdf",
+            str(tmp_path / "with-asset.md"),
+            _FakeResult(
+                "![](tmp/page-1.png)",
+                [_FakeAsset("page-1.png", str(asset_path), "tmp/page-1.png")],
+            ),
+        ),
+        SeparateSaveJob(
+            "missing-asset.pdf",
+            str(tmp_path / "missing-asset.md"),
+            _FakeResult(
+                "![](tmp/gone.png)",
+                [_FakeAsset("gone.png", str(tmp_path / "gone.png"), "tmp/gone.png")],
+            ),
+        ),
+    ]
+
+    summary = run_separate_saves(jobs, max_workers=2)
+
+    assert [result.source for result in summary.saved] == ["with-asset.pdf"]
+    assert [result.source for result in summary.failed] == ["missing-asset.pdf"]
+    assert "Missing asset file" in summary.failed[0].error
+    assert not (tmp_path / "missing-asset.md").exists()
+    assert summary.asset_transfer.files == 1
+    assert (tmp_path / "with-asset_assets" / "page-1.png").read_bytes() == b"png"
+
+
+def test_run_separate_saves_skips_jobs_after_cancel(tmp_path):
+    checks: list[None] = []
+
+    def cancel_after_three_jobs() -> bool:
+        checks.append(None)
+        return len(checks) > 3
+
+    summary = run_separate_saves(
+        _jobs(tmp_path, 20),
+        max_workers=1,
+        is_cancelled=cancel_after_three_jobs,
+    )
+
+    assert summary.cancelled is True
+    assert len(summary.results) == 3
+    assert len(list(tmp_path.glob("*.md"))) == 3
+
+
+def test_grouped_durability_syncs_files_before_commit_and_directories_once(
+    monkeypatch,
+    tmp_path,
+):
+    events: list[tuple[str, str]] = []
+    lock = threading.Lock()
+    original_sync_file = separate_save._sync_file
+
+    def record_file_sync(path):
+        with lock:
+            events.append(("file", path.name))
+        original_sync_file(path)
+
+    def record_directory_sync(path):
+        with lock:
+            events.append(("directory", str(path)))
+
+    original_save = separate_save.save_prepared_markdown
+
+    def record_commit(output_path, prepared, chunks=None, **kwargs):
+        with lock:
+            events.append(("commit", Path(output_path).name))
+        original_save(output_path, prepared, chunks, **kwargs)
+
+    monkeypatch.setattr(separate_save, "_sync_file", record_file_sync)
+    monkeypatch.setattr(separate_save, "save_prepared_markdown", record_commit)
+    monkeypatch.setattr(separate_save, "_sync_directory", record_directory_sync)
+    monkeypatch.setattr(separate_save, "DURABILITY_GROUP_SIZE", 4)
+
+    summary = run_separate_saves(
+        _jobs(tmp_path, 6),
+        max_workers=3,
+        grouped_durability=True,
+    )
+
+    assert len(summary.saved) == 6
+    file_syncs = [name for kind, name in events if kind == "file"]
+    assert len(file_syncs) == 6
+    assert all(name.startswith(".markitdowngui-") for name in file_syncs)
+    # Each group flushes all of its staged files before committing any of them.
+    kinds = [kind for kind, _name in events]
+    assert kinds == (["file"] * 4 + ["commit"] * 4 + ["directory"]) + (
+        ["file"] * 2 + ["commit"] * 2 + ["directory"]
+    )
+    # Two groups, each syncing the shared output directory once.
+    assert [name for kind, name in events if kind == "directory"] == [str(tmp_path)] * 2
+    assert (tmp_path / "report-5.md").read_text(encoding="utf-8") == "# Report 5"
+
+
+def test_grouped_durability_keeps_previous_output_when_sync_fails(monkeypatch, tmp_path):
+    output_path = tmp_path / "report-0.md"
+    output_path.write_text("previous", encoding="utf-8")
+
+    def fail_sync(_path):
+        raise OSError("I/O error")
+
+    monkeypatch.setattr(separate_save, "_sync_file", fail_sync)
+
+    summary = run_separate_saves(
+        [SeparateSaveJob("report.pdf", str(output_path), ConversionOutcome("# New"))],
+        grouped_durability=True,
+    )
+
+    assert summary.failed[0].error == "I/O error"
+    assert output_path.read_text(encoding="utf-8") == "previous"
+    assert [path.name for path in tmp_path.iterdir()] == ["report-0.md"]
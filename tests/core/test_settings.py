@@ -101,6 +101,10 @@ def test_output_defaults(settings_manager, tmp_path):
     settings_manager.set_save_to_source_folder(True)
     assert settings_manager.get_save_to_source_folder()
 
+    assert settings_manager.get_grouped_save_durability() is False
+    settings_manager.set_grouped_save_durability(True)
+    assert settings_manager.get_grouped_save_durability() is True
+
 def test_batch_size(settings_manager):
     """Test batch size bounds and persistence."""
     assert settings_manager.get_batch_size() == 3
@@ -111,6 +115,12 @@ def test_batch_size(settings_manager):
     settings_manager.set_batch_size(99)
     assert settings_manager.get_batch_size() == 10
 
+def test_process_pool_conversion(settings_manager):
+    """Test the opt-in process-pool conversion preference."""
+    assert settings_manager.get_process_pool_conversion() is False
+    settings_manager.set_process_pool_conversion(True)
+    assert settings_manager.get_process_pool_conversion() is True
+
 def test_ocr_settings(settings_manager):
     """Test OCR-related settings and persistence."""
     assert not settings_manager.get_ocr_enabled()
@@ -121,6 +131,10 @@ def test_ocr_settings(settings_manager):
     settings_manager.set_fast_pdf_conversion(True)
     assert settings_manager.get_fast_pdf_conversion()
 
+    assert not settings_manager.get_hybrid_pdf_ocr()
+    settings_manager.set_hybrid_pdf_ocr(True)
+    assert settings_manager.get_hybrid_pdf_ocr()
+
     assert not settings_manager.get_anydoc_enabled()
     settings_manager.set_anydoc_enabled(True)
     assert settings_manager.get_anydoc_enabled()
@@ -172,6 +186,24 @@ def test_ocr_settings(settings_manager):
     settings_manager.set_glmocr_ollama_model(" custom-ollama-model ")
     assert settings_manager.get_glmocr_ollama_model() == "custom-ollama-model"
 
+    assert settings_manager.get_glmocr_ollama_concurrency() == 1
+    settings_manager.set_glmocr_ollama_concurrency(4)
+    assert settings_manager.get_glmocr_ollama_concurrency() == 4
+    settings_manager.set_glmocr_ollama_concurrency(0)
+    assert settings_manager.get_glmocr_ollama_concurrency() == 1
+
+    assert settings_manager.get_glmocr_ollama_image_format() == "jpeg"
+    settings_manager.set_glmocr_ollama_image_format(" WebP ")
+    assert settings_manager.get_glmocr_ollama_image_format() == "webp"
+    settings_manager.set_glmocr_ollama_image_format("gif")
+    assert settings_manager.get_glmocr_ollama_image_format() == "jpeg"
+    assert settings_manager.get_glmocr_ollama_image_quality() == 75
+    settings_manager.set_glmocr_ollama_image_quality(150)
+    assert settings_manager.get_glmocr_ollama_image_quality() == 100
+    assert settings_manager.get_glmocr_ollama_image_max_edge() == 0
+    settings_manager.set_glmocr_ollama_image_max_edge(2048)
+    assert settings_manager.get_glmocr_ollama_image_max_edge() == 2048
+
     assert settings_manager.get_glmocr_sdk_server_url() == "http://127.0.0.1:5002/glmocr/parse"
     settings_manager.set_glmocr_sdk_server_url(" http://localhost:5002/glmocr/parse ")
     assert settings_manager.get_glmocr_sdk_server_url() == "http://localhost:5002/glmocr/parse"
@@ -197,6 +229,15 @@ def test_ocr_settings(settings_manager):
     settings_manager.set_http_ocr_timeout_seconds(9999)
     assert settings_manager.get_http_ocr_timeout_seconds() == 3600
 
+    assert settings_manager.get_http_ocr_chunk_pages() == 0
+    settings_manager.set_http_ocr_chunk_pages(5000)
+    assert settings_manager.get_http_ocr_chunk_pages() == 1000
+    settings_manager.set_http_ocr_chunk_pages(-3)
+    assert settings_manager.get_http_ocr_chunk_pages() == 0
+    assert settings_manager.get_http_ocr_chunk_workers() == 2
+    settings_manager.set_http_ocr_chunk_workers(0)
+    assert settings_manager.get_http_ocr_chunk_workers() == 1
+
     assert settings_manager.get_docintel_endpoint() == ""
     settings_manager.set_docintel_endpoint(" https://example.cognitiveservices.azure.com/ ")
     assert settings_manager.get_docintel_endpoint() == "https://example.cognitiveservices.azure.com/"
@@ -205,6 +246,39 @@ def test_ocr_settings(settings_manager):
     settings_manager.set_ocr_languages(" eng+deu ")
     assert settings_manager.get_ocr_languages() == "eng+deu"
 
+    assert 1 <= settings_manager.get_ocr_page_workers() <= 4
+    settings_manager.set_ocr_page_workers(6)
+    assert settings_manager.get_ocr_page_workers() == 6
+    settings_manager.set_ocr_page_workers(99)
+    assert settings_manager.get_ocr_page_workers() == 16
+
+    assert settings_manager.get_ocr_render_ahead() == 2
+    settings_manager.set_ocr_render_ahead(0)
+    assert settings_manager.get_ocr_render_ahead() == 0
+    settings_manager.set_ocr_render_ahead(99)
+    assert settings_manager.get_ocr_render_ahead() == 16
+
+    assert settings_manager.get_ocr_render_max_megapixels() == 16
+    settings_manager.set_ocr_render_max_megapixels(500)
+    assert settings_manager.get_ocr_render_max_megapixels() == 100
+    assert settings_manager.get_ocr_render_color() == "rgb"
+    settings_manager.set_ocr_render_color(" Grayscale ")
+    assert settings_manager.get_ocr_render_color() == "grayscale"
+    settings_manager.set_ocr_render_color("sepia")
+    assert settings_manager.get_ocr_render_color() == "rgb"
+
+    assert settings_manager.get_ocr_page_cache_enabled()
+    settings_manager.set_ocr_page_cache_enabled(False)
+    assert not settings_manager.get_ocr_page_cache_enabled()
+
+    assert settings_manager.get_result_memory_budget_mb() == 256
+    settings_manager.set_result_memory_budget_mb(1)
+    assert settings_manager.get_result_memory_budget_mb() == 16
+
     assert settings_manager.get_tesseract_path() == ""
     settings_manager.set_tesseract_path(" /usr/bin/tesseract ")
     assert settings_manager.get_tesseract_path() == "/usr/bin/tesseract"
+
+    assert settings_manager.get_tesseract_engine_reuse()
+    settings_manager.set_tesseract_engine_reuse(False)
+    assert not settings_manager.get_tesseract_engine_reuse()
@@ -0,0 +1,160 @@
+import shutil
+import sys
+import threading
+import time
+import types
+
+import pytest
+
+from markitdowngui.core import tesseract_engine
+
+
+class _FakeTessBaseAPI:
+    instances: list["_FakeTessBaseAPI"] = []
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+        self.image = None
+        self.ended = False
+        _FakeTessBaseAPI.instances.append(self)
+
+    def SetImage(self, image):
+        if image == "broken":
+            raise RuntimeError("bad image")
+        self.image = image
+
+    def Recognize(self, timeout=0):
+        self.timeout = timeout
+        return self.image != "stuck"
+
+    def GetUTF8Text(self):
+        return f"  text of {self.image}\n"
+
+    def End(self):
+        self.ended = True
+
+
+@pytest.fixture
+def fake_tesserocr(monkeypatch):
+    _FakeTessBaseAPI.instances = []
+    module = types.SimpleNamespace(PyTessBaseAPI=_FakeTessBaseAPI)
+    monkeypatch.setitem(sys.modules, "tesserocr", module)
+    return module
+
+
+def test_engine_pool_reuses_one_engine_per_language_across_images(fake_tesserocr):
+    pool = tesseract_engine.TesseractEnginePool()
+
+    texts = [pool.recognize(f"page-{index}", lang="eng+deu") for index in range(5)]
+    pool.recognize("other", lang="fra", tessdata_dir="/opt/tessdata")
+
+    assert texts[3] == "text of page-3"
+    assert pool.created_count == 2
+    assert [engine.kwargs for engine in _FakeTessBaseAPI.instances] == [
+        {"lang": "eng+deu"},
+        {"lang": "fra", "path": "/opt/tessdata"},
+    ]
+    pool.close()
+    assert all(engine.ended for engine in _FakeTessBaseAPI.instances)
+
+
+def test_engine_pool_gives_concurrent_threads_their_own_engines(fake_tesserocr):
+    pool = tesseract_engine.TesseractEnginePool()
+    barrier = threading.Barrier(3)
+    seen: list[object] = []
+
+    def hold_engine():
+        with pool.engine(lang="eng") as engine:
+            seen.append(engine)
+            barrier.wait(timeout=5)
+
+    threads = [threading.Thread(target=hold_engine) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    pool.recognize("next page", lang="eng")
+
+    assert len({id(engine) for engine in seen}) == 3
+    assert pool.created_count == 3
+
+
+def test_engine_pool_drops_failed_engines_and_caps_idle_ones(fake_tesserocr):
+    pool = tesseract_engine.TesseractEnginePool(max_idle=1)
+
+    with pytest.raises(RuntimeError, match="bad image"):
+        pool.recognize("broken", lang="eng")
+    assert _FakeTessBaseAPI.instances[0].ended is True
+
+    with pool.engine(lang="eng") as first, pool.engine(lang="eng") as second:
+        pass
+
+    # The inner engine is parked first, so the outer one finds the pool full.
+    assert second.ended is False
+    assert first.ended is True
+
+
+def test_engine_pool_cancels_recognition_at_the_timeout(fake_tesserocr):
+    pool = tesseract_engine.TesseractEnginePool()
+
+    assert pool.recognize("page", lang="eng", timeout_seconds=2.5) == "text of page"
+    assert _FakeTessBaseAPI.instances[0].timeout == 2500
+
+    with pytest.raises(RuntimeError, match="timed out after 2.5 seconds"):
+        pool.recognize("stuck", lang="eng", timeout_seconds=2.5)
+    # An engine whose recognition was cancelled is not parked for reuse.
+    assert _FakeTessBaseAPI.instances[0].ended is True
+    pool.recognize("next", lang="eng")
+    assert pool.created_count == 2
+    assert _FakeTessBaseAPI.instances[1].timeout == 0
+
+
+def test_tessdata_dir_for_uses_models_installed_beside_the_executable(tmp_path):
+    executable = tmp_path / "Tesseract-OCR" / "tesseract.exe"
+    (executable.parent / "tessdata").mkdir(parents=True)
+
+    assert tesseract_engine.tessdata_dir_for(str(executable)) == str(
+        executable.parent / "tessdata"
+    )
+    assert tesseract_engine.tessdata_dir_for(str(tmp_path / "tesseract")) == ""
+    assert tesseract_engine.tessdata_dir_for("") == ""
+
+
+def test_tesserocr_available_reflects_import(monkeypatch, fake_tesserocr):
+    assert tesseract_engine.tesserocr_available() is True
+
+    monkeypatch.setitem(sys.modules, "tesserocr", None)
+
+    assert tesseract_engine.tesserocr_available() is False
+
+
+@pytest.mark.skipif(
+    not tesseract_engine.tesserocr_available() or shutil.which("tesseract") is None,
+    reason="needs tesserocr and the tesseract executable",
+)
+def test_engine_reuse_benchmark_against_pytesseract_subprocesses():
+    pytesseract = pytest.importorskip("pytesseract")
+    from PIL import Image, ImageDraw
+
+    image = Image.new("RGB", (800, 200), "white")
+    ImageDraw.Draw(image).text((20, 80), "The quick brown fox 12345", fill="black")
+    pages = 20
+    pool = tesseract_engine.TesseractEnginePool()
+
+    started = time.perf_counter()
+    for _ in range(pages):
+        pytesseract.image_to_string(image, lang="eng")
+    subprocess_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for _ in range(pages):
+        pool.recognize(image, lang="eng")
+    reused_seconds = time.perf_counter() - started
+    pool.close()
+
+    print(
+        f"{pages} pages: pytesseract {subprocess_seconds:.2f}s, "
+        f"reused engine {reused_seconds:.2f}s"
+    )
+    assert pool.created_count == 1
+    assert reused_seconds < subprocess_seconds
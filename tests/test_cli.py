@@ -0,0 +1,99 @@
+import io
+import json
+from pathlib import Path
+
+from markitdowngui import cli
+from markitdowngui.core.conversion import ConversionOutcome, DEFAULT_OCR_PAGE_WORKERS
+
+
+def test_expand_inputs_resolves_globs_directories_and_manifests(tmp_path):
+    (tmp_path / "docs").mkdir()
+    first = tmp_path / "docs" / "a.txt"
+    second = tmp_path / "docs" / "b.txt"
+    third = tmp_path / "c.txt"
+    for path in (first, second, third):
+        path.write_text(path.stem, encoding="utf-8")
+    (tmp_path / "docs" / ".hidden").write_text("skip", encoding="utf-8")
+    manifest = tmp_path / "manifest.txt"
+    manifest.write_text(
+        f"# inputs\n{third}\n\nhttps://example.com/page\n{first}\n",
+        encoding="utf-8",
+    )
+
+    files = cli.expand_inputs(
+        [str(tmp_path / "docs" / "*.txt"), str(tmp_path / "docs")],
+        [str(manifest), "-"],
+        stdin=io.StringIO(f"{second}\n"),
+    )
+
+    assert files == [
+        str(first.resolve()),
+        str(second.resolve()),
+        str(third.resolve()),
+        "https://example.com/page",
+    ]
+
+
+def test_main_converts_saves_and_prints_json_summary(monkeypatch, tmp_path, capsys):
+    good = tmp_path / "good.txt"
+    bad = tmp_path / "bad.txt"
+    good.write_text("hello", encoding="utf-8")
+    bad.write_text("broken", encoding="utf-8")
+
+    def fake_convert(file_path, _options, **_kwargs):
+        if file_path.endswith("bad.txt"):
+            raise RuntimeError("unsupported content")
+        return ConversionOutcome(markdown="# hello", backend="native")
+
+    monkeypatch.setattr(
+        "markitdowngui.core.conversion.convert_file_with_details",
+        fake_convert,
+    )
+
+    exit_code = cli.main([str(good), str(bad), "-o", str(tmp_path / "out"), "-j", "2"])
+
+    captured = capsys.readouterr()
+    summary = json.loads(captured.out)
+    assert exit_code == cli.EXIT_CONVERSION_FAILED
+    assert (summary["total"], summary["succeeded"], summary["failed"]) == (2, 1, 1)
+    good_item, bad_item = summary["items"]
+    assert good_item["status"] == "saved"
+    assert good_item["backend"] == "native"
+    assert good_item["output"] == str(tmp_path / "out" / "good.md")
+    assert bad_item["status"] == "failed"
+    assert "unsupported content" in bad_item["error"]
+    assert (tmp_path / "out" / "good.md").read_text(encoding="utf-8") == "# hello"
+    assert "[2/2]" in captured.err
+
+
+def test_main_writes_combined_output_and_summary_file(monkeypatch, tmp_path, capsys):
+    sources = [tmp_path / "one.txt", tmp_path / "two.txt"]
+    for source in sources:
+        source.write_text(source.stem, encoding="utf-8")
+    monkeypatch.setattr(
+        "markitdowngui.core.conversion.convert_file_with_details",
+        lambda file_path, _options, **_kwargs: ConversionOutcome(
+            markdown=f"text of {Path(file_path).name}",
+        ),
+    )
+    combined = tmp_path / "all.md"
+    summary_path = tmp_path / "summary.json"
+
+    exit_code = cli.main(
+        [*map(str, sources), "--combined", str(combined), "--summary", str(summary_path), "-q"]
+    )
+
+    assert exit_code == cli.EXIT_OK
+    assert capsys.readouterr().err == ""
+    summary = json.loads(summary_path.read_text(encoding="utf-8"))
+    assert summary["succeeded"] == 2
+    assert summary["combined_output"] == str(combined.resolve())
+    assert summary["assets"]["copied"] == 0
+    text = combined.read_text(encoding="utf-8")
+    assert text.index("text of one.txt") < text.index("text of two.txt")
+
+
+def test_ocr_page_workers_default_matches_the_desktop_setting():
+    args = cli.build_parser().parse_args(["input.pdf"])
+
+    assert args.ocr_page_workers == DEFAULT_OCR_PAGE_WORKERS
@@ -0,0 +1,12 @@
+import os
+
+from PySide6.QtGui import QGuiApplication
+import pytest
+
+
+@pytest.fixture(scope="session")
+def qt_app():
+    # Queued signals from worker threads need an application event loop. Keep
+    # one instance for the session; the QML load tests reuse it.
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    return QGuiApplication.instance() or QGuiApplication([])
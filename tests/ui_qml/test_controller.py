@@ -4,12 +4,19 @@ from types import SimpleNamespace
 import pytest
 from PySide6.QtCore import QSettings, QUrl
 
-from markitdowngui.core.conversion import ConversionAsset, ConversionOutcome
+from markitdowngui.core.conversion import (
+    ConversionAsset,
+    ConversionBatchSummary,
+    ConversionOutcome,
+)
 from markitdowngui.core.markdown_assets import (
     prepare_markdown_for_separate_save,
     prepare_markdown_for_separate_save_transaction,
 )
+from markitdowngui.core import separate_save
+from markitdowngui.core.conversion_cache import ConversionCache
 from markitdowngui.core.settings import SettingsManager
+from markitdowngui.ui_qml import controller as controller_module
 from markitdowngui.ui_qml.controller import (
     AppController,
     PackagedUpdateInstaller,
@@ -143,12 +150,29 @@ def _complete_results(
     results: dict[str, ConversionOutcome],
     failed_sources: set[str] | None = None,
 ) -> None:
-    controller.worker = SimpleNamespace(
-        is_cancelled=False,
-        failed_files=failed_sources or set(),
-    )
+    failed_sources = failed_sources or set()
+    controller.worker = SimpleNamespace(is_cancelled=False)
     controller._converting = True
-    controller._handle_finished(results)
+    controller._handle_items_finished(
+        [
+            (source, outcome, source in failed_sources)
+            for source, outcome in results.items()
+        ]
+    )
+    controller._handle_finished(
+        ConversionBatchSummary(
+            total=len(results),
+            completed=len(results),
+            failed=len(failed_sources & results.keys()),
+        )
+    )
+
+
+def _finish_separate_save(controller: AppController, qt_app) -> None:
+    assert controller.savingOutputs is True
+    controller.save_worker.wait()
+    qt_app.processEvents()
+    assert controller.savingOutputs is False
 
 
 def test_controller_add_url_rejects_invalid_url(controller):
@@ -2010,10 +2034,11 @@ def test_controller_stops_active_conversion_before_discarding_for_close(
     monkeypatch,
 ):
     source = "C:/tmp/report.pdf"
-    controller.result_model.set_results(
-        {source: ConversionOutcome("# Converted", backend="native")}
+    controller.result_model.add_result(
+        source,
+        ConversionOutcome("# Converted", backend="native"),
+        unsaved=True,
     )
-    controller._unsaved_result_sources.add(source)
     controller._temp_asset_root = "C:/tmp/markitdown-assets"
     events: list[str] = []
     controller.worker = SimpleNamespace(
@@ -2046,6 +2071,7 @@ def test_controller_notifies_before_save_dialog_when_no_output(controller):
 
 def test_controller_separate_save_prefers_source_folder_for_local_files(
     controller,
+    qt_app,
     tmp_path,
 ):
     source_dir = tmp_path / "source"
@@ -2066,6 +2092,7 @@ def test_controller_separate_save_prefers_source_folder_for_local_files(
     )
 
     controller.saveSeparateOutputs(str(fallback_dir))
+    _finish_separate_save(controller, qt_app)
 
     assert (source_dir / "report.md").read_text(encoding="utf-8") == "# Local\n\nBody"
     assert (fallback_dir / "example.com-page.md").read_text(
@@ -2075,6 +2102,7 @@ def test_controller_separate_save_prefers_source_folder_for_local_files(
 
 def test_controller_separate_save_can_skip_dialog_for_local_source_folders(
     controller,
+    qt_app,
     tmp_path,
 ):
     source_dir = tmp_path / "source"
@@ -2090,6 +2118,7 @@ def test_controller_separate_save_can_skip_dialog_for_local_source_folders(
     assert controller.canSaveSeparateWithoutDialog is True
 
     controller.saveSeparateOutputs("")
+    _finish_separate_save(controller, qt_app)
 
     assert (source_dir / "report.md").read_text(encoding="utf-8") == "# Local\n\nBody"
 
@@ -2137,7 +2166,7 @@ def test_controller_save_combined_skips_failed_results(controller, tmp_path):
     assert controller.hasUnsavedSuccessfulResults is False
 
 
-def test_controller_save_separate_skips_failed_results(controller, tmp_path):
+def test_controller_save_separate_skips_failed_results(controller, qt_app, tmp_path):
     output_dir = tmp_path / "exports"
     _complete_results(
         controller,
@@ -2152,6 +2181,7 @@ def test_controller_save_separate_skips_failed_results(controller, tmp_path):
     )
 
     controller.saveSeparateOutputs(str(output_dir))
+    _finish_separate_save(controller, qt_app)
 
     saved_files = sorted(path.name for path in output_dir.glob("*.md"))
     assert saved_files == ["ok.md"]
@@ -2159,7 +2189,12 @@ def test_controller_save_separate_skips_failed_results(controller, tmp_path):
     assert controller.hasUnsavedSuccessfulResults is False
 
 
-def test_controller_save_separate_reports_partial_save_failures(controller, tmp_path, monkeypatch):
+def test_controller_save_separate_reports_partial_save_failures(
+    controller,
+    qt_app,
+    tmp_path,
+    monkeypatch,
+):
     output_dir = tmp_path / "exports"
     _complete_results(
         controller,
@@ -2168,18 +2203,19 @@ def test_controller_save_separate_reports_partial_save_failures(controller, tmp_
             "C:/tmp/fail.pdf": ConversionOutcome("# Also converted", backend="native"),
         },
     )
-    original_save = controller._save_prepared_markdown
+    original_save = separate_save.save_prepared_markdown
 
-    def fail_one_output(output_path, prepared_output):
-        if output_path.endswith("fail.md"):
+    def fail_one_output(output_path, prepared_output, **kwargs):
+        if str(output_path).endswith("fail.md"):
             raise OSError("disk full")
-        original_save(output_path, prepared_output)
+        original_save(output_path, prepared_output, **kwargs)
 
-    monkeypatch.setattr(controller, "_save_prepared_markdown", fail_one_output)
+    monkeypatch.setattr(separate_save, "save_prepared_markdown", fail_one_output)
     messages: list[tuple[str, str]] = []
     controller.toastRequested.connect(lambda kind, message: messages.append((kind, message)))
 
     controller.saveSeparateOutputs(str(output_dir))
+    _finish_separate_save(controller, qt_app)
 
     assert messages == [("error", "Saved 1 file; 1 file failed to save.")]
     assert controller.hasUnsavedSuccessfulResults is True
@@ -2226,9 +2262,9 @@ def test_controller_restores_asset_root_when_markdown_replace_fails(
         prepared.markdown,
     )
     monkeypatch.setattr(
-        controller.file_manager,
+        separate_save.FileManager,
         "stage_markdown_file",
-        lambda *_args: staged_file,
+        staticmethod(lambda *_args: staged_file),
     )
     monkeypatch.setattr(
         staged_file,
@@ -2237,7 +2273,7 @@ def test_controller_restores_asset_root_when_markdown_replace_fails(
     )
 
     with pytest.raises(OSError, match="disk is unavailable"):
-        controller._save_prepared_markdown(str(output_path), prepared)
+        separate_save.save_prepared_markdown(str(output_path), prepared)
 
     assert output_path.read_text(encoding="utf-8") == old_markdown
     assert (tmp_path / "report_assets" / "page.png").read_bytes() == b"old asset"
@@ -2274,9 +2310,9 @@ def test_controller_restores_owned_assets_when_asset_free_save_fails(
         prepared.markdown,
     )
     monkeypatch.setattr(
-        controller.file_manager,
+        separate_save.FileManager,
         "stage_markdown_file",
-        lambda *_args: staged_file,
+        staticmethod(lambda *_args: staged_file),
     )
     monkeypatch.setattr(
         staged_file,
@@ -2285,7 +2321,7 @@ def test_controller_restores_owned_assets_when_asset_free_save_fails(
     )
 
     with pytest.raises(OSError, match="disk is unavailable"):
-        controller._save_prepared_markdown(str(output_path), prepared)
+        separate_save.save_prepared_markdown(str(output_path), prepared)
 
     assert output_path.read_text(encoding="utf-8") == old_markdown
     assert (tmp_path / "report_assets" / "page.png").read_bytes() == b"old asset"
@@ -2322,17 +2358,13 @@ def test_controller_finished_status_reports_mixed_failures(controller):
     controller.toastRequested.connect(
         lambda kind, message: messages.append((kind, message))
     )
-    controller.worker = SimpleNamespace(
-        is_cancelled=False,
-        failed_files={"C:/tmp/broken.pdf"},
-    )
-    controller._converting = True
-
-    controller._handle_finished(
+    _complete_results(
+        controller,
         {
             "C:/tmp/ok.pdf": ConversionOutcome("# Converted", backend="native"),
             "C:/tmp/broken.pdf": ConversionOutcome("Conversion failed", backend="native"),
-        }
+        },
+        {"C:/tmp/broken.pdf"},
     )
 
     assert controller.statusText == "1 converted, 1 failed"
@@ -2347,10 +2379,8 @@ def test_controller_exposes_completed_items_before_the_worker_finishes(controlle
     assert controller.statusText == "Converting first.pdf"
     assert controller.progressIndeterminate is False
 
-    controller._handle_item_finished(
-        "C:/tmp/first.pdf",
-        ConversionOutcome("# First", backend="native"),
-        False,
+    controller._handle_items_finished(
+        [("C:/tmp/first.pdf", ConversionOutcome("# First", backend="native"), False)]
     )
 
     assert controller.result_model.rowCount() == 1
@@ -2359,11 +2389,9 @@ def test_controller_exposes_completed_items_before_the_worker_finishes(controlle
     assert controller.completedCount == 1
     assert controller.totalCount == 2
 
-    controller.worker = SimpleNamespace(is_cancelled=False, failed_files=set())
+    controller.worker = SimpleNamespace(is_cancelled=False)
     controller._converting = True
-    controller._handle_finished(
-        {"C:/tmp/first.pdf": ConversionOutcome("# First", backend="native")}
-    )
+    controller._handle_finished(ConversionBatchSummary(total=1, completed=1))
 
     assert controller.result_model.rowCount() == 1
     assert controller.hasUnsavedSuccessfulResults is True
@@ -2374,14 +2402,10 @@ def test_controller_finished_status_reports_all_failed(controller):
     controller.toastRequested.connect(
         lambda kind, message: messages.append((kind, message))
     )
-    controller.worker = SimpleNamespace(
-        is_cancelled=False,
-        failed_files={"C:/tmp/broken.pdf"},
-    )
-    controller._converting = True
-
-    controller._handle_finished(
-        {"C:/tmp/broken.pdf": ConversionOutcome("Conversion failed", backend="native")}
+    _complete_results(
+        controller,
+        {"C:/tmp/broken.pdf": ConversionOutcome("Conversion failed", backend="native")},
+        {"C:/tmp/broken.pdf"},
     )
 
     assert controller.statusText == "1 failed"
@@ -2427,6 +2451,9 @@ def test_controller_retries_failed_results_without_discarding_successes(
     assert controller.hasFailedResults is True
     assert controller.failedResultCount == 2
     assert controller.hasUnsavedSuccessfulResults is True
+    assert controller.resultStatistics["files"] == 1
+    assert controller.resultStatistics["words"] == 2
+    assert controller.resultStatistics["headings"] == 1
 
     controller.retryFailedResults()
 
@@ -2558,6 +2585,50 @@ def test_controller_cancel_unpauses_worker(controller):
     assert changes == [None]
 
 
+def test_controller_clears_caches_off_the_gui_thread(
+    controller,
+    monkeypatch,
+    qt_app,
+    tmp_path,
+):
+    import threading
+
+    cleared_on: list[int] = []
+    original_clear = ConversionCache.clear
+
+    def record_clear(self):
+        cleared_on.append(threading.get_ident())
+        original_clear(self)
+
+    monkeypatch.setattr(ConversionCache, "clear", record_clear)
+    monkeypatch.setattr(
+        controller_module,
+        "OcrPageCache",
+        lambda: controller_module.ConversionCache(tmp_path / "ocr-pages"),
+    )
+    cache_root = tmp_path / "conversions"
+    (cache_root / "ab").mkdir(parents=True)
+    controller._conversion_cache = ConversionCache(cache_root)
+    messages: list[tuple[str, str]] = []
+    controller.toastRequested.connect(lambda kind, message: messages.append((kind, message)))
+
+    controller.clearConversionCache()
+    worker = controller._cache_clear_worker
+    controller.clearConversionCache()
+    assert controller._cache_clear_worker is worker
+    worker.wait()
+    for _ in range(20):
+        qt_app.processEvents()
+        if controller._cache_clear_worker is None:
+            break
+
+    assert not cache_root.exists()
+    assert len(cleared_on) == 2
+    assert threading.get_ident() not in cleared_on
+    assert messages == [("success", "Conversion cache cleared.")]
+    assert controller._cache_clear_worker is None
+
+
 def test_controller_shutdown_rejects_close_until_worker_stops(controller):
     worker = SimpleNamespace(
         is_paused=True,
@@ -2719,3 +2790,43 @@ def test_controller_exposes_selected_failed_result(controller):
 
     controller.selectResult(1)
     assert controller.selectedResultFailed is True
+
+
+def test_controller_checks_chunked_preview_without_reading_spilled_bodies(
+    controller,
+    monkeypatch,
+):
+    store = controller.result_model.store
+    store.set_memory_budget(0)
+    controller.result_model.set_results(
+        {"C:/tmp/large.pdf": ConversionOutcome("x" * (1024 * 1024), backend="native")}
+    )
+    controller.selectResult(0)
+    reads: list[int] = []
+    original_get = store.get
+    monkeypatch.setattr(store, "get", lambda key: reads.append(key) or original_get(key))
+
+    assert all(controller.selectedPreviewChunked for _ in range(5))
+    assert reads == []
+
+
+def test_controller_renders_large_previews_in_background(controller, qt_app):
+    controller._preview_renderer.inline_max_chars = 0
+    controller.result_model.set_results(
+        {"C:/tmp/report.pdf": ConversionOutcome("# Large report", backend="native")}
+    )
+    changes: list[None] = []
+    controller.selectedPreviewChanged.connect(lambda: changes.append(None))
+    controller.selectResult(0)
+    changes.clear()
+
+    assert "Rendering preview" in controller.selectedPreviewHtml
+
+    controller._preview_renderer.shutdown()
+    for _ in range(20):
+        qt_app.processEvents()
+        if changes:
+            break
+
+    assert changes == [None]
+    assert "Large report" in controller.selectedPreviewHtml
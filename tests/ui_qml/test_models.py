@@ -1,6 +1,7 @@
 from PySide6.QtCore import Qt
 
 from markitdowngui.core.conversion import ConversionOutcome
+from markitdowngui.core.result_store import ResultStore
 from markitdowngui.ui_qml.models import QueueModel, ResultModel
 
 
@@ -90,3 +91,113 @@ def test_result_model_removes_only_sources_that_are_being_retried():
 
     assert model.rowCount() == 1
     assert model.item_at(0).source == "C:/tmp/ok.pdf"
+
+
+def test_result_model_inserts_a_burst_of_results_in_one_batch():
+    model = ResultModel()
+    model.add_result("C:/tmp/first.pdf", ConversionOutcome("one two", backend="native"))
+    inserted: list[tuple[int, int]] = []
+    changed: list[tuple[int, int]] = []
+    model.rowsInserted.connect(lambda _parent, first, last: inserted.append((first, last)))
+    model.dataChanged.connect(
+        lambda top_left, bottom_right, _roles=None: changed.append(
+            (top_left.row(), bottom_right.row())
+        )
+    )
+
+    model.add_results(
+        [
+            ("C:/tmp/second.pdf", ConversionOutcome("three", backend="native"), False),
+            ("C:/tmp/first.pdf", ConversionOutcome("revised", backend="native"), False),
+            ("C:/tmp/third.pdf", ConversionOutcome("broken", backend="native"), True),
+        ],
+        unsaved=True,
+    )
+
+    assert inserted == [(1, 2)]
+    assert changed == [(0, 0)]
+    assert [item.source for item in model.items()] == [
+        "C:/tmp/first.pdf",
+        "C:/tmp/second.pdf",
+        "C:/tmp/third.pdf",
+    ]
+    assert model.row_for_source("C:/tmp/third.pdf") == 2
+    assert model.row_for_source("C:/tmp/missing.pdf") == -1
+    assert model.item_at(0).outcome.markdown == "revised"
+
+
+def test_result_model_keeps_aggregate_counters_in_step_with_rows():
+    model = ResultModel()
+    model.add_results(
+        [
+            ("C:/tmp/ok.pdf", ConversionOutcome("one two three", backend="native"), False),
+            ("C:/tmp/other.pdf", ConversionOutcome("four", backend="native"), False),
+            ("C:/tmp/broken.pdf", ConversionOutcome("error text", backend="native"), True),
+        ],
+        unsaved=True,
+    )
+
+    assert model.successful_count == 2
+    assert model.failed_count == 1
+    assert model.unsaved_count == 2
+    assert model.total_words == 4
+    assert model.first_successful_item().source == "C:/tmp/ok.pdf"
+    assert [item.source for item in model.failed_items()] == ["C:/tmp/broken.pdf"]
+
+    assert model.mark_saved({"C:/tmp/ok.pdf"}) is True
+    assert model.mark_saved({"C:/tmp/ok.pdf"}) is False
+    model.add_result("C:/tmp/other.pdf", ConversionOutcome("x", backend="native"), failed=True)
+    model.remove_sources({"C:/tmp/broken.pdf"})
+
+    assert model.successful_count == 1
+    assert model.failed_count == 1
+    assert model.unsaved_count == 0
+    assert model.total_words == 3
+    assert model.row_for_source("C:/tmp/other.pdf") == 1
+
+    model.clear()
+
+    assert (model.successful_count, model.failed_count, model.total_words) == (0, 0, 0)
+    assert model.row_for_source("C:/tmp/ok.pdf") == -1
+
+
+def test_result_model_exposes_cached_document_statistics():
+    model = ResultModel()
+    model.add_results(
+        [
+            ("C:/tmp/a.pdf", ConversionOutcome("# A\n\n![x](x.png)\fpage two"), False),
+            ("C:/tmp/b.pdf", ConversionOutcome("# B\n\nbody"), False),
+            ("C:/tmp/c.pdf", ConversionOutcome("error message"), True),
+        ]
+    )
+    index = model.index(0, 0)
+    item = model.item_at(0)
+
+    assert item.stats is item.stats
+    assert model.data(index, ResultModel.HeadingCountRole) == 1
+    assert model.data(index, ResultModel.ImageCountRole) == 1
+    assert model.data(index, ResultModel.PageCountRole) == 2
+    assert model.data(index, ResultModel.CharacterCountRole) == len(item.outcome.markdown)
+    assert model.roleNames()[ResultModel.TableCountRole] == b"tableCount"
+    assert model.totals.headings == 2
+    assert model.totals.words == item.stats.words + 3
+
+
+def test_result_model_keeps_bodies_in_its_store_and_releases_removed_ones():
+    store = ResultStore(memory_budget_bytes=8)
+    model = ResultModel(store)
+    model.add_results(
+        [
+            ("C:/tmp/a.xlsx", ConversionOutcome("| a |\n| --- |\n| 1 |"), False),
+            ("C:/tmp/b.xlsx", ConversionOutcome("tiny"), False),
+        ]
+    )
+
+    assert store.spilled_count == 1
+    assert model.item_at(0).outcome.markdown == "| a |\n| --- |\n| 1 |"
+    assert model.data(model.index(0, 0), ResultModel.TableCountRole) == 1
+
+    model.remove_sources({"C:/tmp/a.xlsx"})
+
+    assert store.spilled_count == 0
+    model.clear()
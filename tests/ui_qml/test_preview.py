@@ -0,0 +1,130 @@
+from PySide6.QtCore import QCoreApplication, QEvent
+
+from markitdowngui.ui_qml.preview import (
+    PreviewChunkModel,
+    PreviewRenderer,
+    compact_preview_html,
+    split_markdown_chunks,
+)
+
+
+def _wait_for_jobs(renderer: PreviewRenderer) -> None:
+    for _ in range(20):
+        job = renderer._job
+        if job is None:
+            break
+        job.wait()
+        QCoreApplication.processEvents()
+    QCoreApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+
+
+def test_preview_renderer_renders_small_documents_inline_and_caches_them():
+    renderer = PreviewRenderer(inline_max_chars=1024)
+
+    html = renderer.html_for(("a.md", "digest", False), "# Title", [], "p{}")
+
+    assert html is not None
+    assert html.startswith("<style>p{}</style>")
+    assert "Title" in html
+    assert renderer.html_for(("a.md", "digest", False), "ignored", [], "p{}") == html
+
+
+def test_preview_renderer_renders_large_documents_off_the_calling_thread(qt_app):
+    renderer = PreviewRenderer(inline_max_chars=0)
+    ready: list[object] = []
+    renderer.previewReady.connect(ready.append)
+    key = ("big.md", "digest", True)
+
+    assert renderer.html_for(key, "# Large\n\nbody", [], "") is None
+    assert renderer.is_rendering(key) is True
+    assert renderer.html_for(key, "# Large\n\nbody", [], "") is None
+    assert renderer._pending is None
+
+    _wait_for_jobs(renderer)
+
+    assert ready == [key]
+    assert "Large" in renderer.html_for(key, "# Large\n\nbody", [], "")
+    assert renderer.is_rendering(key) is False
+
+
+def test_preview_renderer_runs_one_job_and_keeps_only_the_latest_request(qt_app):
+    renderer = PreviewRenderer(inline_max_chars=0)
+    ready: list[object] = []
+    renderer.previewReady.connect(ready.append)
+
+    for name in ("first", "second", "third"):
+        assert renderer.html_for(name, f"# {name}", [], "") is None
+
+    assert renderer.is_rendering("first") is True
+    assert renderer.is_rendering("second") is False
+    assert renderer.is_rendering("third") is True
+
+    _wait_for_jobs(renderer)
+
+    assert ready == ["first", "third"]
+    assert list(renderer._cache) == ["first", "third"]
+
+
+def test_preview_renderer_shutdown_drops_queued_request_and_waits(qt_app):
+    renderer = PreviewRenderer(inline_max_chars=0)
+    renderer.html_for("running", "# running", [], "")
+    renderer.html_for("queued", "# queued", [], "")
+    job = renderer._job
+
+    renderer.shutdown()
+
+    assert job.isFinished() is True
+    assert renderer.is_rendering("queued") is False
+    _wait_for_jobs(renderer)
+    assert "queued" not in renderer._cache
+
+
+def test_preview_renderer_evicts_least_recently_used_html():
+    renderer = PreviewRenderer(max_chars=1, inline_max_chars=1024)
+    renderer.html_for("first", "first", [], "")
+    renderer.html_for("second", "second", [], "")
+
+    assert list(renderer._cache) == ["second"]
+
+
+def test_compact_preview_html_replaces_qt_heading_tags():
+    html = compact_preview_html(
+        '<h1 style="margin-bottom:0px;"><span style="font-size:xx-large;">T</span></h1>'
+    )
+
+    assert html == (
+        '<p style="margin-bottom:10px;"><span style="font-size:18px;">T</span></p>'
+    )
+
+
+def test_split_markdown_chunks_cuts_at_blank_lines_outside_code_fences():
+    markdown = "alpha\n\nbeta gamma\n\n```\ncode\n\nmore code\n```\ntail\n"
+
+    chunks = split_markdown_chunks(markdown, chunk_chars=4)
+    texts = [markdown[start:end] for start, end in chunks]
+
+    assert "".join(texts) == markdown
+    assert texts[0] == "alpha\n\n"
+    assert all(text.count("```") in (0, 2) for text in texts)
+
+
+def test_preview_chunk_model_exposes_chunks_and_finds_text():
+    model = PreviewChunkModel(PreviewRenderer())
+    markdown = "# One\n\nfirst\n\n# Two\n\nSecond Needle\n"
+    changed: list[int] = []
+    model.dataChanged.connect(lambda top_left, *_args: changed.append(top_left.row()))
+
+    model.set_document(("doc", "digest"), markdown, [], "p{}", chunk_chars=8)
+
+    assert model.rowCount() > 1
+    assert "".join(model.chunk_text(row) for row in range(model.rowCount())) == markdown
+    assert model.find("needle") == model.rowCount() - 1
+    assert model.find("ONE", 1) == 0
+    assert model.find("absent") == -1
+    assert "first" in model.data(model.index(0, 0), PreviewChunkModel.HtmlRole)
+
+    model.set_document(("doc", "digest"), markdown, [], "p{color:red}")
+
+    assert changed == [0]
+    model.clear()
+    assert model.rowCount() == 0
@@ -80,10 +80,13 @@ def _close_main_qml(app, controller, engine):
 
 
 def _find_by_property(root, property_name, value):
+    # Reading a property the object lacks returns None, and PySide6 6.12
+    # over-releases that None; enough of those abort the interpreter.
     matches = [
         item
         for item in root.findChildren(QObject)
-        if item.property(property_name) == value
+        if item.metaObject().indexOfProperty(property_name) >= 0
+        and item.property(property_name) == value
     ]
     assert len(matches) == 1
     return matches[0]
@@ -295,6 +298,45 @@ def test_compact_results_keep_preview_actions_inside_the_panel(monkeypatch, tmp_
         _close_main_qml(app, controller, engine)
 
 
+def test_large_results_preview_only_materialises_visible_chunks(monkeypatch, tmp_path):
+    app, controller, engine, root = _load_main_qml(monkeypatch, tmp_path)
+
+    try:
+        paragraph = "Row value " * 40 + "\n\n"
+        markdown = "# Large\n\n" + paragraph * 2000 + "needle at the end\n"
+        controller.result_model.set_results(
+            {str(tmp_path / "large.md"): ConversionOutcome(markdown)}
+        )
+        controller.selectResult(0)
+        controller.resultsChanged.emit()
+        root.setWidth(1180)
+        root.setHeight(760)
+        app.processEvents()
+
+        chunked = next(
+            item
+            for item in root.findChildren(QQuickItem)
+            if item.objectName() == "chunkedPreview"
+        )
+        row_count = controller.preview_chunk_model.rowCount()
+        delegates = chunked.property("contentItem").childItems()
+
+        assert controller.selectedPreviewChunked is True
+        assert controller.selectedPreviewHtml == ""
+        assert chunked.isVisible()
+        assert row_count > 10
+        assert 0 < len(delegates) < row_count
+        assert controller.findInSelectedPreview("NEEDLE", 0) == row_count - 1
+        assert not [
+            item
+            for item in root.findChildren(QQuickItem)
+            if item.metaObject().indexOfProperty("text") >= 0
+            and item.property("text") == markdown
+        ]
+    finally:
+        _close_main_qml(app, controller, engine)
+
+
 def test_reduce_motion_updates_qml_controls(monkeypatch, tmp_path):
     app, controller, engine, root = _load_main_qml(monkeypatch, tmp_path)
 
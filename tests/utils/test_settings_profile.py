@@ -69,7 +69,9 @@ def test_settings_profile_import_applies_safe_settings(tmp_path):
             },
             "conversion": {
                 "batchSize": 8,
+                "processPoolConversion": True,
                 "fastPdfConversion": True,
+                "hybridPdfOcr": True,
                 "anydocEnabled": True,
                 "preservePdfImages": True,
                 "preserveDocxImages": True,
@@ -103,7 +105,9 @@ def test_settings_profile_import_applies_safe_settings(tmp_path):
     assert settings.get_save_to_source_folder() is True
     assert settings.get_save_mode() is False
     assert settings.get_batch_size() == 8
+    assert settings.get_process_pool_conversion() is True
     assert settings.get_fast_pdf_conversion() is True
+    assert settings.get_hybrid_pdf_ocr() is True
     assert settings.get_anydoc_enabled() is True
     assert settings.get_preserve_pdf_images() is True
     assert settings.get_preserve_docx_images() is True